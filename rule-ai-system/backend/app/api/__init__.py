@@ -1,7 +1,11 @@
 from fastapi import APIRouter
 from app.api.rule_validator import router as rule_validator_router
 from app.api.rule_report import router as rule_report_router
+from app.api.rule_set import router as rule_set_router
+from app.api.rule_repository import router as rule_repository_router
 
 api_router = APIRouter(prefix="/api/v1/rules")
 api_router.include_router(rule_validator_router, tags=["rule-validator"])
 api_router.include_router(rule_report_router, tags=["rule-report"])
+api_router.include_router(rule_set_router, tags=["rule-set"])
+api_router.include_router(rule_repository_router, tags=["rule-repository"])
@@ -0,0 +1,59 @@
+import asyncio
+from typing import Any, Dict, Tuple
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+from app.services.metrics import metrics
+from app.services.report_cache import report_cache
+from app.services.subtree_cache import subtree_cache
+from app.services.validation_cache import validation_cache
+
+# PlainTextResponse가 charset=utf-8을 덧붙임
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+router = APIRouter()
+
+
+# /metrics 한 번 출력에 쓰는 캐시 통계 (게이지마다 다시 읽지 않도록 수집 시 한 번만 갱신)
+_cache_snapshot: Dict[str, Dict[str, Any]] = {}
+
+
+def _cache_stats() -> Dict[str, Dict[str, Any]]:
+    """캐시별 통계 (서브트리 캐시는 이 프로세스 기준, 리포트 캐시는 설정된 경우만)"""
+    stats = {"validation": validation_cache.stats(), "subtree": subtree_cache.stats()}
+    if report_cache is not None:
+        stats["report"] = report_cache.stats()
+    return stats
+
+
+def _refresh_cache_snapshot() -> None:
+    global _cache_snapshot
+    _cache_snapshot = _cache_stats()
+
+
+def _cache_field(field: str):
+    def collect() -> Dict[Tuple[str, ...], float]:
+        return {(name,): stats[field] for name, stats in _cache_snapshot.items()}
+    return collect
+
+
+def _cache_lookups() -> Dict[Tuple[str, ...], float]:
+    values: Dict[Tuple[str, ...], float] = {}
+    for name, stats in _cache_snapshot.items():
+        values[(name, "hit")] = stats["hits"]
+        values[(name, "miss")] = stats["misses"]
+    return values
+
+
+metrics.on_collect(_refresh_cache_snapshot)
+metrics.gauge("rule_cache_hit_ratio", "캐시 적중률 (프로세스 시작 이후)", ("cache",), _cache_field("hit_ratio"))
+metrics.gauge("rule_cache_entries", "캐시 항목 수", ("cache",), _cache_field("size"))
+metrics.gauge("rule_cache_lookups_total", "캐시 조회 수", ("cache", "result"), _cache_lookups, kind="counter")
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus 텍스트 형식 메트릭 (METRICS_ENABLED가 꺼져 있으면 404)"""
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="메트릭 수집이 비활성화되어 있습니다.")
+    # 수집 콜백이 캐시 락/DB를 기다릴 수 있으므로 스레드에서 출력
+    return PlainTextResponse(await asyncio.to_thread(metrics.render), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,11 +1,18 @@
+import asyncio
+import logging
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from app.models.report import RuleReportRequest, RuleReportResponse
-from app.services.rule_report_service import RuleReportService
-from app.services.rule_analyzer import RuleAnalyzer
+from app.services.rule_report_service import RuleReportService, report_flight
+from app.services.report_cache import report_cache
+from app.services.report_stream import format_sse
+from app.services.analysis_executor import analysis_executor
 from app.models.rule import Rule, RuleCondition
 from typing import List, Dict, Any
 import json
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 def convert_conditions(conditions: Dict[str, Any]) -> List[RuleCondition]:
@@ -42,11 +49,19 @@ def convert_conditions(conditions: Dict[str, Any]) -> List[RuleCondition]:
                     
                 result.append(rule_condition)
     except Exception as e:
-        print(f"조건 변환 중 오류 발생: {str(e)}")
+        logger.warning("조건 변환 중 오류 발생: %s", e)
         return []
         
     return result
 
+@router.get("/report/stats")
+async def get_report_stats():
+    """리포트 캐시 적중률과 동시 요청 병합 통계"""
+    return {
+        "cache": await asyncio.to_thread(report_cache.stats) if report_cache is not None else None,
+        "single_flight": report_flight.stats()
+    }
+
 @router.post("/report", response_model=RuleReportResponse)
 async def generate_rule_report(request: RuleReportRequest):
     """
@@ -63,12 +78,12 @@ async def generate_rule_report(request: RuleReportRequest):
         
         # 중첩된 rule_json 처리
         if "rule_json" in rule_data and isinstance(rule_data["rule_json"], dict):
-            print("중첩된 rule_json 필드를 발견했습니다. 내부 데이터를 사용합니다.")
+            logger.debug("중첩된 rule_json 필드를 발견했습니다. 내부 데이터를 사용합니다.")
             rule_data = rule_data["rule_json"]
         
         # 요청 데이터가 검증 결과 객체인지 확인
         if "is_valid" in rule_data and "issues" in rule_data and "structure" in rule_data:
-            print("검증 결과 객체가 전송되었습니다. 원본 룰 데이터를 추출합니다.")
+            logger.debug("검증 결과 객체가 전송되었습니다. 원본 룰 데이터를 추출합니다.")
             # 이 경우 원래 룰 데이터는 읽을 수 없음
             # 응급 처리: 기본 오류 리포트 반환
             rule_id = "Unknown"
@@ -125,12 +140,11 @@ async def generate_rule_report(request: RuleReportRequest):
         try:
             # 룰 검증
             rule = Rule(**rule_data)
-            analyzer = RuleAnalyzer()
-            validation_result = await analyzer.analyze_rule(rule)
+            validation_result = await analysis_executor.analyze(rule)
             
             # 리포트 생성
             report_service = RuleReportService()
-            result = await report_service.generate_report(rule, validation_result)
+            result = await report_service.generate_report(rule, validation_result, request.mode)
             
             return RuleReportResponse(
                 report=result["report"],
@@ -138,7 +152,7 @@ async def generate_rule_report(request: RuleReportRequest):
                 rule_name=result["rule_name"]
             )
         except Exception as e:
-            print(f"룰 처리 실패: {str(e)}")
+            logger.warning("룰 처리 실패: %s", e)
             
             # 직접 응급 리포트 생성
             rule_id = rule_data.get("id", "Unknown")
@@ -178,8 +192,54 @@ async def generate_rule_report(request: RuleReportRequest):
                 rule_name=rule_name
             )
     except Exception as e:
-        print(f"리포트 생성 오류: {str(e)}")
+        logger.warning("리포트 생성 오류: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"리포트 생성 중 오류 발생: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+
+
+@router.post("/report/stream")
+async def stream_rule_report(request: RuleReportRequest):
+    """
+    룰 리포트를 SSE(text/event-stream)로 스트리밍
+    
+    - 분석이 끝나는 즉시 기본 정보/조건 구조/이슈 요약 섹션을 보내고, 이후 LLM 토큰을 이어서 전달합니다.
+    - 이벤트: meta, section, token, done (오류 시 error)
+    """
+    rule_data = request.rule_json.copy()
+    if "rule_json" in rule_data and isinstance(rule_data["rule_json"], dict):
+        rule_data = rule_data["rule_json"]
+    if "is_valid" in rule_data and "issues" in rule_data and "structure" in rule_data:
+        raise HTTPException(status_code=400, detail="검증 결과 객체가 아닌 원본 룰 JSON을 입력하세요.")
+    
+    if "ruleId" in rule_data:
+        rule_data["id"] = rule_data.pop("ruleId")
+    rule_data.pop("message", None)
+    if isinstance(rule_data.get("conditions"), dict):
+        rule_data["conditions"] = convert_conditions(rule_data["conditions"])
+    elif not isinstance(rule_data.get("conditions"), list):
+        rule_data["conditions"] = []
+    
+    try:
+        rule = Rule(**rule_data)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"룰 형식 오류: {str(e)}")
+    
+    # 분석은 응답 시작 전에 끝내서 첫 이벤트가 분석 비용만큼만 지연되도록 함
+    validation_result = await analysis_executor.analyze(rule)
+    report_service = RuleReportService()
+    
+    async def events():
+        try:
+            async for event, data in report_service.stream_report(rule, validation_result, request.mode):
+                yield format_sse(event, data)
+        except Exception as e:
+            logger.warning("리포트 스트리밍 오류: %s", e)
+            yield format_sse("error", {"detail": str(e)})
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
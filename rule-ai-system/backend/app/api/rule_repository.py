@@ -0,0 +1,122 @@
+import asyncio
+import logging
+from fastapi import APIRouter, Body, HTTPException
+from app.models.rule import Rule
+from app.models.rule_repository import RuleSaveRequest, RuleVersionInfo, RuleVersionListResponse, StoredRuleResponse
+from app.services.json_patch import apply_patch
+from app.services.revalidation_queue import revalidation_queue
+from app.services.rule_analyzer import rule_analyzer
+from app.services.rule_conversion import convert_json_to_rule
+from app.services.rule_repository import StoredRule, rule_repository
+from app.services.subtree_cache import subtree_cache
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def _require_repository() -> None:
+    if rule_repository is None or revalidation_queue is None:
+        raise HTTPException(status_code=503, detail="룰 저장소가 비활성화되어 있습니다 (RULE_REPOSITORY_URL).")
+
+
+def _to_response(stored: StoredRule, changed: bool = False) -> StoredRuleResponse:
+    current = stored.is_current(rule_analyzer.schema_version)
+    return StoredRuleResponse(
+        rule_id=stored.rule_id,
+        version=stored.version,
+        changed=changed,
+        status="current" if current else "pending",
+        schema_version=stored.schema_version,
+        rule=stored.rule,
+        result=stored.result
+    )
+
+
+@router.put("/repository/{rule_id}", response_model=StoredRuleResponse)
+async def save_rule(rule_id: str, request: RuleSaveRequest):
+    """
+    룰 저장 - 내용이 바뀌었으면 새 버전을 만들고 백그라운드 재검증 큐에 등록
+
+    - **rule_id**: 저장소 룰 ID (룰 JSON의 ruleId보다 우선)
+    - **rule_json**: 룰 JSON (validate-json과 같은 원본 형식)
+    """
+    _require_repository()
+    try:
+        if not request.rule_json:
+            raise ValueError("Rule JSON cannot be empty")
+        rule = convert_json_to_rule(dict(request.rule_json, ruleId=rule_id))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        version, changed = await asyncio.to_thread(rule_repository.save, rule_id, rule)
+        stored = await asyncio.to_thread(rule_repository.get, rule_id)
+        if not stored.is_current(rule_analyzer.schema_version):
+            revalidation_queue.enqueue([rule_id])
+        return _to_response(stored, changed)
+    except Exception as e:
+        error_msg = f"Error saving rule: {str(e)}"
+        logger.warning("API 오류: %s", error_msg)
+        raise HTTPException(status_code=500, detail=error_msg)
+
+
+@router.patch("/repository/{rule_id}", response_model=StoredRuleResponse)
+async def patch_rule(rule_id: str, operations: List[Dict[str, Any]] = Body(...)):
+    """
+    저장된 룰에 JSON Patch (RFC 6902) 를 적용하고 바로 재검증
+
+    - **operations**: 조회 응답의 rule 필드(룰 모델) 기준 패치 연산 목록
+      예: [{"op": "replace", "path": "/conditions/0/conditions/3/value", "value": 30}]
+    - 바뀌지 않은 조건 서브트리의 분석 결과는 서브트리 캐시에서 재사용합니다.
+    """
+    _require_repository()
+    stored = await asyncio.to_thread(rule_repository.get, rule_id)
+    if stored is None:
+        raise HTTPException(status_code=404, detail=f"룰을 찾을 수 없습니다: {rule_id}")
+    try:
+        patched = apply_patch(stored.rule.model_dump(mode="json"), operations)
+        rule = Rule.model_validate(patched).model_copy(update={"id": rule_id})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"패치를 적용할 수 없습니다: {str(e)}")
+
+    try:
+        version, changed = await asyncio.to_thread(rule_repository.save, rule_id, rule)
+        await revalidation_queue.revalidate(rule_id)
+        return _to_response(await asyncio.to_thread(rule_repository.get, rule_id), changed)
+    except Exception as e:
+        error_msg = f"Error patching rule: {str(e)}"
+        logger.warning("API 오류: %s", error_msg)
+        raise HTTPException(status_code=500, detail=error_msg)
+
+
+@router.get("/repository/revalidation/stats")
+async def get_revalidation_stats():
+    """재검증 큐와 저장소 통계 (서브트리 캐시는 이 프로세스 기준)"""
+    _require_repository()
+    return {**revalidation_queue.stats(), **(await asyncio.to_thread(rule_repository.stats)), "subtree_cache": subtree_cache.stats()}
+
+
+@router.get("/repository/{rule_id}", response_model=StoredRuleResponse)
+async def get_rule(rule_id: str, version: Optional[int] = None):
+    """
+    저장된 룰과 캐시된 검증 결과 조회
+
+    - **version**: 조회할 버전 (없으면 현재 버전, 결과는 그 버전으로 검증한 경우에만 포함)
+    """
+    _require_repository()
+    stored = await asyncio.to_thread(rule_repository.get, rule_id, version)
+    if stored is None:
+        raise HTTPException(status_code=404, detail=f"룰을 찾을 수 없습니다: {rule_id}")
+    return _to_response(stored)
+
+
+@router.get("/repository/{rule_id}/versions", response_model=RuleVersionListResponse)
+async def get_rule_versions(rule_id: str):
+    """룰 버전 목록"""
+    _require_repository()
+    versions = await asyncio.to_thread(rule_repository.versions, rule_id)
+    if not versions:
+        raise HTTPException(status_code=404, detail=f"룰을 찾을 수 없습니다: {rule_id}")
+    return RuleVersionListResponse(rule_id=rule_id, versions=[RuleVersionInfo(**version) for version in versions])
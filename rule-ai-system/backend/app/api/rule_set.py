@@ -0,0 +1,72 @@
+import asyncio
+import logging
+from fastapi import APIRouter, HTTPException
+from app.models.rule import Rule
+from app.models.rule_set import RuleSetOverlapResponse, RuleSetRequest, RuleSetShadowResponse
+from app.services.rule_conversion import convert_json_to_rule
+from app.services.rule_set_analyzer import rule_set_analyzer
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def convert_rule_set(rules_json: List[Dict[str, Any]]) -> List[Tuple[str, Rule]]:
+    """룰 JSON 목록을 (룰 ID, Rule) 목록으로 변환 - ID가 없으면 입력 위치(#1, #2, ...)를 ID로 사용"""
+    rules = []
+    seen = set()
+    for position, rule_json in enumerate(rules_json):
+        if not isinstance(rule_json, dict):
+            raise ValueError(f"{position + 1}번째 룰이 JSON 객체가 아닙니다.")
+        rule = convert_json_to_rule(rule_json)
+        rule_id = str(rule.id) if rule.id else f"#{position + 1}"
+        if rule_id in seen:
+            raise ValueError(f"룰 ID가 중복되었습니다: {rule_id}")
+        seen.add(rule_id)
+        rules.append((rule_id, rule))
+    return rules
+
+
+@router.post("/rule-set/overlaps", response_model=RuleSetOverlapResponse)
+async def find_rule_set_overlaps(request: RuleSetRequest):
+    """
+    룰 집합에서 같은 고객에게 함께 적용될 수 있는(영역이 겹치는) 활성 룰 쌍 검출
+
+    - **rules**: 룰 JSON 목록 (validate-json과 같은 원본 형식, priority/enabled 사용)
+    """
+    try:
+        # 룰이 많으면 변환도 오래 걸리므로 스레드에서 실행
+        rules = await asyncio.to_thread(convert_rule_set, request.rules)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        return await rule_set_analyzer.find_overlaps(rules)
+    except Exception as e:
+        error_msg = f"Error analyzing rule set: {str(e)}"
+        logger.warning("API 오류: %s", error_msg)
+        raise HTTPException(status_code=500, detail=error_msg)
+
+
+@router.post("/rule-set/shadows", response_model=RuleSetShadowResponse)
+async def find_rule_set_shadows(request: RuleSetRequest):
+    """
+    룰 집합에서 우선순위가 더 높은(priority 값이 작은) 룰에 가려지는 룰 검출
+
+    - **rules**: 룰 JSON 목록 (validate-json과 같은 원본 형식, priority/enabled 사용)
+    - shadowed: 상위 룰들이 영역 전체를 덮어 절대 적용되지 않는 룰
+    - partially_shadowed: 영역 일부에서 상위 룰이 먼저 적용되는 룰
+    """
+    try:
+        # 룰이 많으면 변환도 오래 걸리므로 스레드에서 실행
+        rules = await asyncio.to_thread(convert_rule_set, request.rules)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        return await rule_set_analyzer.find_shadowed(rules)
+    except Exception as e:
+        error_msg = f"Error analyzing rule set shadows: {str(e)}"
+        logger.warning("API 오류: %s", error_msg)
+        raise HTTPException(status_code=500, detail=error_msg)
@@ -14,6 +14,75 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     LLM_MODEL: str = os.getenv("LLM_MODEL", "gpt-4")
     
+    # LLM 호출 설정 (동시 호출 수, 타임아웃, 연결 풀)
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+    LLM_TIMEOUT_SECONDS: float = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+    LLM_CONNECT_TIMEOUT_SECONDS: float = float(os.getenv("LLM_CONNECT_TIMEOUT_SECONDS", "10"))
+    LLM_MAX_CONNECTIONS: int = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", "2"))
+    
+    # 룰 분석 실행 설정 (inline: 이벤트 루프에서 직접 실행, process: 프로세스 풀에서 실행)
+    ANALYSIS_EXECUTION_MODE: str = os.getenv("ANALYSIS_EXECUTION_MODE", "inline")
+    ANALYSIS_PROCESS_WORKERS: int = int(os.getenv("ANALYSIS_PROCESS_WORKERS", "2"))
+    # 조건 노드 수가 이 값보다 작으면 process 모드에서도 직접 실행 (프로세스 간 전송 비용이 더 큼)
+    ANALYSIS_INLINE_MAX_CONDITIONS: int = int(os.getenv("ANALYSIS_INLINE_MAX_CONDITIONS", "200"))
+    
+    # 분기 판정(BDD) 한도 - 조건 노드 수, BDD 노드 수, 연산 단계 수 중 하나라도 넘으면 해당 룰의 분기 판정만 생략
+    # (ANALYSIS_BDD_MAX_NODES가 0이면 분기 판정 사용 안 함, 연산 단계 한도는 0이면 제한 없음)
+    ANALYSIS_BDD_MAX_CONDITIONS: int = int(os.getenv("ANALYSIS_BDD_MAX_CONDITIONS", "200"))
+    ANALYSIS_BDD_MAX_NODES: int = int(os.getenv("ANALYSIS_BDD_MAX_NODES", "20000"))
+    ANALYSIS_BDD_MAX_STEPS: int = int(os.getenv("ANALYSIS_BDD_MAX_STEPS", "20000"))
+    
+    # 룰 집합 분석에서 룰 하나를 표현하는 제약 박스(DNF 항) 최대 수 - 넘으면 하나의 근사 박스로 합침
+    RULE_REGION_MAX_BOXES: int = int(os.getenv("RULE_REGION_MAX_BOXES", "64"))
+    
+    # NDJSON 일괄 검증 동시 처리 수와 줄 하나의 최대 크기 (바이트)
+    BULK_VALIDATION_CONCURRENCY: int = int(os.getenv("BULK_VALIDATION_CONCURRENCY", "8"))
+    BULK_VALIDATION_MAX_LINE_BYTES: int = int(os.getenv("BULK_VALIDATION_MAX_LINE_BYTES", str(1024 * 1024)))
+    
+    # 검증 결과 LRU 캐시 크기 (0이면 사용 안 함)
+    VALIDATION_CACHE_SIZE: int = int(os.getenv("VALIDATION_CACHE_SIZE", "1024"))
+    # 서브트리 해시별 노드 검사 산출물 LRU 캐시 크기 (0이면 사용 안 함)
+    SUBTREE_CACHE_SIZE: int = int(os.getenv("SUBTREE_CACHE_SIZE", "8192"))
+    
+    # 리포트 캐시 설정 (SQLite 파일 경로가 비어 있으면 사용 안 함)
+    REPORT_CACHE_PATH: str = os.getenv("REPORT_CACHE_PATH", "data/report_cache.sqlite3")
+    REPORT_CACHE_TTL_SECONDS: int = int(os.getenv("REPORT_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    REPORT_CACHE_MAX_ENTRIES: int = int(os.getenv("REPORT_CACHE_MAX_ENTRIES", "5000"))
+    
+    # 룰 저장소 DB 주소 (SQLAlchemy URL, 비어 있으면 사용 안 함)와 백그라운드 재검증 동시 처리 수
+    RULE_REPOSITORY_URL: str = os.getenv("RULE_REPOSITORY_URL", "sqlite:///data/rules.sqlite3")
+    REVALIDATION_CONCURRENCY: int = int(os.getenv("REVALIDATION_CONCURRENCY", "2"))
+    
+    # 검증 워커 브로커 (local: 파일/메모리 로그, kafka: Kafka)와 토픽, 배치 설정
+    VALIDATION_BROKER: str = os.getenv("VALIDATION_BROKER", "local")
+    # local 브로커 로그 디렉터리 (비어 있으면 메모리에만 보관)
+    VALIDATION_BROKER_PATH: str = os.getenv("VALIDATION_BROKER_PATH", "data/broker")
+    KAFKA_BOOTSTRAP_SERVERS: str = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
+    VALIDATION_REQUEST_TOPIC: str = os.getenv("VALIDATION_REQUEST_TOPIC", "rule-changes")
+    VALIDATION_RESULT_TOPIC: str = os.getenv("VALIDATION_RESULT_TOPIC", "rule-validation-results")
+    VALIDATION_CONSUMER_GROUP: str = os.getenv("VALIDATION_CONSUMER_GROUP", "rule-validator")
+    VALIDATION_BATCH_SIZE: int = int(os.getenv("VALIDATION_BATCH_SIZE", "100"))
+    VALIDATION_POLL_TIMEOUT_SECONDS: float = float(os.getenv("VALIDATION_POLL_TIMEOUT_SECONDS", "1.0"))
+    VALIDATION_METRICS_INTERVAL_SECONDS: float = float(os.getenv("VALIDATION_METRICS_INTERVAL_SECONDS", "30"))
+    
+    # 리포트 생성 방식 기본값 (fast: 템플릿만, hybrid: 템플릿 + LLM 총평, llm: LLM 전체 작성)
+    REPORT_MODE: str = os.getenv("REPORT_MODE", "llm")
+    
+    # 리포트 프롬프트 인코딩 (compact: 조건식 + 이슈 다이제스트, full: 기존 템플릿)과 추정 토큰 예산
+    REPORT_PROMPT_MODE: str = os.getenv("REPORT_PROMPT_MODE", "compact")
+    REPORT_PROMPT_TOKEN_BUDGET: int = int(os.getenv("REPORT_PROMPT_TOKEN_BUDGET", "3000"))
+    
+    # 분석 단계/LLM/리포트 후처리 시간 수집과 /metrics 노출 여부
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "True").lower() == "true"
+    
+    # 로그 설정 - 앱 기본 레벨, 모듈별 레벨("app.services.rule_analyzer=DEBUG,app.api=WARNING"),
+    # 형식(text | json), DEBUG 로그를 남길 작업(요청) 비율 (0~1)
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVELS: str = os.getenv("LOG_LEVELS", "")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")
+    LOG_DEBUG_SAMPLE_RATE: float = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "1.0"))
+    
     # 개발 환경 설정
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
     
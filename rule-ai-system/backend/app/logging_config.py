@@ -0,0 +1,141 @@
+import json
+import logging
+import random
+import sys
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, ContextManager, Dict, Iterator, Optional
+from app.config import settings
+
+LOG_FORMATS = ("text", "json")
+APP_LOGGER = "app"
+
+# 현재 작업(요청)의 DEBUG 샘플링 결정 - None이면 샘플링 범위 밖
+_debug_sampled: ContextVar[Optional[bool]] = ContextVar("debug_sampled", default=None)
+_debug_sample_rate = 1.0
+_handler: Optional[logging.Handler] = None
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """
+    모듈별 로그 레벨 설정 파싱
+
+    - "app.services.rule_analyzer=DEBUG,app.api=WARNING" -> {"app.services.rule_analyzer": 10, "app.api": 30}
+    """
+    levels: Dict[str, int] = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        name, separator, level = item.partition("=")
+        value = logging.getLevelName(level.strip().upper())
+        if not separator or not name.strip() or not isinstance(value, int):
+            raise ValueError(f"잘못된 로그 레벨 설정입니다: {item.strip()}")
+        levels[name.strip()] = value
+    return levels
+
+
+class TextFormatter(logging.Formatter):
+    """사람이 읽는 한 줄 형식 - extra={"fields": {...}}는 key=value로 덧붙임"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 객체 하나 - extra={"fields": {...}}는 최상위 키로 합침"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            payload.update(fields)
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class DebugSampleFilter(logging.Filter):
+    """
+    DEBUG 로그 샘플링 - debug_sampling() 범위 안에서는 그 범위의 결정을, 범위 밖에서는 로그마다 샘플링 비율을 따름
+
+    - 걸러진 로그는 메시지를 만들지 않습니다 (포맷은 핸들러가 출력할 때만 수행).
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        sampled = _debug_sampled.get()
+        if sampled is None:
+            return random.random() < _debug_sample_rate
+        return sampled
+
+
+def debug_enabled(logger: logging.Logger) -> bool:
+    """
+    DEBUG 덤프를 만들지 여부 - 레벨이 DEBUG 이하이고 현재 작업이 샘플링에서 빠지지 않았을 때만 True
+
+    - 인자를 만드는 데 비용이 드는 덤프(목록 정리, 미리보기 등)는 이 검사 안에서 만듭니다.
+    """
+    return logger.isEnabledFor(logging.DEBUG) and _debug_sampled.get() is not False
+
+
+@contextmanager
+def _sampling_scope() -> Iterator[None]:
+    token = _debug_sampled.set(random.random() < _debug_sample_rate)
+    try:
+        yield
+    finally:
+        _debug_sampled.reset(token)
+
+
+def debug_sampling(logger: logging.Logger) -> ContextManager[None]:
+    """
+    작업(요청) 하나를 DEBUG 샘플링 단위로 묶음 - 샘플에 뽑힌 작업은 DEBUG 로그를 모두 남기고, 빠진 작업은 하나도 남기지 않음
+
+    - DEBUG가 꺼져 있거나 샘플링 비율이 1이거나 이미 바깥 범위가 있으면 아무것도 하지 않습니다.
+    """
+    if _debug_sample_rate >= 1.0 or _debug_sampled.get() is not None or not logger.isEnabledFor(logging.DEBUG):
+        return nullcontext()
+    return _sampling_scope()
+
+
+def configure_logging(level: Optional[str] = None, levels: Optional[str] = None,
+                      log_format: Optional[str] = None, debug_sample_rate: Optional[float] = None) -> None:
+    """
+    앱 로거("app") 설정 - 인자를 생략하면 설정값(LOG_LEVEL, LOG_LEVELS, LOG_FORMAT, LOG_DEBUG_SAMPLE_RATE) 사용
+
+    - 다시 호출하면 이전에 붙인 핸들러를 교체합니다.
+    - 설정하지 않은 상태(테스트, 벤치마크)에서는 표준 logging 기본값대로 WARNING 이상만 stderr로 나갑니다.
+    """
+    global _debug_sample_rate, _handler
+    log_format = log_format or settings.LOG_FORMAT
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"지원하지 않는 로그 형식입니다: {log_format}")
+    app_logger = logging.getLogger(APP_LOGGER)
+    app_logger.setLevel((level or settings.LOG_LEVEL).upper())
+    for name, module_level in parse_levels(settings.LOG_LEVELS if levels is None else levels).items():
+        logging.getLogger(name).setLevel(module_level)
+    _debug_sample_rate = min(1.0, max(0.0, settings.LOG_DEBUG_SAMPLE_RATE if debug_sample_rate is None else debug_sample_rate))
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter() if log_format == "json" else TextFormatter())
+    if _debug_sample_rate < 1.0:
+        handler.addFilter(DebugSampleFilter())
+    if _handler is not None:
+        app_logger.removeHandler(_handler)
+    app_logger.addHandler(handler)
+    # 루트 로거에 핸들러를 붙이는 서버 설정과 겹쳐 두 번 출력되지 않도록 전파하지 않음
+    app_logger.propagate = False
+    _handler = handler
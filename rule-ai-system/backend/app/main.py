@@ -1,11 +1,41 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api import api_router
+from app.api.metrics import router as metrics_router
+from app.logging_config import configure_logging
+from app.services.analysis_executor import analysis_executor
+from app.services.llm_service import close_llm_service
+from app.services.report_cache import report_cache
+from app.services.revalidation_queue import revalidation_queue
+from app.services.rule_repository import rule_repository
+
+# 로그 레벨/형식 설정 (LOG_LEVEL, LOG_LEVELS, LOG_FORMAT, LOG_DEBUG_SAMPLE_RATE)
+configure_logging()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명 주기 - 공유 리소스 시작/종료"""
+    await analysis_executor.start()
+    if revalidation_queue is not None:
+        await revalidation_queue.start()
+    yield
+    if revalidation_queue is not None:
+        await revalidation_queue.stop()
+    analysis_executor.shutdown()
+    if rule_repository is not None:
+        rule_repository.close()
+    await close_llm_service()
+    if report_cache is not None:
+        report_cache.close()
+
 
 app = FastAPI(
     title="Rule AI System API",
     description="API for generating and validating rules using LLM",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -19,6 +49,8 @@ app.add_middleware(
 
 # API 라우터 등록 - prefix 수정
 app.include_router(api_router)
+# Prometheus 수집 엔드포인트는 API prefix 밖 (/metrics)
+app.include_router(metrics_router, tags=["metrics"])
 
 @app.get("/")
 async def root():
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal
 from pydantic import BaseModel, Field
 
 class RuleReportRequest(BaseModel):
@@ -6,6 +6,7 @@ class RuleReportRequest(BaseModel):
     rule_json: dict = Field(..., description="분석할 룰 JSON")
     include_markdown: bool = Field(True, description="마크다운 형식으로 반환할지 여부")
     validation_result: Optional[Dict[str, Any]] = Field(None, description="이미 분석된 룰 검증 결과 (없으면 새로 검증)")
+    mode: Optional[Literal["fast", "hybrid", "llm"]] = Field(None, description="리포트 생성 방식 (fast: 템플릿만, hybrid: 템플릿 + LLM 총평, llm: LLM 전체 작성, 없으면 서버 기본값)")
 
 class RuleReportResponse(BaseModel):
     """룰 리포트 응답 모델"""
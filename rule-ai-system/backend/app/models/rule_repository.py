@@ -0,0 +1,33 @@
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+from app.models.rule import Rule
+from app.models.validation_result import ValidationResult
+
+
+class RuleSaveRequest(BaseModel):
+    """룰 저장 요청 모델"""
+    rule_json: Dict[str, Any] = Field(..., description="저장할 룰 JSON (validate-json과 같은 원본 형식)")
+
+
+class RuleVersionInfo(BaseModel):
+    """저장된 룰 버전 정보"""
+    version: int
+    rule_hash: str
+    created_at: float
+
+
+class StoredRuleResponse(BaseModel):
+    """저장된 룰과 캐시된 검증 결과"""
+    rule_id: str
+    version: int
+    changed: bool = Field(False, description="이번 저장으로 새 버전이 만들어졌는지 여부")
+    status: str = Field(..., description="current: 현재 버전/스키마 기준 결과 있음, pending: 재검증 대기 중")
+    schema_version: Optional[str] = Field(None, description="검증 결과가 기준으로 삼은 스키마 버전")
+    rule: Rule
+    result: Optional[ValidationResult] = None
+
+
+class RuleVersionListResponse(BaseModel):
+    """룰 버전 목록 응답 모델"""
+    rule_id: str
+    versions: List[RuleVersionInfo] = Field(default_factory=list)
@@ -0,0 +1,45 @@
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+
+
+class RuleSetRequest(BaseModel):
+    """룰 집합 분석 요청 모델"""
+    rules: List[Dict[str, Any]] = Field(..., description="분석할 룰 JSON 목록 (validate-json과 같은 원본 형식)")
+
+
+class RuleOverlap(BaseModel):
+    """같은 고객에게 함께 적용될 수 있는 룰 쌍"""
+    rule_id: str
+    other_rule_id: str
+    priority: int
+    other_priority: int
+    winner_rule_id: Optional[str] = Field(None, description="먼저 적용되는 룰 (priority 값이 작은 룰, 같으면 None)")
+    shared_fields: List[str] = Field(default_factory=list, description="두 룰이 함께 제약하는 필드")
+    region: Dict[str, str] = Field(default_factory=dict, description="공유 필드별 겹치는 영역")
+    approximate: bool = Field(False, description="근사 영역으로 판정했는지 여부 (해석하지 않는 연산자, 분기 수 초과)")
+
+
+class RuleSetOverlapResponse(BaseModel):
+    """룰 집합 겹침 분석 응답 모델"""
+    rule_count: int
+    enabled_rule_count: int
+    group_count: int = Field(0, description="필드 공유 기준으로 나눈 독립 그룹 수")
+    overlaps: List[RuleOverlap] = Field(default_factory=list)
+
+
+class RuleShadow(BaseModel):
+    """우선순위가 더 높은 룰에 가려지는 룰"""
+    rule_id: str
+    priority: int
+    status: str = Field(..., description="shadowed: 절대 적용되지 않음, partially_shadowed: 일부 영역에서 상위 룰이 먼저 적용됨")
+    covering_rule_ids: List[str] = Field(default_factory=list, description="가리는 상위 룰 (우선순위 순)")
+    approximate: bool = Field(False, description="근사 영역이 섞여 있어 부분 가림 판정이 실제보다 넓을 수 있는지 여부")
+
+
+class RuleSetShadowResponse(BaseModel):
+    """룰 집합 가림 분석 응답 모델"""
+    rule_count: int
+    enabled_rule_count: int
+    shadowed_count: int = 0
+    partially_shadowed_count: int = 0
+    shadows: List[RuleShadow] = Field(default_factory=list)
@@ -0,0 +1,166 @@
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Tuple
+from app.config import settings
+from app.models.rule import Rule, RuleCondition
+from app.models.validation_result import ValidationResult
+from app.services.metrics import metrics, record_analysis
+from app.services.rule_analyzer import rule_analyzer
+from app.services.subtree_cache import subtree_cache
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_MODES = ("inline", "process")
+
+
+def _init_worker() -> None:
+    """워커 프로세스 초기화 - 분석기 모듈과 스키마를 미리 로드"""
+    from app.services import rule_analyzer as analyzer_module
+    analyzer_module.rule_analyzer.analyze(Rule(name="warmup", conditions=[]))
+
+
+def _warmup() -> bool:
+    """워커 기동 확인용 빈 작업"""
+    return True
+
+
+def _analyze_in_worker(rule: Rule) -> Tuple[ValidationResult, List[Tuple[str, float]], Optional[int]]:
+    """
+    워커 프로세스에서 룰 분석 (입력/결과 모두 모델 그대로 pickle로 전달)
+
+    - JSON은 inf/nan 값을 null로 바꾸므로 거치지 않습니다. 직접 분석과 같은 룰을 분석해야 합니다.
+    - 워커의 메트릭은 수집되지 않으므로 단계별 시간과 룰 크기를 결과와 함께 돌려보내 부모 프로세스에서 기록합니다.
+    """
+    timer = metrics.stage_timer()
+    result = rule_analyzer.analyze(rule, subtree_cache, timer)
+    return result, list(timer.marks), timer.size
+
+
+def _run_all(func: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+    """작업 목록 순차 실행 (스레드에서 호출)"""
+    return [func(item) for item in items]
+
+
+def count_condition_nodes(conditions: Optional[List[RuleCondition]]) -> int:
+    """조건 트리의 전체 노드 수"""
+    count = 0
+    stack = list(conditions or [])
+    while stack:
+        condition = stack.pop()
+        count += 1
+        if condition.conditions:
+            stack.extend(condition.conditions)
+    return count
+
+
+class AnalysisExecutor:
+    """
+    룰 분석 실행기
+
+    - inline 모드: 이벤트 루프에서 바로 분석합니다.
+    - process 모드: 조건 노드 수가 기준 이상인 룰은 프로세스 풀에서 분석하여 큰 룰이 다른 요청을 막지 않도록 합니다.
+    """
+
+    def __init__(self, mode: str = "inline", max_workers: int = 2, inline_max_conditions: int = 200):
+        if mode not in EXECUTION_MODES:
+            raise ValueError(f"지원하지 않는 분석 실행 모드입니다: {mode}")
+        self.mode = mode
+        self.max_workers = max(1, max_workers)
+        self.inline_max_conditions = inline_max_conditions
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    async def start(self) -> None:
+        """
+        프로세스 풀 생성 및 워커 사전 기동 (process 모드에서만)
+
+        - 워커 기동은 이벤트 루프를 막지 않고 기다립니다. 풀은 첫 await 전에 만들어 두므로
+          동시에 들어온 요청이 풀을 두 번 만들지 않습니다.
+        """
+        if self.mode != "process" or self._pool is not None:
+            return
+        pool = self._pool = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker)
+        # 워커 수만큼 빈 작업을 보내 첫 요청 전에 모든 프로세스를 띄움
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.gather(*(loop.run_in_executor(pool, _warmup) for _ in range(self.max_workers)))
+        except BrokenProcessPool as e:
+            logger.warning("분석 프로세스 풀 기동 실패: %s", e)
+            self._discard_pool(pool)
+            return
+        logger.info("분석 프로세스 풀 시작: 워커 %d개", self.max_workers)
+
+    def shutdown(self) -> None:
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        """
+        깨진 프로세스 풀 정리 - 다음 요청에서 새로 만들도록 비우고 관리 스레드와 남은 프로세스를 종료
+
+        - 그 사이 다른 요청이 새 풀을 만들었다면 새 풀은 그대로 둡니다.
+        """
+        if self._pool is pool:
+            self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def should_offload(self, rule: Rule) -> bool:
+        """프로세스 풀에서 분석할지 여부"""
+        if self.mode != "process":
+            return False
+        return count_condition_nodes(rule.conditions) >= self.inline_max_conditions
+
+    async def analyze(self, rule: Rule) -> ValidationResult:
+        """룰 분석 - 실행 모드와 룰 크기에 따라 직접 실행 또는 프로세스 풀 실행"""
+        if not self.should_offload(rule):
+            return rule_analyzer.analyze(rule, subtree_cache)
+
+        await self.start()
+        pool = self._pool
+        if pool is None:
+            return rule_analyzer.analyze(rule, subtree_cache)
+        loop = asyncio.get_running_loop()
+        try:
+            result, marks, size = await loop.run_in_executor(pool, _analyze_in_worker, rule)
+        except BrokenProcessPool as e:
+            # 워커가 비정상 종료된 경우 풀을 정리하고 이번 요청은 직접 분석
+            logger.warning("분석 프로세스 풀 오류, 직접 분석으로 전환: %s", e)
+            self._discard_pool(pool)
+            return rule_analyzer.analyze(rule, subtree_cache)
+        record_analysis(marks, size)
+        return result
+
+    async def map(self, func: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        """
+        독립 작업 목록 실행 - process 모드에서는 프로세스 풀에서 병렬 실행, 그 외에는 스레드에서 실행
+
+        - func는 모듈 수준 함수여야 하고 인자와 결과는 pickle 가능해야 합니다.
+        - 룰 집합 분석처럼 오래 걸리는 작업이므로 어느 모드에서도 이벤트 루프에서 직접 실행하지 않습니다.
+        """
+        if not items:
+            return []
+        if self.mode != "process":
+            return await asyncio.to_thread(_run_all, func, items)
+
+        await self.start()
+        pool = self._pool
+        if pool is None:
+            return await asyncio.to_thread(_run_all, func, items)
+        loop = asyncio.get_running_loop()
+        try:
+            return list(await asyncio.gather(*(loop.run_in_executor(pool, func, item) for item in items)))
+        except BrokenProcessPool as e:
+            logger.warning("분석 프로세스 풀 오류, 스레드 실행으로 전환: %s", e)
+            self._discard_pool(pool)
+            return await asyncio.to_thread(_run_all, func, items)
+
+
+# 앱 전체에서 공유하는 분석 실행기
+analysis_executor = AnalysisExecutor(
+    mode=settings.ANALYSIS_EXECUTION_MODE,
+    max_workers=settings.ANALYSIS_PROCESS_WORKERS,
+    inline_max_conditions=settings.ANALYSIS_INLINE_MAX_CONDITIONS
+)
@@ -0,0 +1,97 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+
+class LineTooLongError(ValueError):
+    """한 줄이 허용 크기를 넘음"""
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """
+    바이트 청크 스트림을 줄 단위로 분리 - (줄 번호, 줄 내용) 반환
+
+    - 빈 줄은 건너뛰지만 줄 번호는 셉니다.
+    - max_line_bytes를 넘는 줄은 내용을 모으지 않고 버린 뒤 내용 대신 None을 반환합니다.
+    """
+    buffer = bytearray()
+    line_number = 0
+    overflow = False
+    async for chunk in chunks:
+        start = 0
+        while True:
+            newline = chunk.find(b"\n", start)
+            piece = chunk[start:] if newline < 0 else chunk[start:newline]
+            if not overflow:
+                buffer += piece
+                if len(buffer) > max_line_bytes:
+                    overflow = True
+                    buffer.clear()
+            if newline < 0:
+                break
+            line_number += 1
+            if overflow:
+                yield line_number, None
+            elif buffer.strip():
+                yield line_number, bytes(buffer)
+            buffer.clear()
+            overflow = False
+            start = newline + 1
+    if overflow or buffer.strip():
+        yield line_number + 1, None if overflow else bytes(buffer)
+
+
+def error_envelope(line: int, error: Exception) -> Dict[str, Any]:
+    """줄 하나의 오류 결과"""
+    return {"line": line, "status": "error", "error": {"type": type(error).__name__, "message": str(error)}}
+
+
+async def validate_lines(
+    lines: AsyncIterator[Tuple[int, Optional[bytes]]],
+    validate: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    concurrency: int,
+    max_line_bytes: int
+) -> AsyncIterator[str]:
+    """
+    줄 단위 룰 JSON을 동시에 최대 concurrency개까지 검증하고, 끝나는 순서대로 NDJSON 줄을 반환
+
+    - 처리 중인 줄이 concurrency개면 하나가 끝날 때까지 입력을 더 읽지 않으므로, 입력과 출력 모두 전체를 메모리에 두지 않습니다.
+    - 줄마다 결과 봉투({"line", "status", ...})를 만들고, 잘못된 줄은 status "error"로 보고한 뒤 계속 진행합니다.
+    - 마지막 줄은 처리 건수 요약({"status": "done", ...})입니다.
+    """
+    concurrency = max(1, concurrency)
+    pending: Set["asyncio.Task[Dict[str, Any]]"] = set()
+    counts = {"ok": 0, "error": 0}
+
+    async def run(line: int, content: Optional[bytes]) -> Dict[str, Any]:
+        try:
+            if content is None:
+                raise LineTooLongError(f"줄 크기가 {max_line_bytes}바이트를 넘습니다")
+            rule_json = json.loads(content)
+            if not isinstance(rule_json, dict) or not rule_json:
+                raise ValueError("Rule JSON must be a non-empty object")
+            return {"line": line, "status": "ok", **(await validate(rule_json))}
+        except Exception as e:
+            return error_envelope(line, e)
+
+    def emit(task: "asyncio.Task[Dict[str, Any]]") -> str:
+        envelope = task.result()
+        counts[envelope["status"]] += 1
+        return json.dumps(envelope, ensure_ascii=False) + "\n"
+
+    try:
+        async for line, content in lines:
+            pending.add(asyncio.ensure_future(run(line, content)))
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield emit(task)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield emit(task)
+    finally:
+        # 클라이언트가 연결을 끊으면 남은 검증 작업 취소
+        for task in pending:
+            task.cancel()
+    yield json.dumps({"status": "done", "total": counts["ok"] + counts["error"], **counts}) + "\n"
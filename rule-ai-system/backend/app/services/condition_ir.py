@@ -0,0 +1,164 @@
+from typing import Dict, List, Any, Optional, Iterator
+from app.models.rule import RuleCondition
+
+# 연산자 코드 (비교 연산을 정수로 표현하여 검사 로직에서 문자열 비교를 줄임)
+OP_UNKNOWN = -1
+OP_EQ = 0
+OP_NE = 1
+OP_GT = 2
+OP_GE = 3
+OP_LT = 4
+OP_LE = 5
+OP_IN = 6
+OP_NOT_IN = 7
+OP_CONTAINS = 8
+OP_NOT_CONTAINS = 9
+OP_STARTS_WITH = 10
+OP_ENDS_WITH = 11
+OP_AND = 12
+OP_OR = 13
+
+OPERATOR_CODES: Dict[str, int] = {
+    "==": OP_EQ,
+    "!=": OP_NE,
+    ">": OP_GT,
+    ">=": OP_GE,
+    "<": OP_LT,
+    "<=": OP_LE,
+    "in": OP_IN,
+    "not_in": OP_NOT_IN,
+    "contains": OP_CONTAINS,
+    "not_contains": OP_NOT_CONTAINS,
+    "starts_with": OP_STARTS_WITH,
+    "ends_with": OP_ENDS_WITH,
+    "and": OP_AND,
+    "AND": OP_AND,
+    "or": OP_OR,
+    "OR": OP_OR
+}
+
+# 범위 비교 연산자 코드
+RANGE_OP_CODES = frozenset([OP_GT, OP_GE, OP_LT, OP_LE])
+
+
+class CompiledConditions:
+    """
+    조건 트리를 한 번의 순회로 평탄화한 중간 표현(IR)
+
+    - 모든 노드는 전위 순회(pre-order) 순서로 배열에 저장되며, 배열 인덱스 + 1이 글로벌 조건 번호입니다.
+    - 노드 i의 서브트리는 [i, end[i]) 구간에 연속으로 위치합니다.
+    - 자식 노드는 c = i + 1 부터 c = end[c] 로 건너뛰며 순회합니다.
+    """
+
+    __slots__ = (
+        "size", "fields", "field_ids", "field_names", "operators", "op_codes",
+        "values", "parent", "depth", "end", "logical", "postings", "roots"
+    )
+
+    def __init__(self):
+        self.size = 0
+        self.fields: List[str] = []           # 노드별 원본 필드명
+        self.field_ids: List[int] = []        # 노드별 필드 ID (field_names 인덱스, 필드가 없으면 -1)
+        self.field_names: List[str] = []      # 필드 ID -> 필드명
+        self.operators: List[str] = []        # 노드별 원본 연산자
+        self.op_codes: List[int] = []         # 노드별 연산자 코드
+        self.values: List[Any] = []           # 노드별 값
+        self.parent: List[int] = []           # 부모 노드 인덱스 (최상위는 -1)
+        self.depth: List[int] = []            # 노드 깊이 (최상위 = 1)
+        self.end: List[int] = []              # 서브트리 끝 (exclusive)
+        self.logical: List[Optional[str]] = []  # 하위 조건이 있는 노드의 논리 연산자 (AND/OR)
+        self.postings: Dict[str, List[int]] = {}  # 필드별 노드 인덱스 목록 (전위 순서)
+        self.roots: List[int] = []            # 최상위 조건 노드 인덱스
+
+    def has_children(self, index: int) -> bool:
+        """하위 조건 존재 여부"""
+        return self.end[index] > index + 1
+
+    def children(self, index: int) -> Iterator[int]:
+        """직계 하위 조건 인덱스 순회"""
+        child = index + 1
+        end = self.end[index]
+        while child < end:
+            yield child
+            child = self.end[child]
+
+    def location(self, index: int) -> str:
+        """조건 위치 문자열 (글로벌 조건 번호 기반)"""
+        return f"조건 {index + 1}"
+
+    def is_field_condition(self, index: int) -> bool:
+        """실제 필드를 가진 비교 조건인지 여부 (논리 연산자 블록 제외)"""
+        field = self.fields[index]
+        return bool(field) and field != "placeholder" and field.upper() not in ["AND", "OR", "GROUP"]
+
+    def group_logical(self, index: int) -> str:
+        """그룹 노드의 논리 연산자 (operator가 AND/OR가 아니면 field의 AND/OR 라벨, 그것도 아니면 AND)"""
+        if self.logical[index] is not None:
+            return self.logical[index]
+        field = (self.fields[index] or "").upper()
+        return field if field in ("AND", "OR") else "AND"
+
+    @property
+    def max_depth(self) -> int:
+        """조건 트리의 최대 깊이 (조건이 없으면 1)"""
+        return max(self.depth) if self.depth else 1
+
+
+def compile_conditions(conditions: List[RuleCondition]) -> CompiledConditions:
+    """조건 트리를 한 번 순회하여 CompiledConditions 생성"""
+    ir = CompiledConditions()
+    field_index: Dict[str, int] = {}
+
+    # 재귀 대신 명시적 스택 사용 - (조건, 부모 인덱스, 깊이)
+    stack = [(condition, -1, 1) for condition in reversed(conditions or [])]
+    # 서브트리 끝 계산을 위한 열린 노드 스택
+    open_nodes: List[int] = []
+
+    while stack:
+        condition, parent, depth = stack.pop()
+        index = ir.size
+        ir.size += 1
+
+        # 현재 노드의 부모 체인에 속하지 않는 열린 노드는 닫음
+        while open_nodes and open_nodes[-1] != parent:
+            ir.end[open_nodes.pop()] = index
+
+        field = condition.field
+        operator = condition.operator
+        ir.fields.append(field)
+        ir.operators.append(operator)
+        ir.op_codes.append(OPERATOR_CODES.get(operator, OP_UNKNOWN))
+        ir.values.append(condition.value)
+        ir.parent.append(parent)
+        ir.depth.append(depth)
+        ir.end.append(index + 1)
+
+        if field:
+            field_id = field_index.get(field)
+            if field_id is None:
+                field_id = len(ir.field_names)
+                field_index[field] = field_id
+                ir.field_names.append(field)
+                ir.postings[field] = []
+            ir.postings[field].append(index)
+            ir.field_ids.append(field_id)
+        else:
+            ir.field_ids.append(-1)
+
+        if parent == -1:
+            ir.roots.append(index)
+
+        if condition.conditions:
+            upper = operator.upper() if operator else None
+            ir.logical.append(upper if upper in ("AND", "OR") else None)
+            open_nodes.append(index)
+            for child in reversed(condition.conditions):
+                stack.append((child, index, depth + 1))
+        else:
+            ir.logical.append(None)
+
+    # 남은 열린 노드는 전체 끝에서 닫음
+    while open_nodes:
+        ir.end[open_nodes.pop()] = ir.size
+
+    return ir
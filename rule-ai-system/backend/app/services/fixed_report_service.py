@@ -1,15 +1,22 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import json
-from app.services.llm_service import LLMService
+from app.services.llm_service import LLMService, get_llm_service
 from app.models.validation_result import ValidationResult, ConditionIssue
 from app.models.rule import Rule
+from app.services.report_markdown import build_issue_section, issue_type_name
+
+# 리포트 생성 방식
+# - fast: ValidationResult만으로 템플릿 리포트 생성 (LLM 호출 없음)
+# - hybrid: 템플릿 리포트 + LLM이 작성한 짧은 총평
+# - llm: LLM이 리포트 전체를 작성하고 후처리로 수치 보정
+REPORT_MODES = ("fast", "hybrid", "llm")
 
 class RuleReportService:
     """Service for generating rule analysis reports"""
 
-    def __init__(self):
-        """Initialize rule report service with LLM service"""
-        self.llm_service = LLMService()
+    def __init__(self, llm_service: Optional[LLMService] = None):
+        """Initialize rule report service with LLM service (기본값: 앱 공유 인스턴스)"""
+        self.llm_service = llm_service or get_llm_service()
 
     async def generate_report(self, rule: Rule, validation_result: ValidationResult) -> Dict[str, Any]:
         """룰에 대한 상세 리포트 생성"""
@@ -30,3 +37,172 @@ class RuleReportService:
             # LLM 서비스 호출 실패 시 대체 리포트 생성
             return self._generate_fallback_report(rule, validation_result)
 
+
+class TemplateReportRenderer:
+    """
+    ValidationResult만으로 리포트를 만드는 템플릿 렌더러
+
+    - 기본 정보, 조건 구조, 이슈 요약, 필드별 이슈 목록은 모두 분석 결과에서 그대로 가져오므로 LLM 없이 즉시 생성됩니다.
+    - 총평은 기본 문구를 쓰거나, narrative로 받은 문장(hybrid 모드의 LLM 응답)으로 대체합니다.
+    """
+
+    def render(self, rule_json: Dict[str, Any], validation_result: ValidationResult, narrative: Optional[str] = None) -> str:
+        """전체 리포트 (기본 정보 → 조건 구조 → 이슈 요약 → 이슈 유형별 상세 → 총평)"""
+        return self.body(rule_json, validation_result) + self.conclusion(validation_result, narrative)
+
+    def body(self, rule_json: Dict[str, Any], validation_result: ValidationResult) -> str:
+        """총평 앞까지의 리포트"""
+        return self.header(rule_json, validation_result) + self.issue_sections(validation_result)
+
+    def conclusion(self, validation_result: ValidationResult, narrative: Optional[str] = None) -> str:
+        """총평 섹션"""
+        text = narrative.strip() if narrative and narrative.strip() else self.recommendation(validation_result)
+        return f"## 📌 총평\n\n{text}\n"
+
+    def issue_sections(self, validation_result: ValidationResult) -> str:
+        """issue_counts 순서의 이슈 유형별 상세 (필드별 이슈 목록)"""
+        if not validation_result.issue_counts:
+            return "검출된 이슈가 없습니다.\n\n"
+
+        issues_by_type: Dict[str, List[ConditionIssue]] = {}
+        for issue in validation_result.issues:
+            # 그룹 연산자는 필드로 간주하지 않음
+            if issue.field and issue.field.upper() in ["OR", "AND", "GROUP"]:
+                continue
+            issues_by_type.setdefault(issue.issue_type, []).append(issue)
+
+        return "".join(
+            build_issue_section(issue_type_name(issue_type), count, issues_by_type.get(issue_type, []))
+            for issue_type, count in validation_result.issue_counts.items()
+        )
+
+    def recommendation(self, validation_result: ValidationResult) -> str:
+        """총평 문구"""
+        if validation_result.is_valid:
+            return "이 룰은 모든 검증을 통과했습니다. 바로 적용 가능합니다."
+        elif len([i for i in validation_result.issues if getattr(i, 'severity', '') == "error"]) > 0:
+            return "이 룰에는 수정이 필요한 오류가 있습니다. 위 내용을 참고하여 수정 후 다시 검증해주세요."
+        return "이 룰에는 경고만 있으므로 적용 가능합니다. 다만, 경고 사항을 검토하시면 더 나은 룰이 될 수 있습니다."
+
+    def top_level_operator(self, rule_json: Dict[str, Any]) -> str:
+        """최상위 연산자 판별"""
+        top_level_operator = "N/A"
+        conditions = rule_json.get("conditions", [])
+        if isinstance(conditions, dict):
+            # 앵커 패턴(객체 형태)인 경우
+            top_level_operator = conditions.get("operator", "N/A")
+        elif isinstance(conditions, list) and conditions:
+            # 배열 형태일 때는 첫 번째 조건이 group이면 해당 field를 최상위 연산자로 간주
+            if any(c.get("operator") == "group" for c in conditions if isinstance(c, dict)):
+                for condition in conditions:
+                    if isinstance(condition, dict) and condition.get("operator") == "group":
+                        top_level_operator = condition.get("field", "") 
+                        break
+            else:
+                # 모두 기본 조건일 경우 묵시적으로 AND로 간주
+                top_level_operator = "AND (묵시적)"
+        return top_level_operator
+
+    def structure_values(self, validation_result: ValidationResult) -> Tuple[int, int, int, List[str]]:
+        """구조 정보 추출 - (중첩 단계, 조건 노드 수, 필드 조건 수, 사용된 필드)"""
+        depth = 1
+        condition_node_count = 0
+        field_condition_count = 0
+        unique_fields = []
+        
+        if hasattr(validation_result, "structure"):
+            depth = validation_result.structure.depth
+            condition_node_count = getattr(validation_result.structure, "condition_node_count", 0)
+            field_condition_count = getattr(validation_result.structure, "field_condition_count", 0)
+            unique_fields = validation_result.structure.unique_fields
+            
+            # 이전 버전과의 호환성: condition_count를 condition_node_count로 사용
+            if condition_node_count == 0 and hasattr(validation_result.structure, "condition_count"):
+                condition_node_count = validation_result.structure.condition_count
+        return depth, condition_node_count, field_condition_count, unique_fields
+
+    def field_list_text(self, unique_fields: List[str]) -> str:
+        """사용된 필드 목록 생성 (연산자 제외)"""
+        # 필드명 매핑 정보 (가독성을 위한 설명 추가)
+        field_mappings = {
+            "MBL_ACT_MEM_PCNT": "무선 회선 수",
+            "ENTR_STUS_CD": "가입 상태",
+            "MRKT_CD": "마켓 코드",
+            "IOT_MEM_PCNT": "IoT 회선 수",
+            "AGE": "나이",
+            "USER_TYPE": "사용자 유형",
+            "SCORE": "점수",
+            "PROD_CD": "상품 코드"
+        }
+
+        field_list_text = ""
+        if unique_fields:
+            for field in unique_fields:
+                # AND, OR, GROUP 같은 연산자는 제외
+                if field and field.upper() not in ["OR", "AND", "GROUP"] and field != "placeholder":
+                    description = field_mappings.get(field, "")
+                    if description:
+                        field_list_text += f"  - {field} ({description})\n"
+                    else:
+                        field_list_text += f"  - {field}\n"
+        else:
+            field_list_text = "  없음\n"
+        return field_list_text
+
+    def header(
+        self,
+        rule_json: Dict[str, Any],
+        validation_result: ValidationResult,
+        condition_expression: str = "",
+        include_type_counts: bool = True
+    ) -> str:
+        """LLM 없이 분석 결과만으로 만드는 리포트 앞부분 (기본 정보, 조건 구조, 이슈 요약, 선택적으로 조건식)"""
+        rule_id = rule_json.get("ruleId", rule_json.get("id", "Unknown"))
+        rule_name = rule_json.get("name", "Unnamed Rule")
+        depth, condition_node_count, field_condition_count, unique_fields = self.structure_values(validation_result)
+        
+        issue_counts = validation_result.issue_counts or {}
+        if validation_result.is_valid:
+            issue_summary = "✅ 모든 검증을 통과했습니다."
+        elif issue_counts:
+            issue_summary = f"총 {len(issue_counts)}가지 유형의 오류, 총 {sum(issue_counts.values())}건 감지됨."
+        else:
+            issue_summary = "이슈 정보가 제공되지 않았습니다."
+        issue_lines = "".join(
+            f"- {issue_type_name(issue_type)}: {count}건\n"
+            for issue_type, count in issue_counts.items()
+        ) if include_type_counts else ""
+        expression_block = f"조건식 (번호 = 조건 위치):\n```\n{condition_expression}\n```\n\n" if condition_expression else ""
+        
+        return f"""# ✅ 룰 오류 검토 보고서
+
+## 📌 1. 기본 정보
+
+| 항목 | 내용 |
+|------|------|
+| 룰 ID | {rule_id} |
+| 룰명 | {rule_name} |
+| 우선순위 | {rule_json.get("priority", "N/A")} |
+| 설명 | {rule_json.get("description", "설명 없음")} |
+
+## 🧠 2. 조건 구조 요약
+
+| 항목 | 내용 |
+|------|------|
+| 최상위 연산자 | {self.top_level_operator(rule_json)} |
+| 중첩 단계 | {depth} |
+| 조건 총 개수 | {condition_node_count} |
+| 필드 조건 수 | {field_condition_count} |
+| 사용된 필드 목록 | {len(unique_fields)}개 필드 |
+
+사용된 필드:
+{self.field_list_text(unique_fields)}
+{expression_block}## ⚠️ 3. 검출된 이슈 요약
+
+**이슈 요약:** {issue_summary}
+{issue_lines}
+"""
+
+
+# 앱 전체에서 공유하는 템플릿 렌더러 (상태 없음)
+template_report_renderer = TemplateReportRenderer()
@@ -0,0 +1,422 @@
+import math
+from typing import Dict, List, Any, Optional, Tuple
+from app.services.condition_ir import CompiledConditions
+
+NEG_INF = float("-inf")
+POS_INF = float("inf")
+
+
+def is_number(value: Any) -> bool:
+    """
+    유한한 숫자 값 여부 (bool 제외)
+
+    - JSON의 1e999 같은 값은 inf로 파싱되므로 숫자가 아닌 값처럼 구간 검사에서 제외합니다.
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    return isinstance(value, int) or math.isfinite(value)
+
+
+class Interval:
+    """숫자 구간 (경계 포함 여부를 함께 저장)"""
+
+    __slots__ = ("lo", "lo_inclusive", "hi", "hi_inclusive")
+
+    def __init__(self, lo: float = NEG_INF, lo_inclusive: bool = False, hi: float = POS_INF, hi_inclusive: bool = False):
+        self.lo = lo
+        self.lo_inclusive = lo_inclusive and lo != NEG_INF
+        self.hi = hi
+        self.hi_inclusive = hi_inclusive and hi != POS_INF
+
+    def is_empty(self) -> bool:
+        """빈 구간 여부"""
+        if self.lo > self.hi:
+            return True
+        return self.lo == self.hi and not (self.lo_inclusive and self.hi_inclusive)
+
+    def intersect(self, other: "Interval") -> "Interval":
+        """두 구간의 교집합"""
+        if self.lo > other.lo or (self.lo == other.lo and not self.lo_inclusive):
+            lo, lo_inclusive = self.lo, self.lo_inclusive
+        else:
+            lo, lo_inclusive = other.lo, other.lo_inclusive
+        if self.hi < other.hi or (self.hi == other.hi and not self.hi_inclusive):
+            hi, hi_inclusive = self.hi, self.hi_inclusive
+        else:
+            hi, hi_inclusive = other.hi, other.hi_inclusive
+        return Interval(lo, lo_inclusive, hi, hi_inclusive)
+
+    def overlaps(self, other: "Interval") -> bool:
+        """두 구간이 겹치는지 여부"""
+        return not self.intersect(other).is_empty()
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Interval) and (self.lo, self.lo_inclusive, self.hi, self.hi_inclusive) == (other.lo, other.lo_inclusive, other.hi, other.hi_inclusive)
+
+    def __hash__(self) -> int:
+        return hash((self.lo, self.lo_inclusive, self.hi, self.hi_inclusive))
+
+    def __repr__(self) -> str:
+        left = "[" if self.lo_inclusive else "("
+        right = "]" if self.hi_inclusive else ")"
+        return f"{left}{self.lo}, {self.hi}{right}"
+
+
+def interval_from_comparison(operator: str, value: Any) -> Optional[Interval]:
+    """비교 조건을 구간으로 변환 (숫자 비교가 아니면 None)"""
+    if not is_number(value):
+        return None
+    if operator == "==":
+        return Interval(value, True, value, True)
+    if operator == ">":
+        return Interval(lo=value, lo_inclusive=False)
+    if operator == ">=":
+        return Interval(lo=value, lo_inclusive=True)
+    if operator == "<":
+        return Interval(hi=value, hi_inclusive=False)
+    if operator == "<=":
+        return Interval(hi=value, hi_inclusive=True)
+    return None
+
+
+class Conflict:
+    """AND 그룹 내에서 동시에 만족할 수 없는 최소 조건 집합"""
+
+    __slots__ = ("field", "indices", "kind", "values")
+
+    def __init__(self, field: str, indices: List[int], kind: str, values: Dict[str, Any]):
+        self.field = field
+        self.indices = sorted(indices)  # IR 노드 인덱스
+        self.kind = kind                # range / equality / not_equal / point_excluded
+        self.values = values            # 설명 생성을 위한 연산자/값 정보
+
+
+class _FieldState:
+    """AND 그룹에서 한 필드에 누적된 제약 (변경 시 새 객체로 교체하여 되돌리기 지원)"""
+
+    __slots__ = ("lo", "lo_inclusive", "lo_src", "hi", "hi_inclusive", "hi_src", "eq_src", "dead")
+
+    def __init__(self):
+        self.lo = NEG_INF
+        self.lo_inclusive = False
+        self.lo_src = -1
+        self.hi = POS_INF
+        self.hi_inclusive = False
+        self.hi_src = -1
+        self.eq_src = -1
+        self.dead = False
+
+    def copy(self) -> "_FieldState":
+        state = _FieldState()
+        state.lo, state.lo_inclusive, state.lo_src = self.lo, self.lo_inclusive, self.lo_src
+        state.hi, state.hi_inclusive, state.hi_src = self.hi, self.hi_inclusive, self.hi_src
+        state.eq_src = self.eq_src
+        state.dead = self.dead
+        return state
+
+
+def _value_key(value: Any) -> Any:
+    """같음/같지 않음 비교용 정규화 키"""
+    if is_number(value):
+        return ("n", float(value))
+    return ("s", str(value))
+
+
+def _same_value(value1: Any, value2: Any) -> bool:
+    """두 == 조건 값이 같은 값을 가리키는지 여부"""
+    if is_number(value1) and is_number(value2):
+        return value1 == value2
+    return type(value1) is type(value2) and value1 == value2
+
+
+class ContradictionEngine:
+    """
+    필드별 제약 폴딩 기반 모순 검출기
+
+    - AND(및 묵시적 AND) 그룹 단위로 조건을 누적하며, OR 분기는 각각 별도 그룹으로 상위 제약을 상속합니다.
+    - 숫자 비교(>, >=, <, <=, ==)는 하한/상한 구간으로, ==/!= 는 값 집합으로 접어 빈 교집합을 즉시 검출합니다.
+    - 분기 종료 시 변경 기록(trail)을 되돌려 상태를 복원하므로 전체 비용은 조건 수에 선형입니다.
+    """
+
+    def __init__(self, ir: CompiledConditions):
+        self.ir = ir
+        self.conflicts: List[Conflict] = []
+        self._states: Dict[str, _FieldState] = {}
+        self._not_equal: Dict[Tuple[str, Any], int] = {}
+        self._trail: List[Tuple[str, Any, Any]] = []
+        self._seen = set()
+
+    def run(self) -> List[Conflict]:
+        """모든 AND 그룹을 검사하여 모순 목록 반환"""
+        ir = self.ir
+        # (그룹 구성 노드 목록, 되돌릴 trail 위치) - 명시적 스택으로 분기 처리
+        stack: List[Tuple[Optional[List[int]], int]] = [(list(ir.roots), -1)]
+        while stack:
+            members, mark = stack.pop()
+            if members is None:
+                self._undo(mark)
+                continue
+
+            # 그룹에 직접 결합된(AND 경로로 연결된) 조건을 먼저 모두 누적
+            branches: List[int] = []
+            pending = list(reversed(members))
+            while pending:
+                index = pending.pop()
+                if ir.has_children(index):
+                    if ir.logical[index] == "OR":
+                        branches.append(index)
+                    else:
+                        pending.extend(reversed(list(ir.children(index))))
+                elif ir.is_field_condition(index):
+                    self._add(index)
+
+            # OR 분기는 현재 상태를 상속한 별도 그룹으로 처리
+            for or_index in reversed(branches):
+                for child in reversed(list(ir.children(or_index))):
+                    stack.append((None, len(self._trail)))
+                    stack.append(([child], -1))
+        return self.conflicts
+
+    def _undo(self, mark: int) -> None:
+        while len(self._trail) > mark:
+            kind, key, old = self._trail.pop()
+            target = self._states if kind == "state" else self._not_equal
+            if old is None:
+                target.pop(key, None)
+            else:
+                target[key] = old
+
+    def _set_state(self, field: str, state: _FieldState) -> None:
+        self._trail.append(("state", field, self._states.get(field)))
+        self._states[field] = state
+
+    def _report(self, field: str, indices: List[int], kind: str, **values: Any) -> None:
+        key = (field, frozenset(indices))
+        if key not in self._seen:
+            self._seen.add(key)
+            self.conflicts.append(Conflict(field, indices, kind, values))
+        # 모순이 확인된 필드는 현재 분기에서 더 이상 검사하지 않음 (연쇄 보고 방지)
+        state = self._states[field].copy()
+        state.dead = True
+        self._set_state(field, state)
+
+    def _add(self, index: int) -> None:
+        ir = self.ir
+        field = ir.fields[index]
+        operator = ir.operators[index]
+        value = ir.values[index]
+        if operator not in ("==", "!=", ">", ">=", "<", "<="):
+            return
+        if isinstance(value, (list, dict)):
+            return
+
+        current = self._states.get(field)
+        if current is None:
+            current = _FieldState()
+            self._set_state(field, current)
+        if current.dead:
+            return
+
+        if operator == "==":
+            self._add_equal(field, index, value, current)
+        elif operator == "!=":
+            self._add_not_equal(field, index, value, current)
+        elif is_number(value):
+            self._add_bound(field, index, operator, value, current)
+
+    def _add_equal(self, field: str, index: int, value: Any, current: _FieldState) -> None:
+        ir = self.ir
+        if current.eq_src != -1:
+            eq_value = ir.values[current.eq_src]
+            if not _same_value(eq_value, value):
+                self._report(field, [current.eq_src, index], "equality", value1=eq_value, value2=value)
+            return
+
+        ne_src = self._not_equal.get((field, _value_key(value)))
+        if ne_src is not None:
+            self._report(field, [ne_src, index], "not_equal", value=value)
+            return
+
+        if is_number(value):
+            violated = self._violated_bound(current, value)
+            if violated != -1:
+                self._report(field, [violated, index], "equal_bound", value=value,
+                             bound_operator=ir.operators[violated], bound_value=ir.values[violated])
+                return
+
+        state = current.copy()
+        state.eq_src = index
+        self._set_state(field, state)
+
+    def _add_not_equal(self, field: str, index: int, value: Any, current: _FieldState) -> None:
+        ir = self.ir
+        key = _value_key(value)
+        if current.eq_src != -1 and _value_key(ir.values[current.eq_src]) == key:
+            self._report(field, [current.eq_src, index], "not_equal", value=value)
+            return
+
+        # 구간이 한 점으로 좁혀진 상태에서 그 점을 제외하는 경우
+        if is_number(value) and current.lo == current.hi == value and current.lo_inclusive and current.hi_inclusive:
+            self._report(field, [current.lo_src, current.hi_src, index], "point_excluded", value=value)
+            return
+
+        if (field, key) not in self._not_equal:
+            self._trail.append(("not_equal", (field, key), None))
+            self._not_equal[(field, key)] = index
+
+    def _add_bound(self, field: str, index: int, operator: str, value: Any, current: _FieldState) -> None:
+        ir = self.ir
+        state = current.copy()
+        if operator in (">", ">="):
+            inclusive = operator == ">="
+            # 더 좁은 하한만 반영
+            if value < state.lo or (value == state.lo and (inclusive or not state.lo_inclusive)):
+                return
+            state.lo, state.lo_inclusive, state.lo_src = value, inclusive, index
+        else:
+            inclusive = operator == "<="
+            # 더 좁은 상한만 반영
+            if value > state.hi or (value == state.hi and (inclusive or not state.hi_inclusive)):
+                return
+            state.hi, state.hi_inclusive, state.hi_src = value, inclusive, index
+
+        if Interval(state.lo, state.lo_inclusive, state.hi, state.hi_inclusive).is_empty():
+            self._report(field, [state.lo_src, state.hi_src], "range",
+                         lower_operator=ir.operators[state.lo_src], lower_value=state.lo,
+                         upper_operator=ir.operators[state.hi_src], upper_value=state.hi)
+            return
+
+        if state.eq_src != -1 and is_number(ir.values[state.eq_src]):
+            eq_value = ir.values[state.eq_src]
+            if self._violated_bound(state, eq_value) == index:
+                self._report(field, [state.eq_src, index], "equal_bound", value=eq_value,
+                             bound_operator=operator, bound_value=value)
+                return
+
+        if state.lo == state.hi and state.lo_inclusive and state.hi_inclusive:
+            ne_src = self._not_equal.get((field, _value_key(state.lo)))
+            if ne_src is not None:
+                self._report(field, [state.lo_src, state.hi_src, ne_src], "point_excluded", value=state.lo)
+                return
+
+        self._set_state(field, state)
+
+    def _violated_bound(self, state: _FieldState, value: Any) -> int:
+        """값이 벗어나는 경계 조건의 인덱스 (없으면 -1)"""
+        if state.lo_src != -1 and (value < state.lo or (value == state.lo and not state.lo_inclusive)):
+            return state.lo_src
+        if state.hi_src != -1 and (value > state.hi or (value == state.hi and not state.hi_inclusive)):
+            return state.hi_src
+        return -1
+
+
+def find_contradictions(ir: CompiledConditions) -> List[Conflict]:
+    """IR 전체에서 AND 그룹별 모순 조건 집합 검출"""
+    return ContradictionEngine(ir).run()
+
+
+def _start_position(interval: Interval) -> Tuple[float, int]:
+    """스윕 라인 상의 시작 위치 (열린 경계는 해당 값 바로 뒤)"""
+    return (interval.lo, 0 if interval.lo_inclusive or interval.lo == NEG_INF else 1)
+
+
+def _end_position(interval: Interval) -> Tuple[float, int]:
+    """스윕 라인 상의 끝 위치 (열린 경계는 해당 값 바로 앞)"""
+    return (interval.hi, 0 if interval.hi_inclusive or interval.hi == POS_INF else -1)
+
+
+def find_overlaps(items: List[Tuple[Any, Interval]]) -> List[Tuple[Any, Any, Interval]]:
+    """
+    정렬된 끝점 스윕으로 서로 겹치는 모든 구간 쌍 검출 - O(n log n + k)
+
+    Args:
+        items: (키, 구간) 목록
+
+    Returns:
+        (키1, 키2, 겹치는 구간) 목록 - 키1은 입력 순서상 앞선 항목
+    """
+    events = []
+    for order, (_, interval) in enumerate(items):
+        if interval.is_empty():
+            continue
+        # 같은 위치에서는 시작 이벤트(0)를 끝 이벤트(1)보다 먼저 처리하여 경계가 닿는 닫힌 구간도 겹침으로 판단
+        events.append((_start_position(interval), 0, order))
+        events.append((_end_position(interval), 1, order))
+    events.sort()
+
+    overlaps = []
+    active: Dict[int, Interval] = {}
+    for _, kind, order in events:
+        if kind == 1:
+            active.pop(order, None)
+            continue
+        key, interval = items[order]
+        for other_order, other_interval in active.items():
+            first, second = (other_order, order) if other_order < order else (order, other_order)
+            overlaps.append((items[first][0], items[second][0], interval.intersect(other_interval)))
+        active[order] = interval
+    return overlaps
+
+
+class IntervalTree:
+    """
+    정적 구간 트리 - 시작 위치로 정렬한 배열 위의 암묵적 균형 이진 트리
+
+    - 각 노드(구간 [lo, hi)의 중앙 원소)에 서브트리 구간의 최대 끝 위치를 보관합니다.
+    - 질의 구간보다 먼저 끝나는 서브트리와 질의 구간 뒤에서 시작하는 오른쪽 서브트리는 건너뛰므로 O(log n + k)입니다.
+    """
+
+    def __init__(self, items: List[Tuple[Any, Interval]]):
+        self.items = sorted((item for item in items if not item[1].is_empty()), key=lambda item: _start_position(item[1]))
+        self._starts = [_start_position(interval) for _, interval in self.items]
+        self._ends = [_end_position(interval) for _, interval in self.items]
+        self._max_end: List[Tuple[float, int]] = list(self._ends)
+        # 하위 노드부터 최대 끝 위치 계산 - (lo, hi, 자식 처리 여부) 명시적 스택
+        stack = [(0, len(self.items), False)]
+        while stack:
+            lo, hi, ready = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if not ready:
+                stack.append((lo, hi, True))
+                stack.append((lo, mid, False))
+                stack.append((mid + 1, hi, False))
+                continue
+            best = self._ends[mid]
+            if lo < mid:
+                best = max(best, self._max_end[(lo + mid) // 2])
+            if mid + 1 < hi:
+                best = max(best, self._max_end[(mid + 1 + hi) // 2])
+            self._max_end[mid] = best
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def query(self, interval: Interval) -> List[Any]:
+        """질의 구간과 겹치는 항목의 키 목록"""
+        if interval.is_empty():
+            return []
+        start, end = _start_position(interval), _end_position(interval)
+        result = []
+        stack = [(0, len(self.items))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            # 서브트리의 모든 구간이 질의 시작 전에 끝남
+            if self._max_end[mid] < start:
+                continue
+            stack.append((lo, mid))
+            # 중앙 원소가 질의 끝 뒤에서 시작하면 오른쪽 서브트리도 모두 뒤에서 시작
+            if self._starts[mid] > end:
+                continue
+            if self._ends[mid] >= start:
+                result.append(self.items[mid][0])
+            stack.append((mid + 1, hi))
+        return result
+
+    def stab(self, value: Any) -> List[Any]:
+        """값을 포함하는 항목의 키 목록"""
+        return self.query(Interval(value, True, value, True))
@@ -0,0 +1,131 @@
+import copy
+from typing import Any, Dict, List, Tuple
+
+
+class JsonPatchError(ValueError):
+    """JSON Patch 적용 오류 (잘못된 연산, 없는 경로, test 실패)"""
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """JSON Pointer (RFC 6901) 를 토큰 목록으로 변환 (~1 → /, ~0 → ~)"""
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchError(f"잘못된 JSON Pointer: {pointer}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _list_index(container: List[Any], token: str, allow_end: bool) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise JsonPatchError(f"잘못된 배열 인덱스: {token}")
+    index = int(token)
+    limit = len(container) if allow_end else len(container) - 1
+    if index > limit:
+        raise JsonPatchError(f"배열 인덱스 범위 초과: {token}")
+    return index
+
+
+def _resolve(document: Any, tokens: List[str]) -> Any:
+    current = document
+    for token in tokens:
+        if isinstance(current, dict):
+            if token not in current:
+                raise JsonPatchError(f"경로를 찾을 수 없습니다: {token}")
+            current = current[token]
+        elif isinstance(current, list):
+            current = current[_list_index(current, token, allow_end=False)]
+        else:
+            raise JsonPatchError(f"경로를 찾을 수 없습니다: {token}")
+    return current
+
+
+def _json_equal(left: Any, right: Any) -> bool:
+    """JSON 값 비교 - 파이썬과 달리 true와 1은 다른 값으로 봄"""
+    if isinstance(left, bool) or isinstance(right, bool):
+        return type(left) is type(right) and left == right
+    if isinstance(left, dict) and isinstance(right, dict):
+        return left.keys() == right.keys() and all(_json_equal(left[key], right[key]) for key in left)
+    if isinstance(left, list) and isinstance(right, list):
+        return len(left) == len(right) and all(_json_equal(a, b) for a, b in zip(left, right))
+    return left == right
+
+
+def _parent(document: Any, pointer: str) -> Tuple[Any, str]:
+    tokens = parse_pointer(pointer)
+    if not tokens:
+        raise JsonPatchError("문서 루트는 이 연산의 대상이 될 수 없습니다")
+    return _resolve(document, tokens[:-1]), tokens[-1]
+
+
+def _add(document: Any, pointer: str, value: Any) -> Any:
+    if pointer == "":
+        return value
+    parent, token = _parent(document, pointer)
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_list_index(parent, token, allow_end=True), value)
+    else:
+        raise JsonPatchError(f"값을 추가할 수 없는 경로입니다: {pointer}")
+    return document
+
+
+def _remove(document: Any, pointer: str) -> Any:
+    parent, token = _parent(document, pointer)
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JsonPatchError(f"경로를 찾을 수 없습니다: {pointer}")
+        return parent.pop(token)
+    if isinstance(parent, list):
+        return parent.pop(_list_index(parent, token, allow_end=False))
+    raise JsonPatchError(f"경로를 찾을 수 없습니다: {pointer}")
+
+
+def apply_patch(document: Any, operations: List[Dict[str, Any]]) -> Any:
+    """
+    JSON Patch (RFC 6902) 적용 - 원본은 그대로 두고 패치된 사본을 반환
+
+    - 지원 연산: add, remove, replace, move, copy, test
+    - 연산 하나라도 실패하면 JsonPatchError (사본에만 적용하므로 부분 적용 상태가 남지 않음)
+    """
+    result = copy.deepcopy(document)
+    for position, operation in enumerate(operations):
+        if not isinstance(operation, dict):
+            raise JsonPatchError(f"연산 {position + 1}: 객체가 아닙니다")
+        op = operation.get("op")
+        path = operation.get("path")
+        if not isinstance(path, str):
+            raise JsonPatchError(f"연산 {position + 1}: path가 없습니다")
+        try:
+            if op in ("add", "replace", "test") and "value" not in operation:
+                raise JsonPatchError("value가 없습니다")
+            if op in ("move", "copy") and not isinstance(operation.get("from"), str):
+                raise JsonPatchError("from이 없습니다")
+
+            if op == "add":
+                result = _add(result, path, copy.deepcopy(operation["value"]))
+            elif op == "remove":
+                _remove(result, path)
+            elif op == "replace":
+                if path == "":
+                    result = copy.deepcopy(operation["value"])
+                else:
+                    _remove(result, path)
+                    result = _add(result, path, copy.deepcopy(operation["value"]))
+            elif op == "move":
+                source = operation["from"]
+                if path != source and path.startswith(source + "/"):
+                    raise JsonPatchError("값을 자기 하위 경로로 옮길 수 없습니다")
+                result = _add(result, path, _remove(result, source))
+            elif op == "copy":
+                result = _add(result, path, copy.deepcopy(_resolve(result, parse_pointer(operation["from"]))))
+            elif op == "test":
+                if not _json_equal(_resolve(result, parse_pointer(path)), operation["value"]):
+                    raise JsonPatchError("test 실패")
+            else:
+                raise JsonPatchError(f"지원하지 않는 연산입니다: {op}")
+        except JsonPatchError as e:
+            raise JsonPatchError(f"연산 {position + 1} ({op} {path}): {str(e)}") from None
+    return result
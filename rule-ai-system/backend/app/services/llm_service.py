@@ -1,83 +1,213 @@
+import asyncio
 import json
+import logging
 import os
-from typing import Dict, Any, List, Optional
-from openai import OpenAI
+from time import perf_counter
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
+import httpx
+from openai import AsyncOpenAI
 from app.config import settings
+from app.services.metrics import metrics, record_llm_call
+from app.services.prompt_encoding import estimate_tokens
+
+logger = logging.getLogger(__name__)
 
 class LLMService:
-    """Service for interacting with LLM"""
+    """
+    Service for interacting with LLM
+    
+    - 비동기 OpenAI 클라이언트와 공유 HTTP 연결 풀을 사용하므로 앱 수명 동안 하나의 인스턴스를 재사용합니다.
+    - 동시 호출 수는 세마포어로 제한하고, 호출마다 타임아웃을 지정할 수 있습니다.
+    """
     
     def __init__(self):
         """Initialize LLM service with API key from settings"""
+        self._semaphore = asyncio.Semaphore(max(1, settings.LLM_MAX_CONCURRENCY))
+        self.timeout = settings.LLM_TIMEOUT_SECONDS
         try:
             api_key = os.environ.get("OPENAI_API_KEY") or settings.OPENAI_API_KEY
             if not api_key:
-                print("경고: OpenAI API 키가 설정되어 있지 않습니다. 대체 응답 모드로 작동합니다.")
+                logger.warning("OpenAI API 키가 설정되어 있지 않습니다. 대체 응답 모드로 작동합니다.")
                 self.client = None
                 self.model = None
                 self.fake_mode = True
                 return
                 
             elif api_key.startswith("sk-your-") or api_key == "sk-your-valid-openai-api-key":
-                print("경고: 기본 OpenAI API 키가 변경되지 않았습니다. 대체 응답 모드로 작동합니다.")
+                logger.warning("기본 OpenAI API 키가 변경되지 않았습니다. 대체 응답 모드로 작동합니다.")
                 self.client = None
                 self.model = None
                 self.fake_mode = True
                 return
             
-            self.client = OpenAI(api_key=api_key)
+            # 모든 호출이 공유하는 HTTP 연결 풀
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.LLM_MAX_CONNECTIONS
+                ),
+                timeout=httpx.Timeout(self.timeout, connect=settings.LLM_CONNECT_TIMEOUT_SECONDS)
+            )
+            self.client = AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=settings.LLM_MAX_RETRIES)
             self.model = os.environ.get("LLM_MODEL") or settings.LLM_MODEL
             self.fake_mode = False
-            print(f"LLM 서비스 초기화 완료 - 사용 모델: {self.model}")
+            logger.info("LLM 서비스 초기화 완료 - 사용 모델: %s", self.model)
         except Exception as e:
-            print(f"LLM 서비스 초기화 오류: {str(e)}. 대체 응답 모드로 작동합니다.")
+            logger.warning("LLM 서비스 초기화 오류: %s. 대체 응답 모드로 작동합니다.", e)
             self.client = None
             self.model = None
             self.fake_mode = True
     
-    async def call_llm(self, prompt: str, system_message: str = None) -> str:
+    async def call_llm(self, prompt: str, system_message: str = None, timeout: Optional[float] = None) -> str:
         """
         Call LLM with prompt and optional system message
         
         Args:
             prompt: User prompt to send to LLM
             system_message: Optional system message for context
+            timeout: 이번 호출의 타임아웃(초), 없으면 LLM_TIMEOUT_SECONDS
             
         Returns:
             LLM response as string
         """
+        content, _ = await self.call_llm_with_status(prompt, system_message, timeout)
+        return content
+    
+    async def call_llm_with_status(self, prompt: str, system_message: str = None, timeout: Optional[float] = None) -> Tuple[str, bool]:
+        """
+        LLM 호출 결과와 실제 모델 응답 여부를 함께 반환
+        
+        Returns:
+            (응답 문자열, 모델 응답이면 True / 대체 응답이면 False)
+        """
         # API 키가 없거나 대체 모드인 경우
         if self.fake_mode:
-            return self._generate_fallback_response(prompt, system_message)
+            return self._generate_fallback_response(prompt, system_message), False
             
         try:
-            messages = []
-            
-            # 시스템 메시지 추가
-            if system_message:
-                messages.append({"role": "system", "content": system_message})
-                
-            # 사용자 프롬프트 추가
-            messages.append({"role": "user", "content": prompt})
-            
-            # ChatCompletion API 호출
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.1
-            )
+            return await self.complete(prompt, system_message, timeout), True
+        except Exception as e:
+            logger.warning("LLM API 호출 오류: %s. 대체 응답을 생성합니다.", e)
+            return self._generate_fallback_response(prompt, system_message), False
+    
+    async def complete(self, prompt: str, system_message: str = None, timeout: Optional[float] = None) -> str:
+        """
+        LLM API 호출 (오류 시 대체 응답 없이 예외 발생)
+        
+        Args:
+            prompt: User prompt to send to LLM
+            system_message: Optional system message for context
+            timeout: 이번 호출의 타임아웃(초), 없으면 LLM_TIMEOUT_SECONDS
             
-            # 응답 추출
-            content = response.choices[0].message.content
-            return content
+        Returns:
+            LLM response as string
+        """
+        if self.fake_mode:
+            raise RuntimeError("LLM 서비스가 대체 응답 모드입니다.")
         
+        messages = self._build_messages(prompt, system_message)
+        
+        # ChatCompletion API 호출 - 동시 호출 수 제한 (소요 시간은 슬롯을 얻은 뒤부터 측정)
+        async with self._semaphore:
+            started = perf_counter()
+            usage = None
+            outcome = "error"
+            try:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.1,
+                    timeout=timeout or self.timeout
+                )
+                usage = getattr(response, "usage", None)
+                outcome = "ok"
+            finally:
+                record_llm_call(
+                    "complete", outcome, perf_counter() - started,
+                    usage.prompt_tokens if usage else None,
+                    usage.completion_tokens if usage else None
+                )
+        
+        # 응답 추출
+        content = response.choices[0].message.content
+        return content
+    
+    async def stream(self, prompt: str, system_message: str = None, timeout: Optional[float] = None) -> AsyncIterator[str]:
+        """
+        LLM 응답을 토큰 조각 단위로 스트리밍
+        
+        - 대체 모드이거나 첫 조각 전에 오류가 나면 대체 응답을 한 번에 전달합니다.
+        - 일부 조각을 보낸 뒤 오류가 나면 그 시점에서 스트림을 끝냅니다.
+        - 스트리밍 응답에는 토큰 사용량이 없으므로 메트릭의 토큰 수는 estimate_tokens 추정치입니다.
+        
+        Args:
+            prompt: User prompt to send to LLM
+            system_message: Optional system message for context
+            timeout: 이번 호출의 타임아웃(초), 없으면 LLM_TIMEOUT_SECONDS
+        """
+        if self.fake_mode:
+            yield self._generate_fallback_response(prompt, system_message)
+            return
+        
+        messages = self._build_messages(prompt, system_message)
+        emitted = False
+        pieces: List[str] = []
+        started = None
+        # 소비자가 스트림을 끝까지 읽지 않고 닫으면 cancelled
+        outcome = "cancelled"
+        try:
+            # 스트림이 끝날 때까지 동시 호출 슬롯 점유
+            async with self._semaphore:
+                started = perf_counter()
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.1,
+                    timeout=timeout or self.timeout,
+                    stream=True
+                )
+                async for chunk in response:
+                    if not chunk.choices:
+                        continue
+                    content = chunk.choices[0].delta.content
+                    if content:
+                        emitted = True
+                        pieces.append(content)
+                        yield content
+            outcome = "ok"
         except Exception as e:
-            print(f"LLM API 호출 오류: {str(e)}. 대체 응답을 생성합니다.")
-            return self._generate_fallback_response(prompt, system_message)
+            outcome = "error"
+            logger.warning("LLM 스트리밍 오류: %s", e)
+            if not emitted:
+                yield self._generate_fallback_response(prompt, system_message)
+        finally:
+            if started is not None and metrics.enabled:
+                record_llm_call(
+                    "stream", outcome, perf_counter() - started,
+                    sum(estimate_tokens(message["content"]) for message in messages),
+                    estimate_tokens("".join(pieces))
+                )
+    
+    def _build_messages(self, prompt: str, system_message: str = None) -> List[Dict[str, str]]:
+        """ChatCompletion 메시지 목록 구성"""
+        messages = []
+            
+        # 시스템 메시지 추가
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+            
+        # 사용자 프롬프트 추가
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
+    async def close(self) -> None:
+        """HTTP 연결 풀 종료"""
+        if self.client is not None:
+            await self.client.close()
     
     def _generate_fallback_response(self, prompt: str, system_message: str = None) -> str:
         """API 호출 실패 시 대체 응답 생성"""
-        print("대체 응답 생성 중...")
+        logger.debug("대체 응답 생성 중...")
         
         # 프롬프트에 '리포트'가 포함되어 있는지 확인
         if "리포트" in prompt.lower() or "report" in prompt.lower():
@@ -133,5 +263,26 @@ OpenAI API 키가 설정되어 있지 않거나 유효하지 않습니다. 다
         try:
             return json.loads(json_str)
         except json.JSONDecodeError as e:
-            print(f"JSON 파싱 오류: {str(e)}, 응답: {response}")
-            raise Exception(f"LLM 응답을 JSON으로 파싱할 수 없습니다: {str(e)}") 
\ No newline at end of file
+            logger.warning("JSON 파싱 오류: %s", e)
+            logger.debug("JSON 파싱 실패 응답: %s", response)
+            raise Exception(f"LLM 응답을 JSON으로 파싱할 수 없습니다: {str(e)}") 
+
+
+# 앱 수명 동안 공유하는 LLM 서비스 (첫 사용 시 생성)
+_llm_service: Optional[LLMService] = None
+
+
+def get_llm_service() -> LLMService:
+    """공유 LLM 서비스 인스턴스 반환"""
+    global _llm_service
+    if _llm_service is None:
+        _llm_service = LLMService()
+    return _llm_service
+
+
+async def close_llm_service() -> None:
+    """공유 LLM 서비스 종료"""
+    global _llm_service
+    if _llm_service is not None:
+        await _llm_service.close()
+        _llm_service = None
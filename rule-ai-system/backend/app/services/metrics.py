@@ -0,0 +1,304 @@
+import logging
+import math
+import threading
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 초 단위 지연 시간 버킷 (분석 단계는 수십 µs, LLM 호출은 수십 초까지)
+LATENCY_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 룰 조건 노드 수 버킷
+SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+# 호출당 LLM 토큰 수 버킷
+TOKEN_BUCKETS = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+# 히스토그램에 아직 반영하지 않은 분석 기록 수 상한 (넘으면 기록할 때마다 가장 오래된 것 하나를 반영)
+PENDING_ANALYSES_LIMIT = 1024
+
+Labels = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Prometheus 텍스트 형식의 숫자"""
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n") for value in values)
+    return "{" + ",".join(f"{name}=\"{value}\"" for name, value in zip(names, escaped)) + "}"
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램 (레이블 값 조합별 시리즈)
+
+    - 관측 한 번은 버킷 이분 탐색과 락 안의 덧셈 세 번뿐입니다.
+    - 버킷 개수는 레이블 조합마다 고정이라 관측 수와 무관하게 메모리가 일정합니다.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float], label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self.label_names = tuple(label_names)
+        self._series: Dict[Labels, List] = {}
+        self._lock = threading.Lock()
+
+    def _observe_locked(self, value: float, labels: Labels) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            # [버킷별 개수(마지막은 +Inf), 합계, 개수]
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        with self._lock:
+            self._observe_locked(value, labels)
+
+    def observe_intervals(self, marks: Sequence[Tuple[str, float]]) -> None:
+        """
+        연속 시각 기록 [(시작 레이블, t0), (레이블1, t1), ...]의 구간(t1 - t0 ...)을 레이블별로 락 한 번에 기록
+
+        - 레이블이 하나인 히스토그램 전용입니다 (분석 단계 타이머 기록).
+        """
+        buckets = self.buckets
+        with self._lock:
+            previous = marks[0][1]
+            for label, at in marks[1:]:
+                value = at - previous
+                previous = at
+                labels = (label,)
+                series = self._series.get(labels)
+                if series is None:
+                    series = self._series[labels] = [[0] * (len(buckets) + 1), 0.0, 0]
+                series[0][bisect_left(buckets, value)] += 1
+                series[1] += value
+                series[2] += 1
+
+    def snapshot(self, labels: Labels = ()) -> Optional[Dict[str, float]]:
+        """레이블 조합 하나의 개수/합계 (관측이 없으면 None)"""
+        with self._lock:
+            series = self._series.get(labels)
+            return None if series is None else {"count": series[2], "sum": series[1]}
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((labels, list(counts), total, count) for labels, (counts, total, count) in self._series.items())
+        names = self.label_names + ("le",)
+        lines = []
+        for labels, counts, total, count in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(names, labels + (_format_value(bound),))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {count}")
+        return lines
+
+
+class Gauge:
+    """
+    수집 시점에 값을 읽는 게이지
+
+    - callback은 {레이블 값 조합: 값}을 반환하며 /metrics 요청 때만 호출됩니다.
+    - 다른 객체가 세고 있는 누적 값(캐시 적중 수 등)은 kind="counter"로 노출합니다.
+    """
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 callback: Optional[Callable[[], Dict[Labels, float]]] = None, kind: str = "gauge"):
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.callback = callback
+
+    def render(self) -> List[str]:
+        if self.callback is None:
+            return []
+        try:
+            values = self.callback()
+        except Exception as e:
+            logger.warning("메트릭 수집 오류 (%s): %s", self.name, e)
+            return []
+        return [f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}" for labels, value in sorted(values.items())]
+
+
+class StageTimer:
+    """
+    분석 단계 타이머 - 단계가 끝날 때마다 mark(단계명)를 호출
+
+    - mark는 (단계명, perf_counter 시각)을 리스트에 추가할 뿐이고, 구간 계산과 히스토그램 기록은
+      분석이 끝난 뒤 한 번에 합니다 (프로세스 풀 워커에서는 marks를 결과와 함께 부모로 전달).
+    - marks[0]은 시작 시각입니다.
+    """
+
+    __slots__ = ("marks", "size")
+
+    def __init__(self):
+        self.marks: List[Tuple[str, float]] = [("", perf_counter())]
+        self.size: Optional[int] = None
+
+    def mark(self, stage: str) -> None:
+        self.marks.append((stage, perf_counter()))
+
+
+class _NullStageTimer:
+    """수집이 꺼져 있을 때 쓰는 타이머 - 아무것도 하지 않음"""
+
+    __slots__ = ()
+    marks: Tuple = ()
+    size = None
+
+    def mark(self, stage: str) -> None:
+        pass
+
+    def __setattr__(self, name: str, value) -> None:
+        pass
+
+
+NULL_STAGE_TIMER = _NullStageTimer()
+
+
+class MetricsRegistry:
+    """
+    메트릭 모음과 Prometheus 텍스트 출력
+
+    - enabled가 False면 계측 지점은 관측을 건너뛰고 /metrics는 비활성화됩니다.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: List = []
+        self._collect_hooks: List[Callable[[], None]] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, buckets: Sequence[float], label_names: Sequence[str] = ()) -> Histogram:
+        return self.register(Histogram(name, documentation, buckets, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = (),
+              callback: Optional[Callable[[], Dict[Labels, float]]] = None, kind: str = "gauge") -> Gauge:
+        return self.register(Gauge(name, documentation, label_names, callback, kind))
+
+    def on_collect(self, hook: Callable[[], None]) -> None:
+        """출력 직전에 호출할 함수 등록 (미뤄 둔 관측 반영 등)"""
+        self._collect_hooks.append(hook)
+
+    def collect(self) -> None:
+        for hook in self._collect_hooks:
+            hook()
+
+    def stage_timer(self):
+        """분석 단계 타이머 (수집이 꺼져 있으면 비용 없는 빈 타이머)"""
+        return StageTimer() if self.enabled else NULL_STAGE_TIMER
+
+    @contextmanager
+    def timed(self, histogram: Histogram, labels: Labels = ()) -> Iterator[None]:
+        """블록 실행 시간 관측 (예외가 나도 기록)"""
+        if not self.enabled:
+            yield
+            return
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            histogram.observe(perf_counter() - started, labels)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식 (version 0.0.4)"""
+        self.collect()
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 앱 전체에서 공유하는 메트릭 (프로세스 풀 워커의 분석 단계 시간은 부모 프로세스에서 기록)
+metrics = MetricsRegistry(enabled=settings.METRICS_ENABLED)
+
+analyzer_stage_seconds = metrics.histogram(
+    "rule_analyzer_stage_seconds", "룰 분석 단계별 소요 시간(초)", LATENCY_BUCKETS, ("stage",)
+)
+rule_condition_nodes = metrics.histogram(
+    "rule_condition_nodes", "분석한 룰의 조건 노드 수", SIZE_BUCKETS
+)
+llm_request_seconds = metrics.histogram(
+    "rule_llm_request_seconds", "LLM 호출 소요 시간(초)", LATENCY_BUCKETS, ("operation", "outcome")
+)
+llm_tokens = metrics.histogram(
+    "rule_llm_tokens", "LLM 호출당 토큰 수 (스트리밍은 추정치)", TOKEN_BUCKETS, ("operation", "kind")
+)
+report_postprocess_seconds = metrics.histogram(
+    "rule_report_postprocess_seconds", "리포트 후처리 단계별 소요 시간(초)", LATENCY_BUCKETS, ("step",)
+)
+
+
+# 분석 요청 경로에서는 기록을 큐에 넣기만 하고, 히스토그램 반영은 /metrics 수집 때 몰아서 함
+_pending_analyses: deque = deque()
+
+
+def _fold_analysis(marks: Sequence[Tuple[str, float]], size: Optional[int]) -> None:
+    if len(marks) > 1:
+        analyzer_stage_seconds.observe_intervals(marks)
+    if size is not None:
+        rule_condition_nodes.observe(size)
+
+
+def flush_analyses() -> None:
+    """미뤄 둔 분석 기록을 히스토그램에 반영 (deque의 popleft는 스레드 안전)"""
+    while True:
+        try:
+            marks, size = _pending_analyses.popleft()
+        except IndexError:
+            return
+        _fold_analysis(marks, size)
+
+
+def record_analysis(marks: Sequence[Tuple[str, float]], size: Optional[int]) -> None:
+    """
+    룰 분석 한 번의 단계별 시간(StageTimer.marks)과 룰 크기 기록
+
+    - 요청 경로의 비용은 큐 추가 한 번입니다. 수집이 한동안 없어 큐가 상한을 넘으면
+      기록할 때마다 가장 오래된 기록 하나를 반영해 메모리를 일정하게 유지합니다.
+    """
+    if not metrics.enabled:
+        return
+    _pending_analyses.append((marks, size))
+    if len(_pending_analyses) > PENDING_ANALYSES_LIMIT:
+        try:
+            _fold_analysis(*_pending_analyses.popleft())
+        except IndexError:
+            pass
+
+
+metrics.on_collect(flush_analyses)
+
+
+def record_llm_call(operation: str, outcome: str, seconds: float,
+                    prompt_tokens: Optional[int] = None, completion_tokens: Optional[int] = None) -> None:
+    """LLM 호출 한 번의 소요 시간과 토큰 수 기록"""
+    if not metrics.enabled:
+        return
+    llm_request_seconds.observe(seconds, (operation, outcome))
+    if prompt_tokens is not None:
+        llm_tokens.observe(prompt_tokens, (operation, "prompt"))
+    if completion_tokens is not None:
+        llm_tokens.observe(completion_tokens, (operation, "completion"))
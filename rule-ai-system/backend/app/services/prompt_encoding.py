@@ -0,0 +1,126 @@
+import json
+from typing import Any, Callable, Dict, List, Optional
+from app.models.validation_result import ValidationResult
+
+# 그룹 노드로 취급하는 필드명 (리포트에서 필드로 보여주지 않음)
+GROUP_FIELDS = frozenset(["AND", "OR", "GROUP", "PLACEHOLDER"])
+
+# 토큰 예산을 넘을 때 차례로 적용하는 압축 단계
+# - low_severity_detail: 경고 등 error가 아닌 이슈의 설명을 유지할지 (False면 필드별 건수만)
+# - max_fields_per_type: 이슈 유형별로 보여줄 필드 수 (None이면 전부)
+# - expression_depth: 조건식을 펼칠 최대 깊이 (None이면 전부, 0이면 조건식 생략)
+ENCODING_LEVELS: List[Dict[str, Any]] = [
+    {"low_severity_detail": True, "max_fields_per_type": None, "expression_depth": None},
+    {"low_severity_detail": False, "max_fields_per_type": None, "expression_depth": None},
+    {"low_severity_detail": False, "max_fields_per_type": 5, "expression_depth": 3},
+    {"low_severity_detail": False, "max_fields_per_type": 2, "expression_depth": 1},
+    {"low_severity_detail": False, "max_fields_per_type": 1, "expression_depth": 0}
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    프롬프트 토큰 수 추정 (토크나이저 없이 쓰는 보수적 근사)
+
+    - ASCII 문자는 4자당 1토큰, 한글 등 그 외 문자는 1자당 1토큰으로 계산합니다.
+    """
+    ascii_count = len(text.encode("ascii", "ignore"))
+    return (ascii_count + 3) // 4 + (len(text) - ascii_count)
+
+
+def _group_label(condition: Dict[str, Any]) -> str:
+    """하위 조건을 가진 노드의 논리 연산자"""
+    operator = str(condition.get("operator") or "").upper()
+    if operator in ("AND", "OR"):
+        return operator
+    field = str(condition.get("field") or "").upper()
+    return field if field in ("AND", "OR") else "AND"
+
+
+def _count_nodes(condition: Dict[str, Any]) -> int:
+    """노드와 모든 하위 노드 수"""
+    return 1 + sum(_count_nodes(child) for child in condition.get("conditions") or [] if isinstance(child, dict))
+
+
+def render_conditions(conditions: List[Dict[str, Any]], max_depth: Optional[int] = None) -> str:
+    """
+    조건 트리를 들여쓴 논리식으로 표현
+
+    - 번호는 분석기의 조건 번호(전위 순서, 그룹 노드 포함)와 같아서 issues[].location과 바로 대응됩니다.
+    - null 값 키와 placeholder 필드는 표시하지 않고, max_depth보다 깊은 그룹은 생략한 노드 수로 대체합니다.
+    """
+    lines: List[str] = []
+    number = 0
+    # 재귀 대신 명시적 스택 사용 - (조건, 깊이)
+    stack = [(condition, 1) for condition in reversed(conditions or []) if isinstance(condition, dict)]
+    while stack:
+        condition, depth = stack.pop()
+        number += 1
+        indent = "  " * (depth - 1)
+        children = [child for child in condition.get("conditions") or [] if isinstance(child, dict)]
+        if children:
+            if max_depth is not None and depth >= max_depth:
+                hidden = _count_nodes(condition) - 1
+                lines.append(f"{indent}[{number}] {_group_label(condition)} (하위 조건 {hidden}개 생략)")
+                number += hidden
+                continue
+            lines.append(f"{indent}[{number}] {_group_label(condition)}")
+            for child in reversed(children):
+                stack.append((child, depth + 1))
+        else:
+            value = json.dumps(condition.get("value"), ensure_ascii=False)
+            lines.append(f"{indent}[{number}] {condition.get('field')} {condition.get('operator')} {value}")
+    return "\n".join(lines)
+
+
+def build_issue_digest(
+    validation_result: ValidationResult,
+    type_name: Callable[[str], str],
+    low_severity_detail: bool = True,
+    max_fields_per_type: Optional[int] = None
+) -> str:
+    """
+    이슈를 유형 → 필드 → 설명 순으로 묶은 요약
+
+    - 같은 필드의 같은 설명은 한 줄로 합치고 위치만 나열합니다.
+    - low_severity_detail이 False면 error가 아닌 이슈는 필드별 건수만 남깁니다.
+    """
+    # 유형 → 필드 → 설명 → 위치 목록 (삽입 순서 유지)
+    grouped: Dict[str, Dict[str, Dict[str, List[str]]]] = {}
+    low_counts: Dict[str, Dict[str, int]] = {}
+    type_totals: Dict[str, int] = {}
+    for issue in validation_result.issues:
+        type_totals[issue.issue_type] = type_totals.get(issue.issue_type, 0) + 1
+        # 그룹 연산자는 필드로 간주하지 않음
+        if issue.field and issue.field.upper() in GROUP_FIELDS:
+            continue
+        field = issue.field or "전체 룰"
+        by_field = grouped.setdefault(issue.issue_type, {})
+        if not low_severity_detail and issue.severity != "error":
+            type_counts = low_counts.setdefault(issue.issue_type, {})
+            type_counts[field] = type_counts.get(field, 0) + 1
+            by_field.setdefault(field, {})
+            continue
+        locations = by_field.setdefault(field, {}).setdefault(issue.explanation, [])
+        if issue.location and issue.location not in locations:
+            locations.append(issue.location)
+
+    # issue_counts 순서를 따르고, issues에만 있는 유형은 뒤에 붙임
+    issue_types = list(validation_result.issue_counts) + [t for t in grouped if t not in validation_result.issue_counts]
+    sections = []
+    for issue_type in issue_types:
+        count = validation_result.issue_counts.get(issue_type, type_totals.get(issue_type, 0))
+        lines = [f"### {type_name(issue_type)}: {count}건"]
+        fields = list(grouped.get(issue_type, {}).items())
+        shown = fields if max_fields_per_type is None else fields[:max_fields_per_type]
+        for field, explanations in shown:
+            low_count = low_counts.get(issue_type, {}).get(field)
+            if low_count:
+                lines.append(f"- {field}: 경고 {low_count}건 (상세 생략)")
+            for explanation, locations in explanations.items():
+                location_text = f" (위치: {' / '.join(locations)})" if locations else ""
+                lines.append(f"- {field}: {explanation}{location_text}")
+        if len(fields) > len(shown):
+            lines.append(f"- 외 {len(fields) - len(shown)}개 필드 생략")
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections)
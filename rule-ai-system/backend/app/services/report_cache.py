@@ -0,0 +1,157 @@
+import asyncio
+import os
+import sqlite3
+import time
+from threading import Lock
+from typing import Any, Dict, Optional
+from app.config import settings
+
+
+class ReportCache:
+    """
+    SQLite 기반 리포트 캐시 (재시작 후에도 유지)
+
+    - 키: 정규화 룰 해시 + ValidationResult 해시 + 모델명 + 프롬프트 버전
+    - TTL이 지난 항목은 조회 결과에서 빼고 저장 시 제거하며, 최대 건수를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    - 조회는 읽기만 합니다. 적중 시각(LRU 순서)은 메모리에 모았다가 저장/종료 시 또는 touch_batch건마다 한 번에 기록합니다.
+    - 이벤트 루프에서는 get_async/put_async를 사용합니다 (DB 작업을 스레드에서 실행).
+    - 항목 수는 연결/저장 시점에 세어 메모리에 두므로 stats()는 DB를 읽지 않고 락도 잡지 않습니다.
+    - DB 파일은 첫 사용 시점에 생성합니다.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = 7 * 24 * 3600, max_entries: int = 5000, touch_batch: int = 256):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.touch_batch = max(1, touch_batch)
+        self.hits = 0
+        self.misses = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._touched: Dict[str, float] = {}
+        self._size: Optional[int] = None
+        self._lock = Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS report_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    report TEXT NOT NULL,
+                    rule_id TEXT,
+                    rule_name TEXT,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_report_cache_accessed ON report_cache (accessed_at)")
+            connection.commit()
+            self._size = connection.execute("SELECT COUNT(*) FROM report_cache").fetchone()[0]
+            self._connection = connection
+        return self._connection
+
+    def _flush_touches(self, connection: sqlite3.Connection) -> None:
+        """모아 둔 적중 시각 기록 (커밋은 호출한 쪽에서)"""
+        if self._touched:
+            connection.executemany(
+                "UPDATE report_cache SET accessed_at = ? WHERE cache_key = ?",
+                [(accessed_at, cache_key) for cache_key, accessed_at in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 리포트 조회 (없거나 만료되면 None)"""
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT report, rule_id, rule_name, created_at FROM report_cache WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            report, rule_id, rule_name, created_at = row
+            if self.ttl_seconds > 0 and now - created_at > self.ttl_seconds:
+                # 만료 항목은 다음 저장 시 정리
+                self.misses += 1
+                return None
+            self._touched[cache_key] = now
+            if len(self._touched) >= self.touch_batch:
+                self._flush_touches(connection)
+                connection.commit()
+            self.hits += 1
+            return {"report": report, "rule_id": rule_id, "rule_name": rule_name}
+
+    async def get_async(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """get을 이벤트 루프 밖(스레드)에서 실행"""
+        return await asyncio.to_thread(self.get, cache_key)
+
+    def put(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """리포트 저장 후 만료/초과 항목 정리"""
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            # 최근 사용 순서를 반영한 뒤 초과 항목 정리
+            self._flush_touches(connection)
+            connection.execute(
+                "INSERT OR REPLACE INTO report_cache (cache_key, report, rule_id, rule_name, created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (cache_key, result["report"], result.get("rule_id"), result.get("rule_name"), now, now)
+            )
+            if self.ttl_seconds > 0:
+                connection.execute("DELETE FROM report_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+            if self.max_entries > 0:
+                connection.execute(
+                    """
+                    DELETE FROM report_cache WHERE cache_key IN (
+                        SELECT cache_key FROM report_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,)
+                )
+            connection.commit()
+            self._size = connection.execute("SELECT COUNT(*) FROM report_cache").fetchone()[0]
+
+    async def put_async(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """put을 이벤트 루프 밖(스레드)에서 실행"""
+        await asyncio.to_thread(self.put, cache_key, result)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/미적중 통계 (첫 사용 전이면 DB를 열어 항목 수를 셈)"""
+        if self._size is None:
+            with self._lock:
+                self._connect()
+        hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "size": self._size,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0
+        }
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            if self._connection is not None:
+                self._flush_touches(self._connection)
+                self._connection.commit()
+                self._connection.close()
+                self._connection = None
+                self._size = None
+
+
+# 앱 전체에서 공유하는 리포트 캐시 (REPORT_CACHE_PATH 가 비어 있으면 사용 안 함)
+report_cache: Optional[ReportCache] = ReportCache(
+    path=settings.REPORT_CACHE_PATH,
+    ttl_seconds=settings.REPORT_CACHE_TTL_SECONDS,
+    max_entries=settings.REPORT_CACHE_MAX_ENTRIES
+) if settings.REPORT_CACHE_PATH else None
@@ -0,0 +1,213 @@
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+from app.models.validation_result import ConditionIssue, ValidationResult
+
+# 이슈 유형 섹션 헤더 ("### 조건 겹침: 2건")
+ISSUE_SECTION_HEADER = re.compile(r"^(#{3,})\s*(.+?):\s*(\d+)건")
+
+# 이슈 요약 문장 패턴 - (정규식, 유형 수 그룹, 건수 그룹)
+SUMMARY_SENTENCE_PATTERNS: List[Tuple["re.Pattern", int, int]] = [
+    (re.compile(r"총\s+(\d+)가지\s+유형의\s+오류,\s+총\s+(\d+)건\s+감지됨"), 1, 2),
+    (re.compile(r"총\s+(\d+)가지\s+유형[,의]?\s+총\s+(\d+)건[의]?\s+(이슈|오류)"), 1, 2),
+    (re.compile(r"총\s+(\d+)가지\s+유형[의]?\s+(이슈|오류)[,가]?\s+총\s+(\d+)건"), 1, 3)
+]
+
+# 이슈 요약 섹션으로 보는 제목 키워드
+SUMMARY_SECTION_KEYWORDS = ("검출된 이슈", "검출된 오류", "이슈 요약")
+
+# 이슈 타입 → 한글 이름
+ISSUE_TYPE_NAMES: Dict[str, str] = {
+    "duplicate_condition": "조건 겹침",
+    "invalid_operator": "잘못된 연산자",
+    "type_mismatch": "타입 오류",
+    "self_contradiction": "자기모순",
+    "structure_complexity": "중첩 과도",
+    "missing_condition": "누락 조건",
+    "analysis_error": "분석 오류",
+    "invalid_structure": "구조 오류"
+}
+
+
+def issue_type_name(issue_type: str) -> str:
+    """이슈 타입의 한글 이름 (매핑이 없으면 그대로)"""
+    return ISSUE_TYPE_NAMES.get(issue_type, issue_type)
+
+
+class MarkdownSection:
+    """
+    제목 한 줄과 본문, 하위 섹션으로 이루어진 마크다운 섹션 트리 노드
+
+    - 루트는 level 0이고 heading이 없으며, 첫 제목 앞의 내용을 본문으로 가집니다.
+    - 줄은 줄바꿈을 포함한 원문 그대로 저장하므로 수정하지 않은 부분은 render()에서 원문과 같습니다.
+    """
+
+    __slots__ = ("level", "heading", "body", "children", "parent")
+
+    def __init__(self, level: int, heading: Optional[str] = None, body: Optional[List[str]] = None):
+        self.level = level
+        self.heading = heading
+        self.body: List[str] = body if body is not None else []
+        self.children: List["MarkdownSection"] = []
+        self.parent: Optional["MarkdownSection"] = None
+
+    @property
+    def title(self) -> str:
+        """'#'와 공백을 뺀 제목"""
+        return self.heading.strip().lstrip("#").strip() if self.heading else ""
+
+    def append(self, section: "MarkdownSection") -> None:
+        section.parent = self
+        self.children.append(section)
+
+    def insert_before(self, sections: List["MarkdownSection"]) -> None:
+        """이 섹션 바로 앞에 형제 섹션들을 순서대로 삽입"""
+        siblings = self.parent.children
+        for section in sections:
+            section.parent = self.parent
+        index = siblings.index(self)
+        siblings[index:index] = sections
+
+    def remove(self) -> None:
+        """하위 섹션과 함께 트리에서 제거"""
+        if self.parent is not None:
+            self.parent.children.remove(self)
+            self.parent = None
+
+    def walk(self) -> Iterator["MarkdownSection"]:
+        """전위 순서로 하위 섹션 순회 (자기 자신 제외) - 순회 중 제거해도 안전하도록 미리 펼친 목록 사용"""
+        result = []
+        stack = list(reversed(self.children))
+        while stack:
+            section = stack.pop()
+            result.append(section)
+            stack.extend(reversed(section.children))
+        return iter(result)
+
+    def render(self) -> str:
+        """트리를 마크다운 문자열로 한 번에 직렬화"""
+        parts: List[str] = []
+        stack = [self]
+        while stack:
+            section = stack.pop()
+            if section.heading is not None:
+                parts.append(section.heading)
+            parts.extend(section.body)
+            stack.extend(reversed(section.children))
+        # 줄바꿈 없이 끝난 줄 뒤에 새 섹션이 붙는 경우에만 줄바꿈 보충
+        for index in range(len(parts) - 1):
+            if parts[index] and not parts[index].endswith("\n"):
+                parts[index] += "\n"
+        return "".join(parts)
+
+
+def remove_sections(sections: List[MarkdownSection]) -> None:
+    """여러 섹션을 부모별로 한 번씩만 걸러서 제거"""
+    removed = set(map(id, sections))
+    parents = {id(section.parent): section.parent for section in sections if section.parent is not None}
+    for parent in parents.values():
+        parent.children = [child for child in parent.children if id(child) not in removed]
+    for section in sections:
+        section.parent = None
+
+
+def _split_lines(text: str) -> List[str]:
+    """줄바꿈('\\n')을 포함한 줄 목록 (마지막 줄은 줄바꿈이 없을 수 있음)"""
+    lines = [line + "\n" for line in text.split("\n")]
+    last = lines.pop()[:-1]
+    if last:
+        lines.append(last)
+    return lines
+
+
+def parse_markdown_sections(text: str) -> MarkdownSection:
+    """마크다운을 한 번 훑어서 제목 단계별 섹션 트리 생성 (코드 블록 안의 '#'은 제목으로 보지 않음)"""
+    root = MarkdownSection(0)
+    stack = [root]
+    in_fence = False
+    for line in _split_lines(text):
+        stripped = line.lstrip()
+        if stripped.startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence and stripped.startswith("#"):
+            level = len(stripped) - len(stripped.lstrip("#"))
+            while stack[-1].level >= level:
+                stack.pop()
+            section = MarkdownSection(level, line)
+            stack[-1].append(section)
+            stack.append(section)
+            continue
+        stack[-1].body.append(line)
+    return root
+
+
+def find_summary_section(root: MarkdownSection) -> Optional[MarkdownSection]:
+    """이슈 요약 섹션 (이슈 유형 섹션 제외, 첫 번째)"""
+    for section in root.walk():
+        if ISSUE_SECTION_HEADER.match(section.heading.strip()):
+            continue
+        if any(keyword in section.title for keyword in SUMMARY_SECTION_KEYWORDS):
+            return section
+    return None
+
+
+def find_conclusion_section(root: MarkdownSection) -> Optional[MarkdownSection]:
+    """총평 섹션"""
+    for section in root.walk():
+        if "총평" in section.title:
+            return section
+    return None
+
+
+def issue_type_sections(root: MarkdownSection) -> List[Tuple[MarkdownSection, str, int]]:
+    """이슈 유형 섹션 목록 - (섹션, 유형 한글 이름, 보고된 건수)"""
+    result = []
+    for section in root.walk():
+        match = ISSUE_SECTION_HEADER.match(section.heading.strip())
+        if match:
+            result.append((section, match.group(2).strip(), int(match.group(3))))
+    return result
+
+
+def reported_summary_counts(text: str) -> Optional[Tuple[int, int]]:
+    """이슈 요약 문장에 보고된 (유형 수, 총 건수) - 문장이 없으면 None"""
+    for pattern, type_group, count_group in SUMMARY_SENTENCE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return int(match.group(type_group)), int(match.group(count_group))
+    return None
+
+
+def correct_summary_sentence(validation_result: ValidationResult) -> str:
+    """issue_counts 기준 이슈 요약 문장"""
+    issue_counts = validation_result.issue_counts
+    return f"총 {len(issue_counts)}가지 유형의 오류, 총 {sum(issue_counts.values())}건 감지됨."
+
+
+def build_issue_section(type_name: str, count: int, issues: List[ConditionIssue]) -> str:
+    """issue_counts 기준 이슈 유형 섹션 (필드별로 묶은 이슈 목록, 이슈가 없으면 안내 문구)"""
+    section = f"### {type_name}: {count}건\n\n"
+    if not issues:
+        return section + "**이슈 정보 없음**\n- validation_result에는 있으나 상세 정보가 없습니다.\n\n"
+
+    # 필드별로 그룹화
+    field_issues: Dict[str, List[ConditionIssue]] = {}
+    for issue in issues:
+        field_issues.setdefault(issue.field if issue.field else "전체 룰", []).append(issue)
+
+    for field, grouped in field_issues.items():
+        section += f"**{field}**\n"
+        for issue in grouped:
+            if issue.location:
+                section += f"- {issue.explanation} (위치: {issue.location})\n"
+            else:
+                section += f"- {issue.explanation}\n"
+        section += "\n"
+    return section
+
+
+def section_from_text(text: str) -> MarkdownSection:
+    """제목 한 줄로 시작하는 마크다운 조각을 섹션 하나로 변환"""
+    root = parse_markdown_sections(text)
+    section = root.children[0]
+    section.remove()
+    return section
@@ -0,0 +1,155 @@
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.models.validation_result import ValidationResult
+from app.services.report_markdown import ISSUE_SECTION_HEADER, build_issue_section
+
+logger = logging.getLogger(__name__)
+
+# 스트림 시작 시 결정적으로 먼저 보낸 섹션 - LLM이 다시 생성한 같은 섹션은 버림
+DETERMINISTIC_SECTION_KEYWORDS = ("기본 정보", "조건 구조", "이슈 요약", "카운트", "생성 지침")
+
+MODE_PASS = "pass"      # 토큰을 그대로 전달
+MODE_BUFFER = "buffer"  # 섹션이 끝날 때까지 모았다가 보정 후 전달
+MODE_SKIP = "skip"      # 버림
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """SSE(text/event-stream) 이벤트 문자열"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+class ReportStreamFixer:
+    """
+    LLM 리포트 토큰 스트림을 섹션 단위로 보정
+
+    - 줄 첫 글자가 '#'가 아니면 토큰을 바로 전달하고, 제목 줄은 줄이 끝날 때까지 모아 섹션 종류를 판단합니다.
+    - "### 유형: N건" 섹션은 끝날 때까지 모았다가 issue_counts 기준으로 건수를 고치거나(없는 유형이면) 버립니다.
+    - 이미 결정적으로 보낸 섹션(기본 정보, 조건 구조, 이슈 요약)은 버리고,
+      누락된 이슈 유형 섹션은 총평 앞(또는 스트림 끝)에 보충합니다.
+    """
+
+    def __init__(self, validation_result: ValidationResult, type_name: Callable[[str], str]):
+        self.expected: Dict[str, int] = {}
+        self.samples: Dict[str, Any] = {}
+        for issue_type, count in validation_result.issue_counts.items():
+            self.expected[type_name(issue_type)] = count
+        for issue in validation_result.issues:
+            name = type_name(issue.issue_type)
+            if name in self.expected and name not in self.samples:
+                self.samples[name] = issue
+
+        self.seen: set = set()
+        self.mode = MODE_PASS
+        self._held: Optional[str] = None       # 판단을 보류 중인 줄 앞부분
+        self._line_start = True
+        self._section: List[str] = []
+        self._section_header: Optional[Tuple[str, str, int]] = None
+        self._missing_emitted = False
+
+    def feed(self, text: str) -> List[str]:
+        """토큰을 받아 지금 전달할 수 있는 조각 목록 반환"""
+        out: List[str] = []
+        for piece in text.splitlines(keepends=True):
+            self._consume(piece, out)
+        return out
+
+    def close(self) -> List[str]:
+        """스트림 종료 - 남은 줄과 섹션을 정리하고 누락된 이슈 유형 섹션 보충"""
+        out: List[str] = []
+        if self._held is not None:
+            held, self._held = self._held, None
+            self._finish_line(held, out)
+        self._close_section(out)
+        out.extend(self._missing_sections())
+        return out
+
+    def _consume(self, piece: str, out: List[str]) -> None:
+        if self._held is not None:
+            self._held += piece
+            piece = self._held
+            self._held = None
+        elif not self._line_start:
+            self._emit(piece, out)
+            self._line_start = piece.endswith("\n")
+            return
+
+        if piece.endswith("\n"):
+            self._finish_line(piece, out)
+            self._line_start = True
+            return
+
+        stripped = piece.lstrip()
+        if not stripped or stripped.startswith("#"):
+            # 공백뿐이거나 제목 줄 - 줄이 끝날 때까지 보류
+            self._held = piece
+            return
+
+        self._emit(piece, out)
+        self._line_start = False
+
+    def _finish_line(self, line: str, out: List[str]) -> None:
+        if line.lstrip().startswith("#"):
+            self._start_section(line, out)
+        else:
+            self._emit(line, out)
+
+    def _emit(self, text: str, out: List[str]) -> None:
+        if self.mode == MODE_PASS:
+            out.append(text)
+        elif self.mode == MODE_BUFFER:
+            self._section.append(text)
+
+    def _start_section(self, heading: str, out: List[str]) -> None:
+        self._close_section(out)
+
+        stripped = heading.strip()
+        title = stripped.lstrip("#").strip()
+        header = ISSUE_SECTION_HEADER.match(stripped)
+        if header:
+            self.mode = MODE_BUFFER
+            self._section = [heading]
+            self._section_header = (header.group(1), header.group(2).strip(), int(header.group(3)))
+        elif not stripped.startswith("##") or any(keyword in title for keyword in DETERMINISTIC_SECTION_KEYWORDS):
+            self.mode = MODE_SKIP
+        else:
+            if "총평" in title:
+                out.extend(self._missing_sections())
+            self.mode = MODE_PASS
+            out.append(heading)
+
+    def _close_section(self, out: List[str]) -> None:
+        """버퍼링 중인 이슈 유형 섹션을 보정하여 전달"""
+        if self.mode != MODE_BUFFER or self._section_header is None:
+            return
+        hashes, name, reported = self._section_header
+        lines = self._section
+        self._section = []
+        self._section_header = None
+        self.mode = MODE_PASS
+
+        count = self.expected.get(name)
+        if count is None:
+            logger.debug("[리포트 스트림] 유효하지 않은 이슈 유형 '%s' 섹션 제거", name)
+            return
+        if name in self.seen:
+            logger.debug("[리포트 스트림] 중복된 이슈 유형 '%s' 섹션 제거", name)
+            return
+        self.seen.add(name)
+        if reported != count:
+            logger.debug("[리포트 스트림] 이슈 유형 '%s' 개수 수정: %s → %d", name, reported, count)
+            lines[0] = ISSUE_SECTION_HEADER.sub(lambda match: f"{hashes} {name}: {count}건", lines[0].lstrip(), count=1)
+        out.append("".join(lines))
+
+    def _missing_sections(self) -> List[str]:
+        if self._missing_emitted:
+            return []
+        self._missing_emitted = True
+        sections = []
+        for name, count in self.expected.items():
+            if name not in self.seen:
+                logger.debug("[리포트 스트림] 누락된 이슈 유형 '%s' 섹션 추가", name)
+                self.seen.add(name)
+                sample = self.samples.get(name)
+                sections.append(build_issue_section(name, count, [sample] if sample is not None else []))
+        return sections
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set
+from app.config import settings
+from app.services.analysis_executor import analysis_executor
+from app.services.rule_analyzer import RuleAnalyzer, rule_analyzer
+from app.services.rule_hash import digest
+from app.services.rule_repository import ALL_RULES_FIELD, RuleRepository, dependent_fields, rule_repository
+
+logger = logging.getLogger(__name__)
+
+
+def schema_fingerprints(analyzer: RuleAnalyzer, fields: Iterable[str]) -> Dict[str, str]:
+    """
+    필드별 스키마 지문 - 그 필드를 쓰는 룰의 분석 결과에 영향을 주는 스키마 항목의 해시
+
+    - 필드 정의, (추론 포함) 필드 타입, 그 타입의 기본 허용 연산자를 포함합니다.
+    - 가상 필드 "*"는 모든 룰이 쓰는 논리 연산자 정의입니다.
+    """
+    fingerprints = {}
+    for field in fields:
+        if field == ALL_RULES_FIELD:
+            document: Dict[str, Any] = {"logical": analyzer._valid_operators.get("logical")}
+        else:
+            field_type = analyzer._get_field_type(field)
+            document = {"schema": analyzer.field_schema.get(field), "type": field_type, "operators": analyzer._valid_operators.get(field_type)}
+        fingerprints[field] = digest(document)[:16]
+    return fingerprints
+
+
+class RevalidationQueue:
+    """
+    저장소 룰의 백그라운드 재검증 큐
+
+    - 룰이 저장되어 새 버전이 생기면 그 룰 ID만 큐에 넣습니다. 이미 대기 중인 룰은 다시 넣지 않습니다.
+    - 시작 시 룰마다 결과를 분석할 때의 필드별 스키마 지문과 현재 스키마를 비교해, 바뀐 필드를 쓰는 룰과 결과가 없는 룰만 재검증합니다.
+    - 워커는 처리 시점의 최신 버전을 분석하고, 그사이 룰이 또 바뀌었으면 결과를 버립니다 (새 버전이 다시 큐에 있음).
+    - 저장소 호출은 블로킹 DB 작업이므로 스레드에서 실행합니다.
+    """
+
+    def __init__(self, repository: RuleRepository, analyzer: RuleAnalyzer, concurrency: int = 1):
+        self.repository = repository
+        self.analyzer = analyzer
+        self.concurrency = max(1, concurrency)
+        self.processed = 0
+        self.skipped = 0
+        self.failed = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._pending: Set[str] = set()
+        self._workers: List[asyncio.Task] = []
+
+    def _ensure_workers(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self.concurrency:
+            self._workers.append(asyncio.create_task(self._work()))
+
+    async def start(self) -> int:
+        """워커 시작 후 스키마 변경/미검증 룰 등록 - 등록한 룰 수 반환"""
+        self._ensure_workers()
+        repository = self.repository
+        fingerprints = schema_fingerprints(self.analyzer, await asyncio.to_thread(repository.referenced_fields))
+        affected = await asyncio.to_thread(repository.apply_schema, self.analyzer.schema_version, fingerprints)
+        stale = await asyncio.to_thread(repository.stale_rule_ids, self.analyzer.schema_version)
+        count = self.enqueue(affected + stale)
+        if count:
+            logger.info("룰 재검증 대기 등록: %d개 (스키마 변경 영향 %d개)", count, len(affected))
+        return count
+
+    def enqueue(self, rule_ids: Iterable[str]) -> int:
+        """룰 ID 등록 (이미 대기 중이면 건너뜀) - 새로 등록한 수 반환"""
+        self._ensure_workers()
+        count = 0
+        for rule_id in rule_ids:
+            if rule_id in self._pending:
+                continue
+            self._pending.add(rule_id)
+            self._queue.put_nowait(rule_id)
+            count += 1
+        return count
+
+    async def join(self) -> None:
+        """대기 중인 재검증이 모두 끝날 때까지 대기"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """워커 종료 (대기 중인 룰은 다음 시작 때 미검증 룰로 다시 등록됨)"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._pending.clear()
+
+    async def _work(self) -> None:
+        while True:
+            rule_id = await self._queue.get()
+            # 처리 중에 다시 저장된 룰은 또 등록될 수 있도록 먼저 대기 목록에서 뺌
+            self._pending.discard(rule_id)
+            try:
+                await self.revalidate(rule_id)
+            except Exception as e:
+                self.failed += 1
+                logger.warning("룰 재검증 오류: %s, %s", rule_id, e)
+            finally:
+                self._queue.task_done()
+
+    async def revalidate(self, rule_id: str) -> bool:
+        """룰 하나 재검증 - 결과를 저장했으면 True"""
+        stored = await asyncio.to_thread(self.repository.get, rule_id)
+        schema_version = self.analyzer.schema_version
+        if stored is None or stored.is_current(schema_version):
+            self.skipped += 1
+            return False
+        if self.analyzer is rule_analyzer:
+            # 공유 분석기는 실행기를 거쳐 큰 룰을 프로세스 풀에서 분석
+            result = await analysis_executor.analyze(stored.rule)
+        else:
+            result = self.analyzer.analyze(stored.rule)
+        fingerprints = schema_fingerprints(self.analyzer, dependent_fields(stored.rule))
+        if not await asyncio.to_thread(self.repository.store_result, rule_id, stored.version, schema_version, result, fingerprints):
+            self.skipped += 1
+            return False
+        self.processed += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """재검증 처리 통계"""
+        return {
+            "pending": len(self._pending),
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "workers": len(self._workers)
+        }
+
+
+# 앱 전체에서 공유하는 재검증 큐 (룰 저장소를 사용하지 않으면 None)
+revalidation_queue: Optional[RevalidationQueue] = RevalidationQueue(
+    rule_repository,
+    rule_analyzer,
+    concurrency=settings.REVALIDATION_CONCURRENCY
+) if rule_repository is not None else None
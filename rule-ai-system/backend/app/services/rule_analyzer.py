@@ -1,70 +1,119 @@
-from typing import Dict, List, Any, Optional
+import logging
+from bisect import bisect_left
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from app.models.validation_result import ValidationResult, ConditionIssue, StructureInfo
 from app.models.rule import Rule, RuleCondition
+from app.services.condition_ir import CompiledConditions, compile_conditions
+from app.config import settings
+from app.services.interval_engine import Conflict, find_contradictions, find_overlaps, interval_from_comparison, is_number
+from app.services.satisfiability import ALWAYS_TRUE, REDUNDANT, UNSATISFIABLE, BDDLimitExceeded, BranchFinding, analyze_branches
+from app.services.rule_hash import digest
+from app.services.subtree_cache import SubtreeArtifactCache, SubtreeArtifacts, subtree_hashes
+from app.services.metrics import StageTimer, metrics, record_analysis
+from app.logging_config import debug_sampling
+
+logger = logging.getLogger(__name__)
+
+
+def _freeze(value: Any) -> Any:
+    """스키마 정의를 읽기 전용 구조로 변환 (dict -> MappingProxyType, list -> tuple)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# 필드별 타입 스키마 정의 (실제 비즈니스 필드에 맞게 확장) - 모든 분석 호출이 공유하는 읽기 전용 스키마
+FIELD_SCHEMA: Mapping[str, Mapping[str, Any]] = _freeze({
+    # 숫자 타입 필드들
+    "MBL_ACT_MEM_PCNT": {"type": "number", "description": "무선 회선 수", "allowed_operators": ["==", "!=", ">", "<", ">=", "<=", "in"]},
+    "IOT_MEM_PCNT": {"type": "number", "description": "IoT 회선 수", "allowed_operators": ["==", "!=", ">", "<", ">=", "<=", "in"]},
+    "age": {"type": "number", "description": "나이"},
+    "score": {"type": "number", "description": "점수"},
+    "price": {"type": "number", "description": "가격"},
+    "amount": {"type": "number", "description": "금액"},
+    "quantity": {"type": "number", "description": "수량"},
+    
+    # 문자열 타입 필드들
+    "ENTR_STUS_CD": {"type": "string", "description": "가입 상태", "policy": {"sortable": False, "code_group": True}},
+    "MRKT_CD": {"type": "string", "description": "마켓 코드", "policy": {"sortable": False, "code_group": False}, "allowed_operators": ["==", "!=", "in"]},
+    "name": {"type": "string", "description": "이름"},
+    "grade": {"type": "string", "description": "등급"},
+    "category": {"type": "string", "description": "카테고리"},
+    "membership": {"type": "string", "description": "멤버십"},
+    "status": {"type": "string", "description": "상태"},
+    
+    # 배열 타입 필드들
+    "tags": {"type": "array", "description": "태그 목록"},
+    
+    # 날짜 타입 필드들
+    "date": {"type": "date", "description": "날짜"}
+})
+
+# 타입별 허용 연산자 (기본값)
+VALID_OPERATORS: Mapping[str, Tuple[str, ...]] = _freeze({
+    "string": ["==", "!=", "contains", "starts_with", "ends_with"],
+    "number": ["==", "!=", ">", "<", ">=", "<=", "in"],
+    "boolean": ["==", "!="],
+    "array": ["contains", "not_contains", "in", "not_in"],
+    "date": ["==", "!=", ">", "<", ">=", "<="],
+    "logical": ["and", "or"]  # 논리 연산자는 별도 타입으로 정의
+})
+
+# 스키마 버전 - 스키마 내용이 바뀌면 달라지며, 분석 결과 캐시 무효화에 사용
+SCHEMA_VERSION: str = digest({"field_schema": FIELD_SCHEMA, "valid_operators": VALID_OPERATORS})[:16]
+
 
 class RuleAnalyzer:
-    """룰 분석 서비스"""
+    """
+    룰 분석 서비스
+
+    - 스키마는 읽기 전용 모듈 상수를 공유하며, 분석 중 상태는 호출마다 지역 변수(IR, 이슈 목록)로만 유지합니다.
+    - 인스턴스에 분석 상태를 저장하지 않으므로 하나의 인스턴스를 동시 요청에서 함께 사용할 수 있습니다.
+    - 입력 Rule 객체는 변경하지 않습니다.
+    """
     
-    def __init__(self):
-        self.issues: List[ConditionIssue] = []
-        self.field_types: Dict[str, str] = {}
-        self.condition_map: Dict[str, List[Dict[str, Any]]] = {}
-        # 글로벌 조건 인덱스 추적을 위한 변수
-        self.global_condition_index = 0
-        self.condition_index_map = {}  # 조건 객체 ID와 인덱스 매핑
-        
-        # 필드별 타입 스키마 정의 (실제 비즈니스 필드에 맞게 확장)
-        self.field_schema = {
-            # 숫자 타입 필드들
-            "MBL_ACT_MEM_PCNT": {"type": "number", "description": "무선 회선 수", "allowed_operators": ["==", "!=", ">", "<", ">=", "<=", "in"]},
-            "IOT_MEM_PCNT": {"type": "number", "description": "IoT 회선 수", "allowed_operators": ["==", "!=", ">", "<", ">=", "<=", "in"]},
-            "age": {"type": "number", "description": "나이"},
-            "score": {"type": "number", "description": "점수"},
-            "price": {"type": "number", "description": "가격"},
-            "amount": {"type": "number", "description": "금액"},
-            "quantity": {"type": "number", "description": "수량"},
-            
-            # 문자열 타입 필드들
-            "ENTR_STUS_CD": {"type": "string", "description": "가입 상태", "policy": {"sortable": False, "code_group": True}},
-            "MRKT_CD": {"type": "string", "description": "마켓 코드", "policy": {"sortable": False, "code_group": False}, "allowed_operators": ["==", "!=", "in"]},
-            "name": {"type": "string", "description": "이름"},
-            "grade": {"type": "string", "description": "등급"},
-            "category": {"type": "string", "description": "카테고리"},
-            "membership": {"type": "string", "description": "멤버십"},
-            "status": {"type": "string", "description": "상태"},
-            
-            # 배열 타입 필드들
-            "tags": {"type": "array", "description": "태그 목록"},
-            
-            # 날짜 타입 필드들
-            "date": {"type": "date", "description": "날짜"}
-        }
-        
-        # 타입별 허용 연산자 (기본값)
-        self._valid_operators = {
-            "string": ["==", "!=", "contains", "starts_with", "ends_with"],
-            "number": ["==", "!=", ">", "<", ">=", "<=", "in"],
-            "boolean": ["==", "!="],
-            "array": ["contains", "not_contains", "in", "not_in"],
-            "date": ["==", "!=", ">", "<", ">=", "<="],
-            "logical": ["and", "or"]  # 논리 연산자는 별도 타입으로 정의
-        }
+    field_schema: Mapping[str, Mapping[str, Any]] = FIELD_SCHEMA
+    _valid_operators: Mapping[str, Tuple[str, ...]] = VALID_OPERATORS
+    schema_version: str = SCHEMA_VERSION
     
     async def analyze_rule(self, rule: Rule) -> ValidationResult:
         """룰을 분석하고 검증 결과를 반환"""
+        return self.analyze(rule)
+    
+    def analyze(self, rule: Rule, subtree_cache: Optional[SubtreeArtifactCache] = None, timer: Optional[StageTimer] = None) -> ValidationResult:
+        """
+        룰 분석 본체 (CPU 작업만 수행하는 동기 함수 - 프로세스 풀 워커에서도 그대로 호출)
+
+        - subtree_cache가 있으면 노드 단위 검사 결과를 서브트리 해시로 재사용합니다.
+        - 단계별 소요 시간과 룰 크기는 분석이 끝난 뒤 메트릭에 기록합니다.
+          timer를 넘기면 그 타이머에만 남기고 기록은 호출자가 합니다 (프로세스 풀 워커에서 부모로 전달할 때).
+        """
+        with debug_sampling(logger):
+            if timer is not None:
+                return self._analyze(rule, subtree_cache, timer)
+            timer = metrics.stage_timer()
+            try:
+                return self._analyze(rule, subtree_cache, timer)
+            finally:
+                record_analysis(timer.marks, timer.size)
+
+    def _analyze(self, rule: Rule, subtree_cache: Optional[SubtreeArtifactCache], timer: StageTimer) -> ValidationResult:
         try:
-            print(f"룰 분석 시작: {rule.name}")
-            self.issues = []
-            self.global_condition_index = 0
-            self.condition_index_map = {}
+            logger.debug("룰 분석 시작: %s", rule.name)
+            issues: List[ConditionIssue] = []
             contradiction_fields = set()  # 모순이 발견된 필드 추적
             
-            # 전체 조건에 글로벌 인덱스 부여
-            self._assign_global_indices(rule.conditions)
+            # 조건 트리를 한 번만 순회하여 평탄화된 IR 생성 (글로벌 인덱스 = 배열 인덱스 + 1)
+            ir = compile_conditions(rule.conditions)
+            timer.size = ir.size
+            timer.mark("compile")
             
             # 기본 검증
             if not rule.conditions:
-                self.issues.append(ConditionIssue(
+                issues.append(ConditionIssue(
                     field="conditions",
                     issue_type="missing_condition",
                     severity="error",
@@ -73,21 +122,13 @@ class RuleAnalyzer:
                     suggestion=self._generate_suggestion("missing_condition", "conditions")
                 ))
                 
-            # 타입 불일치 사전 확인 - 전체 조건 순회
+            # 노드 단위 검사 (타입 사전 확인 + 조건 노드 검증) - 캐시가 있으면 바뀌지 않은 서브트리의 결과 재사용
             try:
-                # 모든 타입 불일치 이슈 수집
-                type_mismatch_issues = self._precheck_type_mismatches(rule.conditions)
-                
-                # 타입 불일치 오류를 이슈 목록에 추가하고 계속 진행
-                if type_mismatch_issues:
-                    type_issues_count = len(type_mismatch_issues)
-                    print(f"타입 불일치 오류가 {type_issues_count}개 발견되었지만, 다른 검사도 계속 진행합니다.")
-                    self.issues.extend(type_mismatch_issues)
-                
+                type_mismatch_issues, node_issues, field_counts = self._check_nodes(ir, subtree_cache)
             except Exception as e:
-                print(f"타입 검사 중 오류: {str(e)}")
+                logger.warning("타입 검사 중 오류: %s", e)
                 # 타입 검사 도중 예상치 못한 오류 발생 시 처리
-                self.issues.append(ConditionIssue(
+                issues.append(ConditionIssue(
                     field=None,
                     issue_type="analysis_error",
                     severity="error",
@@ -95,70 +136,47 @@ class RuleAnalyzer:
                     explanation=f"타입 검사 중 오류: {str(e)}",
                     suggestion="조건의 형식과 값을 확인하세요."
                 ))
+                type_mismatch_issues = []
+                node_issues = [issue for index in range(ir.size) for issue in self._checked_condition_node(ir, index)]
+                field_counts = None
             
-            # 조건 검증
-            for idx, condition in enumerate(rule.conditions):
-                try:
-                    issues = await self._analyze_conditions(condition, index=idx+1, contradiction_fields=contradiction_fields)
-                    self.issues.extend(issues)
-                except Exception as e:
-                    print(f"조건 {idx+1} 분석 중 오류: {str(e)}")
-                    # 타입 비교 예외 특별 처리
-                    if "not supported between instances of" in str(e):
-                        error_parts = str(e).split("not supported between instances of")
-                        if len(error_parts) > 1:
-                            type_info = error_parts[1].strip()
-                            self.issues.append(ConditionIssue(
-                                field=getattr(condition, "field", None),
-                                issue_type="type_mismatch",
-                                severity="error",
-                                location=f"조건 {idx+1}",
-                                explanation=f"타입 불일치: {type_info} 간에 비교 연산이 불가능합니다. 타입을 일치시켜주세요.",
-                                suggestion="조건에 사용된 값의 타입이 일치하는지 확인하세요. 숫자는 숫자끼리, 문자열은 문자열끼리 비교해야 합니다."
-                            ))
-                        else:
-                            # 기타 예외는 기존 방식대로 처리
-                            self.issues.append(ConditionIssue(
-                                field=getattr(condition, "field", None),
-                                issue_type="analysis_error",
-                                severity="error",
-                                location=f"조건 {idx+1}",
-                                explanation=f"조건 분석 중 오류: {str(e)}",
-                                suggestion="조건의 형식과 값을 확인하세요."
-                            ))
-                    else:
-                        # 기타 예외는 기존 방식대로 처리
-                        self.issues.append(ConditionIssue(
-                            field=getattr(condition, "field", None),
-                            issue_type="analysis_error",
-                            severity="error",
-                            location=f"조건 {idx+1}",
-                            explanation=f"조건 분석 중 오류: {str(e)}",
-                            suggestion="조건의 형식과 값을 확인하세요."
-                        ))
-                    continue
+            # 타입 불일치 오류를 이슈 목록에 추가하고 계속 진행
+            if type_mismatch_issues:
+                logger.debug("타입 불일치 오류가 %d개 발견되었지만, 다른 검사도 계속 진행합니다.", len(type_mismatch_issues))
+                issues.extend(type_mismatch_issues)
+            issues.extend(node_issues)
+            timer.mark("node_checks")
             
             # 모순 조건 검증 - 우선순위 높게 처리
-            contradiction_issues, detected_contradiction_fields = self._check_contradictions(rule.conditions)
-            self.issues.extend(contradiction_issues)
+            contradiction_issues, detected_contradiction_fields = self._check_contradictions(ir)
+            issues.extend(contradiction_issues)
             contradiction_fields.update(detected_contradiction_fields)
+            timer.mark("contradictions")
             
             # 중복 조건 검증 (모순이 없는 필드에 대해서만)
-            duplicate_issues = self._check_duplicate_conditions(rule.conditions, contradiction_fields)
-            self.issues.extend(duplicate_issues)
+            duplicate_issues = self._check_duplicate_conditions(ir, contradiction_fields)
+            issues.extend(duplicate_issues)
+            timer.mark("duplicates")
+            
+            # 분기 판정 - 여러 조건/그룹에 걸친 모순, 항상 참인 분기, 다른 조건에 포함되는 분기
+            branch_issues = self._check_branch_satisfiability(ir, contradiction_fields)
+            issues.extend(branch_issues)
+            timer.mark("branch_satisfiability")
             
             # 조건 누락 가능성 검사
-            missing_issues = self._check_missing_conditions(rule.conditions)
-            self.issues.extend(missing_issues)
+            missing_issues = self._check_missing_conditions(ir)
+            issues.extend(missing_issues)
+            timer.mark("missing_conditions")
             
             # 분기 불명확 검사 추가
-            ambiguous_issues = self._check_ambiguous_branches(rule.conditions)
-            self.issues.extend(ambiguous_issues)
+            ambiguous_issues = self._check_ambiguous_branches(ir)
+            issues.extend(ambiguous_issues)
+            timer.mark("ambiguity")
             
             # 구조 복잡성 검사 - complexity_warning으로 이슈 타입 변경
             # 조건 중첩 깊이 ≥ 5, 또는 총 조건 수 ≥ 10일 경우
-            depth = self._calculate_depth(rule.conditions)
-            condition_count = self._count_conditions(rule.conditions)
+            depth = ir.max_depth
+            condition_count = ir.size
             
             if depth >= 5 or condition_count >= 10:
                 complexity_explanation = []
@@ -169,7 +187,7 @@ class RuleAnalyzer:
                 
                 explanation = ". ".join(complexity_explanation) + ". 룰의 복잡성이 높아질 수 있습니다."
                 
-                self.issues.append(ConditionIssue(
+                issues.append(ConditionIssue(
                     field=None,  # 필드를 NULL로 설정
                     issue_type="complexity_warning",
                     severity="warning",
@@ -179,7 +197,7 @@ class RuleAnalyzer:
                 ))
             
             # 유효성 검사 - 오류 심각도 이슈가 있으면 유효하지 않음
-            is_valid = len([i for i in self.issues if i.severity == "error"]) == 0
+            is_valid = len([i for i in issues if i.severity == "error"]) == 0
             
             # 7가지 이슈 타입 필터링 - 요구사항에 없는 이슈 타입은 제거
             allowed_issue_types = [
@@ -192,28 +210,34 @@ class RuleAnalyzer:
                 "complexity_warning"
             ]
             
-            filtered_issues = [issue for issue in self.issues if issue.issue_type in allowed_issue_types]
-            self.issues = filtered_issues
+            issues = [issue for issue in issues if issue.issue_type in allowed_issue_types]
             
             # 이슈 타입별 건수 집계
             issue_counts = {}
-            for issue in self.issues:
+            for issue in issues:
                 if issue.issue_type not in issue_counts:
                     issue_counts[issue.issue_type] = 0
                 issue_counts[issue.issue_type] += 1
             
-            # 조건 구조 정보 계산
-            unique_fields = self._extract_unique_fields(rule.conditions)
+            # 조건 구조 정보 계산 (노드 단위 검사에서 집계한 필드별 조건 수가 있으면 재사용)
+            if field_counts is not None:
+                unique_fields = list(field_counts)
+                field_condition_count = sum(field_counts.values())
+            else:
+                unique_fields = self._extract_unique_fields(ir)
+                field_condition_count = self._count_field_conditions(ir)
+            timer.mark("aggregation")
             
             # 룰 요약 생성
             try:
-                rule_summary = self._generate_rule_summary(rule)
+                rule_summary = self._generate_rule_summary(rule, ir)
             except Exception as e:
-                print(f"룰 요약 생성 중 오류: {str(e)}")
+                logger.warning("룰 요약 생성 중 오류: %s", e)
                 rule_summary = "룰 요약을 생성할 수 없습니다."
+            timer.mark("summary")
             
             # 중복된 제안 최적화 (동일한 필드에 대해 동일한 제안이 있으면 통합)
-            optimized_issues = self._optimize_issues(self.issues)
+            optimized_issues = self._optimize_issues(issues)
             
             # 이슈 정렬 - severity (error > warning) 우선, 그 다음 field 알파벳 순
             sorted_issues = sorted(
@@ -230,10 +254,10 @@ class RuleAnalyzer:
                 if issue.issue_type not in issue_counts:
                     issue_counts[issue.issue_type] = 0
                 issue_counts[issue.issue_type] += 1
+            timer.mark("optimize_issues")
             
             # 조건 관련 통계 계산
-            condition_node_count = self._count_conditions(rule.conditions)
-            field_condition_count = self._count_field_conditions(rule.conditions)
+            condition_node_count = ir.size
             
             # 총 이슈 건수
             total_issue_count = len(sorted_issues)
@@ -251,22 +275,25 @@ class RuleAnalyzer:
             )
             
             # AI 코멘트 생성
-            ai_comment = self._generate_ai_comment(rule, sorted_issues, structure_info)
+            ai_comment = self._generate_ai_comment(ir, sorted_issues, structure_info)
+            timer.mark("ai_comment")
             
-            print(f"룰 분석 완료: {rule.name}, 이슈 개수: {total_issue_count}")
+            logger.debug("룰 분석 완료: %s, 이슈 개수: %d", rule.name, total_issue_count)
             
-            return ValidationResult(
+            result = ValidationResult(
                 is_valid=is_valid,
                 summary=summary,
                 issue_counts=issue_counts,
                 issues=sorted_issues,
                 structure=structure_info,
                 rule_summary=rule_summary,
-                complexity_score=self._calculate_complexity_score(rule.conditions),
+                complexity_score=self._calculate_complexity_score(ir, field_condition_count, len(unique_fields)),
                 ai_comment=ai_comment
             )
+            timer.mark("result")
+            return result
         except Exception as e:
-            print(f"룰 분석 중 치명적 오류: {str(e)}")
+            logger.exception("룰 분석 중 치명적 오류: %s", e)
             # 분석 중 예외 발생 시 기본 결과 반환
             return ValidationResult(
                 is_valid=False,
@@ -292,101 +319,176 @@ class RuleAnalyzer:
                 ai_comment=None
             )
     
-    def _infer_field_types(self, rule: Rule) -> None:
+    def _infer_field_types(self, rule: Rule) -> Dict[str, str]:
         """필드 타입 추론"""
+        field_types: Dict[str, str] = {}
+        
         def process_conditions(conditions: List[RuleCondition]) -> None:
             for condition in conditions:
                 # 필드가 있는 경우만 타입 추론 (논리 연산자 블록이 아닌 경우)
                 if condition.field:
                     if condition.field in ["age", "score", "amount", "price", "quantity"]:
-                        self.field_types[condition.field] = "number"
+                        field_types[condition.field] = "number"
                     elif condition.value is not None:
                         if isinstance(condition.value, bool):
-                            self.field_types[condition.field] = "boolean"
+                            field_types[condition.field] = "boolean"
                         elif isinstance(condition.value, (int, float)):
-                            self.field_types[condition.field] = "number"
+                            field_types[condition.field] = "number"
                         elif isinstance(condition.value, list):
-                            self.field_types[condition.field] = "array"
+                            field_types[condition.field] = "array"
                         else:
-                            self.field_types[condition.field] = "string"
+                            field_types[condition.field] = "string"
                 
                 if condition.conditions:
                     process_conditions(condition.conditions)
         
         process_conditions(rule.conditions)
+        return field_types
     
-    async def _analyze_conditions(self, condition: RuleCondition, parent_field: Optional[str] = None, depth: int = 0, index: int = 0, contradiction_fields: set = None) -> List[ConditionIssue]:
-        """조건 분석"""
-        issues = []
-        
-        # contradiction_fields가 None이면 빈 세트로 초기화
-        if contradiction_fields is None:
-            contradiction_fields = set()
+    def _check_nodes(self, ir: CompiledConditions, subtree_cache: Optional[SubtreeArtifactCache] = None) -> Tuple[List[ConditionIssue], List[ConditionIssue], Optional[Dict[str, int]]]:
+        """
+        노드 단위 검사 - (타입 사전 검사 이슈, 조건 노드 검사 이슈, 필드별 비교 조건 수) 반환
+
+        - 캐시가 없으면 모든 노드를 검사하고 필드별 조건 수는 None입니다.
+        - 캐시가 있으면 서브트리 해시로 산출물을 찾아, 없는 서브트리(수정된 조건에서 루트까지의 경로)만 계산합니다.
+        """
+        if subtree_cache is None:
+            node_issues = [issue for index in range(ir.size) for issue in self._checked_condition_node(ir, index)]
+            return self._precheck_type_mismatches(ir), node_issues, None
+
+        hashes = subtree_hashes(ir)
+        artifacts: Dict[int, SubtreeArtifacts] = {}
+        # 캐시에 없는 노드만 펼치는 후위 순회 (명시적 스택)
+        stack = [(root, False) for root in reversed(ir.roots)]
+        while stack:
+            index, expanded = stack.pop()
+            if expanded:
+                own = SubtreeArtifacts(
+                    [(0, issue) for issue in self._precheck_node(ir, index, "")],
+                    [(0, issue) for issue in self._checked_condition_node(ir, index, "")],
+                    {ir.fields[index]: 1} if ir.is_field_condition(index) else {}
+                )
+                subtree = own.combine([(child - index, artifacts.pop(child)) for child in ir.children(index)])
+                subtree_cache.put(hashes[index], self.schema_version, subtree)
+                artifacts[index] = subtree
+                continue
+            cached = subtree_cache.get(hashes[index], self.schema_version)
+            if cached is not None:
+                artifacts[index] = cached
+                continue
+            stack.append((index, True))
+            stack.extend((child, False) for child in reversed(list(ir.children(index))))
+
+        # 루트별 산출물을 이어 붙이고 위치 문자열 채우기
+        rule_artifacts = SubtreeArtifacts([], [], {}).combine([(root, artifacts[root]) for root in ir.roots])
+        precheck = [issue.model_copy(update={"location": ir.location(index)}) for index, issue in rule_artifacts.precheck]
+        node_issues = [issue.model_copy(update={"location": self._node_location(ir, index)}) for index, issue in rule_artifacts.node_issues]
+        return precheck, node_issues, rule_artifacts.field_counts
+
+    def _checked_condition_node(self, ir: CompiledConditions, index: int, location: Optional[str] = None) -> List[ConditionIssue]:
+        """조건 노드 검사 - 검사 중 예외는 이슈로 변환"""
+        location = self._node_location(ir, index) if location is None else location
+        try:
+            return self._analyze_condition_node(ir, index, location)
+        except Exception as e:
+            logger.warning("조건 %d 분석 중 오류: %s", index + 1, e)
+            # 타입 비교 예외 특별 처리
+            if "not supported between instances of" in str(e):
+                error_parts = str(e).split("not supported between instances of")
+                if len(error_parts) > 1:
+                    type_info = error_parts[1].strip()
+                    return [ConditionIssue(
+                        field=ir.fields[index],
+                        issue_type="type_mismatch",
+                        severity="error",
+                        location=location,
+                        explanation=f"타입 불일치: {type_info} 간에 비교 연산이 불가능합니다. 타입을 일치시켜주세요.",
+                        suggestion="조건에 사용된 값의 타입이 일치하는지 확인하세요. 숫자는 숫자끼리, 문자열은 문자열끼리 비교해야 합니다."
+                    )]
+            # 기타 예외는 기존 방식대로 처리
+            return [ConditionIssue(
+                field=ir.fields[index],
+                issue_type="analysis_error",
+                severity="error",
+                location=location,
+                explanation=f"조건 분석 중 오류: {str(e)}",
+                suggestion="조건의 형식과 값을 확인하세요."
+            )]
 
-        # 연산자 검증
-        location = f"조건 {self._get_condition_location(condition)}"
-        if parent_field:
-            location = f"{location} (필드: {parent_field})"
+    def _node_location(self, ir: CompiledConditions, index: int) -> str:
+        """조건 노드 검사 이슈의 위치 (상위 조건이 일반 필드 조건이면 필드 정보 표시)"""
+        location = f"조건 {ir.location(index)}"
+        parent = ir.parent[index]
+        if parent != -1 and not self._is_logical_block(ir, parent) and ir.fields[parent]:
+            location = f"{location} (필드: {ir.fields[parent]})"
+        return location
+
+    def _analyze_condition_node(self, ir: CompiledConditions, index: int, location: str) -> List[ConditionIssue]:
+        """IR 노드 하나에 대한 조건 분석 (하위 조건은 호출 측에서 전위 순서로 처리)"""
+        issues = []
+        field = ir.fields[index]
+        operator = ir.operators[index]
+        value = ir.values[index]
             
         # 논리 연산자 블록인지 확인
-        is_logical_block = condition.field == "placeholder" or (condition.field is None and condition.conditions is not None)
+        is_logical_block = self._is_logical_block(ir, index)
         
         # 일반 필드 조건인 경우에만 필드 검증 수행
-        if not is_logical_block and condition.field and condition.field != "placeholder":
+        if not is_logical_block and field and field != "placeholder":
             try:
                 # 타입 검증을 먼저 수행 (중요: 연산자 검증보다 먼저)
-                if not self._is_valid_type(condition.field, condition.value):
+                if not self._is_valid_type(field, value):
                     field_desc = ""
-                    if condition.field in self.field_schema and "description" in self.field_schema[condition.field]:
-                        field_desc = f" ({self.field_schema[condition.field]['description']})"
+                    if field in self.field_schema and "description" in self.field_schema[field]:
+                        field_desc = f" ({self.field_schema[field]['description']})"
                         
-                    field_type = self._get_field_type(condition.field)
-                    field_type_desc = self._get_field_type_description(condition.field)
-                    value_type = type(condition.value).__name__ if condition.value is not None else "None"
+                    field_type = self._get_field_type(field)
+                    field_type_desc = self._get_field_type_description(field)
+                    value_type = type(value).__name__ if value is not None else "None"
                     
                     issues.append(ConditionIssue(
-                        field=condition.field,
+                        field=field,
                         issue_type="type_mismatch",
                         severity="error",
                         location=location,
-                        explanation=f"{condition.field}{field_desc} 값 '{condition.value}'은(는) {value_type} 타입으로 지정되었지만, 이 필드는 {field_type_desc}이어야 합니다.",
-                        suggestion=self._generate_suggestion("type_mismatch", condition.field, value=condition.value)
+                        explanation=f"{field}{field_desc} 값 '{value}'은(는) {value_type} 타입으로 지정되었지만, 이 필드는 {field_type_desc}이어야 합니다.",
+                        suggestion=self._generate_suggestion("type_mismatch", field, value=value)
                     ))
                     # 타입이 유효하지 않으면 연산자 검증을 건너뛰고 다음 조건으로 넘어갑니다
                 # 타입이 유효한 경우에만 연산자 검증
-                elif not self._is_valid_operator(condition.field, condition.operator):
-                    readable_operator = self._get_human_readable_operator(condition.operator)
+                elif not self._is_valid_operator(field, operator):
+                    readable_operator = self._get_human_readable_operator(operator)
                     field_desc = ""
-                    if condition.field in self.field_schema and "description" in self.field_schema[condition.field]:
-                        field_desc = f" ({self.field_schema[condition.field]['description']})"
+                    if field in self.field_schema and "description" in self.field_schema[field]:
+                        field_desc = f" ({self.field_schema[field]['description']})"
                         
-                    field_type = self._get_field_type_description(condition.field)
+                    field_type = self._get_field_type_description(field)
                     
                     # 정책 정보 추가
                     policy_info = ""
-                    if condition.field in self.field_schema and "policy" in self.field_schema[condition.field]:
-                        policy = self.field_schema[condition.field]["policy"]
-                        if not policy.get("sortable", False) and condition.operator in [">", "<", ">=", "<="]:
+                    if field in self.field_schema and "policy" in self.field_schema[field]:
+                        policy = self.field_schema[field]["policy"]
+                        if not policy.get("sortable", False) and operator in [">", "<", ">=", "<="]:
                             policy_info = "이 필드는 문자열 타입이며, 정렬 비교가 허용되지 않습니다."
-                        elif policy.get("code_group", False) and condition.operator in [">", "<", ">=", "<="]:
+                        elif policy.get("code_group", False) and operator in [">", "<", ">=", "<="]:
                             policy_info = "이 필드는 코드 그룹 필드로, 순서 비교가 의미가 없습니다."
                     
-                    explanation = f"'{readable_operator}' 연산자는 {condition.field}{field_desc} 필드에 사용할 수 없습니다. 이 필드는 {field_type} 타입입니다."
+                    explanation = f"'{readable_operator}' 연산자는 {field}{field_desc} 필드에 사용할 수 없습니다. 이 필드는 {field_type} 타입입니다."
                     if policy_info:
                         explanation += f" {policy_info}"
                     
                     issues.append(ConditionIssue(
-                        field=condition.field,
+                        field=field,
                         issue_type="invalid_operator",
                         severity="error",
                         location=location,
                         explanation=explanation,
-                        suggestion=self._generate_suggestion("invalid_operator", condition.field, condition.operator)
+                        suggestion=self._generate_suggestion("invalid_operator", field, operator)
                     ))
             except Exception as e:
-                print(f"필드 조건 분석 중 오류 ({location}): {str(e)}")
+                logger.warning("필드 조건 분석 중 오류 (%s): %s", location, e)
                 issues.append(ConditionIssue(
-                    field=condition.field,
+                    field=field,
                     issue_type="analysis_error",
                     severity="error",
                     location=location,
@@ -397,18 +499,18 @@ class RuleAnalyzer:
         # 논리 연산자 블록인 경우, 연산자의 유효성 검사
         elif is_logical_block:
             try:
-                if condition.operator.lower() not in ["and", "or"]:
+                if operator.lower() not in ["and", "or"]:
                     issues.append(ConditionIssue(
                         field=None,  # 필드는 None으로 설정 (논리 연산자 블록)
                         issue_type="invalid_structure",
                         severity="error",
                         location=location,
-                        explanation=f"논리 연산자 블록에는 'AND' 또는 'OR' 연산자만 사용할 수 있습니다. 현재 '{condition.operator}'이(가) 사용되었습니다.",
+                        explanation=f"논리 연산자 블록에는 'AND' 또는 'OR' 연산자만 사용할 수 있습니다. 현재 '{operator}'이(가) 사용되었습니다.",
                         suggestion="논리 연산자 블록에는 'AND' 또는 'OR'만 사용하세요."
                     ))
                     
                 # 하위 조건이 없는 경우 경고
-                if not condition.conditions or len(condition.conditions) == 0:
+                if not ir.has_children(index):
                     issues.append(ConditionIssue(
                         field=None,  # 필드는 None으로 설정 (논리 연산자 블록)
                         issue_type="invalid_structure",
@@ -418,9 +520,9 @@ class RuleAnalyzer:
                         suggestion="논리 연산자 블록에 하위 조건을 추가하세요."
                     ))
             except Exception as e:
-                print(f"논리 연산자 블록 분석 중 오류 ({location}): {str(e)}")
+                logger.warning("논리 연산자 블록 분석 중 오류 (%s): %s", location, e)
                 issues.append(ConditionIssue(
-                    field=getattr(condition, "field", "unknown"),
+                    field=field if field is not None else "unknown",
                     issue_type="analysis_error",
                     severity="error",
                     location=location,
@@ -428,37 +530,13 @@ class RuleAnalyzer:
                     suggestion="논리 연산자 블록의 형식을 확인하세요."
                 ))
 
-        # 중복 조건 검증
-        if condition.conditions:
-            try:
-                # 여기서는 중복 검증 제거 - analyze_rule에서 이미 처리함
-                # duplicate_issues = self._check_duplicate_conditions(condition.conditions, contradiction_fields)
-                # issues.extend(duplicate_issues)
-
-                # 중첩 조건 분석
-                for idx, nested_condition in enumerate(condition.conditions):
-                    # 논리 연산자 블록인 경우 parent_field를 None으로 설정
-                    nested_issues = await self._analyze_conditions(
-                        nested_condition, 
-                        parent_field=None if is_logical_block else condition.field, 
-                        depth=depth + 1, 
-                        index=idx + 1,
-                        contradiction_fields=contradiction_fields
-                    )
-                    issues.extend(nested_issues)
-            except Exception as e:
-                print(f"중첩 조건 분석 중 오류 ({location}): {str(e)}")
-                issues.append(ConditionIssue(
-                    field=None,
-                    issue_type="analysis_error",
-                    severity="error",
-                    location=location,
-                    explanation=f"중첩 조건 분석 중 오류: {str(e)}",
-                    suggestion="중첩 조건의 구조를 확인하세요."
-                ))
-
         return issues
     
+    def _is_logical_block(self, ir: CompiledConditions, index: int) -> bool:
+        """논리 연산자 블록 여부 (placeholder 필드 또는 필드 없이 하위 조건만 있는 노드)"""
+        field = ir.fields[index]
+        return field == "placeholder" or (field is None and ir.has_children(index))
+    
     def _is_valid_operator(self, field: str, operator: str) -> bool:
         """연산자 유효성 검사"""
         # 필드 타입 확인
@@ -527,123 +605,69 @@ class RuleAnalyzer:
         else:  # 알 수 없는 타입은 모든 값 허용
             return True
     
-    def _calculate_depth(self, conditions: List[RuleCondition], current_depth: int = 1) -> int:
-        """조건 트리의 최대 깊이 계산 - 중첩 구조 정확히 반영"""
-        if not conditions or len(conditions) == 0:
-            return current_depth
-            
-        max_depth = current_depth
-        for condition in conditions:
-            if condition.conditions and len(condition.conditions) > 0:
-                # 중첩된 조건 구조 발견 - 깊이 증가
-                child_depth = self._calculate_depth(condition.conditions, current_depth + 1)
-                max_depth = max(max_depth, child_depth)
-                
-        return max_depth
-    
-    def _check_duplicate_conditions(self, conditions: List[RuleCondition], contradiction_fields: set = None) -> List[ConditionIssue]:
+    def _check_duplicate_conditions(self, ir: CompiledConditions, contradiction_fields: set = None) -> List[ConditionIssue]:
         """중복 조건 검사"""
         if contradiction_fields is None:
             contradiction_fields = set()
         
         issues = []
         
-        # 필드별로 조건을 그룹화
-        self.condition_map = {}
-        
-        def map_conditions(condition_list, parent_path=""):
-            for idx, condition in enumerate(condition_list):
-                # 필드가 있는 경우만 중복 체크 
-                # 논리 연산자 블록이 아닌 실제 필드 조건만 체크
-                # placeholder 필드는 제외 (논리 연산자 블록을 표현하기 위해 사용)
-                if condition.field and condition.field not in contradiction_fields and condition.field != "placeholder":
-                    # 필드 인덱스 정보와 함께 조건 저장
-                    condition_id = f"{parent_path}/{idx+1}" if parent_path else f"{idx+1}"
-                    if condition.field not in self.condition_map:
-                        self.condition_map[condition.field] = []
-                    
-                    # 조건 위치 정보 추가
-                    global_index = self.condition_index_map.get(id(condition), 0)
-                    condition_location = f"조건 {global_index}" if global_index else condition_id
-                    
-                    self.condition_map[condition.field].append({
-                        "field": condition.field,
-                        "operator": condition.operator,
-                        "value": condition.value,
-                        "index": idx + 1,
-                        "parent_path": parent_path,
-                        "condition_id": condition_id,
-                        "location": condition_location,
-                        "condition_obj": condition
-                    })
-                    
-                # 중첩 조건이 있는 경우 재귀 처리
-                if condition.conditions:
-                    new_path = f"{parent_path}/{idx+1}" if parent_path else f"{idx+1}"
-                    map_conditions(condition.conditions, new_path)
-        
-        # 조건 매핑 생성
-        map_conditions(conditions)
+        # 필드별로 조건을 그룹화 - IR의 필드별 포스팅 리스트 사용
+        # placeholder 필드는 제외 (논리 연산자 블록을 표현하기 위해 사용)
+        condition_map = {
+            field: postings
+            for field, postings in ir.postings.items()
+            if field not in contradiction_fields and field != "placeholder"
+        }
         
         # 필드별로 중복 조건 검사
-        for field, condition_list in self.condition_map.items():
+        for field, condition_list in condition_map.items():
             # 동일 필드에 대해 2개 이상 조건이 있는 경우만 체크
-            if len(condition_list) >= 2 and field not in contradiction_fields:
+            if len(condition_list) >= 2:
                 # 완전히 동일한 조건 찾기 (필드, 연산자, 값이 모두 동일)
                 duplicate_groups = {}
                 
-                for i, condition1 in enumerate(condition_list):
-                    field1 = condition1["field"]
-                    op1 = condition1["operator"]
-                    val1 = condition1["value"]
+                for index in condition_list:
+                    op1 = ir.operators[index]
+                    val1 = ir.values[index]
                     
                     # 정확한 비교를 위해 값을 문자열로 변환하지 않고 원본 타입 그대로 비교
                     # 완전히 동일한 조건 그룹핑을 위한 키 생성 (필드-연산자-값 조합)
                     # 타입까지 포함하여 정확히 비교하기 위해 타입 정보 추가
-                    group_key = f"{field1}-{op1}-{val1}-{type(val1).__name__}"
+                    group_key = f"{field}-{op1}-{val1}-{type(val1).__name__}"
                     
                     if group_key not in duplicate_groups:
                         duplicate_groups[group_key] = []
                     
-                    duplicate_groups[group_key].append(condition1)
+                    duplicate_groups[group_key].append(index)
                 
                 # 각 그룹에서 중복 조건 확인 (완전히 동일한 조건만)
                 for group_key, group_conditions in duplicate_groups.items():
                     if len(group_conditions) >= 2:
-                        # 중복된 조건들의 위치 정보 수집
-                        locations = []
-                        for cond in group_conditions:
-                            if "location" in cond and cond["location"]:
-                                locations.append(cond["location"])
-                            elif "condition_id" in cond:
-                                locations.append(f"조건 {cond['condition_id']}")
-                        
-                        # 위치 정보를 쉼표로 구분하여 표준화
-                        location_str = ", ".join(locations)
+                        # 중복된 조건들의 위치 정보를 쉼표로 구분하여 표준화
+                        location_str = ", ".join(ir.location(index) for index in group_conditions)
                         
                         # 각 중복 그룹당 1건의 이슈 생성
-                        sample_condition = group_conditions[0]
+                        sample = group_conditions[0]
                         issues.append(ConditionIssue(
                             field=field,
                             issue_type="duplicate_condition",
                             severity="warning",
                             location=location_str,  # 표준화된 위치 정보
-                            explanation=f"동일한 조건이 여러 위치({location_str})에 중복 정의되어 있습니다: {field} {sample_condition['operator']} {sample_condition['value']}",
+                            explanation=f"동일한 조건이 여러 위치({location_str})에 중복 정의되어 있습니다: {field} {ir.operators[sample]} {ir.values[sample]}",
                             suggestion=self._generate_suggestion("duplicate_condition", field)
                         ))
         
         return issues
     
-    def _calculate_complexity_score(self, conditions: List[RuleCondition]) -> int:
-        """룰 조건 복잡도 점수 계산"""
-        if not conditions:
+    def _calculate_complexity_score(self, ir: CompiledConditions, field_condition_count: int, unique_fields: int) -> int:
+        """룰 조건 복잡도 점수 계산 (필드 조건 수와 고유 필드 수는 구조 정보 계산 결과 사용)"""
+        if not ir.roots:
             return 0
         
         # 깊이와 조건 수를 고려한 복잡도 점수
-        depth = self._calculate_depth(conditions)
-        condition_count = self._count_conditions(conditions)
-        field_condition_count = self._count_field_conditions(conditions)
-        unique_fields = len(self._extract_unique_fields(conditions))
+        depth = ir.max_depth
+        condition_count = ir.size
         
         # 복잡도 계산 공식: 깊이 * 2 + 필드 조건 수 + 총 조건 수 * 0.5
         complexity = depth * 2 + field_condition_count + condition_count * 0.5
@@ -654,124 +678,122 @@ class RuleAnalyzer:
         
         return int(complexity)
     
-    def _check_contradictions(self, conditions: List[RuleCondition]) -> tuple:
-        """모순 조건 검사"""
+    def _check_contradictions(self, ir: CompiledConditions) -> tuple:
+        """모순 조건 검사 - AND 그룹별 필드 제약을 구간/값 집합으로 접어 빈 교집합 검출"""
         issues = []
         contradiction_fields = set()
         
-        # 필드별로 조건을 그룹화
-        field_conditions = {}
-        
-        def collect_field_conditions(condition_list, parent_path=""):
-            for idx, condition in enumerate(condition_list):
-                # 필드가 있는 경우만 모순 체크 (논리 연산자 블록이 아닌 경우)
-                if condition.field:
-                    # 필드 인덱스 정보와 함께 조건 저장
-                    condition_id = f"{parent_path}/{idx+1}" if parent_path else f"{idx+1}"
-                    if condition.field not in field_conditions:
-                        field_conditions[condition.field] = []
-                    
-                    # 조건 위치 정보 추가
-                    global_index = self.condition_index_map.get(id(condition), 0)
-                    condition_location = f"조건 {global_index}" if global_index else condition_id
-                    
-                    field_conditions[condition.field].append({
-                        "field": condition.field,
-                        "operator": condition.operator,
-                        "value": condition.value,
-                        "index": idx + 1,
-                        "parent_path": parent_path,
-                        "condition_id": condition_id,
-                        "location": condition_location,
-                        "condition_obj": condition
-                    })
-                    
-                # 중첩 조건이 있는 경우 재귀 처리
-                if condition.conditions:
-                    new_path = f"{parent_path}/{idx+1}" if parent_path else f"{idx+1}"
-                    collect_field_conditions(condition.conditions, new_path)
-        
-        # 조건 수집
-        collect_field_conditions(conditions)
-        
-        # 수집된 필드별로 모순 체크
-        for field, field_condition_list in field_conditions.items():
-            contradictions = []
-            
-            # 필드 내 조건이 2개 이상인 경우만 체크
-            if len(field_condition_list) >= 2:
-                for i, condition1 in enumerate(field_condition_list):
-                    for j in range(i+1, len(field_condition_list)):
-                        condition2 = field_condition_list[j]
-                        is_contradiction = False
-                        explanation = ""
-                        
-                        op1 = condition1["operator"]
-                        val1 = condition1["value"]
-                        op2 = condition2["operator"]
-                        val2 = condition2["value"]
-                        
-                        # == 와 != 조건의 자기모순 케이스 먼저 확인 (우선순위 높임)
-                        if (op1 == "==" and op2 == "!=" and str(val1) == str(val2)) or \
-                           (op1 == "!=" and op2 == "==" and str(val1) == str(val2)):
-                            is_contradiction = True
-                            explanation = f"{field} 필드가 '{val1}'와 같고 같지 않아야 함"
-                        elif isinstance(val1, str) and isinstance(val2, str):
-                            # 문자열 동등 비교
-                            if (op1 == "==" and op2 == "==" and val1 != val2):
-                                is_contradiction = True
-                                explanation = f"{field} 필드가 '{val1}'와 '{val2}' 두 값과 동시에 같을 수 없음"
-                        elif isinstance(val1, (int, float)) and isinstance(val2, (int, float)):
-                            # 숫자 범위 체크
-                            if (op1 == ">" and op2 == "<=" and val1 <= val2) or \
-                               (op1 == "<=" and op2 == ">" and val1 >= val2):
-                                is_contradiction = True
-                                explanation = f"{field} 필드가 {val1}보다 크고 {val2}보다 작거나 같을 수 없음"
-                            elif (op1 == ">=" and op2 == "<" and val1 >= val2) or \
-                                 (op1 == "<" and op2 == ">=" and val1 <= val2):
-                                is_contradiction = True
-                                explanation = f"{field} 필드가 {val1}보다 크거나 같고 {val2}보다 작을 수 없음"
-                            # 같음/같지 않음 체크  
-                            elif (op1 == "==" and op2 == "==" and val1 != val2):
-                                is_contradiction = True
-                                explanation = f"{field} 필드가 {val1}와 {val2} 두 값과 동시에 같을 수 없음"
-                        elif (op1 == "==" and op2 == "=="):
-                            # 서로 다른 타입의 값에 대한 == 연산자 사용 시 모순
-                            is_contradiction = True
-                            explanation = f"{field} 필드가 '{val1}'(타입: {type(val1).__name__})와 '{val2}'(타입: {type(val2).__name__}) 두 다른 타입의 값과 동시에 같을 수 없음"
-                        
-                        if is_contradiction:
-                            # 조건 위치 정보 포맷
-                            location1 = condition1["location"]
-                            location2 = condition2["location"]
-                            location_str = f"{location1}, {location2}"
-                            
-                            # 이미 있는 모순과 중복되지 않게 체크
-                            if any(c["location1"] == location1 and c["location2"] == location2 for c in contradictions):
-                                continue
-                                
-                            contradictions.append({
-                                "location1": location1,
-                                "location2": location2,
-                                "explanation": explanation
-                            })
-                            
-                            # 모순 필드 추적
-                            contradiction_fields.add(field)
-            
-            # 발견된 모순에 대해 이슈 생성
-            for contradiction in contradictions:
-                issues.append(ConditionIssue(
-                    field=field,
-                    issue_type="self_contradiction",
-                    severity="error",
-                    location=f"{contradiction['location1']}, {contradiction['location2']}",
-                    explanation=f"자기모순: {contradiction['explanation']}",
-                    suggestion=self._generate_suggestion("self_contradiction", field)
-                ))
+        # OR 분기는 각각 별도의 AND 그룹으로 검사되므로 서로 다른 분기 간 조건은 모순으로 보지 않음
+        for conflict in find_contradictions(ir):
+            field = conflict.field
+            contradiction_fields.add(field)
+            
+            # 최소 모순 집합의 위치 정보 (조건 번호 순)
+            location_str = ", ".join(ir.location(index) for index in conflict.indices)
+            
+            issues.append(ConditionIssue(
+                field=field,
+                issue_type="self_contradiction",
+                severity="error",
+                location=location_str,
+                explanation=f"자기모순: {self._describe_conflict(conflict)}",
+                suggestion=self._generate_suggestion("self_contradiction", field)
+            ))
         
         return issues, contradiction_fields
     
+    def _check_branch_satisfiability(self, ir: CompiledConditions, contradiction_fields: set) -> List[ConditionIssue]:
+        """
+        BDD 분기 판정 결과를 이슈로 변환 (필드 단위 모순/완전 중복 검사가 이미 보고한 내용은 제외)
+
+        - 조건 노드 수/BDD 노드 수/연산 단계 수 한도를 넘거나 판정 중 오류가 나면 이 검사만 생략합니다
+          (부가 검사이므로 룰 검증 결과에는 영향을 주지 않음).
+        """
+        if not settings.ANALYSIS_BDD_MAX_NODES or ir.size > settings.ANALYSIS_BDD_MAX_CONDITIONS:
+            return []
+        try:
+            findings = analyze_branches(self, ir, max_nodes=settings.ANALYSIS_BDD_MAX_NODES, max_steps=settings.ANALYSIS_BDD_MAX_STEPS)
+        except BDDLimitExceeded as e:
+            logger.info("분기 판정 생략: %s", e)
+            return []
+        except Exception:
+            logger.warning("분기 판정 오류로 생략", exc_info=True)
+            return []
+        
+        issues = []
+        for finding in findings:
+            fields = list(dict.fromkeys(ir.fields[index] for index in finding.indices if ir.is_field_condition(index)))
+            if fields and all(field in contradiction_fields for field in fields):
+                continue
+            if finding.kind == REDUNDANT and self._is_exact_duplicate(ir, finding):
+                continue
+            
+            field = fields[0] if len(fields) == 1 else None
+            subject = "룰 전체가" if finding.index == -1 else f"{ir.location(finding.index)}은(는)"
+            others = ", ".join(ir.location(index) for index in finding.indices if index != finding.index)
+            if finding.kind == UNSATISFIABLE:
+                issue_type = "self_contradiction"
+                severity = "error"
+                if others:
+                    explanation = f"분기 모순: {others}을(를) 동시에 만족하는 값이 없어 {subject} 항상 거짓입니다."
+                else:
+                    explanation = f"분기 모순: {subject} 만족하는 값이 없어 항상 거짓입니다."
+            elif finding.kind == ALWAYS_TRUE:
+                issue_type = "duplicate_condition"
+                severity = "warning"
+                if finding.index == -1 or not others:
+                    explanation = f"항상 참인 분기: {subject} 어떤 값이든 항상 참입니다."
+                else:
+                    explanation = f"항상 참인 분기: {subject} 상위 조건({others})에 의해 항상 참이므로 결과에 영향을 주지 않습니다."
+            else:
+                issue_type = "duplicate_condition"
+                severity = "warning"
+                explanation = f"불필요한 분기: {subject} {others}에 포함되어 결과에 영향을 주지 않습니다."
+            
+            issues.append(ConditionIssue(
+                field=field,
+                issue_type=issue_type,
+                severity=severity,
+                location=", ".join(ir.location(index) for index in finding.indices),
+                explanation=explanation,
+                suggestion=self._generate_suggestion(issue_type, field) if field else "여러 조건과 분기 구조가 함께 작용합니다. 관련 조건을 검토하고 분기를 정리하세요."
+            ))
+        return issues
+    
+    def _is_exact_duplicate(self, ir: CompiledConditions, finding: BranchFinding) -> bool:
+        """판정 근거가 대상과 완전히 같은 조건 하나뿐인지 여부 (중복 조건 검사에서 이미 보고됨)"""
+        others = [index for index in finding.indices if index != finding.index]
+        if finding.index == -1 or len(others) != 1 or ir.has_children(finding.index):
+            return False
+        target, other = finding.index, others[0]
+        value, other_value = ir.values[target], ir.values[other]
+        return (ir.fields[target], ir.operators[target], repr(value), type(value)) == (ir.fields[other], ir.operators[other], repr(other_value), type(other_value))
+    
+    def _describe_conflict(self, conflict: Conflict) -> str:
+        """모순 유형별 설명 문구 생성"""
+        field = conflict.field
+        values = conflict.values
+        lower_phrases = {">": "보다 크고", ">=": "보다 크거나 같고"}
+        upper_phrases = {"<": "보다 작을", "<=": "보다 작거나 같을"}
+        bound_phrases = {">": "보다 클", ">=": "보다 크거나 같을", "<": "보다 작을", "<=": "보다 작거나 같을"}
+        
+        if conflict.kind == "range":
+            return (f"{field} 필드가 {values['lower_value']}{lower_phrases[values['lower_operator']]} "
+                    f"{values['upper_value']}{upper_phrases[values['upper_operator']]} 수 없음")
+        elif conflict.kind == "equality":
+            value1, value2 = values["value1"], values["value2"]
+            if type(value1) is not type(value2) and not (is_number(value1) and is_number(value2)):
+                return f"{field} 필드가 '{value1}'(타입: {type(value1).__name__})와 '{value2}'(타입: {type(value2).__name__}) 두 다른 타입의 값과 동시에 같을 수 없음"
+            if isinstance(value1, str):
+                return f"{field} 필드가 '{value1}'와 '{value2}' 두 값과 동시에 같을 수 없음"
+            return f"{field} 필드가 {value1}와 {value2} 두 값과 동시에 같을 수 없음"
+        elif conflict.kind == "not_equal":
+            return f"{field} 필드가 '{values['value']}'와 같고 같지 않아야 함"
+        elif conflict.kind == "equal_bound":
+            return f"{field} 필드가 {values['value']}와 같으면서 {values['bound_value']}{bound_phrases[values['bound_operator']]} 수 없음"
+        else:  # point_excluded
+            return f"{field} 필드가 가질 수 있는 값은 {values['value']} 하나뿐인데 {values['value']}와 같지 않아야 함"
+    
     def _generate_summary(self, issues: List[ConditionIssue]) -> str:
         """이슈 목록에서 요약 생성"""
         error_count = len([issue for issue in issues if issue.severity == "error"])
@@ -805,31 +827,34 @@ class RuleAnalyzer:
         
         return " ".join(summary_parts)
     
-    def _generate_rule_summary(self, rule: Rule) -> str:
+    def _generate_rule_summary(self, rule: Rule, ir: CompiledConditions) -> str:
         """룰 요약 생성"""
-        def format_condition(condition: RuleCondition, indent: int = 0) -> str:
+        def format_condition(index: int, indent: int = 0) -> str:
+            field = ir.fields[index]
+            operator = ir.operators[index]
+            
             # 논리 연산자 블록인지 확인
-            is_logical_block = condition.field == "placeholder" or (condition.field is None and condition.conditions is not None)
+            is_logical_block = self._is_logical_block(ir, index)
             
-            if condition.conditions:
-                nested_conditions = [format_condition(c, indent + 1) for c in condition.conditions]
-                if condition.operator.lower() == "and":
+            if ir.has_children(index):
+                nested_conditions = [format_condition(child, indent + 1) for child in ir.children(index)]
+                if operator.lower() == "and":
                     return f"{'  ' * indent}모든 조건이 만족해야 합니다:\n" + "\n".join(nested_conditions)
                 else:
                     return f"{'  ' * indent}다음 조건 중 하나가 만족해야 합니다:\n" + "\n".join(nested_conditions)
             else:
                 # 실제 필드 조건인 경우에만 필드 정보 표시
-                if not is_logical_block and condition.field and condition.field != "placeholder":
-                    field_desc = self._get_field_type_description(condition.field)
-                    operator_desc = self._get_human_readable_operator(condition.operator)
-                    return f"{'  ' * indent}{field_desc} '{condition.field}'이(가) '{condition.value}'와(과) {operator_desc}"
+                if not is_logical_block and field and field != "placeholder":
+                    field_desc = self._get_field_type_description(field)
+                    operator_desc = self._get_human_readable_operator(operator)
+                    return f"{'  ' * indent}{field_desc} '{field}'이(가) '{ir.values[index]}'와(과) {operator_desc}"
                 else:
                     return f"{'  ' * indent}조건 구조 오류: 필드 정보가 없습니다."
 
-        if not rule.conditions:
+        if not ir.roots:
             return "이 룰에는 조건이 없습니다."
             
-        conditions_summary = [format_condition(condition) for condition in rule.conditions]
+        conditions_summary = [format_condition(index) for index in ir.roots]
         return "이 룰은 다음과 같은 조건을 가집니다:\n" + "\n".join(conditions_summary)
     
     def _get_human_readable_operator(self, operator: str) -> str:
@@ -979,193 +1004,73 @@ class RuleAnalyzer:
         }
         return type_descriptions.get(field_type, "알 수 없는 타입")
     
-    def _get_condition_location(self, condition: RuleCondition) -> str:
-        """조건의 위치 정보 문자열 반환"""
-        global_index = self.condition_index_map.get(id(condition), 0)
-        if global_index:
-            return f"조건 {global_index}"
-        return "알 수 없는 위치"
-    
-    def _get_conditions_location(self, conditions: List[RuleCondition]) -> str:
-        """여러 조건의 위치 정보 문자열 반환"""
-        if not conditions:
-            return ""
-            
-        indices = []
-        for condition in conditions:
-            global_index = self.condition_index_map.get(id(condition), 0)
-            if global_index:
-                indices.append(str(global_index))
-        
-        if len(indices) > 2:
-            # 3개 이상이면 처음과 끝만 표시
-            return f"조건 {indices[0]}~{indices[-1]}"
-        else:
-            # 2개 이하면 단순 나열
-            return "조건 " + ", ".join(indices)
-
-    def _check_ambiguous_branches(self, conditions: List[RuleCondition]) -> List[ConditionIssue]:
+    def _check_ambiguous_branches(self, ir: CompiledConditions) -> List[ConditionIssue]:
         """분기 불명확 검사 - 입력값이 어느 조건에도 해당되지 않거나, 여러 조건 분기에 동시에 포함되는 경우를 감지"""
         issues = []
+        summaries = _BranchSummaries(self, ir)
         
-        # 필드별 조건 정보 수집
-        field_conditions = {}
+        # 최상위 조건 목록과 하위 조건을 가진 모든 노드(전위 순서)를 각각의 검사 범위로 사용
+        scopes = [-1] + [index for index in range(ir.size) if ir.has_children(index)]
         
-        def collect_condition_info(condition_list, parent_path="", parent_operator=None):
-            for idx, condition in enumerate(condition_list):
-                # 필드가 있고 논리 연산자가 아닌 경우만 처리
-                if condition.field and condition.field != "placeholder":
-                    if condition.field not in field_conditions:
-                        field_conditions[condition.field] = []
-                    
-                    # 조건 인덱스와 위치 기록
-                    condition_id = f"{parent_path}/{idx+1}" if parent_path else f"{idx+1}"
-                    global_index = self.condition_index_map.get(id(condition), 0)
-                    condition_location = f"조건 {global_index}" if global_index else condition_id
-                    
-                    # 상위 논리 연산자 정보와 함께 조건 정보 저장
-                    field_conditions[condition.field].append({
-                        "field": condition.field,
-                        "operator": condition.operator,
-                        "value": condition.value,
-                        "location": condition_location,
-                        "parent_operator": parent_operator  # 상위 논리 연산자 (AND/OR)
-                    })
-                
-                # 중첩 조건이 있는 경우 재귀 처리
-                if condition.conditions:
-                    # 현재 조건의 논리 연산자 판단
-                    current_operator = None
-                    if condition.operator and condition.operator.upper() in ["AND", "OR"]:
-                        current_operator = condition.operator.upper()
-                    
-                    # 부모 연산자가 없고 자식이 있는 경우, 기본값 AND 설정 (묵시적 AND)
-                    if not current_operator and not parent_operator:
-                        current_operator = "AND"
-                    
-                    # 재귀 호출 시 현재 연산자 전달
-                    new_path = f"{parent_path}/{idx+1}" if parent_path else f"{idx+1}"
-                    collect_condition_info(condition.conditions, new_path, current_operator or parent_operator)
-        
-        # 필드별 조건 정보 수집
-        collect_condition_info(conditions)
-        
-        # 각 필드별로 분기 불명확 검사
-        for field, conditions_list in field_conditions.items():
-            # 동일 필드에 대한 조건이 2개 이상인 경우만 검사
-            if len(conditions_list) < 2:
-                continue
+        for scope in scopes:
+            # 자식 요약을 병합한 검사 범위 요약 (범위 바로 아래 조건은 상위 연산자 없음)
+            field_summaries = summaries.scope(scope)
             
-            # 필드 타입 확인
-            field_type = self._get_field_type(field)
-            
-            # 타입별 검사 방법 선택
-            if field_type == "number":
-                ambiguous_issue = self._check_number_field_ambiguity(field, conditions_list)
-                if ambiguous_issue:
-                    issues.append(ambiguous_issue)
-            elif field_type == "string":
-                ambiguous_issue = self._check_string_field_ambiguity(field, conditions_list)
-                if ambiguous_issue:
-                    issues.append(ambiguous_issue)
-        
-        # 중첩 조건에 대해서도 검사
-        for condition in conditions:
-            if condition.conditions:
-                nested_issues = self._check_ambiguous_branches(condition.conditions)
-                issues.extend(nested_issues)
+            # 각 필드별로 분기 불명확 검사
+            for field, summary in field_summaries.items():
+                # 동일 필드에 대한 조건이 2개 이상인 경우만 검사
+                if summary.count < 2:
+                    continue
+                
+                # 필드 타입 확인
+                field_type = self._get_field_type(field)
+                
+                # 타입별 검사 방법 선택
+                if field_type == "number":
+                    ambiguous_issue = self._check_number_field_ambiguity(field, summary, summaries)
+                    if ambiguous_issue:
+                        issues.append(ambiguous_issue)
+                elif field_type == "string":
+                    ambiguous_issue = self._check_string_field_ambiguity(field, scope, summary, summaries)
+                    if ambiguous_issue:
+                        issues.append(ambiguous_issue)
         
         return issues
     
-    def _check_number_field_ambiguity(self, field: str, conditions: List[Dict[str, Any]]) -> Optional[ConditionIssue]:
+    def _check_number_field_ambiguity(self, field: str, summary: "_FieldSummary", summaries: "_BranchSummaries") -> Optional[ConditionIssue]:
         """숫자 필드에 대한 분기 불명확 검사"""
-        # 1. 동일 상위 OR 블록 내에서 값 영역이 겹치는 조건 검사
-        or_groups = {}
-        
-        # OR 그룹별로 조건 분류
-        for condition in conditions:
-            parent_op = condition.get("parent_operator")
-            if parent_op == "OR":
-                group_key = str(id(parent_op))  # 부모 연산자 객체의 ID
-                if group_key not in or_groups:
-                    or_groups[group_key] = []
-                or_groups[group_key].append(condition)
-        
-        # 각 OR 그룹 내에서 값 영역 겹침 확인
-        overlapping_conditions = []
-        for group_key, group_conditions in or_groups.items():
-            if len(group_conditions) < 2:
-                continue
-                
-            # 범위 조건 추출
-            ranges = []
-            for condition in group_conditions:
-                op = condition["operator"]
-                value = condition["value"]
-                
-                if not isinstance(value, (int, float)):
-                    try:
-                        value = float(value)
-                    except (ValueError, TypeError):
-                        continue
-                
-                if op == "==":
-                    ranges.append({"min": value, "max": value, "condition": condition})
-                elif op == ">":
-                    ranges.append({"min": value + 0.000001, "max": float("inf"), "condition": condition})
-                elif op == ">=":
-                    ranges.append({"min": value, "max": float("inf"), "condition": condition})
-                elif op == "<":
-                    ranges.append({"min": float("-inf"), "max": value - 0.000001, "condition": condition})
-                elif op == "<=":
-                    ranges.append({"min": float("-inf"), "max": value, "condition": condition})
-            
-            # 범위 겹침 확인
-            for i in range(len(ranges)):
-                for j in range(i+1, len(ranges)):
-                    range1 = ranges[i]
-                    range2 = ranges[j]
-                    
-                    # 겹치는 부분이 있는지 확인
-                    if max(range1["min"], range2["min"]) <= min(range1["max"], range2["max"]):
-                        overlapping_conditions.append((range1["condition"], range2["condition"]))
-        
-        # 겹치는 조건이 있으면 이슈 생성
-        if overlapping_conditions:
+        # 1. 동일 상위 OR 블록 내에서 값 영역이 겹치는 조건 검사 - OR 그룹별 겹침은 요약 생성 시 한 번만 계산됨
+        if summary.groups:
+            cache_key = ("overlap", field, summary.groups)
+            cached = summaries.issues.get(cache_key)
+            if cached is not None:
+                return cached
+            
             locations = []
-            for cond1, cond2 in overlapping_conditions:
-                locations.append(f"{cond1['location']}, {cond2['location']}")
+            overlap_ranges = []
+            for group in summary.groups:
+                for cond1, cond2, overlap in summaries.overlaps[(group, field)]:
+                    locations.append(f"{summaries.ir.location(cond1)}, {summaries.ir.location(cond2)}")
+                    overlap_ranges.append(f"{summaries.ir.location(cond1)}∩{summaries.ir.location(cond2)} {overlap}")
             
             location_str = "; ".join(locations)
             field_desc = ""
             if field in self.field_schema and "description" in self.field_schema[field]:
                 field_desc = f" ({self.field_schema[field]['description']})"
             
-            return ConditionIssue(
+            issue = ConditionIssue(
                 field=field,
                 issue_type="ambiguous_branch",
                 severity="warning",
                 location=location_str,
-                explanation=f"{field}{field_desc} 필드에 대한 조건이 여러 분기에 동시에 적용될 수 있습니다. 값 범위가 겹치는 조건이 있습니다.",
+                explanation=f"{field}{field_desc} 필드에 대한 조건이 여러 분기에 동시에 적용될 수 있습니다. 값 범위가 겹치는 조건이 있습니다. (겹치는 구간: {'; '.join(overlap_ranges)})",
                 suggestion="조건 분기를 명확하게 정의하세요. 범위가 겹치지 않도록 조건을 수정하세요."
             )
+            summaries.issues[cache_key] = issue
+            return issue
         
-        # 2. 어느 조건에도 해당되지 않는 사각지대 검출
-        all_values = set()
-        for condition in conditions:
-            op = condition["operator"]
-            value = condition["value"]
-            
-            if op == "==" and isinstance(value, (int, float)):
-                all_values.add(value)
-        
-        # 0을 포함한 주요 값이 누락되었는지 확인
-        key_values = [0, 1]  # 주요 확인 값
-        missing_values = []
-        
-        for key_value in key_values:
-            if key_value not in all_values and all(not self._value_matches_condition(key_value, condition) for condition in conditions):
-                missing_values.append(key_value)
+        # 2. 어느 조건에도 해당되지 않는 사각지대 검출 (0을 포함한 주요 값)
+        missing_values = summaries.missing_key_values(field, summary)
         
         if missing_values:
             field_desc = ""
@@ -1184,33 +1089,28 @@ class RuleAnalyzer:
         
         return None
     
-    def _check_string_field_ambiguity(self, field: str, conditions: List[Dict[str, Any]]) -> Optional[ConditionIssue]:
+    def _check_string_field_ambiguity(self, field: str, scope: int, summary: "_FieldSummary", summaries: "_BranchSummaries") -> Optional[ConditionIssue]:
         """문자열 필드에 대한 분기 불명확 검사"""
         # 문자열 필드는 주로 == 연산자로 검사하므로, 동일 값에 대한 중복 조건 검사
-        string_values = {}
-        
-        for condition in conditions:
-            op = condition["operator"]
-            value = condition["value"]
-            
-            if op == "==" and isinstance(value, str):
-                if value not in string_values:
-                    string_values[value] = []
-                string_values[value].append(condition)
-        
-        # 동일 값에 대해 여러 조건이 있는 경우
-        ambiguous_values = {}
-        for value, value_conditions in string_values.items():
-            if len(value_conditions) > 1:
-                # 서로 다른 상위 연산자(AND/OR) 아래에 있는 경우만 애매함으로 판단
-                parent_ops = set(cond.get("parent_operator") for cond in value_conditions)
-                if len(parent_ops) > 1 or "OR" in parent_ops:
-                    ambiguous_values[value] = value_conditions
+        # 동일 값에 대해 여러 조건이 있고, 서로 다른 상위 연산자(AND/OR) 아래에 있거나 OR 아래에 있는 경우만 애매함으로 판단
+        ambiguous_values = []
+        for value, counts in summary.values.items():
+            present = [count for count in counts[:LABEL_PENDING] if count]
+            if sum(present) > 1 and (len(present) > 1 or counts[LABEL_OR]):
+                ambiguous_values.append(value)
         
         if ambiguous_values:
+            # 값별 조건 위치는 (필드, 값) 포스팅 리스트에서 검사 범위 구간만 잘라 사용
+            start, end = (0, summaries.ir.size) if scope == -1 else (scope + 1, summaries.ir.end[scope])
+            value_ranges = tuple((value,) + summaries.value_range(field, value, start, end) for value in ambiguous_values)
+            cache_key = ("string", field, value_ranges)
+            cached = summaries.issues.get(cache_key)
+            if cached is not None:
+                return cached
+            
             locations = []
-            for value, value_conditions in ambiguous_values.items():
-                cond_locations = [cond["location"] for cond in value_conditions]
+            for value, lo, hi in value_ranges:
+                cond_locations = [summaries.ir.location(index) for index in summaries.value_postings[(field, value)][lo:hi]]
                 locations.append(f"값 '{value}': {', '.join(cond_locations)}")
             
             location_str = "; ".join(locations)
@@ -1218,7 +1118,7 @@ class RuleAnalyzer:
             if field in self.field_schema and "description" in self.field_schema[field]:
                 field_desc = f" ({self.field_schema[field]['description']})"
             
-            return ConditionIssue(
+            issue = ConditionIssue(
                 field=field,
                 issue_type="ambiguous_branch",
                 severity="warning",
@@ -1226,14 +1126,11 @@ class RuleAnalyzer:
                 explanation=f"{field}{field_desc} 필드에 대한 동일 값이 여러 조건 분기에 중복 정의되어 있어 처리 경로가 불명확합니다.",
                 suggestion="동일 값에 대한 처리를 한 곳으로 통합하여 논리적 일관성을 유지하세요."
             )
+            summaries.issues[cache_key] = issue
+            return issue
             
         # 주요 값('', null 등)이 어느 조건에도 해당되지 않는지 확인
-        key_values = ["", None]  # 주요 확인 값
-        missing_values = []
-        
-        for key_value in key_values:
-            if all(not self._value_matches_condition(key_value, condition) for condition in conditions):
-                missing_values.append(key_value if key_value != "" else "빈 문자열")
+        missing_values = [key_value if key_value != "" else "빈 문자열" for key_value in summaries.missing_key_values(field, summary)]
         
         if missing_values:
             field_desc = ""
@@ -1378,30 +1275,6 @@ class RuleAnalyzer:
             )
         )
 
-    def _assign_global_indices(self, conditions: List[RuleCondition], parent_operator: str = None) -> None:
-        """모든 조건에 글로벌 인덱스 할당"""
-        for condition in conditions:
-            # 인덱스 할당
-            self.global_condition_index += 1
-            self.condition_index_map[id(condition)] = self.global_condition_index
-            
-            # 부모 연산자 정보 저장 (location 표시에 활용)
-            if parent_operator:
-                setattr(condition, 'parent_operator', parent_operator)
-            
-            # 현재 조건의 연산자 추출
-            current_operator = None
-            if hasattr(condition, 'operator'):
-                current_operator = condition.operator
-            
-            # 중첩 조건이 있는 경우 재귀 처리
-            if condition.conditions:
-                # 논리 연산자는 대문자로 표준화
-                if current_operator and current_operator.upper() in ["AND", "OR"]:
-                    self._assign_global_indices(condition.conditions, current_operator.upper())
-                else:
-                    self._assign_global_indices(condition.conditions, parent_operator)
-
     def _get_field_type(self, field: str) -> str:
         """필드 타입 반환 - 스키마 기반"""
         # 스키마에 정의된 필드 타입 반환
@@ -1423,79 +1296,44 @@ class RuleAnalyzer:
         }
         return field_types.get(field, "string")  # 기본값은 문자열
 
-    def _count_conditions(self, conditions: List[RuleCondition]) -> int:
-        """전체 조건 노드 수 계산 - 논리 연산자 노드 포함"""
-        if not conditions:
-            return 0
-            
-        count = len(conditions)
-        for condition in conditions:
-            if condition.conditions:
-                count += self._count_conditions(condition.conditions)
-                
-        return count
-
-    def _count_field_conditions(self, conditions: List[RuleCondition]) -> int:
+    def _count_field_conditions(self, ir: CompiledConditions) -> int:
         """실제 필드를 가진 비교 조건 수만 계산 (논리 연산자 노드 제외)"""
-        if not conditions:
-            return 0
-            
-        count = 0
-        for condition in conditions:
-            # field가 있고 논리 연산자가 아닌 경우만 카운트
-            if condition.field and condition.field.upper() not in ["AND", "OR", "GROUP"] and condition.field != "placeholder":
-                count += 1
-            
-            # 중첩 조건도 계산
-            if condition.conditions:
-                count += self._count_field_conditions(condition.conditions)
-                
-        return count
+        return sum(1 for index in range(ir.size) if ir.is_field_condition(index))
     
-    def _extract_unique_fields(self, conditions: List[RuleCondition]) -> List[str]:
-        """고유 필드 추출 - 유효한 필드만 포함"""
-        unique_fields = set()
-        
-        def extract_fields(conditions_list):
-            for condition in conditions_list:
-                # 실제 필드만 추가 (논리 연산자 블록 제외)
-                if condition.field and condition.field.upper() not in ["AND", "OR", "GROUP"] and condition.field != "placeholder":
-                    unique_fields.add(condition.field)
-                if condition.conditions:
-                    extract_fields(condition.conditions)
-                    
-        extract_fields(conditions)
-        return list(unique_fields)
+    def _extract_unique_fields(self, ir: CompiledConditions) -> List[str]:
+        """고유 필드 추출 - 유효한 필드만 포함 (첫 등장 순서 유지)"""
+        # 포스팅 리스트의 첫 노드로 필드 유효성 판단 (논리 연산자 블록 제외)
+        return [field for field, postings in ir.postings.items() if ir.is_field_condition(postings[0])]
 
-    def _check_missing_conditions(self, conditions: List[RuleCondition]) -> List[ConditionIssue]:
+    def _check_missing_conditions(self, ir: CompiledConditions) -> List[ConditionIssue]:
         """조건 누락 가능성 탐지"""
         issues = []
-        field_conditions = {}
-        
-        # 필드별로 조건 그룹화
-        for condition in conditions:
-            # 논리 연산자 블록 제외, 실제 필드 조건만 검사
-            if condition.field and condition.field != "placeholder":
-                if condition.field not in field_conditions:
-                    field_conditions[condition.field] = []
-                
-                field_conditions[condition.field].append({
-                    "operator": condition.operator,
-                    "value": condition.value
-                })
         
-        # 각 필드별로 누락된 조건 검사
-        for field, conditions_list in field_conditions.items():
-            # 현재는 숫자 타입 필드에 대한 범위 누락만 검사
-            if field in self.field_schema and self.field_schema[field]["type"] == "number":
-                missing_ranges = self._check_number_field_missing_ranges(field, conditions_list)
-                issues.extend(missing_ranges)
+        # 최상위 조건 목록과 각 하위 조건 목록(전위 순서)을 형제 그룹 단위로 검사
+        sibling_groups = [ir.roots] + [list(ir.children(index)) for index in range(ir.size) if ir.has_children(index)]
         
-        # 중첩 조건에 대해서도 검사
-        for condition in conditions:
-            if condition.conditions:
-                nested_issues = self._check_missing_conditions(condition.conditions)
-                issues.extend(nested_issues)
+        for siblings in sibling_groups:
+            field_conditions = {}
+            
+            # 필드별로 조건 그룹화
+            for index in siblings:
+                field = ir.fields[index]
+                # 논리 연산자 블록 제외, 실제 필드 조건만 검사
+                if field and field != "placeholder":
+                    if field not in field_conditions:
+                        field_conditions[field] = []
+                    
+                    field_conditions[field].append({
+                        "operator": ir.operators[index],
+                        "value": ir.values[index]
+                    })
+            
+            # 각 필드별로 누락된 조건 검사
+            for field, conditions_list in field_conditions.items():
+                # 현재는 숫자 타입 필드에 대한 범위 누락만 검사
+                if field in self.field_schema and self.field_schema[field]["type"] == "number":
+                    missing_ranges = self._check_number_field_missing_ranges(field, conditions_list)
+                    issues.extend(missing_ranges)
                 
         return issues
     
@@ -1553,7 +1391,7 @@ class RuleAnalyzer:
         
         return issues
     
-    def _generate_ai_comment(self, rule: Rule, issues: List[ConditionIssue], structure: StructureInfo) -> Optional[str]:
+    def _generate_ai_comment(self, ir: CompiledConditions, issues: List[ConditionIssue], structure: StructureInfo) -> Optional[str]:
         """
         정해진 이슈 타입 외에 AI가 자유롭게 판단한 조언을 생성
         - 설계 팁, 의문 제기, 개선 제안, 단순화 제안 등을 포함
@@ -1574,36 +1412,32 @@ class RuleAnalyzer:
         missing_default_fields = []
         special_fields = set(["ENTR_STUS_CD", "MRKT_CD", "MBL_ACT_MEM_PCNT", "IOT_MEM_PCNT"])
         
-        def analyze_fields(conditions):
-            nonlocal missing_default_fields
-            
-            for condition in conditions:
-                # 필드 조건 카운트
-                if condition.field and condition.field != "placeholder":
-                    if condition.field not in field_condition_counts:
-                        field_condition_counts[condition.field] = 0
-                    field_condition_counts[condition.field] += 1
-                    
-                    # 기본값 처리 누락 가능성 체크
-                    if condition.field in special_fields and condition.field not in missing_default_fields:
-                        # 특정 필드들에 대한 조건이 제한적인 경우
-                        if condition.field == "ENTR_STUS_CD" and condition.operator == "==" and condition.value == "정지":
-                            missing_default_fields.append(condition.field)  # 일단 추가
-                
-                # 특정 값을 가진 조건이 있으면 missing_default_fields에서 제거
-                if condition.field == "ENTR_STUS_CD" and condition.operator == "==" and condition.value == "정상":
-                    if "ENTR_STUS_CD" in missing_default_fields:
-                        missing_default_fields.remove("ENTR_STUS_CD")
+        # IR 노드는 전위 순서로 저장되어 있으므로 순서대로 한 번만 순회
+        for index in range(ir.size):
+            field = ir.fields[index]
+            operator = ir.operators[index]
+            value = ir.values[index]
+            
+            # 필드 조건 카운트
+            if field and field != "placeholder":
+                if field not in field_condition_counts:
+                    field_condition_counts[field] = 0
+                field_condition_counts[field] += 1
                 
-                # 논리 연산자 카운트
-                if condition.operator and condition.operator.lower() in ["and", "or"]:
-                    logical_operators[condition.operator.lower()] += 1
-                    
-                # 중첩 조건 재귀 분석
-                if condition.conditions:
-                    analyze_fields(condition.conditions)
-        
-        analyze_fields(rule.conditions)
+                # 기본값 처리 누락 가능성 체크
+                if field in special_fields and field not in missing_default_fields:
+                    # 특정 필드들에 대한 조건이 제한적인 경우
+                    if field == "ENTR_STUS_CD" and operator == "==" and value == "정지":
+                        missing_default_fields.append(field)  # 일단 추가
+            
+            # 특정 값을 가진 조건이 있으면 missing_default_fields에서 제거
+            if field == "ENTR_STUS_CD" and operator == "==" and value == "정상":
+                if "ENTR_STUS_CD" in missing_default_fields:
+                    missing_default_fields.remove("ENTR_STUS_CD")
+            
+            # 논리 연산자 카운트
+            if operator and operator.lower() in ["and", "or"]:
+                logical_operators[operator.lower()] += 1
         
         # 3. 특정 패턴 분석
         # 3.1. OR 연산자가 많은 경우
@@ -1634,77 +1468,257 @@ class RuleAnalyzer:
         
         return " ".join(selected_comments)
 
-    def _precheck_type_mismatches(self, conditions: List[RuleCondition]) -> List[ConditionIssue]:
+    def _precheck_type_mismatches(self, ir: CompiledConditions) -> List[ConditionIssue]:
         """타입 불일치를 검사하여 이슈 목록 반환 (이전: 예외 발생)"""
         issues = []
         
-        for i, condition in enumerate(conditions):
-            try:
-                # 필드 타입 확인
-                if condition.field:
-                    field_type = self._get_field_type(condition.field)
-                    location = f"조건 {self.condition_index_map.get(id(condition), i+1)}"
+        # IR 노드를 전위 순서로 순회 (중첩 조건 포함)
+        for index in range(ir.size):
+            issues.extend(self._precheck_node(ir, index, ir.location(index)))
+                
+        return issues
+
+    def _precheck_node(self, ir: CompiledConditions, index: int, location: str) -> List[ConditionIssue]:
+        """노드 하나의 타입 사전 검사"""
+        issues = []
+        field = ir.fields[index]
+        operator = ir.operators[index]
+        value = ir.values[index]
+        try:
+            # 필드 타입 확인
+            if field:
+                field_type = self._get_field_type(field)
+                
+                # 숫자 타입 필드에 문자열 값을 사용하는 경우 - 더 엄격한 체크
+                if field_type == "number" and not isinstance(value, (int, float)):
+                    # 이전: raise TypeError
+                    # 현재: 이슈 추가
+                    field_desc = ""
+                    if field in self.field_schema and "description" in self.field_schema[field]:
+                        field_desc = f" ({self.field_schema[field]['description']})"
                     
-                    # 숫자 타입 필드에 문자열 값을 사용하는 경우 - 더 엄격한 체크
-                    if field_type == "number" and not isinstance(condition.value, (int, float)):
-                        # 이전: raise TypeError
-                        # 현재: 이슈 추가
-                        field_desc = ""
-                        if condition.field in self.field_schema and "description" in self.field_schema[condition.field]:
-                            field_desc = f" ({self.field_schema[condition.field]['description']})"
-                        
-                        issues.append(ConditionIssue(
-                            field=condition.field,
-                            issue_type="type_mismatch",
-                            severity="error",
-                            location=location,
-                            explanation=f"타입 불일치: 숫자(int) 타입 필드 '{condition.field}'{field_desc}에 {type(condition.value).__name__} 타입 값이 사용되었습니다.",
-                            suggestion=f"조건에 사용된 값의 타입이 일치하는지 확인하세요. '{condition.field}' 필드는 숫자 타입이므로 숫자 값을 사용해야 합니다."
-                        ))
+                    issues.append(ConditionIssue(
+                        field=field,
+                        issue_type="type_mismatch",
+                        severity="error",
+                        location=location,
+                        explanation=f"타입 불일치: 숫자(int) 타입 필드 '{field}'{field_desc}에 {type(value).__name__} 타입 값이 사용되었습니다.",
+                        suggestion=f"조건에 사용된 값의 타입이 일치하는지 확인하세요. '{field}' 필드는 숫자 타입이므로 숫자 값을 사용해야 합니다."
+                    ))
+                
+                # 문자열 타입 필드에 숫자 값을 사용하는 경우
+                if field_type == "string" and isinstance(value, (int, float)):
+                    # 이전: raise TypeError
+                    # 현재: 이슈 추가
+                    field_desc = ""
+                    if field in self.field_schema and "description" in self.field_schema[field]:
+                        field_desc = f" ({self.field_schema[field]['description']})"
                     
-                    # 문자열 타입 필드에 숫자 값을 사용하는 경우
-                    if field_type == "string" and isinstance(condition.value, (int, float)):
+                    issues.append(ConditionIssue(
+                        field=field,
+                        issue_type="type_mismatch",
+                        severity="error",
+                        location=location,
+                        explanation=f"타입 불일치: 문자열(str) 타입 필드 '{field}'{field_desc}에 숫자({type(value).__name__}) 값 {value}이 사용되었습니다.",
+                        suggestion=f"조건에 사용된 값의 타입이 일치하는지 확인하세요. '{field}' 필드는 문자열 타입이므로 문자열 값을 사용해야 합니다."
+                    ))
+                
+                # 비교 연산자에 대한 추가 검사
+                if operator in [">", ">=", "<", "<="]:
+                    # 비교 연산자에 대한 타입 체크
+                    if field_type == "string":
                         # 이전: raise TypeError
                         # 현재: 이슈 추가
                         field_desc = ""
-                        if condition.field in self.field_schema and "description" in self.field_schema[condition.field]:
-                            field_desc = f" ({self.field_schema[condition.field]['description']})"
+                        if field in self.field_schema and "description" in self.field_schema[field]:
+                            field_desc = f" ({self.field_schema[field]['description']})"
                         
                         issues.append(ConditionIssue(
-                            field=condition.field,
-                            issue_type="type_mismatch",
+                            field=field,
+                            issue_type="invalid_operator",
                             severity="error",
                             location=location,
-                            explanation=f"타입 불일치: 문자열(str) 타입 필드 '{condition.field}'{field_desc}에 숫자({type(condition.value).__name__}) 값 {condition.value}이 사용되었습니다.",
-                            suggestion=f"조건에 사용된 값의 타입이 일치하는지 확인하세요. '{condition.field}' 필드는 문자열 타입이므로 문자열 값을 사용해야 합니다."
+                            explanation=f"비교 연산자 '{operator}'는 문자열 타입 필드 '{field}'{field_desc}에 사용할 수 없습니다.",
+                            suggestion=f"문자열 필드에는 '==', '!=', 'contains' 등의 연산자를 사용하세요. 비교 연산자(>, <, >=, <=)는 숫자 타입에만 사용 가능합니다."
                         ))
-                    
-                    # 비교 연산자에 대한 추가 검사
-                    if condition.operator in [">", ">=", "<", "<="]:
-                        # 비교 연산자에 대한 타입 체크
-                        if field_type == "string":
-                            # 이전: raise TypeError
-                            # 현재: 이슈 추가
-                            field_desc = ""
-                            if condition.field in self.field_schema and "description" in self.field_schema[condition.field]:
-                                field_desc = f" ({self.field_schema[condition.field]['description']})"
-                            
-                            issues.append(ConditionIssue(
-                                field=condition.field,
-                                issue_type="invalid_operator",
-                                severity="error",
-                                location=location,
-                                explanation=f"비교 연산자 '{condition.operator}'는 문자열 타입 필드 '{condition.field}'{field_desc}에 사용할 수 없습니다.",
-                                suggestion=f"문자열 필드에는 '==', '!=', 'contains' 등의 연산자를 사용하세요. 비교 연산자(>, <, >=, <=)는 숫자 타입에만 사용 가능합니다."
-                            ))
-            except Exception as e:
-                print(f"타입 검사 중 예외 발생 ({condition.field if hasattr(condition, 'field') else 'unknown'}): {str(e)}")
-                # 예외는 무시하고 계속 진행 (다른 조건 검사를 위해)
-                pass
-            
-            # 중첩 조건이 있는 경우 재귀적으로 검사
-            if condition.conditions:
-                nested_issues = self._precheck_type_mismatches(condition.conditions)
-                issues.extend(nested_issues)
-                
-        return issues
\ No newline at end of file
+        except Exception as e:
+            logger.warning("타입 검사 중 예외 발생 (%s): %s", field, e)
+            # 예외는 무시하고 계속 진행 (다른 조건 검사를 위해)
+
+        return issues
+
+
+# 분기 요약에서 조건의 상위 논리 연산자 분류 (검사 범위 바로 아래 / AND / OR / 아직 정해지지 않음)
+LABEL_NONE = 0
+LABEL_AND = 1
+LABEL_OR = 2
+LABEL_PENDING = 3
+
+# 필드 타입별 사각지대 확인 대상 주요 값
+AMBIGUITY_KEY_VALUES: Dict[str, List[Any]] = {
+    "number": [0, 1],
+    "string": ["", None]
+}
+
+
+class _FieldSummary:
+    """서브트리 내 한 필드의 조건 요약"""
+
+    __slots__ = ("count", "covered", "groups", "values", "pending")
+
+    def __init__(self):
+        self.count = 0                          # 조건 수
+        self.covered = 0                        # 조건에 매칭되는 주요 값 비트마스크
+        self.groups: Tuple[int, ...] = ()       # 값 범위가 겹치는 OR 그룹 노드 (첫 조건 순서)
+        self.values: Dict[Any, List[int]] = {}  # == 문자열 값별 상위 연산자 분류 개수
+        self.pending: List[int] = []            # 상위 AND/OR 그룹이 아직 정해지지 않은 조건 노드
+
+
+class _BranchSummaries:
+    """
+    분기 불명확 검사를 위한 서브트리별 필드 요약
+
+    - 각 노드의 요약은 하위 노드부터 한 번만 계산하고, 자식 요약을 병합하여 부모 요약을 만듭니다.
+    - 조건의 상위 논리 연산자는 가장 가까운 AND/OR 그룹을 만날 때까지 '미정'으로 두었다가 병합 시 확정합니다.
+    - OR 그룹의 값 범위 겹침은 그룹마다 한 번만 계산하며, 같은 내용의 이슈는 검사 범위 간에 재사용합니다.
+    """
+
+    def __init__(self, analyzer: "RuleAnalyzer", ir: CompiledConditions):
+        self.analyzer = analyzer
+        self.ir = ir
+        self.overlaps: Dict[Tuple[int, str], List[Tuple[int, int, Any]]] = {}  # (OR 그룹, 필드) -> 겹치는 조건 쌍
+        self.value_postings: Dict[Tuple[str, Any], List[int]] = {}  # (필드, == 문자열 값) -> 조건 노드
+        self.issues: Dict[Tuple[Any, ...], ConditionIssue] = {}  # 검사 범위 간 재사용 이슈
+        self._group_first: Dict[Tuple[int, str], int] = {}
+        self._covered: Dict[int, int] = {}
+        self._key_values: Dict[str, List[Any]] = {}
+
+        for index in range(ir.size):
+            field = ir.fields[index]
+            if not field or field == "placeholder":
+                continue
+            key_values = self._field_key_values(field)
+            condition = {"operator": ir.operators[index], "value": ir.values[index]}
+            covered = 0
+            for bit, key_value in enumerate(key_values):
+                if analyzer._value_matches_condition(key_value, condition):
+                    covered |= 1 << bit
+            self._covered[index] = covered
+            if condition["operator"] == "==" and isinstance(condition["value"], str):
+                self.value_postings.setdefault((field, condition["value"]), []).append(index)
+
+        # 하위 조건을 가진 노드를 역 전위 순서로 처리하면 자식 요약이 항상 먼저 계산됨
+        self._views: Dict[int, Dict[str, _FieldSummary]] = {}
+        for index in reversed(range(ir.size)):
+            if ir.has_children(index):
+                logical = ir.logical[index]
+                label = LABEL_PENDING if logical is None else (LABEL_OR if logical == "OR" else LABEL_AND)
+                self._views[index] = self._merge(index, list(ir.children(index)), label, label)
+
+    def scope(self, scope: int) -> Dict[str, _FieldSummary]:
+        """검사 범위 요약 (범위 바로 아래 조건은 상위 연산자 없음, 미정 조건은 묵시적 AND)"""
+        children = self.ir.roots if scope == -1 else list(self.ir.children(scope))
+        return self._merge(None, children, LABEL_NONE, LABEL_AND)
+
+    def missing_key_values(self, field: str, summary: _FieldSummary) -> List[Any]:
+        """어느 조건에도 매칭되지 않는 주요 값 목록"""
+        return [key_value for bit, key_value in enumerate(self._field_key_values(field)) if not summary.covered & (1 << bit)]
+
+    def value_range(self, field: str, value: Any, start: int, end: int) -> Tuple[int, int]:
+        """(필드, 값) 포스팅 리스트에서 [start, end) 구간에 해당하는 슬라이스 범위"""
+        postings = self.value_postings[(field, value)]
+        return bisect_left(postings, start), bisect_left(postings, end)
+
+    def _field_key_values(self, field: str) -> List[Any]:
+        key_values = self._key_values.get(field)
+        if key_values is None:
+            key_values = AMBIGUITY_KEY_VALUES.get(self.analyzer._get_field_type(field), [])
+            self._key_values[field] = key_values
+        return key_values
+
+    def _merge(self, anchor: Optional[int], children: List[int], direct_label: int, pending_label: int) -> Dict[str, _FieldSummary]:
+        """
+        자식 요약 병합
+
+        Args:
+            anchor: 미정 조건의 상위 그룹으로 확정할 노드 (없으면 None)
+            children: 직계 하위 조건 노드
+            direct_label: 직계 하위 조건의 상위 연산자 분류
+            pending_label: 자식 요약의 미정 조건에 적용할 분류
+        """
+        ir = self.ir
+        merged: Dict[str, _FieldSummary] = {}
+        members: Dict[str, List[int]] = {}
+
+        for child in children:
+            field = ir.fields[child]
+            if child in self._covered:
+                summary = merged.get(field)
+                if summary is None:
+                    summary = merged[field] = _FieldSummary()
+                summary.count += 1
+                summary.covered |= self._covered[child]
+                value = ir.values[child]
+                if ir.operators[child] == "==" and isinstance(value, str):
+                    summary.values.setdefault(value, [0, 0, 0, 0])[direct_label] += 1
+                if direct_label == LABEL_PENDING:
+                    summary.pending.append(child)
+                elif anchor is not None:
+                    members.setdefault(field, []).append(child)
+
+            for field, child_summary in self._views.get(child, {}).items():
+                summary = merged.get(field)
+                if summary is None:
+                    summary = merged[field] = _FieldSummary()
+                summary.count += child_summary.count
+                summary.covered |= child_summary.covered
+                summary.groups += child_summary.groups
+                for value, counts in child_summary.values.items():
+                    target = summary.values.setdefault(value, [0, 0, 0, 0])
+                    target[LABEL_NONE] += counts[LABEL_NONE]
+                    target[LABEL_AND] += counts[LABEL_AND]
+                    target[LABEL_OR] += counts[LABEL_OR]
+                    target[pending_label] += counts[LABEL_PENDING]
+                if pending_label == LABEL_PENDING:
+                    summary.pending.extend(child_summary.pending)
+                elif anchor is not None and child_summary.pending:
+                    members.setdefault(field, []).extend(child_summary.pending)
+
+        # OR 그룹으로 확정된 조건들의 값 범위 겹침 계산 (그룹당 한 번)
+        if anchor is not None and direct_label == LABEL_OR:
+            for field, member_indices in members.items():
+                if len(member_indices) < 2 or self.analyzer._get_field_type(field) != "number":
+                    continue
+                overlaps = find_overlaps(self._member_ranges(member_indices))
+                if overlaps:
+                    self.overlaps[(anchor, field)] = overlaps
+                    self._group_first[(anchor, field)] = member_indices[0]
+                    merged[field].groups += (anchor,)
+
+        for field, summary in merged.items():
+            if len(summary.groups) > 1:
+                summary.groups = tuple(sorted(summary.groups, key=lambda group: self._group_first[(group, field)]))
+
+        return merged
+
+    def _member_ranges(self, member_indices: List[int]) -> List[Tuple[int, Any]]:
+        """OR 그룹 조건을 (노드, 구간) 목록으로 변환"""
+        ir = self.ir
+        ranges = []
+        for index in member_indices:
+            value = ir.values[index]
+            
+            if not is_number(value):
+                try:
+                    value = float(value)
+                except (ValueError, TypeError):
+                    continue
+            
+            interval = interval_from_comparison(ir.operators[index], value)
+            if interval is not None:
+                ranges.append((index, interval))
+        return ranges
+
+
+# 앱 전체에서 공유하는 분석기 인스턴스 (상태가 없어 동시 요청에서 안전하게 재사용)
+rule_analyzer = RuleAnalyzer()
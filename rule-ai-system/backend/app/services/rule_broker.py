@@ -0,0 +1,276 @@
+import base64
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+from app.config import settings
+
+BROKER_TYPES = ("local", "kafka")
+
+
+class BrokerMessage:
+    """브로커에서 받은 메시지 하나 (토픽, 파티션, 오프셋으로 위치를 식별)"""
+
+    __slots__ = ("topic", "partition", "offset", "key", "value")
+
+    def __init__(self, topic: str, partition: int, offset: int, key: Optional[bytes], value: bytes):
+        self.topic = topic
+        self.partition = partition
+        self.offset = offset
+        self.key = key
+        self.value = value
+
+
+def _next_offsets(messages: List[BrokerMessage]) -> Dict[Tuple[str, int], int]:
+    """파티션별로 커밋할 다음 오프셋 (처리한 마지막 오프셋 + 1)"""
+    offsets: Dict[Tuple[str, int], int] = {}
+    for message in messages:
+        position = (message.topic, message.partition)
+        offsets[position] = max(offsets.get(position, 0), message.offset + 1)
+    return offsets
+
+
+def _first_offsets(messages: List[BrokerMessage]) -> Dict[Tuple[str, int], int]:
+    """파티션별로 다시 읽기 시작할 오프셋 (받은 첫 오프셋)"""
+    offsets: Dict[Tuple[str, int], int] = {}
+    for message in messages:
+        position = (message.topic, message.partition)
+        offsets[position] = min(offsets.get(position, message.offset), message.offset)
+    return offsets
+
+
+class RuleBroker(ABC):
+    """
+    검증 워커가 쓰는 메시지 브로커 인터페이스
+
+    - 한 토픽을 컨슈머 그룹으로 구독하고, 다른 토픽으로 결과를 발행합니다.
+    - 오프셋은 자동 커밋하지 않습니다. 워커가 결과 발행이 확인된 뒤 commit을 호출해야 처리된 것으로 기록됩니다.
+    - close를 뺀 메서드는 모두 추상 메서드이므로, 하나라도 구현하지 않은 브로커는 생성 시점에 TypeError가 납니다.
+    """
+
+    @abstractmethod
+    def poll(self, max_records: int, timeout: float) -> List[BrokerMessage]:
+        """메시지 최대 max_records개 수신 (timeout초 동안 없으면 빈 목록)"""
+
+    @abstractmethod
+    def commit(self, messages: List[BrokerMessage]) -> None:
+        """받은 메시지까지 처리 완료로 커밋"""
+
+    @abstractmethod
+    def rewind(self, messages: List[BrokerMessage]) -> None:
+        """커밋하지 못한 메시지를 다음 poll에서 다시 받도록 읽기 위치를 되돌림"""
+
+    @abstractmethod
+    def publish(self, topic: str, key: Optional[bytes], value: bytes) -> None:
+        """메시지 발행 (전송 완료는 flush에서 확인)"""
+
+    @abstractmethod
+    def flush(self) -> None:
+        """발행한 메시지가 모두 브로커에 기록될 때까지 대기 (실패하면 예외)"""
+
+    @abstractmethod
+    def lag(self) -> int:
+        """구독 토픽에서 아직 커밋되지 않은 메시지 수"""
+
+    def close(self) -> None:
+        """연결 종료"""
+
+
+class LocalBroker(RuleBroker):
+    """
+    로컬 브로커 (테스트/단일 서버용 Kafka 대체)
+
+    - 토픽마다 파티션 하나인 추가 전용 로그입니다.
+    - path가 있으면 토픽 로그({topic}.log, JSON Lines)와 그룹 커밋 오프셋({group}.offsets.json)을 파일로 보관하여
+      다른 프로세스가 발행한 메시지를 읽을 수 있고, 재시작하면 커밋된 위치부터 다시 읽습니다.
+    - path가 없으면 메모리에만 보관합니다.
+    """
+
+    def __init__(self, topic: str, group_id: str, path: Optional[str] = None):
+        self.topic = topic
+        self.group_id = group_id
+        self.path = path
+        self._logs: Dict[str, List[Tuple[Optional[bytes], bytes]]] = {}
+        self._read_bytes: Dict[str, int] = {}
+        self._lock = Lock()
+        if path:
+            os.makedirs(path, exist_ok=True)
+        self._committed = self._load_offsets().get(topic, 0)
+        self._position = self._committed
+
+    def _log_path(self, topic: str) -> str:
+        return os.path.join(self.path, f"{topic}.log")
+
+    def _offsets_path(self) -> str:
+        return os.path.join(self.path, f"{self.group_id}.offsets.json")
+
+    def _load_offsets(self) -> Dict[str, int]:
+        if not self.path or not os.path.exists(self._offsets_path()):
+            return {}
+        with open(self._offsets_path(), encoding="utf-8") as f:
+            return json.load(f)
+
+    def _refresh(self, topic: str) -> List[Tuple[Optional[bytes], bytes]]:
+        """파일 로그에서 새로 추가된 줄을 읽어 메모리 로그에 반영"""
+        log = self._logs.setdefault(topic, [])
+        if not self.path or not os.path.exists(self._log_path(topic)):
+            return log
+        with open(self._log_path(topic), "rb") as f:
+            f.seek(self._read_bytes.get(topic, 0))
+            data = f.read()
+        # 쓰는 중인 마지막 줄(개행 전)은 다음에 읽음
+        complete = data[:data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            record = json.loads(line)
+            key = base64.b64decode(record["key"]) if record["key"] is not None else None
+            log.append((key, base64.b64decode(record["value"])))
+        self._read_bytes[topic] = self._read_bytes.get(topic, 0) + len(complete)
+        return log
+
+    def poll(self, max_records: int, timeout: float) -> List[BrokerMessage]:
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                log = self._refresh(self.topic)
+                records = log[self._position:self._position + max_records]
+                if records:
+                    messages = [
+                        BrokerMessage(self.topic, 0, self._position + index, key, value)
+                        for index, (key, value) in enumerate(records)
+                    ]
+                    self._position += len(records)
+                    return messages
+            if time.monotonic() >= deadline:
+                return []
+            time.sleep(min(0.05, timeout))
+
+    def commit(self, messages: List[BrokerMessage]) -> None:
+        offset = _next_offsets(messages).get((self.topic, 0))
+        if offset is None:
+            return
+        with self._lock:
+            self._committed = max(self._committed, offset)
+            if self.path:
+                offsets = self._load_offsets()
+                offsets[self.topic] = self._committed
+                temporary = self._offsets_path() + ".tmp"
+                with open(temporary, "w", encoding="utf-8") as f:
+                    json.dump(offsets, f)
+                os.replace(temporary, self._offsets_path())
+
+    def rewind(self, messages: List[BrokerMessage]) -> None:
+        offset = _first_offsets(messages).get((self.topic, 0))
+        if offset is not None:
+            with self._lock:
+                self._position = min(self._position, offset)
+
+    def publish(self, topic: str, key: Optional[bytes], value: bytes) -> None:
+        with self._lock:
+            if not self.path:
+                self._logs.setdefault(topic, []).append((key, value))
+                return
+            record = {
+                "key": base64.b64encode(key).decode("ascii") if key is not None else None,
+                "value": base64.b64encode(value).decode("ascii")
+            }
+            with open(self._log_path(topic), "ab") as f:
+                f.write(json.dumps(record).encode("utf-8") + b"\n")
+
+    def flush(self) -> None:
+        # publish가 파일/메모리에 바로 기록하므로 기다릴 것이 없음
+        return None
+
+    def messages(self, topic: str) -> List[Tuple[Optional[bytes], bytes]]:
+        """토픽에 기록된 (키, 값) 전체 (결과 확인용)"""
+        with self._lock:
+            return list(self._refresh(topic))
+
+    def lag(self) -> int:
+        with self._lock:
+            return len(self._refresh(self.topic)) - self._committed
+
+
+class KafkaBroker(RuleBroker):
+    """
+    kafka-python 기반 브로커
+
+    - 자동 커밋을 끄고 워커가 결과 발행을 확인한 뒤 오프셋을 커밋합니다 (at-least-once).
+    - 프로듀서는 acks=all로 모든 복제본 기록을 확인합니다.
+    """
+
+    def __init__(self, topic: str, group_id: str, bootstrap_servers: str):
+        # kafka-python은 Kafka 브로커를 쓸 때만 필요
+        from kafka import KafkaConsumer, KafkaProducer
+
+        servers = [server.strip() for server in bootstrap_servers.split(",") if server.strip()]
+        self.topic = topic
+        self._consumer = KafkaConsumer(
+            topic,
+            bootstrap_servers=servers,
+            group_id=group_id,
+            enable_auto_commit=False,
+            auto_offset_reset="earliest"
+        )
+        self._producer = KafkaProducer(bootstrap_servers=servers, acks="all", retries=5)
+        self._pending: List[Any] = []
+
+    def poll(self, max_records: int, timeout: float) -> List[BrokerMessage]:
+        batches = self._consumer.poll(timeout_ms=int(timeout * 1000), max_records=max_records)
+        return [
+            BrokerMessage(record.topic, record.partition, record.offset, record.key, record.value)
+            for records in batches.values()
+            for record in records
+        ]
+
+    def commit(self, messages: List[BrokerMessage]) -> None:
+        from kafka import TopicPartition
+        from kafka.structs import OffsetAndMetadata
+
+        offsets = _next_offsets(messages)
+        if offsets:
+            self._consumer.commit({
+                TopicPartition(topic, partition): OffsetAndMetadata(offset, None)
+                for (topic, partition), offset in offsets.items()
+            })
+
+    def rewind(self, messages: List[BrokerMessage]) -> None:
+        from kafka import TopicPartition
+
+        for (topic, partition), offset in _first_offsets(messages).items():
+            self._consumer.seek(TopicPartition(topic, partition), offset)
+
+    def publish(self, topic: str, key: Optional[bytes], value: bytes) -> None:
+        self._pending.append(self._producer.send(topic, key=key, value=value))
+
+    def flush(self) -> None:
+        pending, self._pending = self._pending, []
+        self._producer.flush()
+        for future in pending:
+            # 전송 실패는 여기서 예외로 드러남
+            future.get(timeout=0)
+
+    def lag(self) -> int:
+        partitions = list(self._consumer.assignment())
+        if not partitions:
+            return 0
+        end_offsets = self._consumer.end_offsets(partitions)
+        total = 0
+        for partition in partitions:
+            committed = self._consumer.committed(partition)
+            total += end_offsets.get(partition, 0) - (committed if committed is not None else self._consumer.position(partition))
+        return max(0, total)
+
+    def close(self) -> None:
+        self._producer.close()
+        self._consumer.close()
+
+
+def create_broker(broker_type: str = settings.VALIDATION_BROKER) -> RuleBroker:
+    """설정에 따른 검증 요청 토픽 구독 브로커 생성"""
+    if broker_type not in BROKER_TYPES:
+        raise ValueError(f"지원하지 않는 브로커입니다: {broker_type}")
+    if broker_type == "kafka":
+        return KafkaBroker(settings.VALIDATION_REQUEST_TOPIC, settings.VALIDATION_CONSUMER_GROUP, settings.KAFKA_BOOTSTRAP_SERVERS)
+    return LocalBroker(settings.VALIDATION_REQUEST_TOPIC, settings.VALIDATION_CONSUMER_GROUP, settings.VALIDATION_BROKER_PATH or None)
@@ -0,0 +1,275 @@
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+import numpy as np
+from app.models.rule import Rule, RuleCondition
+from app.services.condition_ir import compile_conditions
+
+# 컬럼 종류
+KIND_NUMBER = "number"  # 숫자 배열 (float의 NaN은 null)
+KIND_STRING = "string"  # 유니코드 문자열 배열 + null 마스크
+KIND_MIXED = "mixed"    # 타입이 섞인 object 배열 (원소별 평가)
+KIND_NULL = "null"      # 값이 모두 null이거나 배치에 없는 필드
+
+RANGE_OPERATORS = (">", ">=", "<", "<=")
+
+
+def _is_number(value: Any) -> bool:
+    """분석기 비교 규칙상 숫자로 취급하는 값 (bool 포함)"""
+    return isinstance(value, (int, float, np.integer, np.floating, np.bool_))
+
+
+def value_matches(value: Any, operator: str, condition_value: Any) -> bool:
+    """
+    단일 값 매칭 - RuleAnalyzer._value_matches_condition과 같은 의미
+
+    - 범위 비교는 숫자끼리, 문자열끼리만 가능하고 그 외에는 False
+    - in은 조건 값이 리스트일 때만, contains/starts_with/ends_with는 문자열끼리만 평가
+    - 그 밖의 연산자(not_in, not_contains 등)는 False
+    """
+    if operator in RANGE_OPERATORS:
+        if not ((_is_number(value) and _is_number(condition_value)) or (isinstance(value, str) and isinstance(condition_value, str))):
+            return False
+    if operator == "==":
+        return value == condition_value
+    elif operator == "!=":
+        return value != condition_value
+    elif operator == ">":
+        return value > condition_value
+    elif operator == ">=":
+        return value >= condition_value
+    elif operator == "<":
+        return value < condition_value
+    elif operator == "<=":
+        return value <= condition_value
+    elif operator == "in" and isinstance(condition_value, list):
+        return value in condition_value
+    elif operator == "contains" and isinstance(condition_value, str) and isinstance(value, str):
+        return condition_value in value
+    elif operator == "starts_with" and isinstance(condition_value, str) and isinstance(value, str):
+        return value.startswith(condition_value)
+    elif operator == "ends_with" and isinstance(condition_value, str) and isinstance(value, str):
+        return value.endswith(condition_value)
+    return False
+
+
+class Column:
+    """정규화된 컬럼 - 값 배열, null 마스크(True = null), 종류"""
+
+    __slots__ = ("kind", "values", "nulls")
+
+    def __init__(self, kind: str, values: np.ndarray, nulls: np.ndarray):
+        self.kind = kind
+        self.values = values
+        self.nulls = nulls
+
+    @classmethod
+    def from_array(cls, data: Any) -> "Column":
+        """
+        배열/리스트를 종류별 표현으로 한 번만 변환 (이후 여러 룰 평가에서 재사용)
+
+        - dtype으로 종류를 정하는 것은 이미 ndarray인 입력뿐입니다. 파이썬 리스트를 np.asarray에 넘기면
+          숫자와 문자열이 섞인 경우 숫자까지 문자열 배열로 바뀌므로 원소별로 종류를 판단합니다.
+        """
+        if isinstance(data, np.ndarray) and data.dtype != object:
+            if data.dtype.kind in "biu":
+                return cls(KIND_NUMBER, data, np.zeros(len(data), dtype=bool))
+            if data.dtype.kind == "f":
+                return cls(KIND_NUMBER, data, np.isnan(data))
+            if data.dtype.kind == "U":
+                return cls(KIND_STRING, data, np.zeros(len(data), dtype=bool))
+
+        # object 배열 - None/NaN은 null, 나머지 값의 타입이 하나면 전용 표현으로 변환
+        if isinstance(data, np.ndarray):
+            array = data.astype(object)
+        else:
+            # 값이 리스트여도 1차원을 유지하도록 원소 단위로 채움
+            values = list(data)
+            array = np.empty(len(values), dtype=object)
+            for row, value in enumerate(values):
+                array[row] = value
+        nulls = np.fromiter((value is None or (isinstance(value, float) and value != value) for value in array), dtype=bool, count=len(array))
+        present = array[~nulls]
+        if len(present) == 0:
+            return cls(KIND_NULL, array, nulls)
+        if all(isinstance(value, str) for value in present):
+            values = array.copy()
+            values[nulls] = ""
+            return cls(KIND_STRING, values.astype(str), nulls)
+        if all(_is_number(value) for value in present):
+            if all(isinstance(value, (int, np.integer)) and not isinstance(value, bool) for value in present) and not nulls.any():
+                return cls(KIND_NUMBER, array.astype(np.int64), nulls)
+            values = array.copy()
+            values[nulls] = np.nan
+            return cls(KIND_NUMBER, values.astype(np.float64), nulls)
+        return cls(KIND_MIXED, array, nulls)
+
+    def match(self, operator: str, condition_value: Any) -> np.ndarray:
+        """조건 매칭 마스크"""
+        size = len(self.nulls)
+        if self.kind == KIND_MIXED:
+            return np.fromiter(
+                (value_matches(None if null else value, operator, condition_value) for value, null in zip(self.values, self.nulls)),
+                dtype=bool, count=size
+            )
+
+        present = ~self.nulls
+        if operator in ("==", "!="):
+            if condition_value is None:
+                equal = self.nulls.copy()
+            elif self.kind == KIND_NUMBER and _is_number(condition_value):
+                equal = present & (self.values == condition_value)
+            elif self.kind == KIND_STRING and isinstance(condition_value, str):
+                equal = present & (self.values == condition_value)
+            else:
+                # 종류가 다른 값은 같을 수 없음 (null은 None과만 같음)
+                equal = np.zeros(size, dtype=bool)
+            return equal if operator == "==" else ~equal
+
+        if operator in RANGE_OPERATORS:
+            comparable = (
+                (self.kind == KIND_NUMBER and _is_number(condition_value))
+                or (self.kind == KIND_STRING and isinstance(condition_value, str))
+            )
+            if not comparable:
+                return np.zeros(size, dtype=bool)
+            if operator == ">":
+                result = self.values > condition_value
+            elif operator == ">=":
+                result = self.values >= condition_value
+            elif operator == "<":
+                result = self.values < condition_value
+            else:
+                result = self.values <= condition_value
+            return present & result
+
+        if operator == "in" and isinstance(condition_value, list):
+            if self.kind == KIND_NUMBER:
+                members = [value for value in condition_value if _is_number(value)]
+            elif self.kind == KIND_STRING:
+                members = [value for value in condition_value if isinstance(value, str)]
+            else:
+                members = []
+            result = present & np.isin(self.values, members) if members else np.zeros(size, dtype=bool)
+            if any(value is None for value in condition_value):
+                result |= self.nulls
+            return result
+
+        if operator in ("contains", "starts_with", "ends_with") and isinstance(condition_value, str) and self.kind == KIND_STRING:
+            if operator == "contains":
+                result = np.char.find(self.values, condition_value) >= 0
+            elif operator == "starts_with":
+                result = np.char.startswith(self.values, condition_value)
+            else:
+                result = np.char.endswith(self.values, condition_value)
+            return present & result
+
+        return np.zeros(size, dtype=bool)
+
+
+class ColumnBatch:
+    """필드명 → Column 묶음 (모든 컬럼은 같은 길이)"""
+
+    def __init__(self, columns: Mapping[str, Any]):
+        self.columns: Dict[str, Column] = {
+            field: data if isinstance(data, Column) else Column.from_array(data) for field, data in columns.items()
+        }
+        lengths = {len(column.nulls) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"컬럼 길이가 서로 다릅니다: {sorted(lengths)}")
+        self.size = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_records(cls, records: List[Mapping[str, Any]], fields: Optional[Iterable[str]] = None) -> "ColumnBatch":
+        """레코드(dict) 목록을 컬럼 배치로 변환 (없는 키는 null)"""
+        if fields is None:
+            fields = list(dict.fromkeys(key for record in records for key in record))
+        columns = {}
+        for field in fields:
+            # 값이 리스트여도 1차원을 유지하도록 원소 단위로 채움
+            column = np.empty(len(records), dtype=object)
+            for row, record in enumerate(records):
+                column[row] = record.get(field)
+            columns[field] = column
+        batch = cls(columns)
+        batch.size = len(records)
+        return batch
+
+    def column(self, field: str) -> Column:
+        """필드 컬럼 (배치에 없는 필드는 전부 null)"""
+        column = self.columns.get(field)
+        if column is None:
+            column = Column(KIND_NULL, np.empty(self.size, dtype=object), np.ones(self.size, dtype=bool))
+            self.columns[field] = column
+        return column
+
+
+class CompiledRule:
+    """
+    조건 트리를 벡터 연산 계획으로 컴파일한 룰
+
+    - 같은 (필드, 연산자, 값) 조건은 한 번만 평가합니다.
+    - 그룹은 자식 마스크를 &/|로 결합하고, AND가 전부 False가 되거나 OR가 전부 True가 되면 남은 자식을 건너뜁니다.
+    - 최상위 조건 목록은 묵시적 AND이며, 조건이 없으면 모든 레코드가 선택됩니다.
+    """
+
+    def __init__(self, conditions: List[RuleCondition]):
+        self.ir = compile_conditions(conditions)
+        # 노드별 리프 키 (그룹 노드는 None)
+        self._leaf_keys: List[Optional[Tuple[str, str, str]]] = []
+        self._logical: List[Optional[str]] = []
+        for index in range(self.ir.size):
+            if self.ir.has_children(index):
+                self._leaf_keys.append(None)
+                self._logical.append(self.ir.group_logical(index))
+            else:
+                self._leaf_keys.append((self.ir.fields[index], self.ir.operators[index], repr(self.ir.values[index])))
+                self._logical.append(None)
+
+    def evaluate(self, batch: Union[ColumnBatch, Mapping[str, Any]]) -> np.ndarray:
+        """배치의 각 레코드가 룰에 매칭되는지 나타내는 bool 마스크"""
+        if not isinstance(batch, ColumnBatch):
+            batch = ColumnBatch(batch)
+        memo: Dict[Tuple[str, str, str], np.ndarray] = {}
+
+        # 재귀 대신 명시적 스택 사용 - [논리 연산자, 자식 목록, 다음 자식 위치, 누적 마스크]
+        stack = [["AND", self.ir.roots, 0, np.ones(batch.size, dtype=bool)]]
+        while True:
+            frame = stack[-1]
+            logical, children, position, result = frame
+            # AND가 전부 False, OR가 전부 True가 되면 남은 자식은 결과에 영향 없음
+            done = position >= len(children) or (not result.any() if logical == "AND" else result.all())
+            if done:
+                stack.pop()
+                if not stack:
+                    return result
+                self._fold(stack[-1], result)
+                continue
+
+            child = children[position]
+            frame[2] = position + 1
+            key = self._leaf_keys[child]
+            if key is None:
+                group_logical = self._logical[child]
+                stack.append([group_logical, list(self.ir.children(child)), 0, np.full(batch.size, group_logical == "AND", dtype=bool)])
+                continue
+            mask = memo.get(key)
+            if mask is None:
+                mask = batch.column(self.ir.fields[child]).match(self.ir.operators[child], self.ir.values[child])
+                memo[key] = mask
+            self._fold(frame, mask)
+
+    def select(self, batch: Union[ColumnBatch, Mapping[str, Any]]) -> np.ndarray:
+        """매칭된 레코드 인덱스"""
+        return np.flatnonzero(self.evaluate(batch))
+
+    @staticmethod
+    def _fold(frame: List[Any], mask: np.ndarray) -> None:
+        """자식 마스크를 그룹 누적 마스크에 결합 (누적 마스크는 그룹 전용 배열이므로 제자리 연산)"""
+        if frame[0] == "AND":
+            frame[3] &= mask
+        else:
+            frame[3] |= mask
+
+
+def compile_rule(rule: Union[Rule, List[RuleCondition]]) -> CompiledRule:
+    """룰(또는 조건 목록)을 평가용으로 컴파일"""
+    return CompiledRule(rule.conditions if isinstance(rule, Rule) else rule)
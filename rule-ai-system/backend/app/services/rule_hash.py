@@ -0,0 +1,86 @@
+import hashlib
+import json
+from typing import Any, Dict, Mapping
+
+# 연산자 약어 -> 표준 연산자 (룰 JSON 변환과 정규화 해시에서 공통 사용)
+OPERATOR_ALIASES: Dict[str, str] = {
+    "eq": "==",
+    "neq": "!=",
+    "gt": ">",
+    "lt": "<",
+    "gte": ">=",
+    "lte": "<=",
+    "and": "and",
+    "or": "or",
+    "contains": "contains",
+    "not_contains": "not_contains",
+    "in": "in",
+    "not_in": "not_in",
+    "starts_with": "starts_with",
+    "ends_with": "ends_with",
+    
+    # 이미 완전한 형태로 제공된 경우
+    "==": "==",
+    "!=": "!=",
+    ">": ">",
+    "<": "<",
+    ">=": ">=",
+    "<=": "<=",
+    "AND": "and",
+    "OR": "or"
+}
+
+
+def canonical_operator(operator: str) -> str:
+    """연산자 약어를 완전한 형태로 변환"""
+    return OPERATOR_ALIASES.get(operator, operator.lower())
+
+
+def _canonicalize_conditions(conditions: Any) -> Any:
+    """조건 JSON 정규화 - 조건/그룹 노드의 operator 값만 표준 연산자로 변환 (value 내용은 그대로 유지)"""
+    if not isinstance(conditions, dict):
+        return conditions
+    result = dict(conditions)
+    if isinstance(result.get("operator"), str):
+        result["operator"] = canonical_operator(result["operator"])
+    if isinstance(result.get("conditions"), list):
+        result["conditions"] = [_canonicalize_conditions(condition) for condition in result["conditions"]]
+    return result
+
+
+def _json_default(value: Any) -> Any:
+    """JSON 기본 타입이 아닌 값 변환 (읽기 전용 매핑은 dict, 그 외는 문자열)"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def canonical_json(value: Any) -> str:
+    """키 순서와 공백에 무관한 정규 JSON 문자열"""
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+
+
+def digest(value: Any) -> str:
+    """정규 JSON 기준 SHA-256 해시"""
+    return hashlib.sha256(canonical_json(value).encode("utf-8")).hexdigest()
+
+
+def rule_model_hash(rule: Any) -> str:
+    """Rule 모델의 정규화 해시 (연산자 약어는 표준 연산자로 통합)"""
+    document = rule.model_dump()
+    document["conditions"] = [_canonicalize_conditions(condition) for condition in document.get("conditions") or []]
+    return digest(document)
+
+
+def canonical_rule_hash(rule_json: Dict[str, Any]) -> str:
+    """
+    원본 룰 JSON의 정규화 해시
+
+    - 키 순서와 무관합니다.
+    - 연산자 약어(gt, AND 등)는 변환 시와 동일하게 표준 연산자로 맞춥니다.
+    - ruleId/id 는 변환 시와 동일하게 하나의 id 로 통합합니다.
+    """
+    document = {key: value for key, value in rule_json.items() if key not in ("ruleId", "id")}
+    document["id"] = rule_json.get("ruleId") or rule_json.get("id")
+    document["conditions"] = _canonicalize_conditions(rule_json.get("conditions", {}))
+    return digest(document)
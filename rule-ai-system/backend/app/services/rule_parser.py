@@ -1,7 +1,10 @@
+import logging
 from typing import Dict, Any, List
 from app.models.rule import Rule, RuleCondition, RuleAction
 import uuid
 
+logger = logging.getLogger(__name__)
+
 class RuleParser:
     """Service for parsing rule JSON into Rule objects"""
     
@@ -45,7 +48,7 @@ class RuleParser:
             
             return rule
         except Exception as e:
-            print(f"규칙 파싱 오류: {str(e)}")
+            logger.warning("규칙 파싱 오류: %s", e)
             raise Exception(f"규칙 JSON을 파싱하는 중 오류가 발생했습니다: {str(e)}")
     
     def _parse_conditions(self, conditions_json: List[Dict[str, Any]]) -> List[RuleCondition]:
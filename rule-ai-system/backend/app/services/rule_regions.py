@@ -0,0 +1,369 @@
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from app.models.rule import Rule
+from app.services.condition_ir import CompiledConditions, compile_conditions
+from app.services.interval_engine import NEG_INF, POS_INF, Interval, interval_from_comparison, is_number
+
+FULL_INTERVAL = Interval()
+
+
+def _is_full(interval: Interval) -> bool:
+    return interval.lo == NEG_INF and interval.hi == POS_INF
+
+
+def _value_key(value: Any) -> Tuple[int, Any]:
+    """값 정렬/표시용 키 (숫자 먼저, 그다음 문자열, None 마지막)"""
+    if isinstance(value, (int, float)):
+        return (0, float(value))
+    if value is None:
+        return (2, "")
+    return (1, str(value))
+
+
+class FieldConstraint:
+    """
+    필드 하나에 대한 정규화된 제약 - 허용 값 집합 또는 (숫자 구간, 제외 값 집합)
+
+    - allowed가 있으면 값은 그 집합 중 하나입니다 (==, in, 한 점으로 좁혀진 구간).
+    - allowed가 없으면 구간이 전체가 아닐 때 값은 구간 안의 숫자이고, excluded(!=)의 값은 제외됩니다.
+    - 정규화 후에는 같은 값 집합을 나타내는 제약의 표현이 하나뿐이므로 비교/포함 판정에 그대로 사용할 수 있습니다.
+    """
+
+    __slots__ = ("allowed", "interval", "excluded")
+
+    def __init__(self, allowed: Optional[FrozenSet[Any]] = None, interval: Interval = FULL_INTERVAL, excluded: FrozenSet[Any] = frozenset()):
+        self.allowed = allowed
+        self.interval = interval
+        self.excluded = excluded
+        self._normalize()
+
+    def _normalize(self) -> None:
+        interval = self.interval
+        if self.allowed is None and not _is_full(interval) and interval.lo == interval.hi and not interval.is_empty():
+            # 한 점 구간은 허용 값 하나로 표현
+            self.allowed = frozenset([interval.lo])
+        if self.allowed is not None:
+            self.allowed = frozenset(value for value in self.allowed if self._in_interval(value) and value not in self.excluded)
+            self.interval = FULL_INTERVAL
+            self.excluded = frozenset()
+        elif not _is_full(interval):
+            # 구간 밖의 제외 값은 의미 없음
+            self.excluded = frozenset(value for value in self.excluded if self._in_interval(value))
+
+    def _in_interval(self, value: Any) -> bool:
+        if _is_full(self.interval):
+            return True
+        return is_number(value) and self.interval.overlaps(Interval(value, True, value, True))
+
+    @property
+    def is_unbounded(self) -> bool:
+        """아무 값이나 허용하는 제약인지 여부"""
+        return self.allowed is None and _is_full(self.interval) and not self.excluded
+
+    def is_empty(self) -> bool:
+        if self.allowed is not None:
+            return not self.allowed
+        return self.interval.is_empty()
+
+    def matches(self, value: Any) -> bool:
+        if self.allowed is not None:
+            return value in self.allowed
+        return self._in_interval(value) and value not in self.excluded
+
+    def intersect(self, other: "FieldConstraint") -> "FieldConstraint":
+        if self.allowed is not None and other.allowed is not None:
+            return FieldConstraint(self.allowed & other.allowed)
+        if self.allowed is not None or other.allowed is not None:
+            allowed, constraint = (self.allowed, other) if self.allowed is not None else (other.allowed, self)
+            return FieldConstraint(frozenset(value for value in allowed if constraint.matches(value)))
+        return FieldConstraint(None, self.interval.intersect(other.interval), self.excluded | other.excluded)
+
+    def overlaps(self, other: "FieldConstraint") -> bool:
+        """두 제약을 함께 만족하는 값이 있는지 여부 (intersect 결과를 만들지 않는 빠른 판정)"""
+        if self.allowed is not None and other.allowed is not None:
+            return not self.allowed.isdisjoint(other.allowed)
+        if self.allowed is not None:
+            return any(other.matches(value) for value in self.allowed)
+        if other.allowed is not None:
+            return any(self.matches(value) for value in other.allowed)
+        interval = self.interval.intersect(other.interval)
+        if interval.is_empty():
+            return False
+        # 한 점으로 좁혀진 경우에만 제외 값 때문에 비게 될 수 있음
+        return interval.lo != interval.hi or not (interval.lo in self.excluded or interval.lo in other.excluded)
+
+    def contains(self, other: "FieldConstraint") -> bool:
+        """other의 모든 값이 이 제약을 만족하는지 여부"""
+        if other.is_empty():
+            return True
+        if other.allowed is not None:
+            return all(self.matches(value) for value in other.allowed)
+        if self.allowed is not None:
+            # 무한 집합은 유한 집합에 포함될 수 없음
+            return False
+        if not _is_full(self.interval):
+            if _is_full(other.interval):
+                return False
+            if other.interval.intersect(self.interval) != other.interval:
+                return False
+        # 이 제약이 제외하는 값은 other에도 없어야 함
+        return not any(other.matches(value) for value in self.excluded)
+
+    def subtract(self, other: "FieldConstraint") -> List["FieldConstraint"]:
+        """
+        이 제약에서 other의 값을 뺀 나머지 (합집합이 차집합을 포함하는 제약 목록)
+
+        - 이 제약이 아무 숫자가 아닌 값도 허용하는데 other가 숫자 구간이면 나머지를 나누지 않고 자신을 그대로 돌려줍니다.
+        """
+        if self.allowed is not None:
+            return [FieldConstraint(frozenset(value for value in self.allowed if not other.matches(value)))]
+        if other.allowed is not None:
+            return [FieldConstraint(None, self.interval, self.excluded | other.allowed)]
+        if _is_full(other.interval):
+            # other는 제외 값만 빠진 전체 - 나머지는 other가 제외한 값 중 이 제약이 허용하는 값
+            return [FieldConstraint(frozenset(value for value in other.excluded if self.matches(value)))]
+        if _is_full(self.interval):
+            return [self]
+        pieces = []
+        if other.interval.lo != NEG_INF:
+            below = Interval(NEG_INF, False, other.interval.lo, not other.interval.lo_inclusive)
+            pieces.append(FieldConstraint(None, self.interval.intersect(below), self.excluded))
+        if other.interval.hi != POS_INF:
+            above = Interval(other.interval.hi, not other.interval.hi_inclusive, POS_INF, False)
+            pieces.append(FieldConstraint(None, self.interval.intersect(above), self.excluded))
+        if other.excluded:
+            pieces.append(FieldConstraint(frozenset(value for value in other.excluded if self.matches(value))))
+        return [piece for piece in pieces if not piece.is_empty()]
+
+    def hull(self, other: "FieldConstraint") -> "FieldConstraint":
+        """두 제약을 모두 포함하는 제약 (근사)"""
+        if self.allowed is not None and other.allowed is not None:
+            return FieldConstraint(self.allowed | other.allowed)
+        intervals = []
+        for constraint in (self, other):
+            if constraint.allowed is None:
+                intervals.append(constraint.interval)
+            elif all(is_number(value) for value in constraint.allowed):
+                values = [float(value) for value in constraint.allowed]
+                intervals.append(Interval(min(values), True, max(values), True))
+            else:
+                intervals.append(FULL_INTERVAL)
+        lower = min(intervals, key=lambda interval: (interval.lo, not interval.lo_inclusive))
+        upper = max(intervals, key=lambda interval: (interval.hi, interval.hi_inclusive))
+        excluded = self.excluded & other.excluded if self.allowed is None and other.allowed is None else frozenset()
+        return FieldConstraint(None, Interval(lower.lo, lower.lo_inclusive, upper.hi, upper.hi_inclusive), excluded)
+
+    def key(self) -> Tuple[Any, ...]:
+        """정규화된 제약의 비교 키"""
+        if self.allowed is not None:
+            return ("allowed", tuple(sorted(self.allowed, key=_value_key)))
+        interval = self.interval
+        return ("interval", interval.lo, interval.lo_inclusive, interval.hi, interval.hi_inclusive, tuple(sorted(self.excluded, key=_value_key)))
+
+    def describe(self) -> str:
+        """사람이 읽을 수 있는 제약 설명"""
+        if self.allowed is not None:
+            values = sorted(self.allowed, key=_value_key)
+            if len(values) == 1:
+                return f"== {values[0]!r}"
+            return "in [" + ", ".join(repr(value) for value in values) + "]"
+        text = "전체" if _is_full(self.interval) else repr(self.interval)
+        if self.excluded:
+            text += " (" + ", ".join(repr(value) for value in sorted(self.excluded, key=_value_key)) + " 제외)"
+        return text
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, FieldConstraint) and self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def __repr__(self) -> str:
+        return f"FieldConstraint({self.describe()})"
+
+
+UNBOUNDED = FieldConstraint()
+
+# 필드 → 제약 (없는 필드는 제약 없음)
+Box = Dict[str, FieldConstraint]
+
+
+def intersect_boxes(box: Box, other: Box) -> Optional[Box]:
+    """두 박스의 교집합 (비어 있으면 None)"""
+    result = dict(box)
+    for field, constraint in other.items():
+        current = result.get(field)
+        if current is not None:
+            constraint = current.intersect(constraint)
+            if constraint.is_empty():
+                return None
+        result[field] = constraint
+    return result
+
+
+def boxes_overlap(box: Box, other: Box) -> bool:
+    """두 박스가 겹치는지 여부"""
+    if len(other) < len(box):
+        box, other = other, box
+    for field, constraint in box.items():
+        other_constraint = other.get(field)
+        if other_constraint is not None and not constraint.overlaps(other_constraint):
+            return False
+    return True
+
+
+def box_contains(box: Box, other: Box) -> bool:
+    """other 박스가 box에 완전히 포함되는지 여부"""
+    for field, constraint in box.items():
+        other_constraint = other.get(field)
+        if other_constraint is None:
+            if not constraint.is_unbounded:
+                return False
+        elif not constraint.contains(other_constraint):
+            return False
+    return True
+
+
+def subtract_box(box: Box, other: Box) -> List[Box]:
+    """
+    box에서 other를 뺀 나머지 박스 목록 (겹치지 않으면 [box])
+
+    - other의 필드를 차례로 보며 "앞선 필드는 other 안, 이 필드는 other 밖"인 조각을 만듭니다.
+    """
+    if not boxes_overlap(box, other):
+        return [box]
+    pieces = []
+    current = dict(box)
+    for field, constraint in other.items():
+        own = current.get(field, UNBOUNDED)
+        for piece in own.subtract(constraint):
+            if not piece.is_empty():
+                pieces.append({**current, field: piece})
+        current[field] = own.intersect(constraint)
+    return pieces
+
+
+def _box_key(box: Box) -> Tuple[Any, ...]:
+    return tuple(sorted((field, constraint.key()) for field, constraint in box.items()))
+
+
+def _hull_box(boxes: List[Box]) -> Box:
+    """모든 박스를 포함하는 박스 하나 (모든 박스가 제약하는 필드만 유지)"""
+    fields = set(boxes[0])
+    for box in boxes[1:]:
+        fields &= set(box)
+    result: Box = {}
+    for field in fields:
+        constraint = boxes[0][field]
+        for box in boxes[1:]:
+            constraint = constraint.hull(box[field])
+        if not constraint.is_unbounded:
+            result[field] = constraint
+    return result
+
+
+class RuleRegion:
+    """
+    룰이 선택하는 값 영역 - 필드별 제약 박스의 합집합 (조건 트리의 DNF)
+
+    - exact가 False이면 박스 수 한도 초과나 해석하지 않는 연산자(contains, not_in 등) 때문에 실제보다 넓게 근사한 영역입니다.
+    """
+
+    __slots__ = ("rule_id", "priority", "boxes", "exact", "fields")
+
+    def __init__(self, rule_id: str, priority: int, boxes: List[Box], exact: bool):
+        self.rule_id = rule_id
+        self.priority = priority
+        self.boxes = boxes
+        self.exact = exact
+        self.fields = sorted({field for box in boxes for field in box})
+
+
+class _RegionBuilder:
+    """IR을 아래에서 위로 한 번 훑어 노드별 박스 목록(DNF)을 만드는 변환기"""
+
+    def __init__(self, ir: CompiledConditions, max_boxes: int):
+        self.ir = ir
+        self.max_boxes = max_boxes
+        self.exact = True
+
+    def build(self) -> List[Box]:
+        ir = self.ir
+        boxes: List[Optional[List[Box]]] = [None] * ir.size
+        # 역 전위 순서로 처리하면 자식 박스 목록이 항상 먼저 계산됨
+        for index in reversed(range(ir.size)):
+            if ir.has_children(index):
+                children = [boxes[child] for child in ir.children(index)]
+                boxes[index] = self._or(children) if ir.group_logical(index) == "OR" else self._and(children)
+                for child in ir.children(index):
+                    boxes[child] = None
+            else:
+                boxes[index] = self._leaf(index)
+        return self._and([boxes[root] for root in ir.roots])
+
+    def _leaf(self, index: int) -> List[Box]:
+        ir = self.ir
+        if not ir.is_field_condition(index):
+            self.exact = False
+            return [{}]
+        constraint = self._constraint(ir.operators[index], ir.values[index])
+        if constraint is None:
+            # 값 영역으로 해석하지 않는 조건은 제약 없음으로 근사
+            self.exact = False
+            return [{}]
+        if constraint.is_empty():
+            return []
+        return [{ir.fields[index]: constraint}]
+
+    @staticmethod
+    def _constraint(operator: str, value: Any) -> Optional[FieldConstraint]:
+        """비교 조건 → 필드 제약 (해석하지 않는 조건은 None)"""
+        if operator == "in":
+            if not isinstance(value, list) or any(isinstance(item, (list, dict)) for item in value):
+                return None
+            return FieldConstraint(frozenset(value))
+        if isinstance(value, (list, dict)):
+            return None
+        if operator == "==":
+            return FieldConstraint(frozenset([value]))
+        if operator == "!=":
+            return FieldConstraint(None, FULL_INTERVAL, frozenset([value]))
+        if operator in (">", ">=", "<", "<="):
+            interval = interval_from_comparison(operator, value)
+            # 문자열 대소 비교는 구간으로 표현하지 않음
+            return FieldConstraint(None, interval) if interval is not None else None
+        return None
+
+    def _or(self, children: List[List[Box]]) -> List[Box]:
+        result: Dict[Tuple[Any, ...], Box] = {}
+        for boxes in children:
+            for box in boxes:
+                result.setdefault(_box_key(box), box)
+        return self._limit(list(result.values()))
+
+    def _and(self, children: List[List[Box]]) -> List[Box]:
+        result: List[Box] = [{}]
+        for boxes in children:
+            product: Dict[Tuple[Any, ...], Box] = {}
+            for left in result:
+                for right in boxes:
+                    box = intersect_boxes(left, right)
+                    if box is not None:
+                        product.setdefault(_box_key(box), box)
+            result = self._limit(list(product.values()))
+            if not result:
+                break
+        return result
+
+    def _limit(self, boxes: List[Box]) -> List[Box]:
+        """박스 수가 한도를 넘으면 모두를 포함하는 박스 하나로 근사"""
+        if len(boxes) <= self.max_boxes:
+            return boxes
+        self.exact = False
+        return [_hull_box(boxes)]
+
+
+def build_rule_region(rule: Rule, rule_id: str, max_boxes: int = 64) -> RuleRegion:
+    """룰을 필드별 제약 박스의 합집합으로 변환"""
+    builder = _RegionBuilder(compile_conditions(rule.conditions), max_boxes)
+    boxes = builder.build() if rule.conditions else [{}]
+    return RuleRegion(rule_id, rule.priority, boxes, builder.exact)
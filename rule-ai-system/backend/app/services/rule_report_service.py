@@ -1,82 +1,283 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
+import copy
 import json
-from app.services.llm_service import LLMService
+import logging
+from app.services.llm_service import LLMService, get_llm_service
+from app.services.report_cache import report_cache
+from app.services.metrics import metrics, report_postprocess_seconds
+from app.services.rule_hash import digest, rule_model_hash
+from app.services.single_flight import SingleFlight
+from app.services.report_stream import ReportStreamFixer
+from app.services.report_markdown import (
+    ISSUE_SECTION_HEADER, build_issue_section, correct_summary_sentence, find_conclusion_section,
+    find_summary_section, issue_type_name, issue_type_sections, parse_markdown_sections,
+    remove_sections, reported_summary_counts, section_from_text
+)
+from app.services.fixed_report_service import REPORT_MODES, template_report_renderer
+from app.services.prompt_encoding import ENCODING_LEVELS, build_issue_digest, estimate_tokens, render_conditions
+from app.config import settings
+from app.logging_config import debug_enabled, debug_sampling
 from app.models.validation_result import ValidationResult, ConditionIssue
 from app.models.rule import Rule
 
+logger = logging.getLogger(__name__)
+
+# 리포트 프롬프트 템플릿 버전 - 프롬프트/시스템 메시지/후처리를 바꾸면 올려서 기존 리포트 캐시를 무효화
+REPORT_PROMPT_VERSION = "3"
+
+# 동일 룰 + 검증 결과에 대한 동시 리포트 요청 병합 (앱 전체 공유)
+report_flight = SingleFlight()
+
+# hybrid 모드에서 총평만 작성할 때의 시스템 메시지
+NARRATIVE_SYSTEM_MESSAGE = "당신은 룰 분석 리포트의 총평 작성기입니다. 주어진 분석 결과에 있는 이슈만 근거로 삼고, 새로운 조건이나 이슈를 만들지 마세요. 반드시 한국어로 작성하세요."
+
+EMPTY_CONDITIONS_NOTICE = "\n\n## ⚠️ 빈 조건 알림\n룰에 조건이 정의되어 있지 않습니다. 룰 사용 전 조건을 반드시 추가해주세요."
+
 class RuleReportService:
     """Service for generating rule analysis reports"""
 
-    def __init__(self):
-        """Initialize rule report service with LLM service"""
-        self.llm_service = LLMService()
-
-    async def generate_report(self, rule: Rule, validation_result: ValidationResult = None) -> Dict[str, Any]:
-        """룰에 대한 상세 리포트 생성"""
+    def __init__(self, llm_service: Optional[LLMService] = None):
+        """Initialize rule report service with LLM service (기본값: 앱 공유 인스턴스)"""
+        self.llm_service = llm_service or get_llm_service()
+
+    async def generate_report(self, rule: Rule, validation_result: ValidationResult = None, mode: Optional[str] = None) -> Dict[str, Any]:
+        """
+        룰에 대한 상세 리포트 생성 - 동일한 룰/검증 결과/모드로 진행 중인 생성이 있으면 그 결과를 함께 사용
+        
+        Args:
+            mode: fast | hybrid | llm (없으면 REPORT_MODE 설정값)
+        """
+        mode = self._resolve_mode(mode)
+        # LLM 서비스(인스턴스/모델)가 다른 서비스의 호출끼리는 병합하지 않음
+        flight_key = digest({
+            "rule": rule_model_hash(rule),
+            "validation_result": digest(validation_result.model_dump()) if validation_result is not None else None,
+            "mode": mode,
+            "llm_service": id(self.llm_service),
+            "model": self.llm_service.model,
+            "fake_mode": self.llm_service.fake_mode
+        })
+        with debug_sampling(logger):
+            result = await report_flight.do(flight_key, lambda: self._generate_report(rule, validation_result, mode))
+        # 병합된 호출끼리 중첩 값까지 공유하지 않도록 깊은 복사본 반환
+        return copy.deepcopy(result)
+
+    def _resolve_mode(self, mode: Optional[str]) -> str:
+        """리포트 생성 방식 결정 (알 수 없는 값이면 llm)"""
+        mode = mode or settings.REPORT_MODE
+        return mode if mode in REPORT_MODES else "llm"
+
+    async def _generate_report(self, rule: Rule, validation_result: ValidationResult = None, mode: str = "llm") -> Dict[str, Any]:
+        """룰에 대한 상세 리포트 생성 (실제 생성 로직)"""
         try:
-            # 중요: conditions가 빈 배열인 경우 특별 처리
-            if not rule.conditions:
-                print("경고: 룰의 conditions 배열이 비어 있습니다. 샘플 조건으로 대체합니다.")
-                # 샘플 조건을 추가하여 리포트 생성이 가능하도록 함
-                # 원본 룰은 수정하지 않고 복사본 만들기
-                rule_copy = Rule(
-                    name=rule.name,
-                    description=rule.description,
-                    conditions=[{
-                        "field": "sample_field",
-                        "operator": "==",
-                        "value": "sample_value",
-                        "conditions": None
-                    }],
-                    action=rule.action,
-                    id=rule.id,
-                    priority=rule.priority,
-                    enabled=rule.enabled
-                )
-                # 빈 조건임을 나타내는 플래그 추가
-                empty_conditions = True
-            else:
-                rule_copy = rule
-                empty_conditions = False
+            rule_copy, empty_conditions = self._prepare_rule(rule)
             
             # LLM을 사용한 리포트 생성
             rule_json = rule_copy.model_dump()
             
             # 검증 결과가 없는 경우 새로 분석
             if validation_result is None:
-                from app.services.rule_analyzer import RuleAnalyzer
-                analyzer = RuleAnalyzer()
-                validation_result = await analyzer.analyze_rule(rule_copy)
+                from app.services.rule_analyzer import rule_analyzer
+                validation_result = await rule_analyzer.analyze_rule(rule_copy)
+            
+            # fast 모드: 템플릿 리포트만 생성 (LLM/캐시 사용 안 함)
+            if mode == "fast":
+                report = template_report_renderer.render(rule_json, validation_result)
+                if empty_conditions:
+                    report += EMPTY_CONDITIONS_NOTICE
+                return {"report": report, "rule_id": rule.id or "N/A", "rule_name": rule.name}
+                
+            # 동일한 룰/분석 결과/모델/프롬프트 버전/모드로 생성한 리포트가 있으면 재사용
+            cache_key = self._report_cache_key(rule, validation_result, mode)
+            if cache_key is not None:
+                cached = await report_cache.get_async(cache_key)
+                if cached is not None:
+                    return cached
+            
+            if mode == "hybrid":
+                return await self._generate_hybrid_report(rule, rule_json, validation_result, empty_conditions, cache_key)
                 
             prompt = self._create_report_prompt(rule_json, validation_result)
             system_message = self._get_system_message()
             
             # LLM 서비스 호출 시 예외 처리 강화
             try:
-                report = await self.llm_service.call_llm(prompt, system_message)
+                report, from_model = await self.llm_service.call_llm_with_status(prompt, system_message)
                 
                 # LLM 응답 검증 및 수정 - 이슈 유형 개수와 총 이슈 건수가 validation_result와 일치하는지 확인
-                report = self._validate_and_fix_report(report, validation_result)
+                with metrics.timed(report_postprocess_seconds, ("validate_and_fix_report",)):
+                    report = self._validate_and_fix_report(report, validation_result)
             
                 # 빈 조건 배열이었던 경우 관련 메시지 추가
                 if empty_conditions:
-                    report += "\n\n## ⚠️ 빈 조건 알림\n룰에 조건이 정의되어 있지 않습니다. 룰 사용 전 조건을 반드시 추가해주세요."
+                    report += EMPTY_CONDITIONS_NOTICE
             
-                return {
+                result = {
                     "report": report,
                     "rule_id": rule.id or "N/A",
                     "rule_name": rule.name
                 }
+                
+                # 실제 모델 응답만 캐시 (대체 응답은 저장하지 않음)
+                if cache_key is not None and from_model:
+                    await report_cache.put_async(cache_key, result)
+                
+                return result
             except Exception as llm_error:
-                print(f"LLM 서비스 호출 오류: {str(llm_error)}")
+                logger.warning("LLM 서비스 호출 오류: %s", llm_error)
                 # LLM 서비스 관련 오류 메시지를 포함하여 대체 리포트 생성
                 return self._generate_fallback_report(rule, validation_result, str(llm_error))
             
         except Exception as e:
-            print(f"리포트 생성 중 예상치 못한 오류: {str(e)}")
+            logger.exception("리포트 생성 중 예상치 못한 오류: %s", e)
             # 일반적인 오류에 대한 대체 리포트 생성
             return self._generate_fallback_report(rule, validation_result, str(e))
 
+    async def stream_report(
+        self,
+        rule: Rule,
+        validation_result: ValidationResult = None,
+        mode: Optional[str] = None
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        리포트를 (이벤트, 데이터) 순서로 스트리밍
+        
+        - meta: 룰 ID/이름
+        - section: 분석 결과만으로 정해지는 섹션을 LLM 호출 전에 즉시 전달
+          (llm: 기본 정보/조건 구조/이슈 요약, hybrid: 총평 앞까지 전체, fast: 리포트 전체)
+        - token: LLM 토큰 (llm 모드의 이슈 유형 섹션은 끝날 때마다 issue_counts 기준으로 보정해서 전달)
+        - done: 보정된 전체 리포트
+        """
+        mode = self._resolve_mode(mode)
+        rule_copy, empty_conditions = self._prepare_rule(rule)
+        if validation_result is None:
+            from app.services.rule_analyzer import rule_analyzer
+            validation_result = await rule_analyzer.analyze_rule(rule_copy)
+        
+        yield "meta", {"rule_id": rule.id or "N/A", "rule_name": rule.name}
+        rule_json = rule_copy.model_dump()
+        
+        if mode == "fast":
+            report = template_report_renderer.render(rule_json, validation_result)
+            if empty_conditions:
+                report += EMPTY_CONDITIONS_NOTICE
+            yield "section", {"text": report}
+            yield "done", {"report": report}
+            return
+        
+        # 캐시된 리포트가 있으면 한 번에 전달
+        cache_key = self._report_cache_key(rule, validation_result, mode)
+        if cache_key is not None:
+            cached = await report_cache.get_async(cache_key)
+            if cached is not None:
+                yield "section", {"text": cached["report"]}
+                yield "done", {"report": cached["report"]}
+                return
+        
+        if mode == "hybrid":
+            parts = [template_report_renderer.body(rule_json, validation_result), "## 📌 총평\n\n"]
+            yield "section", {"text": "".join(parts)}
+            narrative = []
+            async for token in self.llm_service.stream(self._create_narrative_prompt(rule_json, validation_result), NARRATIVE_SYSTEM_MESSAGE):
+                narrative.append(token)
+                yield "token", {"text": token}
+            tail = "\n" + (EMPTY_CONDITIONS_NOTICE if empty_conditions else "")
+            yield "token", {"text": tail}
+            parts.extend(narrative)
+            parts.append(tail)
+            yield "done", {"report": "".join(parts)}
+            return
+        
+        parts = [template_report_renderer.header(rule_json, validation_result)]
+        yield "section", {"text": parts[0]}
+        
+        fixer = ReportStreamFixer(validation_result, self._get_issue_type_kr_name)
+        prompt = self._create_report_prompt(rule_json, validation_result)
+        async for token in self.llm_service.stream(prompt, self._get_system_message()):
+            for text in fixer.feed(token):
+                parts.append(text)
+                yield "token", {"text": text}
+        
+        tail = fixer.close()
+        if empty_conditions:
+            tail.append(EMPTY_CONDITIONS_NOTICE)
+        for text in tail:
+            parts.append(text)
+            yield "token", {"text": text}
+        
+        yield "done", {"report": "".join(parts)}
+
+    def _prepare_rule(self, rule: Rule) -> Tuple[Rule, bool]:
+        """리포트용 룰 준비 - (룰 또는 샘플 조건을 넣은 복사본, 원래 조건이 비어 있었는지 여부)"""
+        # 중요: conditions가 빈 배열인 경우 특별 처리
+        if rule.conditions:
+            return rule, False
+        
+        logger.warning("룰의 conditions 배열이 비어 있습니다. 샘플 조건으로 대체합니다.")
+        # 샘플 조건을 추가하여 리포트 생성이 가능하도록 함
+        # 원본 룰은 수정하지 않고 복사본 만들기
+        rule_copy = Rule(
+            name=rule.name,
+            description=rule.description,
+            conditions=[{
+                "field": "sample_field",
+                "operator": "==",
+                "value": "sample_value",
+                "conditions": None
+            }],
+            action=rule.action,
+            id=rule.id,
+            priority=rule.priority,
+            enabled=rule.enabled
+        )
+        return rule_copy, True
+
+    async def _generate_hybrid_report(
+        self,
+        rule: Rule,
+        rule_json: Dict[str, Any],
+        validation_result: ValidationResult,
+        empty_conditions: bool,
+        cache_key: Optional[str]
+    ) -> Dict[str, Any]:
+        """템플릿 리포트에 LLM이 작성한 짧은 총평만 채운 리포트 (LLM 실패 시 기본 총평)"""
+        prompt = self._create_narrative_prompt(rule_json, validation_result)
+        narrative, from_model = await self.llm_service.call_llm_with_status(prompt, NARRATIVE_SYSTEM_MESSAGE)
+        
+        report = template_report_renderer.render(rule_json, validation_result, narrative if from_model else None)
+        if empty_conditions:
+            report += EMPTY_CONDITIONS_NOTICE
+        result = {"report": report, "rule_id": rule.id or "N/A", "rule_name": rule.name}
+        
+        if cache_key is not None and from_model:
+            await report_cache.put_async(cache_key, result)
+        return result
+
+    def _create_narrative_prompt(self, rule_json: Dict[str, Any], validation_result: ValidationResult) -> str:
+        """hybrid 모드 총평 프롬프트 - 이슈 다이제스트만 전달"""
+        issue_counts = validation_result.issue_counts or {}
+        digest_text = build_issue_digest(validation_result, self._get_issue_type_kr_name, low_severity_detail=False, max_fields_per_type=3)
+        return f"""룰 '{rule_json.get("name", "Unnamed Rule")}' ({rule_json.get("id") or "N/A"})의 분석 결과입니다.
+설명: {rule_json.get("description") or "설명 없음"}
+검증 통과: {"예" if validation_result.is_valid else "아니오"}, 이슈 {len(issue_counts)}가지 유형 / 총 {sum(issue_counts.values())}건
+
+{digest_text or "검출된 이슈가 없습니다."}
+
+위 결과만 근거로 이 룰의 총평과 우선 조치 사항을 3~5문장으로 작성하세요. 제목 없이 본문만 작성하세요.
+"""
+
+    def _report_cache_key(self, rule: Rule, validation_result: ValidationResult, mode: str = "llm") -> Optional[str]:
+        """리포트 캐시 키 (캐시를 사용하지 않으면 None)"""
+        if report_cache is None or self.llm_service.fake_mode:
+            return None
+        return digest({
+            "rule": rule_model_hash(rule),
+            "validation_result": digest(validation_result.model_dump()),
+            "model": self.llm_service.model,
+            "prompt_version": REPORT_PROMPT_VERSION,
+            "mode": mode
+        })
+
     async def generate_report_from_results(self, rule_json: Dict[str, Any], analysis_result: ValidationResult) -> Dict[str, Any]:
         """기존 분석 결과를 활용하여 리포트 생성"""
         try:
@@ -96,7 +297,7 @@ class RuleReportService:
                 "rule_name": rule_name
             }
         except Exception as e:
-            print(f"리포트 생성 오류: {str(e)}")
+            logger.warning("리포트 생성 오류: %s", e)
             # LLM 서비스 호출 실패 시 대체 리포트 생성
             # Rule 객체로 변환하지 않고 기본 정보로 대체 리포트 생성
             fallback_report = f"""# ✅ 룰 오류 검토 보고서
@@ -118,6 +319,61 @@ class RuleReportService:
             }
 
     def _create_report_prompt(self, rule_json: Dict[str, Any], validation_result: ValidationResult) -> str:
+        """
+        리포트 생성 프롬프트 (REPORT_PROMPT_MODE=compact면 압축 인코딩, full이면 기존 템플릿)
+
+        - 압축 인코딩은 토큰 예산(REPORT_PROMPT_TOKEN_BUDGET)을 넘으면 ENCODING_LEVELS 순서로 상세 내용을 줄입니다.
+        """
+        if validation_result is None or settings.REPORT_PROMPT_MODE != "compact":
+            return self._create_full_report_prompt(rule_json, validation_result)
+
+        budget = settings.REPORT_PROMPT_TOKEN_BUDGET
+        for level, options in enumerate(ENCODING_LEVELS):
+            prompt = self._create_compact_report_prompt(rule_json, validation_result, **options)
+            tokens = estimate_tokens(prompt)
+            if tokens <= budget:
+                break
+
+        # 절감량 비교용 기존 프롬프트는 DEBUG 로그를 남길 때만 생성
+        if debug_enabled(logger):
+            full_tokens = estimate_tokens(self._create_full_report_prompt(rule_json, validation_result))
+            logger.debug(
+                "[리포트 프롬프트] 압축 인코딩 %d토큰 (기존 %d토큰, %d토큰 절감, 압축 단계 %d, 예산 %d)",
+                tokens, full_tokens, full_tokens - tokens, level, budget
+            )
+        return prompt
+
+    def _create_compact_report_prompt(
+        self,
+        rule_json: Dict[str, Any],
+        validation_result: ValidationResult,
+        low_severity_detail: bool = True,
+        max_fields_per_type: Optional[int] = None,
+        expression_depth: Optional[int] = None
+    ) -> str:
+        """조건식과 이슈 다이제스트만 담은 압축 프롬프트"""
+        expression = ""
+        if expression_depth != 0:
+            conditions = rule_json.get("conditions", [])
+            expression = render_conditions(conditions if isinstance(conditions, list) else [], expression_depth)
+
+        issue_counts = validation_result.issue_counts or {}
+        # 유형별 건수는 아래 이슈 다이제스트의 섹션 제목에 있으므로 요약에서는 생략
+        prompt = template_report_renderer.header(rule_json, validation_result, expression, include_type_counts=False)
+        if issue_counts:
+            prompt += f"""## 🔢 이슈 카운트 (LLM 전용)
+- 이슈 유형 수: {len(issue_counts)}가지, 총 이슈 건수: {sum(issue_counts.values())}건 - 반드시 이 건수로 보고하세요.
+- 아래 이슈 외의 조건이나 이슈를 추론하거나 만들지 마세요. 위치는 조건식의 번호와 같습니다.
+- 자기모순 이슈가 있으면 가장 먼저 언급하세요.
+
+"""
+        digest = build_issue_digest(validation_result, self._get_issue_type_kr_name, low_severity_detail, max_fields_per_type)
+        prompt += (digest or "검출된 이슈가 없습니다.") + "\n"
+        prompt += f"\n## 📌 총평\n\n{template_report_renderer.recommendation(validation_result)}\n"
+        return prompt
+
+    def _create_full_report_prompt(self, rule_json: Dict[str, Any], validation_result: ValidationResult) -> str:
+        """기존 리포트 프롬프트 (분석 결과 전체를 템플릿에 채움)"""
         # validation_result가 None인 경우 처리
         if validation_result is None:
             # 기본 프롬프트 생성 (오류 리포트)
@@ -154,64 +410,9 @@ class RuleReportService:
         rule_id = rule_json.get("ruleId", rule_json.get("id", "Unknown"))
         rule_name = rule_json.get("name", "Unnamed Rule")
         
-        # 최상위 연산자 판별
-        top_level_operator = "N/A"
-        conditions = rule_json.get("conditions", [])
-        if isinstance(conditions, dict):
-            # 앵커 패턴(객체 형태)인 경우
-            top_level_operator = conditions.get("operator", "N/A")
-        elif isinstance(conditions, list) and conditions:
-            # 배열 형태일 때는 첫 번째 조건이 group이면 해당 field를 최상위 연산자로 간주
-            if any(c.get("operator") == "group" for c in conditions if isinstance(c, dict)):
-                for condition in conditions:
-                    if isinstance(condition, dict) and condition.get("operator") == "group":
-                        top_level_operator = condition.get("field", "") 
-                        break
-            else:
-                # 모두 기본 조건일 경우 묵시적으로 AND로 간주
-                top_level_operator = "AND (묵시적)"
-        
-        # 필드명 매핑 정보 (가독성을 위한 설명 추가)
-        field_mappings = {
-            "MBL_ACT_MEM_PCNT": "무선 회선 수",
-            "ENTR_STUS_CD": "가입 상태",
-            "MRKT_CD": "마켓 코드",
-            "IOT_MEM_PCNT": "IoT 회선 수",
-            "AGE": "나이",
-            "USER_TYPE": "사용자 유형",
-            "SCORE": "점수",
-            "PROD_CD": "상품 코드"
-        }
-
-        # 구조 정보 추출
-        depth = 1
-        condition_node_count = 0
-        field_condition_count = 0
-        unique_fields = []
-        
-        if hasattr(validation_result, "structure"):
-            depth = validation_result.structure.depth
-            condition_node_count = getattr(validation_result.structure, "condition_node_count", 0)
-            field_condition_count = getattr(validation_result.structure, "field_condition_count", 0)
-            unique_fields = validation_result.structure.unique_fields
-            
-            # 이전 버전과의 호환성: condition_count를 condition_node_count로 사용
-            if condition_node_count == 0 and hasattr(validation_result.structure, "condition_count"):
-                condition_node_count = validation_result.structure.condition_count
-
-        # 사용된 필드 목록 생성 (연산자 제외)
-        field_list_text = ""
-        if unique_fields:
-            for field in unique_fields:
-                # AND, OR, GROUP 같은 연산자는 제외
-                if field and field.upper() not in ["OR", "AND", "GROUP"] and field != "placeholder":
-                    description = field_mappings.get(field, "")
-                    if description:
-                        field_list_text += f"  - {field} ({description})\n"
-                    else:
-                        field_list_text += f"  - {field}\n"
-        else:
-            field_list_text = "  없음\n"
+        top_level_operator = template_report_renderer.top_level_operator(rule_json)
+        depth, condition_node_count, field_condition_count, unique_fields = template_report_renderer.structure_values(validation_result)
+        field_list_text = template_report_renderer.field_list_text(unique_fields)
 
         # 이슈 유형별 정보 수집
         issues_by_type = {}
@@ -250,12 +451,12 @@ class RuleReportService:
             # validation_result.issue_counts에 있으나 issues_by_type에 없는 이슈 유형이 있는지 확인
             for issue_type in validation_result.issue_counts:
                 if issue_type not in issues_by_type:
-                    print(f"경고: {issue_type} 이슈 유형이 issue_counts에는 있으나 issues에는 없습니다.")
+                    logger.warning("%s 이슈 유형이 issue_counts에는 있으나 issues에는 없습니다.", issue_type)
             
             # issues_by_type에 있으나 validation_result.issue_counts에 없는 이슈 유형이 있는지 확인
             for issue_type in issues_by_type:
                 if issue_type not in validation_result.issue_counts:
-                    print(f"경고: {issue_type} 이슈 유형이 issues에는 있으나 issue_counts에는 없습니다.")
+                    logger.warning("%s 이슈 유형이 issues에는 있으나 issue_counts에는 없습니다.", issue_type)
 
         for issue_type, issues in issues_by_type.items():
             details = []
@@ -419,15 +620,7 @@ class RuleReportService:
                     markdown_report += "\n"
         
         # 총평 추가
-        recommendation = ""
-        if validation_result.is_valid:
-            recommendation = "이 룰은 모든 검증을 통과했습니다. 바로 적용 가능합니다."
-        elif len([i for i in validation_result.issues if getattr(i, 'severity', '') == "error"]) > 0:
-            recommendation = "이 룰에는 수정이 필요한 오류가 있습니다. 위 내용을 참고하여 수정 후 다시 검증해주세요."
-        else:
-            recommendation = "이 룰에는 경고만 있으므로 적용 가능합니다. 다만, 경고 사항을 검토하시면 더 나은 룰이 될 수 있습니다."
-            
-        markdown_report += f"\n## 📌 총평\n\n{recommendation}\n"
+        markdown_report += f"\n## 📌 총평\n\n{template_report_renderer.recommendation(validation_result)}\n"
         
         return markdown_report
 
@@ -537,274 +730,78 @@ responses는 반드시 한국어로만 작성하세요. 영어를 사용하지 
         }
 
     def _validate_and_fix_report(self, report: str, validation_result: ValidationResult) -> str:
-        """LLM이 생성한 리포트를 검증하고 필요한 경우 수정합니다"""
+        """
+        LLM이 생성한 리포트를 검증하고 필요한 경우 수정합니다
+        
+        - 리포트를 한 번 섹션 트리로 파싱하고, 이슈 요약/이슈 유형 섹션을 구조적으로 고친 뒤 한 번에 직렬화합니다.
+        """
         # 이슈 유형 수와 총 이슈 건수 확인
-        issue_type_count = len(validation_result.issue_counts) if hasattr(validation_result, 'issue_counts') and validation_result.issue_counts else 0
-        total_issue_count = sum(validation_result.issue_counts.values()) if hasattr(validation_result, 'issue_counts') and validation_result.issue_counts else 0
+        issue_counts = validation_result.issue_counts or {}
+        issue_type_count = len(issue_counts)
+        total_issue_count = sum(issue_counts.values())
         
-        print(f"\n[리포트 검증] 실제 이슈: {issue_type_count}가지 유형, {total_issue_count}건")
-        print(f"[리포트 검증] issue_counts: {validation_result.issue_counts}")
+        logger.debug("[리포트 검증] 실제 이슈: %d가지 유형, %d건, issue_counts: %s", issue_type_count, total_issue_count, issue_counts)
         
         if issue_type_count == 0 or total_issue_count == 0:
             return report  # 이슈가 없으면 그대로 반환
         
-        # 리포트에서 "총 X가지 유형의 오류, 총 Y건 감지됨" 패턴 찾기
-        import re
-        
-        # 더 유연한 패턴 매칭 (다양한 표현 방식 고려)
-        summary_patterns = [
-            r"총\s+(\d+)가지\s+유형의\s+오류,\s+총\s+(\d+)건\s+감지됨",
-            r"총\s+(\d+)가지\s+유형[,의]?\s+총\s+(\d+)건[의]?\s+(이슈|오류)",
-            r"총\s+(\d+)가지\s+유형[의]?\s+(이슈|오류)[,가]?\s+총\s+(\d+)건"
-        ]
-        
-        matched_pattern = None
-        reported_type_count = 0
-        reported_issue_count = 0
-        
-        # 각 패턴 시도
-        for pattern in summary_patterns:
-            match = re.search(pattern, report)
-            if match:
-                matched_pattern = pattern
-                if len(match.groups()) == 2:
-                    reported_type_count = int(match.group(1))
-                    reported_issue_count = int(match.group(2))
-                elif len(match.groups()) == 3 and "가지" in pattern:
-                    reported_type_count = int(match.group(1))
-                    reported_issue_count = int(match.group(3))
-                break
-        
-        print(f"[리포트 검증] 보고된 이슈: {reported_type_count}가지 유형, {reported_issue_count}건")
-        
-        # 이슈 유형과 건수를 정확하게 표현하는 요약 생성
-        correct_issue_summary = f"총 {issue_type_count}가지 유형의 오류, 총 {total_issue_count}건 감지됨."
-        
-        # 각 이슈 유형별 카운트 추가
-        issue_type_list = []
-        for issue_type, count in validation_result.issue_counts.items():
-            issue_type_kr = self._get_issue_type_kr_name(issue_type)
-            issue_type_list.append(f"- {issue_type_kr}: {count}건")
-        
-        correct_issue_details = "\n".join(issue_type_list)
-        
-        # LLM 응답이 정확한지 확인
-        if matched_pattern:
-            # 보고된 수치가 실제 수치와 다른 경우 수정
-            if reported_type_count != issue_type_count or reported_issue_count != total_issue_count:
-                print(f"[리포트 검증] 불일치 감지: 보고된({reported_type_count}/{reported_issue_count}) vs 실제({issue_type_count}/{total_issue_count})")
-                
-                # 패턴 교체
-                report = re.sub(matched_pattern, correct_issue_summary, report)
-                
-                # 이슈 유형별 카운트 정보 수정
-                # "이슈 요약:" 이후 내용 찾기
-                summary_section_match = re.search(r"(\*\*이슈 요약:.*?\n)((.*?\n)+?)###", report, re.DOTALL)
-                if summary_section_match:
-                    old_summary = summary_section_match.group(2)
-                    report = report.replace(old_summary, f"{correct_issue_summary}\n{correct_issue_details}\n\n")
-                    print("[리포트 검증] 이슈 요약 섹션 수정 완료")
-                else:
-                    print("[리포트 검증] 이슈 요약 섹션을 찾을 수 없음")
+        root = parse_markdown_sections(report)
+        correct_issue_summary = correct_summary_sentence(validation_result)
+        correct_issue_details = "".join(
+            f"- {self._get_issue_type_kr_name(issue_type)}: {count}건\n" for issue_type, count in issue_counts.items()
+        )
+        
+        # 이슈 요약 섹션 - 보고된 수치가 실제 수치와 다르거나 요약 문장이 없으면 본문 교체
+        summary_section = find_summary_section(root)
+        if summary_section is not None:
+            reported = reported_summary_counts("".join(summary_section.body))
+            logger.debug("[리포트 검증] 보고된 이슈: %s", reported)
+            if reported != (issue_type_count, total_issue_count):
+                summary_section.body = ["\n", f"**이슈 요약:** {correct_issue_summary}\n", correct_issue_details, "\n"]
+                logger.debug("[리포트 검증] 이슈 요약 섹션 수정 완료")
             else:
-                print("[리포트 검증] 수치 일치, 수정 불필요")
+                logger.debug("[리포트 검증] 수치 일치, 수정 불필요")
         else:
-            # 요약 부분을 찾지 못한 경우
-            print("[리포트 검증] 이슈 요약 패턴 미발견, 강제 삽입 시도")
-            
-            # "## ⚠️ 3. 검출된 이슈 요약" 섹션 찾기
-            if "## ⚠️ 3. 검출된 이슈 요약" in report:
-                # 기존 이슈 요약 내용 대체
-                summary_start = report.find("## ⚠️ 3. 검출된 이슈 요약")
-                summary_end = report.find("###", summary_start)
-                if summary_end == -1:  # "###"가 없는 경우 다음 섹션 찾기
-                    summary_end = report.find("## 📌", summary_start)
-                
-                if summary_end != -1:
-                    # 원래 섹션 추출
-                    original_section = report[summary_start:summary_end]
-                    
-                    # 새 내용 생성
-                    new_section = f"## ⚠️ 3. 검출된 이슈 요약\n\n**이슈 요약:** {correct_issue_summary}\n{correct_issue_details}\n\n"
-                    
-                    # 교체
-                    report = report.replace(original_section, new_section)
-                    print("[리포트 검증] 이슈 요약 섹션 전체 교체")
-                else:
-                    # 요약 헤더만 있고 내용이 없는 경우
-                    summary_text = f"\n\n**이슈 요약:** {correct_issue_summary}\n{correct_issue_details}\n\n"
-                    report = report.replace("## ⚠️ 3. 검출된 이슈 요약", f"## ⚠️ 3. 검출된 이슈 요약{summary_text}")
-                    print("[리포트 검증] 이슈 요약 내용 추가")
-        
-        # 각 이슈 유형 섹션 수정
-        # 존재하지 않는 이슈 유형 섹션 제거 (issue_counts에 없는 유형)
-        allowed_issue_types_kr = [self._get_issue_type_kr_name(issue_type) for issue_type in validation_result.issue_counts.keys()]
-        
-        # 각 이슈 유형 섹션 찾기
-        issue_section_pattern = r"### (.+?):\s+(\d+)건"
-        
-        for match in re.finditer(issue_section_pattern, report):
-            issue_type_kr = match.group(1)
-            reported_count = int(match.group(2))
-            
-            # 유효한 이슈 타입인지 확인
-            if issue_type_kr not in allowed_issue_types_kr:
-                # 해당 섹션의 끝 찾기
-                section_start = match.start()
-                next_section = re.search(r"###", report[section_start + 1:])
-                section_end = next_section.start() + section_start + 1 if next_section else report.find("## 📌", section_start)
-                
-                if section_end > section_start:
-                    # 섹션 삭제
-                    original_section = report[section_start:section_end]
-                    report = report.replace(original_section, "")
-                    print(f"[리포트 검증] 유효하지 않은 이슈 유형 '{issue_type_kr}' 섹션 제거")
-            else:
-                # 이슈 개수가 불일치할 경우 수정
-                for issue_type, count in validation_result.issue_counts.items():
-                    issue_type_kr_check = self._get_issue_type_kr_name(issue_type)
-                    if issue_type_kr == issue_type_kr_check and reported_count != count:
-                        # 개수 수정
-                        old_section_header = f"### {issue_type_kr}: {reported_count}건"
-                        new_section_header = f"### {issue_type_kr}: {count}건"
-                        report = report.replace(old_section_header, new_section_header)
-                        print(f"[리포트 검증] 이슈 유형 '{issue_type_kr}' 개수 수정: {reported_count} → {count}")
+            logger.debug("[리포트 검증] 이슈 요약 섹션을 찾을 수 없음")
+        
+        # 이슈 유형 섹션 - 존재하지 않는 유형은 제거하고 건수는 issue_counts 기준으로 수정
+        expected = {self._get_issue_type_kr_name(issue_type): count for issue_type, count in issue_counts.items()}
+        invalid_sections = []
+        first_section = None
+        seen = set()
+        for section, issue_type_kr, reported_count in issue_type_sections(root):
+            count = expected.get(issue_type_kr)
+            if count is None:
+                invalid_sections.append(section)
+                logger.debug("[리포트 검증] 유효하지 않은 이슈 유형 '%s' 섹션 제거", issue_type_kr)
+                continue
+            seen.add(issue_type_kr)
+            if first_section is None:
+                first_section = section
+            if reported_count != count:
+                section.heading = ISSUE_SECTION_HEADER.sub(
+                    lambda match: f"{match.group(1)} {issue_type_kr}: {count}건", section.heading.lstrip(), count=1
+                )
+                logger.debug("[리포트 검증] 이슈 유형 '%s' 개수 수정: %s → %d", issue_type_kr, reported_count, count)
+        remove_sections(invalid_sections)
         
-        # 누락된 이슈 유형 섹션 추가
-        for issue_type, count in validation_result.issue_counts.items():
+        # 누락된 이슈 유형 섹션 추가 - 첫 이슈 섹션 앞, 없으면 총평 앞
+        anchor = first_section or find_conclusion_section(root)
+        missing = []
+        for issue_type, count in issue_counts.items():
             issue_type_kr = self._get_issue_type_kr_name(issue_type)
-            section_pattern = f"### {issue_type_kr}:"
-            
-            if section_pattern not in report:
-                # 첫 이슈 섹션 찾기
-                first_section_match = re.search(r"### (.+?):", report)
-                if first_section_match:
-                    # 첫 이슈 섹션 앞에 추가
-                    first_section_start = first_section_match.start()
-                    insert_point = first_section_start
-                    
-                    # 이슈 샘플 추출 (첫 번째 발견된 issues 항목)
-                    sample_issue = None
-                    for issue in validation_result.issues:
-                        if issue.issue_type == issue_type:
-                            sample_issue = issue
-                            break
-                    
-                    # 추가할 섹션 내용
-                    new_section = f"### {issue_type_kr}: {count}건\n\n"
-                    
-                    if sample_issue:
-                        field = sample_issue.field if sample_issue.field else "전체 룰"
-                        explanation = sample_issue.explanation if hasattr(sample_issue, 'explanation') else ""
-                        location = sample_issue.location if hasattr(sample_issue, 'location') else ""
-                        
-                        new_section += f"**{field}**\n"
-                        if location:
-                            new_section += f"- {explanation} (위치: {location})\n\n"
-                        else:
-                            new_section += f"- {explanation}\n\n"
-                    else:
-                        new_section += f"**이슈 정보 없음**\n- validation_result에는 있으나 상세 정보가 없습니다.\n\n"
-                    
-                    # 보고서에 삽입
-                    report = report[:insert_point] + new_section + report[insert_point:]
-                    print(f"[리포트 검증] 누락된 이슈 유형 '{issue_type_kr}' 섹션 추가")
-                else:
-                    # 첫 이슈 섹션을 찾지 못한 경우 총평 앞에 추가
-                    total_assessment = "## 📌 총평"
-                    if total_assessment in report:
-                        insert_point = report.find(total_assessment)
-                        
-                        new_section = f"### {issue_type_kr}: {count}건\n\n"
-                        
-                        # 이슈 샘플 추출
-                        sample_issue = None
-                        for issue in validation_result.issues:
-                            if issue.issue_type == issue_type:
-                                sample_issue = issue
-                                break
-                        
-                        if sample_issue:
-                            field = sample_issue.field if sample_issue.field else "전체 룰"
-                            explanation = sample_issue.explanation if hasattr(sample_issue, 'explanation') else ""
-                            location = sample_issue.location if hasattr(sample_issue, 'location') else ""
-                            
-                            new_section += f"**{field}**\n"
-                            if location:
-                                new_section += f"- {explanation} (위치: {location})\n\n"
-                            else:
-                                new_section += f"- {explanation}\n\n"
-                        else:
-                            new_section += f"**이슈 정보 없음**\n- validation_result에는 있으나 상세 정보가 없습니다.\n\n"
-                        
-                        report = report[:insert_point] + new_section + report[insert_point:]
-                        print(f"[리포트 검증] 누락된 이슈 유형 '{issue_type_kr}' 섹션을 총평 앞에 추가")
-        
-        print("[리포트 검증] 완료")
-        return report
+            if issue_type_kr in seen:
+                continue
+            # 이슈 샘플 추출 (첫 번째 발견된 issues 항목)
+            sample_issue = next((issue for issue in validation_result.issues if issue.issue_type == issue_type), None)
+            missing.append(section_from_text(build_issue_section(issue_type_kr, count, [sample_issue] if sample_issue else [])))
+            logger.debug("[리포트 검증] 누락된 이슈 유형 '%s' 섹션 추가", issue_type_kr)
+        if missing and anchor is not None:
+            anchor.insert_before(missing)
+        
+        logger.debug("[리포트 검증] 완료")
+        return root.render()
 
     def _get_issue_type_kr_name(self, issue_type: str) -> str:
         """이슈 타입의 한글 이름 반환"""
-        issue_type_mapping = {
-            "duplicate_condition": "조건 겹침",
-            "invalid_operator": "잘못된 연산자",
-            "type_mismatch": "타입 오류",
-            "self_contradiction": "자기모순",
-            "structure_complexity": "중첩 과도",
-            "missing_condition": "누락 조건",
-            "analysis_error": "분석 오류",
-            "invalid_structure": "구조 오류"
-        }
-        return issue_type_mapping.get(issue_type, issue_type)
-
-    def _generate_issue_summary(self, validation_result: ValidationResult) -> str:
-        """이슈 요약 생성"""
-        if not hasattr(validation_result, 'issue_counts') or not validation_result.issue_counts:
-            if not validation_result.issues:
-                return "모든 검증을 통과했습니다."
-            # 이슈 개수 카운트 (issue_counts가 없는 경우에만 직접 계산)
-            issue_types = {}
-            for issue in validation_result.issues:
-                if issue.issue_type not in issue_types:
-                    issue_types[issue.issue_type] = 0
-                issue_types[issue.issue_type] += 1
-                
-            issue_type_count = len(issue_types)
-            total_issue_count = len(validation_result.issues)
-        else:
-            # issue_counts 객체에서 직접 정보 추출
-            issue_types = validation_result.issue_counts
-            issue_type_count = len(validation_result.issue_counts)
-            total_issue_count = sum(validation_result.issue_counts.values())
-        
-        # 이슈가 없는 경우
-        if total_issue_count == 0:
-            return "모든 검증을 통과했습니다."
-        
-        # 이슈 요약 생성 - 단순화된 포맷으로 통일
-        summary = f"총 {issue_type_count}가지 유형의 오류, 총 {total_issue_count}건 감지됨."
-        
-        # 각 이슈 유형별로 필드 정보 추가
-        type_counts = []
-        for issue_type, count in issue_types.items():
-            type_name = self._get_issue_type_kr_name(issue_type)
-            
-            # 해당 이슈 타입의 필드들 추출
-            fields = []
-            for issue in validation_result.issues:
-                if issue.issue_type == issue_type:
-                    if issue.field and issue.field not in fields:
-                        fields.append(issue.field)
-            
-            # 필드 정보가 있으면 추가
-            if fields:
-                field_str = ", ".join(fields)
-                type_counts.append(f"- {type_name}: {count}건 ({field_str})")
-            else:
-                type_counts.append(f"- {type_name}: {count}건")
-        
-        # 이슈 타입별 요약 추가
-        if type_counts:
-            summary += "\n" + "\n".join(type_counts)
-        
-        return summary
+        return issue_type_name(issue_type)
@@ -0,0 +1,286 @@
+import os
+import time
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import Column, Float, Index, Integer, MetaData, String, Table, Text, bindparam, create_engine, delete, event, func, insert, or_, select, update
+from sqlalchemy.engine import Engine, make_url
+from app.config import settings
+from app.models.rule import Rule
+from app.models.validation_result import ValidationResult
+from app.services.rule_hash import rule_model_hash
+from app.services.rule_set_analyzer import rule_fields
+
+# alembic 마이그레이션 스크립트 위치 (backend/migrations)
+MIGRATIONS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "migrations")
+
+# 모든 룰이 의존하는 스키마 항목(타입별 허용 연산자 등)을 나타내는 가상 필드
+ALL_RULES_FIELD = "*"
+
+
+def dependent_fields(rule: Rule) -> List[str]:
+    """룰의 분석 결과가 의존하는 스키마 필드 (조건에 쓰인 필드 + 가상 필드 "*")"""
+    return [ALL_RULES_FIELD, *rule_fields(rule)]
+
+
+# 룰 저장소 테이블 정의 (스키마 변경은 migrations/versions에 alembic 리비전으로 추가)
+metadata = MetaData()
+
+rules_table = Table(
+    "rules", metadata,
+    Column("rule_id", String, primary_key=True),
+    Column("version", Integer, nullable=False),
+    Column("rule_hash", String, nullable=False),
+    Column("result", Text),
+    Column("result_version", Integer),
+    Column("schema_version", String),
+    Column("updated_at", Float, nullable=False)
+)
+rule_versions_table = Table(
+    "rule_versions", metadata,
+    Column("rule_id", String, primary_key=True),
+    Column("version", Integer, primary_key=True),
+    Column("rule", Text, nullable=False),
+    Column("rule_hash", String, nullable=False),
+    Column("created_at", Float, nullable=False)
+)
+rule_fields_table = Table(
+    "rule_fields", metadata,
+    Column("rule_id", String, primary_key=True),
+    Column("field", String, primary_key=True),
+    # 저장된 결과를 분석할 때의 필드 스키마 지문 (결과가 없으면 NULL)
+    Column("fingerprint", String),
+    Index("idx_rule_fields_field", "field")
+)
+
+
+def upgrade_database(engine: Engine) -> None:
+    """DB 스키마를 최신 alembic 리비전으로 올림 (이미 최신이면 아무것도 하지 않음)"""
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config()
+    config.set_main_option("script_location", MIGRATIONS_PATH)
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+
+
+def create_repository_engine(url: str) -> Engine:
+    """저장소 DB 엔진 (SQLite 파일이면 디렉터리를 만들고 WAL 모드 사용)"""
+    database_url = make_url(url)
+    connect_args = {}
+    if database_url.get_backend_name() == "sqlite":
+        connect_args["check_same_thread"] = False
+        directory = os.path.dirname(database_url.database or "")
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    engine = create_engine(database_url, connect_args=connect_args)
+    if database_url.get_backend_name() == "sqlite":
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragma(dbapi_connection, _):
+            dbapi_connection.execute("PRAGMA journal_mode=WAL")
+    return engine
+
+
+class StoredRule:
+    """저장소에 보관된 룰의 현재 버전과 캐시된 검증 결과"""
+
+    __slots__ = ("rule_id", "version", "rule", "rule_hash", "result", "result_version", "schema_version", "updated_at")
+
+    def __init__(self, rule_id: str, version: int, rule: Rule, rule_hash: str, result: Optional[ValidationResult],
+                 result_version: Optional[int], schema_version: Optional[str], updated_at: float):
+        self.rule_id = rule_id
+        self.version = version
+        self.rule = rule
+        self.rule_hash = rule_hash
+        self.result = result
+        self.result_version = result_version
+        self.schema_version = schema_version
+        self.updated_at = updated_at
+
+    def is_current(self, schema_version: str) -> bool:
+        """캐시된 결과가 현재 버전과 스키마 기준인지 여부"""
+        return self.result is not None and self.result_version == self.version and self.schema_version == schema_version
+
+
+class RuleRepository:
+    """
+    SQLAlchemy 기반 룰 저장소
+
+    - 룰은 버전별로 보관하며, 내용(정규화 해시)이 같으면 새 버전을 만들지 않습니다.
+    - 룰마다 마지막 검증 결과와 그때의 룰 버전, 스키마 버전을 함께 저장합니다.
+    - 룰이 참조하는 필드 색인(rule_fields)에 결과를 분석할 때의 필드별 스키마 지문을 함께 두어,
+      스키마가 바뀌면 지문이 다른 필드를 쓰는 룰만 골라낼 수 있습니다.
+    - 첫 사용 시 DB에 연결하고 alembic 마이그레이션으로 스키마를 최신 리비전으로 올립니다.
+    - 모든 메서드는 블로킹 DB 호출이므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self._engine: Optional[Engine] = None
+        self._lock = Lock()
+
+    def _connect(self) -> Engine:
+        if self._engine is None:
+            engine = create_repository_engine(self.url)
+            upgrade_database(engine)
+            self._engine = engine
+        return self._engine
+
+    def save(self, rule_id: str, rule: Rule) -> Tuple[int, bool]:
+        """룰 저장 - (현재 버전, 새 버전이 만들어졌는지 여부)"""
+        rule_hash = rule_model_hash(rule)
+        now = time.time()
+        with self._lock, self._connect().begin() as connection:
+            row = connection.execute(
+                select(rules_table.c.version, rules_table.c.rule_hash).where(rules_table.c.rule_id == rule_id)
+            ).first()
+            if row is not None and row.rule_hash == rule_hash:
+                return row.version, False
+            version = row.version + 1 if row is not None else 1
+            connection.execute(insert(rule_versions_table).values(
+                rule_id=rule_id, version=version, rule=rule.model_dump_json(), rule_hash=rule_hash, created_at=now
+            ))
+            # 이전 버전의 검증 결과는 새 결과가 저장될 때까지 그대로 둠 (result_version으로 구분)
+            if row is None:
+                connection.execute(insert(rules_table).values(rule_id=rule_id, version=version, rule_hash=rule_hash, updated_at=now))
+            else:
+                connection.execute(
+                    update(rules_table).where(rules_table.c.rule_id == rule_id).values(version=version, rule_hash=rule_hash, updated_at=now)
+                )
+            connection.execute(delete(rule_fields_table).where(rule_fields_table.c.rule_id == rule_id))
+            connection.execute(insert(rule_fields_table), [{"rule_id": rule_id, "field": field} for field in set(dependent_fields(rule))])
+            return version, True
+
+    def get(self, rule_id: str, version: Optional[int] = None) -> Optional[StoredRule]:
+        """룰 조회 (version이 없으면 현재 버전)"""
+        with self._lock, self._connect().connect() as connection:
+            row = connection.execute(
+                select(rules_table.c.version, rules_table.c.result, rules_table.c.result_version,
+                       rules_table.c.schema_version, rules_table.c.updated_at).where(rules_table.c.rule_id == rule_id)
+            ).first()
+            if row is None:
+                return None
+            current_version, result, result_version, schema_version, updated_at = row
+            version = current_version if version is None else version
+            version_row = connection.execute(
+                select(rule_versions_table.c.rule, rule_versions_table.c.rule_hash, rule_versions_table.c.created_at)
+                .where(rule_versions_table.c.rule_id == rule_id, rule_versions_table.c.version == version)
+            ).first()
+        if version_row is None:
+            return None
+        rule_json, rule_hash, created_at = version_row
+        # 캐시된 결과는 그 결과를 만든 버전을 조회할 때만 함께 돌려줌
+        if version != result_version:
+            result, result_version, schema_version = None, None, None
+        return StoredRule(
+            rule_id=rule_id,
+            version=version,
+            rule=Rule.model_validate_json(rule_json),
+            rule_hash=rule_hash,
+            result=ValidationResult.model_validate_json(result) if result else None,
+            result_version=result_version,
+            schema_version=schema_version,
+            updated_at=updated_at if version == current_version else created_at
+        )
+
+    def versions(self, rule_id: str) -> List[Dict[str, object]]:
+        """룰의 버전 목록 (오래된 순)"""
+        with self._lock, self._connect().connect() as connection:
+            rows = connection.execute(
+                select(rule_versions_table.c.version, rule_versions_table.c.rule_hash, rule_versions_table.c.created_at)
+                .where(rule_versions_table.c.rule_id == rule_id)
+                .order_by(rule_versions_table.c.version)
+            ).all()
+        return [{"version": version, "rule_hash": rule_hash, "created_at": created_at} for version, rule_hash, created_at in rows]
+
+    def store_result(self, rule_id: str, version: int, schema_version: str, result: ValidationResult,
+                     fingerprints: Dict[str, str]) -> bool:
+        """
+        검증 결과 저장 - 그사이 룰이 다시 바뀌었으면 저장하지 않고 False
+
+        fingerprints는 분석에 쓴 스키마의 필드별 지문이며, 룰이 참조하는 필드마다 함께 기록합니다.
+        """
+        with self._lock, self._connect().begin() as connection:
+            updated = connection.execute(
+                update(rules_table)
+                .where(rules_table.c.rule_id == rule_id, rules_table.c.version == version)
+                .values(result=result.model_dump_json(), result_version=version, schema_version=schema_version)
+            )
+            if updated.rowcount == 0:
+                return False
+            fields = connection.execute(
+                select(rule_fields_table.c.field).where(rule_fields_table.c.rule_id == rule_id)
+            ).scalars().all()
+            connection.execute(
+                update(rule_fields_table)
+                .where(rule_fields_table.c.rule_id == bindparam("target_rule_id"), rule_fields_table.c.field == bindparam("target_field")),
+                [{"target_rule_id": rule_id, "target_field": field, "fingerprint": fingerprints.get(field)} for field in fields]
+            )
+            return True
+
+    def stale_rule_ids(self, schema_version: str) -> List[str]:
+        """현재 버전/스키마 기준 검증 결과가 없는 룰"""
+        with self._lock, self._connect().connect() as connection:
+            rows = connection.execute(
+                select(rules_table.c.rule_id)
+                .where(or_(
+                    rules_table.c.result.is_(None),
+                    rules_table.c.result_version.is_distinct_from(rules_table.c.version),
+                    rules_table.c.schema_version.is_distinct_from(schema_version)
+                ))
+                .order_by(rules_table.c.updated_at)
+            ).all()
+        return [row.rule_id for row in rows]
+
+    def referenced_fields(self) -> List[str]:
+        """저장된 룰이 참조하는 필드 목록"""
+        with self._lock, self._connect().connect() as connection:
+            rows = connection.execute(select(rule_fields_table.c.field).distinct()).all()
+        return [row.field for row in rows]
+
+    def apply_schema(self, schema_version: str, fingerprints: Dict[str, str]) -> List[str]:
+        """
+        스키마 지문 반영 - 결과를 분석할 때와 지문이 다른 필드를 쓰는 룰 ID 목록 반환
+
+        - 모든 필드의 지문이 현재와 같은 룰의 결과는 새 스키마에서도 같으므로 스키마 버전만 갱신합니다.
+        - 지문은 결과를 저장할 때 룰마다 기록하므로, 재검증 전에 재시작해도 이전 결과를 현재 결과로 보지 않습니다.
+        """
+        with self._lock, self._connect().begin() as connection:
+            rows = connection.execute(
+                select(rules_table.c.rule_id, rules_table.c.schema_version, rule_fields_table.c.field, rule_fields_table.c.fingerprint)
+                .join(rule_fields_table, rule_fields_table.c.rule_id == rules_table.c.rule_id)
+                .where(rules_table.c.result.is_not(None), rules_table.c.result_version == rules_table.c.version)
+            ).all()
+            outdated: Set[str] = set()
+            restamp: Set[str] = set()
+            for rule_id, rule_schema_version, field, fingerprint in rows:
+                if fingerprint is None or fingerprint != fingerprints.get(field):
+                    outdated.add(rule_id)
+                elif rule_schema_version != schema_version:
+                    restamp.add(rule_id)
+            restamp -= outdated
+            if restamp:
+                connection.execute(
+                    update(rules_table).where(rules_table.c.rule_id == bindparam("target_rule_id")),
+                    [{"target_rule_id": rule_id, "schema_version": schema_version} for rule_id in sorted(restamp)]
+                )
+            return sorted(outdated)
+
+    def stats(self) -> Dict[str, int]:
+        """저장된 룰/버전 수"""
+        with self._lock, self._connect().connect() as connection:
+            rules = connection.execute(select(func.count()).select_from(rules_table)).scalar_one()
+            versions = connection.execute(select(func.count()).select_from(rule_versions_table)).scalar_one()
+        return {"rules": rules, "versions": versions}
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            if self._engine is not None:
+                self._engine.dispose()
+                self._engine = None
+
+
+# 앱 전체에서 공유하는 룰 저장소 (RULE_REPOSITORY_URL 이 비어 있으면 사용 안 함)
+rule_repository: Optional[RuleRepository] = RuleRepository(settings.RULE_REPOSITORY_URL) if settings.RULE_REPOSITORY_URL else None
@@ -0,0 +1,384 @@
+import asyncio
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Set, Tuple
+from app.config import settings
+from app.models.rule import Rule
+from app.models.rule_set import RuleOverlap, RuleSetOverlapResponse, RuleSetShadowResponse, RuleShadow
+from app.services.analysis_executor import analysis_executor
+from app.services.condition_ir import compile_conditions
+from app.services.interval_engine import NEG_INF, POS_INF, IntervalTree, is_number
+from app.services.rule_regions import Box, FieldConstraint, RuleRegion, box_contains, boxes_overlap, build_rule_region, intersect_boxes, subtract_box
+
+SHADOWED = "shadowed"
+PARTIALLY_SHADOWED = "partially_shadowed"
+
+
+class DisjointSet:
+    """유니온 파인드 (경로 압축 + 크기 기준 합치기)"""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, item: int) -> int:
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, first: int, second: int) -> None:
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return
+        if self.size[first] < self.size[second]:
+            first, second = second, first
+        self.parent[second] = first
+        self.size[first] += self.size[second]
+
+
+def rule_fields(rule: Rule) -> List[str]:
+    """룰 조건에 쓰인 필드 목록 (논리 연산자 블록 제외)"""
+    ir = compile_conditions(rule.conditions)
+    return [field for field, postings in ir.postings.items() if ir.is_field_condition(postings[0])]
+
+
+def partition_by_fields(field_lists: List[List[str]]) -> List[List[int]]:
+    """필드를 공유하는 룰끼리 묶은 그룹 목록 (룰 위치, 입력 순서 유지) - 다른 그룹의 룰과는 겹침을 따질 필요가 없음"""
+    groups = DisjointSet(len(field_lists))
+    owner: Dict[str, int] = {}
+    for position, fields in enumerate(field_lists):
+        for field in fields:
+            if field in owner:
+                groups.union(owner[field], position)
+            else:
+                owner[field] = position
+
+    components: Dict[int, List[int]] = {}
+    for position, fields in enumerate(field_lists):
+        if fields:
+            components.setdefault(groups.find(position), []).append(position)
+    return list(components.values())
+
+
+class FieldIndex:
+    """
+    한 필드를 제약하는 박스들의 후보 색인
+
+    - 숫자 구간 제약은 구간 트리, 허용 값 집합은 값 → 박스 해시 색인과 숫자 값 정렬 목록에 넣습니다.
+    - 제외 값만 있는 제약(!=)은 거의 모든 값과 겹치므로 따로 모아 항상 후보로 돌려줍니다.
+    - 질의 결과는 이 필드에서 겹칠 수 있는 박스의 상위 집합이며, 정확한 판정은 호출 측에서 합니다.
+    """
+
+    def __init__(self, entries: List[Tuple[int, FieldConstraint]]):
+        self.all_ids: Set[int] = set()
+        self.open_ids: Set[int] = set()
+        self.values: Dict[object, List[int]] = {}
+        self.string_value_ids: Set[int] = set()
+        numeric: List[Tuple[float, int]] = []
+        intervals = []
+        for box_id, constraint in entries:
+            self.all_ids.add(box_id)
+            if constraint.allowed is not None:
+                for value in constraint.allowed:
+                    self.values.setdefault(value, []).append(box_id)
+                    if is_number(value):
+                        numeric.append((float(value), box_id))
+                    else:
+                        self.string_value_ids.add(box_id)
+            elif constraint.interval.lo == NEG_INF and constraint.interval.hi == POS_INF:
+                self.open_ids.add(box_id)
+            else:
+                intervals.append((box_id, constraint.interval))
+        numeric.sort()
+        self._numeric_values = [value for value, _ in numeric]
+        self._numeric_ids = [box_id for _, box_id in numeric]
+        self.tree = IntervalTree(intervals)
+
+    def query(self, constraint: FieldConstraint) -> Set[int]:
+        """이 필드에서 constraint와 겹칠 수 있는 박스 ID"""
+        if constraint.allowed is not None:
+            result = set(self.open_ids)
+            for value in constraint.allowed:
+                result.update(self.values.get(value, ()))
+                if is_number(value):
+                    result.update(self.tree.stab(value))
+            return result
+        interval = constraint.interval
+        if interval.lo == NEG_INF and interval.hi == POS_INF:
+            return set(self.all_ids)
+        result = set(self.open_ids)
+        result.update(self.tree.query(interval))
+        start = bisect_left(self._numeric_values, interval.lo)
+        end = bisect_right(self._numeric_values, interval.hi)
+        result.update(self._numeric_ids[start:end])
+        return result
+
+
+def _index_boxes(boxes: List[Box]) -> Dict[str, FieldIndex]:
+    """필드별 박스 색인 생성 (박스 ID = 목록 위치)"""
+    entries: Dict[str, List[Tuple[int, FieldConstraint]]] = {}
+    for box_id, box in enumerate(boxes):
+        for field, constraint in box.items():
+            entries.setdefault(field, []).append((box_id, constraint))
+    return {field: FieldIndex(field_entries) for field, field_entries in entries.items()}
+
+
+def _shared_region(box: Box, other: Box) -> Optional[Dict[str, str]]:
+    """두 박스가 공유 필드에서 모두 겹치면 공유 필드별 교집합 설명, 아니면 None"""
+    intersection = intersect_boxes({field: box[field] for field in box if field in other}, other)
+    if intersection is None:
+        return None
+    return {field: intersection[field].describe() for field in sorted(box) if field in other}
+
+
+def find_region_overlaps(regions: List[RuleRegion]) -> List[RuleOverlap]:
+    """
+    한 그룹 안에서 영역이 겹치는 룰 쌍 검출
+
+    - 박스마다 자신이 제약하는 필드의 색인을 질의하고, 후보가 적은 필드부터 차례로 확인합니다.
+    - 앞선 필드에서 이미 확인한(그 필드도 제약하는) 박스는 다시 보지 않으므로 공통 필드가 있는 박스 쌍은 정확히 한 번 검사됩니다.
+    - 공통 필드가 하나도 없는 룰은 서로 다른 기준의 룰로 보고 겹침으로 보고하지 않습니다.
+    """
+    boxes: List[Box] = []
+    owners: List[int] = []
+    for position, region in enumerate(regions):
+        for box in region.boxes:
+            if box:
+                boxes.append(box)
+                owners.append(position)
+
+    indexes = _index_boxes(boxes)
+
+    found: Dict[Tuple[int, int], Dict[str, str]] = {}
+    for box_id, box in enumerate(boxes):
+        owner = owners[box_id]
+        candidates = sorted(((field, indexes[field].query(constraint)) for field, constraint in box.items()), key=lambda item: len(item[1]))
+        checked_fields: List[str] = []
+        for field, candidate_ids in candidates:
+            for other_id in candidate_ids:
+                other_owner = owners[other_id]
+                if other_id <= box_id or other_owner == owner:
+                    continue
+                pair = (owner, other_owner) if owner < other_owner else (other_owner, owner)
+                if pair in found:
+                    continue
+                other = boxes[other_id]
+                if any(checked in other for checked in checked_fields):
+                    continue
+                region = _shared_region(box, other)
+                if region is not None:
+                    found[pair] = region
+            checked_fields.append(field)
+
+    overlaps = []
+    for (first, second), region in sorted(found.items()):
+        rule, other = regions[first], regions[second]
+        if rule.priority != other.priority:
+            winner = rule.rule_id if rule.priority < other.priority else other.rule_id
+        else:
+            winner = None
+        overlaps.append(RuleOverlap(
+            rule_id=rule.rule_id,
+            other_rule_id=other.rule_id,
+            priority=rule.priority,
+            other_priority=other.priority,
+            winner_rule_id=winner,
+            shared_fields=list(region),
+            region=region,
+            approximate=not (rule.exact and other.exact)
+        ))
+    return overlaps
+
+
+def _subtract_covers(box: Box, covers: List[Tuple[int, Box]], max_boxes: int) -> Tuple[bool, Set[int], bool]:
+    """
+    box에서 덮는 박스들을 차례로 빼기
+
+    - (나머지 없음 여부, 실제로 일부를 덮은 박스 ID, 나머지 조각 수 한도 초과로 멈췄는지 여부)를 돌려줍니다.
+    """
+    remainder = [box]
+    used: Set[int] = set()
+    for cover_id, cover in covers:
+        pieces: List[Box] = []
+        for piece in remainder:
+            if box_contains(cover, piece):
+                used.add(cover_id)
+                continue
+            parts = subtract_box(piece, cover)
+            if len(parts) != 1 or parts[0] is not piece:
+                used.add(cover_id)
+            pieces.extend(parts)
+        remainder = pieces
+        if not remainder:
+            return True, used, False
+        if len(remainder) > max_boxes:
+            return False, used, True
+    return False, used, False
+
+
+def find_shadowed_rules(regions: List[RuleRegion], max_boxes: int = 64) -> List[RuleShadow]:
+    """
+    우선순위가 더 높은(priority 값이 작은) 룰에 가려지는 룰 검출
+
+    - 박스 ID를 priority 순으로 매기므로 어떤 룰보다 먼저 적용되는 박스는 항상 앞쪽 ID 구간에 있습니다.
+    - 박스마다 필드 색인으로 겹칠 수 있는 상위 박스만 고르고, 그중 정확한 영역이면서 자기 필드만 제약하는 박스를
+      차례로 빼서 나머지가 없으면 완전히 가려진 룰입니다. 다른 필드를 섞어야만 덮이는 경우는 찾지 않으므로
+      shadowed 판정은 항상 실제로 성립합니다.
+    - priority가 같은 룰끼리는 적용 순서가 정해져 있지 않으므로 가림으로 보지 않습니다.
+    """
+    order = sorted(range(len(regions)), key=lambda position: regions[position].priority)
+    boxes: List[Box] = []
+    owners: List[int] = []
+    for position in order:
+        for box in regions[position].boxes:
+            boxes.append(box)
+            owners.append(position)
+
+    # priority별 첫 박스 ID - 이보다 앞선 박스가 상위 룰의 박스
+    limits: Dict[int, int] = {}
+    for box_id, owner in enumerate(owners):
+        limits.setdefault(regions[owner].priority, box_id)
+    indexes = _index_boxes(boxes)
+    # 조건 없는 룰은 모든 영역을 덮음 (해석하지 않는 조건만 있어 빈 박스가 된 근사 영역은 제외)
+    unconditional = [box_id for box_id, box in enumerate(boxes) if not box and regions[owners[box_id]].exact]
+
+    shadows = []
+    for position in order:
+        region = regions[position]
+        limit = limits.get(region.priority, 0)
+        if limit == 0:
+            continue
+
+        fully_covered = True
+        truncated = False
+        covering: Set[int] = set()
+        box_candidates: List[Tuple[Box, Dict[int, int]]] = []
+        for box in region.boxes:
+            # 공유 필드마다 겹칠 수 있는 상위 박스 수를 세어, 제약하는 필드가 모두 이 박스 필드 안에 있으면 덮는 후보로 사용
+            counts: Dict[int, int] = {}
+            for field, constraint in box.items():
+                for other_id in indexes[field].query(constraint):
+                    if other_id < limit:
+                        counts[other_id] = counts.get(other_id, 0) + 1
+            for box_id in unconditional:
+                if box_id < limit:
+                    counts[box_id] = 0
+            box_candidates.append((box, counts))
+            if not fully_covered:
+                continue
+            covers = [(other_id, boxes[other_id]) for other_id, count in counts.items() if count == len(boxes[other_id]) and regions[owners[other_id]].exact]
+            covers.sort(key=lambda cover: cover[0])
+            covered, used, stopped = _subtract_covers(box, covers, max_boxes)
+            covering.update(owners[box_id] for box_id in used)
+            truncated = truncated or stopped
+            if not covered:
+                fully_covered = False
+
+        if fully_covered:
+            if region.boxes:
+                shadows.append((position, SHADOWED, covering, False))
+            continue
+
+        # 부분 가림 - 영역이 겹치는 상위 룰 (이미 겹침을 확인한 룰은 다시 보지 않음)
+        overlapping = set(covering)
+        for box, candidates in box_candidates:
+            for other_id in candidates:
+                owner = owners[other_id]
+                if owner not in overlapping and boxes_overlap(box, boxes[other_id]):
+                    overlapping.add(owner)
+        if overlapping:
+            approximate = not region.exact or truncated or any(not regions[owner].exact for owner in overlapping)
+            shadows.append((position, PARTIALLY_SHADOWED, overlapping, approximate))
+
+    result = []
+    for position, status, owner_positions, approximate in sorted(shadows):
+        region = regions[position]
+        result.append(RuleShadow(
+            rule_id=region.rule_id,
+            priority=region.priority,
+            status=status,
+            covering_rule_ids=[regions[owner].rule_id for owner in sorted(owner_positions, key=lambda owner: (regions[owner].priority, owner))],
+            approximate=approximate
+        ))
+    return result
+
+
+def _analyze_components(components: List[List[Tuple[str, Rule]]]) -> List[RuleOverlap]:
+    """그룹 묶음의 겹침 검출 (프로세스 풀 워커에서도 그대로 호출)"""
+    max_boxes = settings.RULE_REGION_MAX_BOXES
+    overlaps = []
+    for component in components:
+        regions = [build_rule_region(rule, rule_id, max_boxes) for rule_id, rule in component]
+        overlaps.extend(find_region_overlaps(regions))
+    return overlaps
+
+
+def _find_shadows(enabled: List[Tuple[str, Rule]]) -> List[RuleShadow]:
+    """활성 룰 목록의 가림 검출 (프로세스 풀 워커에서도 그대로 호출)"""
+    max_boxes = settings.RULE_REGION_MAX_BOXES
+    regions = [build_rule_region(rule, rule_id, max_boxes) for rule_id, rule in enabled]
+    return find_shadowed_rules(regions, max_boxes)
+
+
+def _partition_rules(enabled: List[Tuple[str, Rule]]) -> Tuple[int, List[List[Tuple[str, Rule]]]]:
+    """활성 룰을 필드 공유 그룹으로 분할 - (전체 그룹 수, 룰이 둘 이상인 그룹 목록)"""
+    partition = partition_by_fields([rule_fields(rule) for _, rule in enabled])
+    return len(partition), [[enabled[position] for position in component] for component in partition if len(component) > 1]
+
+
+def _balance(components: List[List[Tuple[str, Rule]]], bins: int) -> List[List[List[Tuple[str, Rule]]]]:
+    """그룹을 크기 순으로 가장 가벼운 묶음에 배정 (워커별 작업량 균형)"""
+    batches: List[List[List[Tuple[str, Rule]]]] = [[] for _ in range(max(1, bins))]
+    loads = [0] * len(batches)
+    for component in sorted(components, key=len, reverse=True):
+        target = loads.index(min(loads))
+        batches[target].append(component)
+        loads[target] += len(component) ** 2
+    return [batch for batch in batches if batch]
+
+
+class RuleSetAnalyzer:
+    """
+    룰 집합 교차 분석 서비스
+
+    - 활성 룰만 대상으로 하며, 필드를 공유하는 룰끼리 유니온 파인드로 묶어 서로 독립인 그룹으로 나눕니다.
+    - 그룹은 분석 실행기(process 모드면 프로세스 풀)에서 나눠 처리하고, 그룹 안에서는 필드별 색인으로 후보 쌍만 검사합니다.
+    - 수천 개 룰이면 수 초가 걸리므로 그룹 분할, 겹침/가림 검출 모두 이벤트 루프 밖(스레드 또는 프로세스 풀)에서 실행합니다.
+    """
+
+    async def find_overlaps(self, rules: List[Tuple[str, Rule]]) -> RuleSetOverlapResponse:
+        """(룰 ID, 룰) 목록에서 영역이 겹치는 활성 룰 쌍 검출"""
+        enabled = [(rule_id, rule) for rule_id, rule in rules if rule.enabled]
+        group_count, components = await asyncio.to_thread(_partition_rules, enabled)
+
+        overlaps: List[RuleOverlap] = []
+        for batch_overlaps in await analysis_executor.map(_analyze_components, _balance(components, analysis_executor.max_workers)):
+            overlaps.extend(batch_overlaps)
+
+        # 입력 순서 기준으로 정렬
+        order = {rule_id: position for position, (rule_id, _) in enumerate(enabled)}
+        overlaps.sort(key=lambda overlap: (order[overlap.rule_id], order[overlap.other_rule_id]))
+        return RuleSetOverlapResponse(
+            rule_count=len(rules),
+            enabled_rule_count=len(enabled),
+            group_count=group_count,
+            overlaps=overlaps
+        )
+
+    async def find_shadowed(self, rules: List[Tuple[str, Rule]]) -> RuleSetShadowResponse:
+        """(룰 ID, 룰) 목록에서 상위 우선순위 룰에 (부분적으로) 가려지는 활성 룰 검출"""
+        enabled = [(rule_id, rule) for rule_id, rule in rules if rule.enabled]
+        shadows = (await analysis_executor.map(_find_shadows, [enabled]))[0]
+        return RuleSetShadowResponse(
+            rule_count=len(rules),
+            enabled_rule_count=len(enabled),
+            shadowed_count=sum(1 for shadow in shadows if shadow.status == SHADOWED),
+            partially_shadowed_count=sum(1 for shadow in shadows if shadow.status == PARTIALLY_SHADOWED),
+            shadows=shadows
+        )
+
+
+# 앱 전체에서 공유하는 룰 집합 분석기
+rule_set_analyzer = RuleSetAnalyzer()
@@ -0,0 +1,586 @@
+import math
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
+from app.services.condition_ir import CompiledConditions
+
+if TYPE_CHECKING:
+    from app.services.rule_analyzer import RuleAnalyzer
+
+# BDD 단말 노드
+FALSE = 0
+TRUE = 1
+
+# 분기 판정 종류
+UNSATISFIABLE = "unsatisfiable"  # 상위 조건 아래에서 절대 참이 될 수 없음
+ALWAYS_TRUE = "always_true"      # 상위 조건 아래에서 항상 참
+REDUNDANT = "redundant"          # 형제 조건에 포함되어 결과에 영향 없음
+
+# 값 도메인으로 정확히 해석하는 연산자 (그 밖의 연산자는 독립 변수로 취급)
+EXACT_OPERATORS = frozenset(["==", "!=", ">", ">=", "<", "<=", "in"])
+
+
+class BDDLimitExceeded(RuntimeError):
+    """BDD 노드 수 또는 연산 단계 수가 한도를 넘은 경우"""
+
+
+class BDD:
+    """
+    축약 순서 이진 결정 다이어그램 (ROBDD)
+
+    - 노드는 (변수, low, high) 튜플로 저장하며, 고유 테이블로 같은 노드를 한 번만 만듭니다.
+    - 변수 번호가 작을수록 루트에 가깝고, 단말 노드(0, 1)의 변수는 무한대로 둡니다.
+    - and/or/not 결과는 연산 캐시에 보관하므로 같은 부분 그래프 연산은 다시 계산하지 않습니다.
+    - 연산은 명시적 스택으로 처리하므로 변수가 많아도 재귀 한도에 걸리지 않습니다.
+    - max_nodes는 메모리를, max_steps(연산 스택 처리 횟수 합계)는 실행 시간을 제한합니다 (0이면 제한 없음).
+    """
+
+    def __init__(self, max_nodes: int = 0, max_steps: int = 0):
+        self.max_nodes = max_nodes
+        self.max_steps = max_steps
+        self.steps = 0
+        self.nodes: List[Tuple[float, int, int]] = [(float("inf"), FALSE, FALSE), (float("inf"), TRUE, TRUE)]
+        self._unique: Dict[Tuple[int, int, int], int] = {}
+        self._and_cache: Dict[Tuple[int, int], int] = {}
+        self._or_cache: Dict[Tuple[int, int], int] = {}
+        self._not_cache: Dict[int, int] = {}
+        self._disjoint_cache: Dict[Tuple[int, int], bool] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self.nodes)
+
+    def node(self, var: int, low: int, high: int) -> int:
+        """(변수, low, high) 노드 (두 자식이 같으면 자식 그대로)"""
+        if low == high:
+            return low
+        key = (var, low, high)
+        result = self._unique.get(key)
+        if result is None:
+            if self.max_nodes and len(self.nodes) >= self.max_nodes:
+                raise BDDLimitExceeded(f"BDD 노드 수가 한도({self.max_nodes})를 넘었습니다.")
+            result = len(self.nodes)
+            self.nodes.append(key)
+            self._unique[key] = result
+        return result
+
+    def _budget(self) -> float:
+        """이번 연산에 남은 단계 수"""
+        return self.max_steps - self.steps if self.max_steps else math.inf
+
+    def _spend(self, steps: int) -> None:
+        self.steps += steps
+        if self.max_steps and self.steps > self.max_steps:
+            raise BDDLimitExceeded(f"BDD 연산 단계 수가 한도({self.max_steps})를 넘었습니다.")
+
+    def conjoin(self, u: int, v: int) -> int:
+        return self._apply(self._and_cache, FALSE, u, v)
+
+    def disjoin(self, u: int, v: int) -> int:
+        return self._apply(self._or_cache, TRUE, u, v)
+
+    def _apply(self, cache: Dict[Tuple[int, int], int], zero: int, u: int, v: int) -> int:
+        """
+        and(zero=FALSE) / or(zero=TRUE) 연산 - 변수 수만큼 깊어지는 재귀 대신 명시적 스택 사용
+
+        - 스택 항목 (u, v, 변수): 변수가 None이면 (u, v)를 계산하고, 아니면 결과 스택의 low/high로 노드를 만듦
+        """
+        one = TRUE - zero
+        nodes = self.nodes
+        results: List[int] = []
+        stack: List[Tuple[int, int, Any]] = [(u, v, None)]
+        budget = self._budget()
+        steps = 0
+        while stack:
+            steps += 1
+            if steps > budget:
+                self._spend(steps)
+            u, v, var = stack.pop()
+            if var is not None:
+                high = results.pop()
+                low = results.pop()
+                result = self.node(var, low, high)
+                cache[(u, v)] = result
+                results.append(result)
+                continue
+            if u == zero or v == zero:
+                results.append(zero)
+                continue
+            if u == one or u == v:
+                results.append(v)
+                continue
+            if v == one:
+                results.append(u)
+                continue
+            if u > v:
+                u, v = v, u
+            result = cache.get((u, v))
+            if result is not None:
+                results.append(result)
+                continue
+            var_u, low_u, high_u = nodes[u]
+            var_v, low_v, high_v = nodes[v]
+            if var_u == var_v:
+                stack.append((u, v, var_u))
+                stack.append((high_u, high_v, None))
+                stack.append((low_u, low_v, None))
+            elif var_u < var_v:
+                stack.append((u, v, var_u))
+                stack.append((high_u, v, None))
+                stack.append((low_u, v, None))
+            else:
+                stack.append((u, v, var_v))
+                stack.append((u, high_v, None))
+                stack.append((u, low_v, None))
+        self._spend(steps)
+        return results[0]
+
+    def negate(self, u: int) -> int:
+        if u <= TRUE:
+            return TRUE - u
+        cache = self._not_cache
+        nodes = self.nodes
+        results: List[int] = []
+        # (노드, 자식 계산 완료 여부)
+        stack: List[Tuple[int, bool]] = [(u, False)]
+        budget = self._budget()
+        steps = 0
+        while stack:
+            steps += 1
+            if steps > budget:
+                self._spend(steps)
+            u, combine = stack.pop()
+            if combine:
+                high = results.pop()
+                low = results.pop()
+                result = self.node(nodes[u][0], low, high)
+                cache[u] = result
+                results.append(result)
+                continue
+            if u <= TRUE:
+                results.append(TRUE - u)
+                continue
+            result = cache.get(u)
+            if result is not None:
+                results.append(result)
+                continue
+            _, low, high = nodes[u]
+            stack.append((u, True))
+            stack.append((high, False))
+            stack.append((low, False))
+        self._spend(steps)
+        return results[0]
+
+    def disjoint(self, u: int, v: int) -> bool:
+        """
+        u ∧ v가 항상 거짓인지 여부 (결과 BDD를 만들지 않고 확인)
+
+        - low 쪽이 겹치면 high 쪽은 확인하지 않습니다.
+        - 스택 항목 (u, v, 단계, high_u, high_v): 0=계산, 1=low 결과 확인 후 high 계산, 2=high 결과 저장
+        """
+        cache = self._disjoint_cache
+        nodes = self.nodes
+        results: List[bool] = []
+        stack: List[Tuple[int, int, int, int, int]] = [(u, v, 0, 0, 0)]
+        budget = self._budget()
+        steps = 0
+        while stack:
+            steps += 1
+            if steps > budget:
+                self._spend(steps)
+            u, v, stage, high_u, high_v = stack.pop()
+            if stage == 1:
+                if results[-1]:
+                    results.pop()
+                    stack.append((u, v, 2, 0, 0))
+                    stack.append((high_u, high_v, 0, 0, 0))
+                else:
+                    cache[(u, v)] = False
+                continue
+            if stage == 2:
+                cache[(u, v)] = results[-1]
+                continue
+            if u == FALSE or v == FALSE:
+                results.append(True)
+                continue
+            if u == TRUE or v == TRUE or u == v:
+                results.append(False)
+                continue
+            if u > v:
+                u, v = v, u
+            result = cache.get((u, v))
+            if result is not None:
+                results.append(result)
+                continue
+            var_u, low_u, high_u = nodes[u]
+            var_v, low_v, high_v = nodes[v]
+            if var_u == var_v:
+                stack.append((u, v, 1, high_u, high_v))
+                stack.append((low_u, low_v, 0, 0, 0))
+            elif var_u < var_v:
+                stack.append((u, v, 1, high_u, v))
+                stack.append((low_u, v, 0, 0, 0))
+            else:
+                stack.append((u, v, 1, u, high_v))
+                stack.append((u, low_v, 0, 0, 0))
+        self._spend(steps)
+        return results[0]
+
+    def implies(self, u: int, v: int) -> bool:
+        """u이면 항상 v인지 여부"""
+        return self.disjoint(u, self.negate(v))
+
+
+class FieldDomain:
+    """
+    필드 하나의 추상 값 도메인 - 룰에 등장한 상수를 경계로 값 공간을 원자(atom)로 분할
+
+    - 숫자: 상수 점과 그 사이의 열린 구간 (-inf, p1), p1, (p1, p2), ..., (pn, inf)
+    - 문자열(코드): 상수 값과 그 사이의 나머지 문자열 구간
+    - null: 룰이 None을 비교하거나 nullable일 때만 포함
+    - 같은 원자에 속한 값은 모든 조건에서 같은 결과를 내므로 원자별 대표값 하나로 조건을 평가합니다.
+    - 원자 번호는 이진 변수 bits개로 인코딩하며, 남는 코드는 마지막 원자로 취급해 별도 도메인 제약이 필요 없습니다.
+    """
+
+    __slots__ = ("field", "representatives", "first_var", "bits")
+
+    def __init__(self, field: str, representatives: List[Any], first_var: int):
+        self.field = field
+        self.representatives = representatives
+        self.first_var = first_var
+        self.bits = (len(representatives) - 1).bit_length()
+
+    def encode(self, bdd: BDD, atoms: int) -> int:
+        """원자 집합(비트마스크)에 속하는 값을 나타내는 BDD"""
+        count = len(self.representatives)
+        full = (1 << count) - 1
+        if atoms & full == full:
+            return TRUE
+        if not atoms & full:
+            return FALSE
+
+        memo: Dict[Tuple[int, int], int] = {}
+
+        def build(level: int, start: int) -> int:
+            # [start, start + 2^(bits - level)) 코드 구간 - 원자 번호는 min(코드, count - 1)
+            width = 1 << (self.bits - level)
+            first = min(start, count - 1)
+            last = min(start + width - 1, count - 1)
+            span = ((1 << (last + 1)) - 1) ^ ((1 << first) - 1)
+            if atoms & span == span:
+                return TRUE
+            if not atoms & span:
+                return FALSE
+            key = (level, start)
+            if key not in memo:
+                half = width >> 1
+                memo[key] = bdd.node(self.first_var + level, build(level + 1, start), build(level + 1, start + half))
+            return memo[key]
+
+        return build(0, 0)
+
+
+def _is_number(value: Any) -> bool:
+    """분석기 비교 규칙상 숫자로 취급하는 값 (bool 포함)"""
+    return isinstance(value, (int, float))
+
+
+def _is_non_finite(value: Any) -> bool:
+    """inf/nan 값 여부 - 원자 경계로 쓰면 대표값이 모두 같아지므로 도메인으로 해석하지 않음"""
+    return isinstance(value, float) and not math.isfinite(value)
+
+
+def _number_representatives(points: List[Any]) -> List[Any]:
+    """숫자 상수 점과 점 사이 구간의 대표값"""
+    if not points:
+        return [0]
+    result = [points[0] - 1]
+    for point, following in zip(points, points[1:]):
+        result.append(point)
+        result.append((point + following) / 2)
+    result.append(points[-1])
+    result.append(points[-1] + 1)
+    return result
+
+
+def _string_representatives(literals: List[str]) -> List[str]:
+    """문자열 상수와 상수 사이 구간(비어 있지 않은 경우만)의 대표값"""
+    if not literals:
+        return [""]
+    result = [] if literals[0] == "" else [""]
+    for literal, following in zip(literals, literals[1:]):
+        result.append(literal)
+        # literal 바로 다음 문자열이 following보다 작아야 사이 구간이 존재
+        if literal + "\x00" < following:
+            result.append(literal + "\x00")
+    result.append(literals[-1])
+    result.append(literals[-1] + "\x00")
+    return result
+
+
+class BranchFinding:
+    """분기 판정 결과 하나"""
+
+    __slots__ = ("kind", "index", "indices")
+
+    def __init__(self, kind: str, index: int, indices: List[int]):
+        self.kind = kind                # unsatisfiable / always_true / redundant
+        self.index = index              # 판정 대상 노드 (-1이면 룰 전체)
+        self.indices = sorted(set(indices))  # 판정 근거가 되는 최소 조건 집합
+
+    def __repr__(self) -> str:
+        return f"BranchFinding({self.kind}, {self.index}, {self.indices})"
+
+
+class SatisfiabilityAnalyzer:
+    """
+    BDD 기반 분기 도달 가능성 분석기
+
+    - 비교 조건은 필드별 원자 집합으로 바꿔 BDD로 인코딩하고, 같은 (필드, 연산자, 값) 조건은 한 번만 인코딩합니다.
+    - 그룹을 위에서부터 방문하며 상위 AND 경로의 조건(문맥) 아래에서 각 분기를 판정합니다.
+      AND 그룹: 문맥과 함께 만족 불가 / 문맥만으로 항상 참 / 다른 형제 조건에 포함(중복)
+      OR 그룹: 문맥과 동시에 참이 될 수 없는 분기 / 다른 분기에 포함되는 분기
+    - 판정마다 근거가 되는 최소 조건 집합을 함께 찾아 위치 정보로 사용합니다.
+    - contains 등 도메인으로 표현하지 않는 조건은 독립 변수로 두므로 판정은 보수적(거짓 양성 없음)입니다.
+    """
+
+    def __init__(self, analyzer: "RuleAnalyzer", ir: CompiledConditions, nullable: bool = False,
+                 max_nodes: int = 0, max_steps: int = 0):
+        self.analyzer = analyzer
+        self.ir = ir
+        self.nullable = nullable
+        self.bdd = BDD(max_nodes, max_steps)
+        self.domains: Dict[str, FieldDomain] = {}
+        self.findings: List[BranchFinding] = []
+        self._next_var = 0
+        self._opaque: Dict[Tuple[Any, ...], int] = {}
+        self._leaf_cache: Dict[Tuple[Any, ...], int] = {}
+        self.functions: List[int] = [TRUE] * ir.size
+
+    def run(self) -> List[BranchFinding]:
+        """모든 그룹을 검사하여 판정 목록 반환 (조건이 없으면 빈 목록)"""
+        ir = self.ir
+        if not ir.roots:
+            return []
+        self._build_domains()
+
+        # 역 전위 순서로 처리하면 자식 BDD가 항상 먼저 계산됨
+        bdd = self.bdd
+        for index in reversed(range(ir.size)):
+            if ir.has_children(index):
+                children = list(ir.children(index))
+                if ir.group_logical(index) == "OR":
+                    result = FALSE
+                    for child in children:
+                        result = bdd.disjoin(result, self.functions[child])
+                else:
+                    result = TRUE
+                    for child in children:
+                        result = bdd.conjoin(result, self.functions[child])
+                self.functions[index] = result
+            else:
+                self.functions[index] = self._leaf(index)
+
+        # (그룹 노드, 문맥 BDD, 문맥을 이루는 (노드, BDD) 목록) - 최상위 조건 목록은 묵시적 AND 그룹(-1)
+        stack: List[Tuple[int, int, List[Tuple[int, int]]]] = [(-1, TRUE, [])]
+        while stack:
+            group, context, terms = stack.pop()
+            children = ir.roots if group == -1 else list(ir.children(group))
+            if group != -1 and ir.group_logical(group) == "OR":
+                stack.extend(reversed(self._visit_or(group, children, context, terms)))
+            else:
+                stack.extend(reversed(self._visit_and(group, children, context, terms)))
+        return self.findings
+
+    def _build_domains(self) -> None:
+        """필드별 상수를 모아 원자 도메인 생성 (변수 순서는 필드 첫 등장 순서)"""
+        ir = self.ir
+        constants: Dict[str, Dict[Any, None]] = {}
+        for index in range(ir.size):
+            if not self._is_exact(index):
+                continue
+            value = ir.values[index]
+            bucket = constants.setdefault(ir.fields[index], {})
+            for item in (value if isinstance(value, list) else [value]):
+                if item is None or isinstance(item, str) or _is_number(item):
+                    bucket[item] = None
+
+        for field, bucket in constants.items():
+            field_type = self.analyzer._get_field_type(field)
+            numbers = sorted((value for value in bucket if _is_number(value)), key=float)
+            literals = sorted(value for value in bucket if isinstance(value, str))
+            representatives: List[Any] = []
+            # 스키마 타입의 값 공간을 기본으로, 다른 타입 상수가 쓰였으면 그 값 공간도 포함
+            if field_type == "number" or numbers:
+                representatives.extend(_number_representatives(numbers))
+            if field_type != "number" or literals:
+                representatives.extend(_string_representatives(literals))
+            if self.nullable or None in bucket:
+                representatives.append(None)
+            domain = FieldDomain(field, representatives, self._next_var)
+            self._next_var += domain.bits
+            self.domains[field] = domain
+
+    def _is_exact(self, index: int) -> bool:
+        """값 도메인으로 정확히 해석할 수 있는 비교 조건인지 여부"""
+        ir = self.ir
+        if ir.has_children(index) or not ir.is_field_condition(index):
+            return False
+        operator = ir.operators[index]
+        value = ir.values[index]
+        if operator not in EXACT_OPERATORS:
+            return False
+        if operator == "in":
+            return isinstance(value, list) and all(not isinstance(item, (list, dict)) and not _is_non_finite(item) for item in value)
+        return not isinstance(value, (list, dict)) and not _is_non_finite(value)
+
+    def _leaf(self, index: int) -> int:
+        """비교 조건 노드의 BDD"""
+        ir = self.ir
+        key = (ir.fields[index], ir.operators[index], repr(ir.values[index]))
+        result = self._leaf_cache.get(key)
+        if result is not None:
+            return result
+
+        if self._is_exact(index):
+            domain = self.domains[ir.fields[index]]
+            condition = {"operator": ir.operators[index], "value": ir.values[index]}
+            atoms = 0
+            for position, representative in enumerate(domain.representatives):
+                if self.analyzer._value_matches_condition(representative, condition):
+                    atoms |= 1 << position
+            result = domain.encode(self.bdd, atoms)
+        else:
+            # 해석하지 않는 조건은 같은 내용끼리만 공유하는 독립 변수
+            result = self.bdd.node(self._next_var, FALSE, TRUE)
+            self._next_var += 1
+        self._leaf_cache[key] = result
+        return result
+
+    def _visit_and(self, group: int, children: List[int], context: int, terms: List[Tuple[int, int]]) -> List[Tuple[int, int, List[Tuple[int, int]]]]:
+        bdd = self.bdd
+        functions = [self.functions[child] for child in children]
+        whole = self.functions[group] if group != -1 else self._fold_and(functions)
+
+        if bdd.disjoint(context, whole):
+            core = self._core(terms + self._conjuncts(children), TRUE)
+            self.findings.append(BranchFinding(UNSATISFIABLE, group, core))
+            return []
+        if bdd.implies(context, whole):
+            core = self._core(terms, bdd.negate(whole))
+            self.findings.append(BranchFinding(ALWAYS_TRUE, group, core + ([group] if group != -1 else list(children))))
+            return []
+
+        # 뒤쪽 형제 조건의 누적 AND (suffix[i] = children[i:]의 AND)
+        suffix = [TRUE] * (len(children) + 1)
+        for position in reversed(range(len(children))):
+            suffix[position] = bdd.conjoin(functions[position], suffix[position + 1])
+
+        visits = []
+        kept: List[int] = []
+        prefix_all = TRUE   # 앞쪽 형제 전체의 AND (하위 그룹 문맥용)
+        prefix_kept = TRUE  # 앞쪽 형제 중 중복으로 판정되지 않은 조건의 AND
+        for position, child in enumerate(children):
+            function = functions[position]
+            siblings = bdd.conjoin(prefix_kept, suffix[position + 1])
+            if bdd.implies(context, function):
+                core = self._core(terms, bdd.negate(function))
+                self.findings.append(BranchFinding(ALWAYS_TRUE, child, core + [child]))
+            elif bdd.implies(bdd.conjoin(context, siblings), function):
+                # 최소 집합 탐색은 뒤쪽 항목을 남기는 쪽을 선호하므로 앞쪽 형제를 뒤에 두어 "앞 조건에 포함됨"으로 설명
+                sibling_terms = self._conjuncts(children[position + 1:] + kept)
+                core = self._core(terms + sibling_terms, bdd.negate(function))
+                self.findings.append(BranchFinding(REDUNDANT, child, core + [child]))
+            else:
+                kept.append(child)
+                prefix_kept = bdd.conjoin(prefix_kept, function)
+                if self.ir.has_children(child):
+                    others = bdd.conjoin(prefix_all, suffix[position + 1])
+                    sibling_terms = self._conjuncts(children[:position] + children[position + 1:])
+                    visits.append((child, bdd.conjoin(context, others), terms + sibling_terms))
+            prefix_all = bdd.conjoin(prefix_all, function)
+        return visits
+
+    def _visit_or(self, group: int, children: List[int], context: int, terms: List[Tuple[int, int]]) -> List[Tuple[int, int, List[Tuple[int, int]]]]:
+        bdd = self.bdd
+        whole = self.functions[group]
+        if bdd.disjoint(context, whole):
+            self.findings.append(BranchFinding(UNSATISFIABLE, group, self._core(terms, whole) + [group]))
+            return []
+        if bdd.implies(context, whole):
+            self.findings.append(BranchFinding(ALWAYS_TRUE, group, self._core(terms, bdd.negate(whole)) + [group]))
+            return []
+
+        # 문맥과 동시에 참이 될 수 없는 분기 (AND 분기는 내부 조건까지 펼쳐 근거를 찾음)
+        live = []
+        for child in children:
+            function = self.functions[child]
+            if bdd.disjoint(context, function):
+                core = self._core(terms + self._conjuncts([child]), TRUE)
+                self.findings.append(BranchFinding(UNSATISFIABLE, child, core))
+            else:
+                live.append(child)
+
+        # 다른 분기에 포함되는 분기 (suffix[i] = live[i:]의 OR)
+        suffix = [FALSE] * (len(live) + 1)
+        for position in reversed(range(len(live))):
+            suffix[position] = bdd.disjoin(self.functions[live[position]], suffix[position + 1])
+
+        visits = []
+        kept: List[int] = []
+        prefix_kept = FALSE
+        for position, child in enumerate(live):
+            function = self.functions[child]
+            siblings = bdd.disjoin(prefix_kept, suffix[position + 1])
+            if bdd.implies(bdd.conjoin(context, function), siblings):
+                other_terms = [(other, bdd.negate(self.functions[other])) for other in kept + live[position + 1:]]
+                core = self._core(terms + other_terms, function)
+                self.findings.append(BranchFinding(REDUNDANT, child, core + [child]))
+                continue
+            kept.append(child)
+            prefix_kept = bdd.disjoin(prefix_kept, function)
+            if self.ir.has_children(child):
+                visits.append((child, context, terms))
+        return visits
+
+    def _conjuncts(self, indices: List[int]) -> List[Tuple[int, int]]:
+        """노드들의 AND를 이루는 (노드, BDD) 목록 - AND 그룹은 하위 조건으로 펼침"""
+        result = []
+        stack = list(reversed(indices))
+        while stack:
+            index = stack.pop()
+            if self.ir.has_children(index) and self.ir.group_logical(index) == "AND":
+                stack.extend(reversed(list(self.ir.children(index))))
+            else:
+                result.append((index, self.functions[index]))
+        return result
+
+    def _fold_and(self, functions: List[int]) -> int:
+        result = TRUE
+        for function in functions:
+            result = self.bdd.conjoin(result, function)
+        return result
+
+    def _core(self, terms: List[Tuple[int, int]], extra: int) -> List[int]:
+        """
+        extra와 함께 항상 거짓이 되는 최소 조건 부분집합 (삭제 기반, BDD 연산 O(n))
+
+        - 앞에서부터 조건을 하나씩 빼 보고, 남은 조건(유지한 앞쪽 + 전체 뒤쪽)만으로도 거짓이면 제외합니다.
+        """
+        bdd = self.bdd
+        suffix = [TRUE] * (len(terms) + 1)
+        for position in reversed(range(len(terms))):
+            suffix[position] = bdd.conjoin(terms[position][1], suffix[position + 1])
+
+        kept = extra
+        core = []
+        for position, (index, function) in enumerate(terms):
+            if bdd.disjoint(kept, suffix[position + 1]):
+                continue
+            kept = bdd.conjoin(kept, function)
+            core.append(index)
+        return core
+
+
+def analyze_branches(analyzer: "RuleAnalyzer", ir: CompiledConditions, nullable: bool = False,
+                     max_nodes: int = 0, max_steps: int = 0) -> List[BranchFinding]:
+    """IR 전체 분기의 만족 불가 / 항상 참 / 중복 판정 (한도를 넘으면 BDDLimitExceeded)"""
+    return SatisfiabilityAnalyzer(analyzer, ir, nullable, max_nodes, max_steps).run()
@@ -0,0 +1,43 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """
+    동일 키의 동시 비동기 호출 병합 (single-flight)
+
+    - 같은 키로 진행 중인 호출이 있으면 새 호출은 작업을 다시 실행하지 않고 진행 중인 결과를 함께 기다립니다.
+    - 작업은 별도 태스크로 실행되므로 먼저 요청한 호출이 취소되어도 나머지 대기자는 결과를 받습니다.
+    """
+
+    def __init__(self):
+        self.calls = 0       # 전체 호출 수
+        self.executions = 0  # 실제 작업 실행 수
+        self.coalesced = 0   # 진행 중인 작업에 병합된 호출 수
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, work: Callable[[], Awaitable[Any]]) -> Any:
+        """키별로 한 번만 작업을 실행하고 결과를 공유"""
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.executions += 1
+            task = asyncio.ensure_future(work())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.shield(task)
+
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """병합 통계"""
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight)
+        }
@@ -0,0 +1,118 @@
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+from app.config import settings
+from app.models.validation_result import ConditionIssue
+from app.services.condition_ir import CompiledConditions
+
+
+def subtree_hashes(ir: CompiledConditions) -> List[bytes]:
+    """
+    노드별 서브트리 해시 (머클 트리) - 노드 내용(필드, 연산자, 값)과 자식 해시를 순서대로 이어 해시
+
+    - 위치와 무관하게 내용이 같은 서브트리는 같은 해시입니다.
+    - 노드 내용은 repr로 직렬화합니다. 값은 JSON에서 온 기본 타입이라 repr이 결정적이며, 1과 1.0, True처럼
+      분석 결과가 달라질 수 있는 값도 구분됩니다. (dict 값의 키 순서가 다르면 다른 해시가 되어 재사용만 못 할 뿐입니다.)
+    - 역 전위 순서로 계산하므로 자식 해시가 항상 먼저 준비됩니다.
+    """
+    hashes: List[bytes] = [b""] * ir.size
+    fields, operators, values, end = ir.fields, ir.operators, ir.values, ir.end
+    for index in reversed(range(ir.size)):
+        node = hashlib.blake2b(repr((fields[index], operators[index], values[index])).encode("utf-8"), digest_size=16)
+        child = index + 1
+        while child < end[index]:
+            node.update(hashes[child])
+            child = end[child]
+        hashes[index] = node.digest()
+    return hashes
+
+
+class SubtreeArtifacts:
+    """
+    서브트리 하나의 분석 산출물 (서브트리 안 상대 위치 기준이라 어느 위치에 있든 재사용 가능)
+
+    - precheck / node_issues: 노드 단위 타입/연산자/구조 검사 이슈 (위치 문자열은 사용 시점에 채움)
+    - field_counts: 필드별 비교 조건 수 (첫 등장 순서)
+    """
+
+    __slots__ = ("precheck", "node_issues", "field_counts")
+
+    def __init__(self, precheck: List[Tuple[int, ConditionIssue]], node_issues: List[Tuple[int, ConditionIssue]], field_counts: Dict[str, int]):
+        self.precheck = precheck
+        self.node_issues = node_issues
+        self.field_counts = field_counts
+
+    def combine(self, children: List[Tuple[int, "SubtreeArtifacts"]]) -> "SubtreeArtifacts":
+        """이 노드 자신의 산출물에 (상대 위치, 자식 산출물)을 전위 순서대로 이어 붙인 서브트리 산출물"""
+        precheck = list(self.precheck)
+        node_issues = list(self.node_issues)
+        field_counts = dict(self.field_counts)
+        for offset, child in children:
+            precheck.extend((offset + position, issue) for position, issue in child.precheck)
+            node_issues.extend((offset + position, issue) for position, issue in child.node_issues)
+            for field, count in child.field_counts.items():
+                field_counts[field] = field_counts.get(field, 0) + count
+        return SubtreeArtifacts(precheck, node_issues, field_counts)
+
+
+class SubtreeArtifactCache:
+    """
+    서브트리 해시 기반 분석 산출물 LRU 캐시
+
+    - 룰의 한 조건만 바뀌면 그 조건에서 루트까지의 경로만 캐시에 없으므로 그 노드들만 다시 계산합니다.
+    - 분석기 스키마 버전이 바뀌면 기존 항목을 모두 비웁니다.
+    - 캐시된 산출물은 여러 요청이 공유하므로 호출 측에서 수정하면 안 됩니다.
+    """
+
+    def __init__(self, max_size: int = 8192):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, SubtreeArtifacts]" = OrderedDict()
+        self._schema_version: Optional[str] = None
+        self._lock = Lock()
+
+    def _check_schema_version(self, schema_version: str) -> None:
+        if schema_version != self._schema_version:
+            self._entries.clear()
+            self._schema_version = schema_version
+
+    def get(self, subtree_hash: bytes, schema_version: str) -> Optional[SubtreeArtifacts]:
+        """캐시 조회 (없으면 None)"""
+        with self._lock:
+            self._check_schema_version(schema_version)
+            artifacts = self._entries.get(subtree_hash)
+            if artifacts is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(subtree_hash)
+            self.hits += 1
+            return artifacts
+
+    def put(self, subtree_hash: bytes, schema_version: str, artifacts: SubtreeArtifacts) -> None:
+        """캐시 저장"""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._check_schema_version(schema_version)
+            self._entries[subtree_hash] = artifacts
+            self._entries.move_to_end(subtree_hash)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/미적중 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+# 앱 전체에서 공유하는 서브트리 산출물 캐시 (프로세스 풀 워커는 프로세스마다 따로 가짐)
+subtree_cache = SubtreeArtifactCache(max_size=settings.SUBTREE_CACHE_SIZE)
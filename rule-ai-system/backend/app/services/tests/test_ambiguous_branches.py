@@ -0,0 +1,38 @@
+from app.models.rule import RuleCondition
+from app.services.condition_ir import compile_conditions
+from app.services.rule_analyzer import RuleAnalyzer
+
+
+def _leaf(field, operator, value):
+    return RuleCondition(field=field, operator=operator, value=value)
+
+
+def _group(operator, *conditions):
+    return RuleCondition(field="placeholder", operator=operator, value=None, conditions=list(conditions))
+
+
+def test_nested_or_overlap_reported_per_scope():
+    """하위 OR 그룹의 범위 겹침은 상위 검사 범위마다 동일한 이슈로 보고"""
+    conditions = [_group("AND",
+        _leaf("ENTR_STUS_CD", "==", "정상"),
+        _group("OR", _leaf("age", ">", 10), _leaf("age", "<=", 20))
+    )]
+    issues = RuleAnalyzer()._check_ambiguous_branches(compile_conditions(conditions))
+    age_issues = [issue for issue in issues if issue.field == "age"]
+
+    # 최상위 범위와 AND 그룹 범위에서 각각 보고되고, OR 그룹 자신의 범위에서는 보고되지 않음
+    assert len(age_issues) == 2
+    assert all(issue.location == "조건 4, 조건 5" for issue in age_issues)
+    assert "(10, 20]" in age_issues[0].explanation
+
+
+def test_string_value_under_mixed_operators():
+    """같은 문자열 값이 AND와 OR 분기에 함께 있으면 분기 불명확"""
+    conditions = [
+        _leaf("MRKT_CD", "==", "LGT"),
+        _group("OR", _leaf("MRKT_CD", "==", "LGT"), _leaf("MRKT_CD", "==", "KT"))
+    ]
+    issues = RuleAnalyzer()._check_ambiguous_branches(compile_conditions(conditions))
+
+    # 최상위 범위에서는 중복 값, OR 그룹 범위에서는 빈 문자열/None 사각지대로 보고
+    assert [issue.location for issue in issues if issue.field == "MRKT_CD"] == ["값 'LGT': 조건 1, 조건 3", "필드 'MRKT_CD' 조건"]
@@ -0,0 +1,70 @@
+import asyncio
+from app.models.rule import Rule, RuleCondition
+from app.services.analysis_executor import AnalysisExecutor, count_condition_nodes
+from app.services.rule_analyzer import rule_analyzer
+
+
+def _rule():
+    return Rule(name="큰 룰", conditions=[
+        RuleCondition(field="age", operator=">", value=10),
+        RuleCondition(field="age", operator="<", value=5),
+        RuleCondition(field="placeholder", operator="OR", value=None, conditions=[
+            RuleCondition(field="MRKT_CD", operator="==", value="LGT"),
+            RuleCondition(field="MRKT_CD", operator="==", value=None)
+        ])
+    ])
+
+
+def test_inline_threshold():
+    """조건 노드 수가 기준보다 작으면 process 모드에서도 직접 실행"""
+    executor = AnalysisExecutor(mode="process", inline_max_conditions=6)
+
+    assert count_condition_nodes(_rule().conditions) == 5
+    assert not executor.should_offload(_rule())
+    assert not AnalysisExecutor(mode="inline", inline_max_conditions=0).should_offload(_rule())
+
+
+def _non_finite_rule():
+    # JSON 입력의 1e999는 inf로 읽힘 - JSON으로 워커에 넘기면 null이 되어 다른 룰을 분석하게 됨
+    return Rule(name="무한대 경계", conditions=[
+        RuleCondition(field="MBL_ACT_MEM_PCNT", operator="<", value=float("inf")),
+        RuleCondition(field="MBL_ACT_MEM_PCNT", operator=">", value=1),
+        RuleCondition(field="age", operator="!=", value=float("nan"))
+    ])
+
+
+def test_process_mode_matches_inline():
+    """프로세스 풀 분석 결과가 직접 분석 결과와 동일 (inf/nan 값 포함)"""
+    executor = AnalysisExecutor(mode="process", max_workers=1, inline_max_conditions=0)
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(executor.start())
+        results = [loop.run_until_complete(executor.analyze(rule)) for rule in (_rule(), _non_finite_rule())]
+    finally:
+        loop.close()
+        executor.shutdown()
+
+    assert results == [rule_analyzer.analyze(_rule()), rule_analyzer.analyze(_non_finite_rule())]
+
+
+def test_broken_pool_is_shut_down_and_replaced():
+    """워커가 죽으면 직접 분석으로 응답하고 깨진 풀을 종료한 뒤 다음 요청에서 새 풀을 만듦"""
+    executor = AnalysisExecutor(mode="process", max_workers=1, inline_max_conditions=0)
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(executor.start())
+        broken = executor._pool
+        for process in list(broken._processes.values()):
+            process.kill()
+            process.join()
+        result = loop.run_until_complete(executor.analyze(_rule()))
+        assert executor._pool is None
+        assert broken._shutdown_thread
+
+        assert loop.run_until_complete(executor.analyze(_rule())) == result
+        assert executor._pool is not None and executor._pool is not broken
+    finally:
+        loop.close()
+        executor.shutdown()
+
+    assert result == rule_analyzer.analyze(_rule())
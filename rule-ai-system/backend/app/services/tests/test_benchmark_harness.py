@@ -0,0 +1,47 @@
+import io
+import contextlib
+from app.services.condition_ir import compile_conditions
+from app.services.rule_conversion import convert_json_to_rule
+from app.services.rule_analyzer import RuleAnalyzer
+from benchmarks.analyzer_benchmark import compare, run_benchmark
+from benchmarks.rule_generator import RuleGenerator, RuleShape
+
+
+def test_generator_is_seeded_and_follows_shape():
+    """같은 시드면 같은 룰, 깊이/분기 수/필드 수/연산자 구성을 따름"""
+    shape = RuleShape(depth=2, fan_out=3, field_count=5, operator_mix={"==": 1, ">": 1}, contradiction_rate=0.0)
+    assert RuleGenerator(shape, seed=7).rules(3) == RuleGenerator(shape, seed=7).rules(3)
+    assert RuleGenerator(shape, seed=7).rules(3) != RuleGenerator(shape, seed=8).rules(3)
+
+    rules = [convert_json_to_rule(rule_json) for rule_json in RuleGenerator(shape, seed=7).rules(10)]
+    irs = [compile_conditions(rule.conditions) for rule in rules]
+    assert all(ir.max_depth <= 4 for ir in irs)
+    fields = {ir.fields[index] for ir in irs for index in range(ir.size) if ir.is_field_condition(index)}
+    operators = {ir.operators[index] for ir in irs for index in range(ir.size) if ir.is_field_condition(index)}
+    assert len(fields) <= 5 and operators <= {"==", ">"}
+
+
+def test_contradiction_rate_produces_contradictions():
+    """contradiction_rate=1이면 모든 AND 그룹에 모순 쌍이 들어가 분석기가 self_contradiction을 보고"""
+    shape = RuleShape(depth=1, fan_out=3, field_count=4, contradiction_rate=1.0)
+    rule = convert_json_to_rule(RuleGenerator(shape, seed=1).rule())
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = RuleAnalyzer().analyze(rule)
+    assert result.issue_counts.get("self_contradiction", 0) >= 1
+
+
+def test_compare_flags_regressions_after_calibration():
+    """기계 보정값 비율만큼 느려진 것은 회귀가 아니고, 그보다 크게 느려지면 회귀"""
+    current = run_benchmark(["small"], rule_count=1, repeat=2, memory=True, time_budget=0.05)
+    checks = current["scenarios"]["small"]["checks"]
+    assert set(checks["analyze_rule"]) >= {"min_ms", "median_ms", "p95_ms", "alloc_kib", "retained_kib", "output_chars"}
+    # INFO 레벨에서는 분석과 리포트 후처리가 아무것도 출력하지 않음
+    assert all(summary["output_chars"] == 0 for summary in checks.values())
+
+    def scenario(calibration_ms, min_ms):
+        return {"scenarios": {"small": {"calibration_ms": calibration_ms, "checks": {"analyze_rule": {"min_ms": min_ms, "alloc_kib": 10.0}}}}}
+
+    assert compare(scenario(2.0, 2.0), scenario(1.0, 1.0)) == []
+    regressions = compare(scenario(1.0, 2.0), scenario(1.0, 1.0))
+    assert [(regression["check"], regression["metric"], regression["ratio"]) for regression in regressions] == [("analyze_rule", "min_ms", 2.0)]
+    assert compare(scenario(1.0, 1.01), scenario(1.0, 1.0)) == []
@@ -0,0 +1,52 @@
+import asyncio
+import json
+from app.services.bulk_validation import iter_lines, validate_lines
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_iter_lines_splits_across_chunks_and_drops_long_lines():
+    """청크 경계와 무관하게 줄을 나누고, 빈 줄은 건너뛰며, 너무 긴 줄은 내용 없이 보고"""
+    lines = _run(_collect(iter_lines(_chunks(b'{"a"', b':1}\n\n{"b":2}\nxxxxxxxx', b"xxxx\n", b'{"c":3}'), max_line_bytes=10)))
+    assert lines == [(1, b'{"a":1}'), (3, b'{"b":2}'), (4, None), (5, b'{"c":3}')]
+
+
+def test_validate_lines_bounds_concurrency_and_reports_errors_per_line():
+    """동시 실행 수를 넘지 않고, 잘못된 줄은 오류 봉투로 보고한 뒤 나머지를 계속 검증"""
+    active = {"now": 0, "max": 0}
+
+    async def validate(rule_json):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(0.001 * (rule_json["n"] % 3))
+        active["now"] -= 1
+        if rule_json["n"] == 5:
+            raise ValueError("bad rule")
+        return {"rule_id": str(rule_json["n"])}
+
+    body = b"".join(json.dumps({"n": n}).encode() + b"\n" for n in range(10)) + b"not json\n"
+    output = _run(_collect(validate_lines(iter_lines(_chunks(body), 1024), validate, concurrency=3, max_line_bytes=1024)))
+    envelopes = [json.loads(line) for line in output]
+
+    assert active["max"] == 3
+    assert envelopes[-1] == {"status": "done", "total": 11, "ok": 9, "error": 2}
+    by_line = {envelope["line"]: envelope for envelope in envelopes[:-1]}
+    assert sorted(by_line) == list(range(1, 12))
+    assert by_line[6]["status"] == "error" and by_line[6]["error"] == {"type": "ValueError", "message": "bad rule"}
+    assert by_line[11]["status"] == "error" and by_line[11]["error"]["type"] == "JSONDecodeError"
+    assert by_line[1] == {"line": 1, "status": "ok", "rule_id": "0"}
@@ -0,0 +1,55 @@
+from app.models.rule import RuleCondition
+from app.services.condition_ir import compile_conditions, OP_GE, OP_EQ, OP_UNKNOWN
+
+
+def _sample_conditions():
+    """중첩 AND/OR 구조를 가진 샘플 조건"""
+    return [
+        RuleCondition(field="MRKT_CD", operator="==", value="LGT"),
+        RuleCondition(field="placeholder", operator="OR", value=None, conditions=[
+            RuleCondition(field="placeholder", operator="AND", value=None, conditions=[
+                RuleCondition(field="MBL_ACT_MEM_PCNT", operator=">=", value=1),
+                RuleCondition(field="IOT_MEM_PCNT", operator=">", value=0)
+            ]),
+            RuleCondition(field="MBL_ACT_MEM_PCNT", operator=">=", value=2)
+        ]),
+        RuleCondition(field="ENTR_STUS_CD", operator="==", value="정지")
+    ]
+
+
+def test_compile_preorder_layout():
+    """전위 순서, 부모 인덱스, 깊이, 서브트리 범위가 올바른지 확인"""
+    ir = compile_conditions(_sample_conditions())
+
+    assert ir.size == 7
+    assert ir.fields == ["MRKT_CD", "placeholder", "placeholder", "MBL_ACT_MEM_PCNT", "IOT_MEM_PCNT", "MBL_ACT_MEM_PCNT", "ENTR_STUS_CD"]
+    assert ir.parent == [-1, -1, 1, 2, 2, 1, -1]
+    assert ir.depth == [1, 1, 2, 3, 3, 2, 1]
+    assert ir.end == [1, 6, 5, 4, 5, 6, 7]
+    assert ir.roots == [0, 1, 6]
+    assert list(ir.children(1)) == [2, 5]
+    assert ir.logical[1] == "OR" and ir.logical[2] == "AND" and ir.logical[0] is None
+    assert ir.max_depth == 3
+
+
+def test_postings_and_operator_codes():
+    """필드별 포스팅 리스트와 연산자 코드 확인"""
+    ir = compile_conditions(_sample_conditions())
+
+    assert ir.postings["MBL_ACT_MEM_PCNT"] == [3, 5]
+    assert ir.field_names[ir.field_ids[3]] == "MBL_ACT_MEM_PCNT"
+    assert ir.op_codes[3] == OP_GE
+    assert ir.op_codes[0] == OP_EQ
+    assert ir.location(5) == "조건 6"
+
+    unknown = compile_conditions([RuleCondition(field="age", operator="between", value=1)])
+    assert unknown.op_codes == [OP_UNKNOWN]
+
+
+def test_compile_empty_conditions():
+    """조건이 없는 경우 빈 IR 생성"""
+    ir = compile_conditions([])
+
+    assert ir.size == 0
+    assert ir.roots == []
+    assert ir.max_depth == 1
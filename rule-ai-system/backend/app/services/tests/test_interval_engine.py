@@ -0,0 +1,98 @@
+from app.models.rule import RuleCondition
+from app.services.condition_ir import compile_conditions
+from app.services.interval_engine import Interval, find_contradictions, find_overlaps, interval_from_comparison
+
+
+def _leaf(field, operator, value):
+    return RuleCondition(field=field, operator=operator, value=value)
+
+
+def _group(operator, *conditions):
+    return RuleCondition(field="placeholder", operator=operator, value=None, conditions=list(conditions))
+
+
+def test_interval_intersection():
+    """구간 교집합과 빈 구간 판정"""
+    assert Interval(lo=1, lo_inclusive=True).intersect(Interval(hi=1, hi_inclusive=True)) == Interval(1, True, 1, True)
+    assert Interval(lo=1, lo_inclusive=False).intersect(Interval(hi=1, hi_inclusive=True)).is_empty()
+    assert not Interval(lo=0).overlaps(Interval(hi=0))
+
+
+def test_range_conflict_in_and_group():
+    """AND 그룹 내 하한/상한 충돌은 최소 2개 조건으로 보고"""
+    conditions = [_group("AND",
+        _leaf("MBL_ACT_MEM_PCNT", ">", 5),
+        _leaf("MBL_ACT_MEM_PCNT", ">", 1),
+        _leaf("MBL_ACT_MEM_PCNT", "<=", 3)
+    )]
+    conflicts = find_contradictions(compile_conditions(conditions))
+
+    assert len(conflicts) == 1
+    assert conflicts[0].kind == "range"
+    assert conflicts[0].indices == [1, 3]
+
+
+def test_or_branches_are_not_contradictions():
+    """서로 다른 OR 분기의 조건은 모순이 아님"""
+    conditions = [_group("OR",
+        _leaf("MBL_ACT_MEM_PCNT", ">", 5),
+        _leaf("MBL_ACT_MEM_PCNT", "<=", 3),
+        _leaf("ENTR_STUS_CD", "==", "정지"),
+        _leaf("ENTR_STUS_CD", "!=", "정지")
+    )]
+
+    assert find_contradictions(compile_conditions(conditions)) == []
+
+
+def test_inherited_constraint_conflicts_with_or_branch():
+    """상위 AND 제약은 OR 분기로 상속되어 분기 내부 조건과 충돌 검사"""
+    conditions = [
+        _leaf("age", ">=", 10),
+        _group("OR", _leaf("age", "<", 5), _leaf("age", ">", 20))
+    ]
+    conflicts = find_contradictions(compile_conditions(conditions))
+
+    assert [conflict.indices for conflict in conflicts] == [[0, 2]]
+
+
+def test_point_range_excluded_by_not_equal():
+    """한 점으로 좁혀진 구간을 != 로 제외하면 3개 조건이 최소 모순 집합"""
+    conditions = [
+        _leaf("score", ">=", 1),
+        _leaf("score", "!=", 1),
+        _leaf("score", "<=", 1)
+    ]
+    conflicts = find_contradictions(compile_conditions(conditions))
+
+    assert len(conflicts) == 1
+    assert conflicts[0].kind == "point_excluded"
+    assert conflicts[0].indices == [0, 1, 2]
+
+
+def test_non_finite_bounds_are_not_intervals():
+    """1e999(inf)/nan 경계는 구간으로 접지 않으므로 만족 가능한 조건을 모순으로 보고하지 않음"""
+    assert interval_from_comparison(">", float("inf")) is None
+    assert interval_from_comparison("<=", float("nan")) is None
+    assert interval_from_comparison(">", 10 ** 400) == Interval(lo=10 ** 400)
+
+    conditions = [_group("AND",
+        _leaf("score", ">", float("inf")),
+        _leaf("score", "<", float("-inf")),
+        _leaf("score", ">=", 1)
+    )]
+    assert find_contradictions(compile_conditions(conditions)) == []
+
+
+def test_sweep_reports_every_overlapping_pair():
+    """끝점 스윕은 겹치는 모든 쌍과 교집합 구간을 보고하고, 열린 경계가 닿는 구간은 제외"""
+    items = [
+        ("a", interval_from_comparison("<=", 5)),
+        ("b", interval_from_comparison(">", 5)),
+        ("c", interval_from_comparison(">=", 3)),
+        ("d", interval_from_comparison("==", 5))
+    ]
+    overlaps = {(first, second): overlap for first, second, overlap in find_overlaps(items)}
+
+    assert set(overlaps) == {("a", "c"), ("a", "d"), ("b", "c"), ("c", "d")}
+    assert overlaps[("a", "c")] == Interval(3, True, 5, True)
+    assert overlaps[("b", "c")] == Interval(lo=5, lo_inclusive=False)
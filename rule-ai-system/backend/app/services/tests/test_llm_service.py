@@ -0,0 +1,44 @@
+import asyncio
+from types import SimpleNamespace
+from app.services.llm_service import LLMService
+
+
+class _StubCompletions:
+    """동시 실행 수와 전달된 타임아웃을 기록하는 가짜 API"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.timeouts = []
+
+    async def create(self, model, messages, temperature, timeout):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.timeouts.append(timeout)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=messages[-1]["content"]))])
+
+
+def test_concurrency_limit_and_timeout():
+    """동시 호출 수는 세마포어로 제한되고 호출별 타임아웃이 전달됨"""
+    service = LLMService()
+    completions = _StubCompletions()
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    service.model = "test-model"
+    service.fake_mode = False
+    service._semaphore = asyncio.Semaphore(2)
+
+    async def run_all():
+        return await asyncio.gather(*(service.call_llm_with_status(f"prompt-{i}", timeout=5) for i in range(6)))
+
+    loop = asyncio.new_event_loop()
+    try:
+        results = loop.run_until_complete(run_all())
+    finally:
+        loop.close()
+
+    assert [text for text, _ in results] == [f"prompt-{i}" for i in range(6)]
+    assert all(from_model for _, from_model in results)
+    assert completions.peak == 2
+    assert completions.timeouts == [5] * 6
@@ -0,0 +1,48 @@
+import json
+import logging
+import pytest
+from app import logging_config
+from app.logging_config import DebugSampleFilter, JsonFormatter, debug_enabled, debug_sampling, parse_levels
+
+
+def test_parse_levels_and_json_fields():
+    """모듈별 레벨 파싱(잘못된 항목은 오류), JSON 형식은 extra fields를 최상위 키로 합침"""
+    assert parse_levels(" app.services.rule_analyzer=debug, app.api=WARNING ,") == {
+        "app.services.rule_analyzer": logging.DEBUG, "app.api": logging.WARNING
+    }
+    assert parse_levels("") == {}
+    with pytest.raises(ValueError):
+        parse_levels("app.api=LOUD")
+    with pytest.raises(ValueError):
+        parse_levels("app.api")
+
+    record = logging.LogRecord("app.worker", logging.INFO, __file__, 1, "처리 %d건", (3,), None)
+    record.fields = {"processed": 3}
+    payload = json.loads(JsonFormatter().format(record))
+    assert payload["level"] == "INFO" and payload["logger"] == "app.worker"
+    assert payload["message"] == "처리 3건" and payload["processed"] == 3
+
+
+def test_debug_sampling_keeps_or_drops_a_whole_scope(monkeypatch):
+    """샘플링 범위 하나 안의 DEBUG 로그는 모두 남거나 모두 빠지고, DEBUG 이외 레벨은 항상 통과"""
+    logger = logging.getLogger("app.tests.sampling")
+    logger.setLevel(logging.DEBUG)
+    sample_filter = DebugSampleFilter()
+    debug = logging.LogRecord(logger.name, logging.DEBUG, __file__, 1, "덤프", (), None)
+    warning = logging.LogRecord(logger.name, logging.WARNING, __file__, 1, "경고", (), None)
+    try:
+        monkeypatch.setattr(logging_config, "_debug_sample_rate", 0.0)
+        with debug_sampling(logger):
+            assert not debug_enabled(logger)
+            assert not sample_filter.filter(debug) and sample_filter.filter(warning)
+        assert debug_enabled(logger)
+
+        monkeypatch.setattr(logging_config, "_debug_sample_rate", 0.999999)
+        monkeypatch.setattr(logging_config.random, "random", lambda: 0.5)
+        with debug_sampling(logger):
+            assert debug_enabled(logger) and sample_filter.filter(debug)
+
+        monkeypatch.setattr(logging_config, "_debug_sample_rate", 1.0)
+        assert debug_sampling(logger).__class__.__name__ == "nullcontext"
+    finally:
+        logger.setLevel(logging.NOTSET)
@@ -0,0 +1,67 @@
+from app.api import metrics as metrics_api
+from app.models.rule import Rule, RuleCondition
+from app.services.metrics import MetricsRegistry, NULL_STAGE_TIMER, analyzer_stage_seconds, metrics, rule_condition_nodes
+from app.services.rule_analyzer import rule_analyzer
+
+
+def test_histogram_renders_cumulative_buckets_and_escaped_labels():
+    """버킷은 누적 개수, +Inf 버킷은 전체 개수, 레이블 값의 따옴표는 이스케이프"""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("test_seconds", "테스트", (0.1, 1.0), ("step",))
+    histogram.observe(0.05, ("a\"b",))
+    histogram.observe(0.5, ("a\"b",))
+    histogram.observe(5, ("a\"b",))
+    registry.gauge("test_ratio", "비율", ("cache",), lambda: {("x",): 0.25})
+
+    text = registry.render()
+    assert "# TYPE test_seconds histogram" in text
+    assert 'test_seconds_bucket{step="a\\"b",le="0.1"} 1' in text
+    assert 'test_seconds_bucket{step="a\\"b",le="1"} 2' in text
+    assert 'test_seconds_bucket{step="a\\"b",le="+Inf"} 3' in text
+    assert 'test_seconds_sum{step="a\\"b"} 5.55' in text
+    assert 'test_seconds_count{step="a\\"b"} 3' in text
+    assert 'test_ratio{cache="x"} 0.25' in text
+
+
+def test_analyzer_records_every_stage_and_rule_size_when_enabled():
+    """분석 한 번에 단계마다 관측 하나와 룰 크기 관측 하나, 수집이 꺼져 있으면 기록 없음"""
+    rule = Rule(name="메트릭", conditions=[
+        RuleCondition(field="age", operator=">", value=10),
+        RuleCondition(field="age", operator="<", value=5)
+    ])
+    stages = ("compile", "node_checks", "contradictions", "duplicates", "branch_satisfiability",
+              "missing_conditions", "ambiguity", "aggregation", "summary", "optimize_issues", "ai_comment", "result")
+    metrics.collect()
+    before = {stage: (analyzer_stage_seconds.snapshot((stage,)) or {"count": 0})["count"] for stage in stages}
+    sizes_before = (rule_condition_nodes.snapshot() or {"count": 0})["count"]
+
+    rule_analyzer.analyze(rule)
+    metrics.collect()
+    assert all(analyzer_stage_seconds.snapshot((stage,))["count"] == before[stage] + 1 for stage in stages)
+    assert rule_condition_nodes.snapshot()["count"] == sizes_before + 1
+
+    enabled = metrics.enabled
+    metrics.enabled = False
+    try:
+        assert metrics.stage_timer() is NULL_STAGE_TIMER
+        rule_analyzer.analyze(rule)
+        metrics.collect()
+    finally:
+        metrics.enabled = enabled
+    assert rule_condition_nodes.snapshot()["count"] == sizes_before + 1
+
+
+def test_cache_stats_are_read_once_per_render(monkeypatch):
+    """캐시 게이지 세 개가 수집 시 한 번 읽은 통계를 함께 사용"""
+    calls = []
+
+    def stats():
+        calls.append(1)
+        return {"cache": {"size": 3, "hits": 2, "misses": 1, "hit_ratio": 0.6667}}
+
+    monkeypatch.setattr(metrics_api, "_cache_stats", stats)
+    text = metrics.render()
+
+    assert len(calls) == 1
+    assert 'rule_cache_entries{cache="cache"} 3' in text
+    assert 'rule_cache_lookups_total{cache="cache",result="miss"} 1' in text
@@ -0,0 +1,83 @@
+from app.models.rule import Rule
+from app.models.validation_result import ConditionIssue, StructureInfo, ValidationResult
+from app.services.condition_ir import compile_conditions
+from app.services.prompt_encoding import build_issue_digest, estimate_tokens, render_conditions
+from app.services.rule_report_service import RuleReportService
+
+
+def _rule():
+    return Rule(id="R1", name="테스트 룰", conditions=[
+        {"field": "MRKT_CD", "operator": "==", "value": "LGT"},
+        {"field": "OR", "operator": "group", "value": None, "conditions": [
+            {"field": "AND", "operator": "group", "value": None, "conditions": [
+                {"field": "MBL_ACT_MEM_PCNT", "operator": ">=", "value": 1},
+                {"field": "IOT_MEM_PCNT", "operator": ">", "value": 0}
+            ]},
+            {"field": "MBL_ACT_MEM_PCNT", "operator": ">=", "value": 2}
+        ]}
+    ])
+
+
+def test_expression_numbers_match_condition_locations():
+    """조건식 번호는 분석기 조건 번호(전위 순서)와 같고, 깊은 그룹은 생략 노드 수로 대체"""
+    rule = _rule()
+    ir = compile_conditions(rule.conditions)
+    expression = render_conditions(rule.model_dump()["conditions"])
+
+    assert expression.splitlines() == [
+        '[1] MRKT_CD == "LGT"',
+        "[2] OR",
+        "  [3] AND",
+        "    [4] MBL_ACT_MEM_PCNT >= 1",
+        "    [5] IOT_MEM_PCNT > 0",
+        "  [6] MBL_ACT_MEM_PCNT >= 2"
+    ]
+    assert ir.location(5) == "조건 6"
+    assert render_conditions(rule.model_dump()["conditions"], max_depth=1).splitlines() == [
+        '[1] MRKT_CD == "LGT"',
+        "[2] OR (하위 조건 4개 생략)"
+    ]
+
+
+def _validation_result():
+    return ValidationResult(
+        is_valid=False,
+        summary="",
+        issue_counts={"duplicate_condition": 2, "type_mismatch": 1},
+        issues=[
+            ConditionIssue(field="AGE", issue_type="duplicate_condition", severity="warning", location="조건 1, 2", explanation="중복 조건"),
+            ConditionIssue(field="AGE", issue_type="duplicate_condition", severity="warning", location="조건 2, 3", explanation="중복 조건"),
+            ConditionIssue(field="NAME", issue_type="type_mismatch", severity="error", location="조건 3", explanation="타입 오류")
+        ],
+        structure=StructureInfo(depth=1, condition_node_count=3, field_condition_count=3, unique_fields=["AGE", "NAME"])
+    )
+
+
+def test_issue_digest_merges_locations_and_summarizes_warnings():
+    """같은 필드/설명은 위치만 합치고, 낮은 심각도 상세는 건수로 요약"""
+    service = RuleReportService(llm_service=object())
+    type_name = service._get_issue_type_kr_name
+
+    assert build_issue_digest(_validation_result(), type_name) == (
+        "### 조건 겹침: 2건\n- AGE: 중복 조건 (위치: 조건 1, 2 / 조건 2, 3)\n\n"
+        "### 타입 오류: 1건\n- NAME: 타입 오류 (위치: 조건 3)"
+    )
+    assert build_issue_digest(_validation_result(), type_name, low_severity_detail=False).startswith(
+        "### 조건 겹침: 2건\n- AGE: 경고 2건 (상세 생략)\n\n"
+    )
+
+
+def test_compact_prompt_respects_token_budget(monkeypatch):
+    """예산이 작으면 상세 내용을 줄인 단계의 프롬프트 사용"""
+    from app.services import rule_report_service
+
+    service = RuleReportService(llm_service=object())
+    rule_json = _rule().model_dump()
+    full = service._create_report_prompt(rule_json, _validation_result())
+
+    monkeypatch.setattr(rule_report_service.settings, "REPORT_PROMPT_TOKEN_BUDGET", estimate_tokens(full) - 1)
+    reduced = service._create_report_prompt(rule_json, _validation_result())
+
+    assert "[4] MBL_ACT_MEM_PCNT >= 1" in full and "중복 조건 (위치" in full
+    assert estimate_tokens(reduced) < estimate_tokens(full)
+    assert "경고 2건 (상세 생략)" in reduced
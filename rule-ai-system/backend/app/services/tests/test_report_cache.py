@@ -0,0 +1,71 @@
+import asyncio
+import time
+from app.services.report_cache import ReportCache
+
+
+def _result(text):
+    return {"report": text, "rule_id": "R1", "rule_name": "룰"}
+
+
+def test_report_cache_survives_reopen(tmp_path):
+    """같은 DB 파일을 다시 열어도 저장된 리포트 조회 가능"""
+    path = str(tmp_path / "cache" / "reports.sqlite3")
+    cache = ReportCache(path)
+    cache.put("key", _result("리포트"))
+    cache.close()
+
+    reopened = ReportCache(path)
+    assert reopened.get("key") == _result("리포트")
+    assert reopened.get("missing") is None
+    assert reopened.stats()["hits"] == 1 and reopened.stats()["misses"] == 1
+
+
+def test_report_cache_ttl_and_size_eviction(tmp_path):
+    """TTL이 지난 항목과 최대 건수를 넘는 오래된 항목 제거"""
+    cache = ReportCache(str(tmp_path / "reports.sqlite3"), ttl_seconds=60, max_entries=2)
+    cache.put("a", _result("a"))
+    cache.put("b", _result("b"))
+    cache.get("a")
+    cache.put("c", _result("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+    cache._connect().execute("UPDATE report_cache SET created_at = ?", (time.time() - 120,))
+    assert cache.get("a") is None
+
+
+def test_report_cache_hits_are_read_only_until_flushed(tmp_path):
+    """적중 시각은 모았다가 touch_batch건마다/저장 시 한 번에 기록하고, 비동기 조회/저장은 같은 결과"""
+    cache = ReportCache(str(tmp_path / "reports.sqlite3"), touch_batch=2)
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(cache.put_async("a", _result("a")))
+        cache.put("b", _result("b"))
+        assert loop.run_until_complete(cache.get_async("a")) == _result("a")
+    finally:
+        loop.close()
+
+    def accessed_at(key):
+        return cache._connect().execute("SELECT accessed_at FROM report_cache WHERE cache_key = ?", (key,)).fetchone()[0]
+
+    # a 적중은 아직 기록되지 않아 b보다 오래된 항목으로 남아 있음
+    stored_b = accessed_at("b")
+    assert accessed_at("a") < stored_b and set(cache._touched) == {"a"}
+    cache.get("b")
+    assert accessed_at("a") > stored_b and not cache._touched
+
+
+def test_report_cache_stats_use_in_memory_size(tmp_path):
+    """항목 수는 연결/저장 시 세어 두므로 저장 중(락 보유 중)에도 stats()가 기다리지 않음"""
+    path = str(tmp_path / "reports.sqlite3")
+    cache = ReportCache(path, max_entries=2)
+    assert cache.stats()["size"] == 0
+    for key in ("a", "b", "c"):
+        cache.put(key, _result(key))
+    assert cache.stats()["size"] == 2
+
+    with cache._lock:
+        assert cache.stats()["size"] == 2
+    cache.close()
+    assert ReportCache(path).stats()["size"] == 2
@@ -0,0 +1,72 @@
+from app.api.v1.rule_validator import force_fix_issue_summary
+from app.models.validation_result import ConditionIssue, StructureInfo, ValidationResult
+from app.services.report_markdown import issue_type_sections, parse_markdown_sections
+from app.services.rule_report_service import RuleReportService
+
+
+REPORT = """# ✅ 룰 오류 검토 보고서
+
+## ⚠️ 3. 검출된 이슈 요약
+**이슈 요약:** 총 3가지 유형의 오류, 총 9건 감지됨.
+
+### 조건 겹침: 5건
+
+**AGE**
+- 중복 조건 (위치: 조건 1, 2)
+
+### 중첩 과도: 1건
+
+- 존재하지 않는 이슈
+
+## 📌 총평
+
+```
+# 코드 블록 안의 제목은 섹션이 아님
+```
+수정이 필요합니다."""
+
+
+def _validation_result():
+    return ValidationResult(
+        is_valid=False,
+        summary="",
+        issue_counts={"duplicate_condition": 2, "type_mismatch": 1},
+        issues=[
+            ConditionIssue(field="AGE", issue_type="duplicate_condition", severity="warning", location="조건 1, 2", explanation="중복 조건"),
+            ConditionIssue(field="AGE", issue_type="duplicate_condition", severity="warning", location="조건 2, 3", explanation="중복 조건"),
+            ConditionIssue(field="NAME", issue_type="type_mismatch", severity="error", location="조건 3", explanation="타입 오류")
+        ],
+        structure=StructureInfo(depth=1, unique_fields=["AGE", "NAME"])
+    )
+
+
+def test_parse_and_render_round_trip():
+    """수정하지 않으면 원문 그대로 직렬화되고, 코드 블록 안의 '#'은 제목으로 보지 않음"""
+    root = parse_markdown_sections(REPORT)
+
+    assert root.render() == REPORT
+    assert [section.title for section in root.children[0].children] == ["⚠️ 3. 검출된 이슈 요약", "📌 총평"]
+    assert [name for _, name, _ in issue_type_sections(root)] == ["조건 겹침", "중첩 과도"]
+
+
+def test_validate_and_fix_report_rewrites_sections():
+    """요약 수치 교체, 건수 수정, 없는 유형 제거, 누락 유형은 첫 이슈 섹션 앞에 추가"""
+    service = RuleReportService(llm_service=object())
+    fixed = service._validate_and_fix_report(REPORT, _validation_result())
+
+    assert "**이슈 요약:** 총 2가지 유형의 오류, 총 3건 감지됨.\n- 조건 겹침: 2건\n- 타입 오류: 1건\n" in fixed
+    assert "9건" not in fixed and "중첩 과도" not in fixed
+    assert fixed.index("### 타입 오류: 1건") < fixed.index("### 조건 겹침: 2건") < fixed.index("## 📌 총평")
+    assert fixed.endswith("수정이 필요합니다.")
+    # 이미 올바른 리포트는 그대로
+    assert service._validate_and_fix_report(fixed, _validation_result()) == fixed
+
+
+def test_force_fix_issue_summary_rebuilds_type_sections():
+    """이슈 유형 섹션을 모두 issues 기준으로 다시 만들어 총평 앞에 배치"""
+    fixed = force_fix_issue_summary({"report": REPORT}, _validation_result())["report"]
+
+    assert "- 조건 겹침: 2건 (AGE)\n- 타입 오류: 1건 (NAME)\n" in fixed
+    assert "- 중복 조건 (위치: 조건 2, 3)" in fixed
+    assert fixed.count("### ") == 2 and "중첩 과도" not in fixed
+    assert fixed.index("### 타입 오류: 1건") < fixed.index("## 📌 총평")
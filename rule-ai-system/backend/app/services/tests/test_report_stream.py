@@ -0,0 +1,110 @@
+import asyncio
+from app.models.rule import Rule
+from app.models.validation_result import ConditionIssue, StructureInfo, ValidationResult
+from app.services.report_stream import ReportStreamFixer
+from app.services.rule_report_service import RuleReportService
+
+
+LLM_REPORT = """# ✅ 룰 오류 검토 보고서
+
+## 📌 1. 기본 정보
+| 룰 ID | R1 |
+
+## ⚠️ 3. 검출된 이슈 요약
+**이슈 요약:** 총 3가지 유형의 오류, 총 9건 감지됨.
+
+### 조건 겹침: 5건
+
+**AGE**
+- 중복 조건 (위치: 조건 1, 2)
+
+### 중첩 과도: 1건
+
+- 존재하지 않는 이슈
+
+## 📌 총평
+
+수정이 필요합니다.
+"""
+
+
+def _validation_result():
+    return ValidationResult(
+        is_valid=False,
+        summary="",
+        issue_counts={"duplicate_condition": 2, "type_mismatch": 1},
+        issues=[
+            ConditionIssue(field="AGE", issue_type="duplicate_condition", severity="warning", location="조건 1, 2", explanation="중복 조건"),
+            ConditionIssue(field="AGE", issue_type="duplicate_condition", severity="warning", location="조건 2, 3", explanation="중복 조건"),
+            ConditionIssue(field="NAME", issue_type="type_mismatch", severity="error", location="조건 3", explanation="타입 오류")
+        ],
+        structure=StructureInfo(depth=1, condition_node_count=3, field_condition_count=3, unique_fields=["AGE", "NAME"])
+    )
+
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_fixer_corrects_sections_regardless_of_token_boundaries():
+    """토큰 경계와 관계없이 건수 수정, 없는 유형 제거, 누락 유형 보충, 결정적 섹션 제거"""
+    service = RuleReportService(llm_service=object())
+    outputs = set()
+    for size in (1, 3, 7, len(LLM_REPORT)):
+        fixer = ReportStreamFixer(_validation_result(), service._get_issue_type_kr_name)
+        parts = []
+        for chunk in _chunks(LLM_REPORT, size):
+            parts.extend(fixer.feed(chunk))
+        parts.extend(fixer.close())
+        outputs.add("".join(parts))
+
+    assert len(outputs) == 1
+    report = outputs.pop()
+    assert report.startswith("### 조건 겹침: 2건\n")
+    assert "기본 정보" not in report and "9건" not in report
+    assert "중첩 과도" not in report
+    assert report.index("### 타입 오류: 1건") < report.index("## 📌 총평")
+    assert report.endswith("수정이 필요합니다.\n")
+
+
+class _StubStreamingLLM:
+    fake_mode = True
+    model = None
+
+    def __init__(self):
+        self.started = False
+
+    async def stream(self, prompt, system_message=None, timeout=None):
+        self.started = True
+        for chunk in _chunks(LLM_REPORT, 4):
+            yield chunk
+
+
+def test_stream_report_sends_deterministic_sections_first():
+    """LLM 토큰보다 기본 정보/이슈 요약 섹션이 먼저 전달되고 done에 보정된 전체 리포트 포함"""
+    llm = _StubStreamingLLM()
+    service = RuleReportService(llm_service=llm)
+    rule = Rule(id="R1", name="테스트 룰", conditions=[{"field": "AGE", "operator": ">", "value": 1}])
+
+    async def collect():
+        events = []
+        async for event, data in service.stream_report(rule, _validation_result()):
+            if event == "section":
+                assert not llm.started
+            events.append((event, data))
+        return events
+
+    loop = asyncio.new_event_loop()
+    try:
+        events = loop.run_until_complete(collect())
+    finally:
+        loop.close()
+
+    names = [event for event, _ in events]
+    assert names[:2] == ["meta", "section"] and names[-1] == "done"
+    header = events[1][1]["text"]
+    assert "총 2가지 유형의 오류, 총 3건 감지됨." in header
+    assert "- 조건 겹침: 2건" in header
+    report = events[-1][1]["report"]
+    assert report == header + "".join(data["text"] for event, data in events if event == "token")
+    assert "### 조건 겹침: 2건" in report and "총 3가지 유형" not in report
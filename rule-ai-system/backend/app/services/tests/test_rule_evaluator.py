@@ -0,0 +1,78 @@
+import numpy as np
+from app.models.rule import Rule
+from app.services.rule_analyzer import RuleAnalyzer
+from app.services.rule_evaluator import ColumnBatch, compile_rule
+
+
+RECORDS = [
+    {"MRKT_CD": "LGT", "MBL_ACT_MEM_PCNT": 1, "IOT_MEM_PCNT": 1, "ENTR_STUS_CD": "A"},
+    {"MRKT_CD": "LGT", "MBL_ACT_MEM_PCNT": 0, "IOT_MEM_PCNT": 2, "ENTR_STUS_CD": "S"},
+    {"MRKT_CD": "KT", "MBL_ACT_MEM_PCNT": 3, "IOT_MEM_PCNT": 0, "ENTR_STUS_CD": "A"},
+    {"MRKT_CD": "LGT", "MBL_ACT_MEM_PCNT": None, "IOT_MEM_PCNT": 0},
+    {"MRKT_CD": None, "MBL_ACT_MEM_PCNT": 2.5, "IOT_MEM_PCNT": "1", "ENTR_STUS_CD": "A"}
+]
+
+
+def _rule():
+    return Rule(id="R002", name="테스트 룰", conditions=[
+        {"field": "MRKT_CD", "operator": "==", "value": "LGT"},
+        {"field": "OR", "operator": "group", "value": None, "conditions": [
+            {"field": "AND", "operator": "group", "value": None, "conditions": [
+                {"field": "MBL_ACT_MEM_PCNT", "operator": ">=", "value": 1},
+                {"field": "ENTR_STUS_CD", "operator": "in", "value": ["A", "S"]}
+            ]},
+            {"field": "IOT_MEM_PCNT", "operator": ">", "value": 1}
+        ]}
+    ])
+
+
+def test_leaf_semantics_match_analyzer():
+    """컬럼 종류(숫자/문자열/혼합/null)와 관계없이 분석기의 단일 값 매칭과 같은 결과"""
+    analyzer = RuleAnalyzer()
+    records = RECORDS + [{"MRKT_CD": "LG", "IOT_MEM_PCNT": True}]
+    batch = ColumnBatch.from_records(records)
+    cases = [
+        ("==", "LGT"), ("!=", "LGT"), ("==", None), ("!=", None), (">", 0), ("<=", 1), (">=", "L"),
+        ("in", ["LGT", None]), ("in", [0, 1]), ("contains", "G"), ("starts_with", "LG"), ("ends_with", "T"), ("not_in", ["KT"])
+    ]
+    for field in ("MRKT_CD", "MBL_ACT_MEM_PCNT", "IOT_MEM_PCNT", "ENTR_STUS_CD", "UNKNOWN"):
+        column = batch.column(field)
+        for operator, value in cases:
+            condition = {"field": field, "operator": operator, "value": value}
+            expected = [analyzer._value_matches_condition(record.get(field), condition) for record in records]
+            assert column.match(operator, value).tolist() == expected, (field, operator, value)
+
+
+def test_nested_groups_and_null_handling():
+    """그룹 라벨(field의 AND/OR)대로 결합하고, null과 없는 필드는 비교에서 제외"""
+    compiled = compile_rule(_rule())
+
+    assert compiled.select(ColumnBatch.from_records(RECORDS)).tolist() == [0, 1]
+    assert compile_rule([]).evaluate({"MRKT_CD": ["LGT", "KT"]}).tolist() == [True, True]
+
+
+def test_columnar_batch_input():
+    """레코드 없이 컬럼 배열을 그대로 받아 평가 (NaN은 null)"""
+    compiled = compile_rule(_rule())
+    mask = compiled.evaluate({
+        "MRKT_CD": np.array(["LGT", "LGT", "LGT"]),
+        "MBL_ACT_MEM_PCNT": np.array([1.0, np.nan, 0.0]),
+        "IOT_MEM_PCNT": np.array([0, 0, 5]),
+        "ENTR_STUS_CD": np.array(["A", "A", "X"])
+    })
+
+    assert mask.tolist() == [True, False, True]
+
+
+def test_mixed_python_list_keeps_value_types():
+    """숫자와 문자열이 섞인 리스트도 숫자를 문자열로 바꾸지 않고 분석기와 같은 결과"""
+    analyzer = RuleAnalyzer()
+    values = [10, "unknown", 3, None, 7.5]
+    compiled = compile_rule(Rule(name="나이", conditions=[{"field": "age", "operator": ">", "value": 5}]))
+    expected = [analyzer._value_matches_condition(value, {"field": "age", "operator": ">", "value": 5}) for value in values]
+
+    assert expected == [True, False, False, False, True]
+    assert compiled.evaluate({"age": values}).tolist() == expected
+    assert compiled.evaluate({"age": [10, "unknown", 3]}).tolist() == [True, False, False]
+    assert compiled.evaluate({"age": [10, 3]}).tolist() == [True, False]
+    assert compiled.evaluate({"age": ["10", "3"]}).tolist() == [False, False]
@@ -0,0 +1,139 @@
+import asyncio
+import sqlite3
+from types import MappingProxyType
+from app.models.rule import Rule
+from app.services.revalidation_queue import RevalidationQueue
+from app.services.rule_analyzer import FIELD_SCHEMA, RuleAnalyzer
+from app.services.rule_repository import RuleRepository
+
+
+def _rule(field, operator, value):
+    return Rule(name="테스트 룰", conditions=[{"field": field, "operator": operator, "value": value}])
+
+
+def _run(coroutine_factory):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine_factory())
+    finally:
+        loop.close()
+
+
+def test_versions_and_background_revalidation(tmp_path):
+    """내용이 바뀔 때만 새 버전, 새 버전은 큐에서 재검증되어 현재 결과가 됨"""
+    repository = RuleRepository(f"sqlite:///{tmp_path / 'rules.sqlite3'}")
+    analyzer = RuleAnalyzer()
+    queue = RevalidationQueue(repository, analyzer)
+
+    async def scenario():
+        assert repository.save("R1", _rule("age", ">", 10)) == (1, True)
+        assert repository.save("R1", _rule("age", ">", 10)) == (1, False)
+        queue.enqueue(["R1", "R1"])
+        await queue.join()
+        first = repository.get("R1")
+
+        assert repository.save("R1", _rule("age", ">", 20)) == (2, True)
+        pending = repository.get("R1")
+        queue.enqueue(["R1"])
+        await queue.join()
+        await queue.stop()
+        return first, pending, repository.get("R1")
+
+    first, pending, second = _run(scenario)
+    assert first.is_current(analyzer.schema_version) and first.result is not None
+    assert not pending.is_current(analyzer.schema_version) and pending.result is None
+    assert second.version == 2 and second.is_current(analyzer.schema_version)
+    assert queue.processed == 2
+    assert [version["version"] for version in repository.versions("R1")] == [1, 2]
+    assert repository.get("R1", version=1).rule.conditions[0].value == 10
+
+
+def test_schema_change_revalidates_only_affected_rules(tmp_path):
+    """스키마에서 바뀐 필드를 쓰는 룰만 다시 분석하고, 나머지는 결과를 유지한 채 스키마 버전만 갱신"""
+    repository = RuleRepository(f"sqlite:///{tmp_path / 'rules.sqlite3'}")
+    for rule_id, rule in [("AGE", _rule("age", ">", 10)), ("MRKT", _rule("MRKT_CD", "==", "LGT"))]:
+        repository.save(rule_id, rule)
+
+    async def start(analyzer):
+        queue = RevalidationQueue(repository, analyzer)
+        count = await queue.start()
+        await queue.join()
+        await queue.stop()
+        return count, queue.processed
+
+    assert _run(lambda: start(RuleAnalyzer())) == (2, 2)
+    assert _run(lambda: start(RuleAnalyzer())) == (0, 0)
+
+    class ChangedSchemaAnalyzer(RuleAnalyzer):
+        field_schema = MappingProxyType(dict(FIELD_SCHEMA, age=MappingProxyType({"type": "string", "description": "나이"})))
+        schema_version = "changed"
+
+    assert _run(lambda: start(ChangedSchemaAnalyzer())) == (1, 1)
+    age, mrkt = repository.get("AGE"), repository.get("MRKT")
+    assert age.is_current("changed") and mrkt.is_current("changed")
+    assert any(issue.issue_type == "invalid_operator" for issue in age.result.issues)
+
+
+def test_restart_before_revalidation_keeps_changed_rules_stale(tmp_path):
+    """스키마 변경 후 재검증 전에 재시작해도 이전 스키마로 분석한 결과를 현재 결과로 보지 않음"""
+    repository = RuleRepository(f"sqlite:///{tmp_path / 'rules.sqlite3'}")
+    repository.save("AGE", _rule("age", ">", 10))
+
+    class ChangedSchemaAnalyzer(RuleAnalyzer):
+        field_schema = MappingProxyType(dict(FIELD_SCHEMA, age=MappingProxyType({"type": "string", "description": "나이"})))
+        schema_version = "changed"
+
+    async def scenario():
+        queue = RevalidationQueue(repository, RuleAnalyzer())
+        await queue.revalidate("AGE")
+
+        # 워커가 처리하기 전에 종료
+        interrupted = RevalidationQueue(repository, ChangedSchemaAnalyzer())
+        first = await interrupted.start()
+        await interrupted.stop()
+
+        restarted = RevalidationQueue(repository, ChangedSchemaAnalyzer())
+        second = await restarted.start()
+        pending = repository.get("AGE")
+        await restarted.join()
+        await restarted.stop()
+        return first, second, pending
+
+    first, second, pending = _run(scenario)
+    assert (first, second) == (1, 1)
+    assert not pending.is_current("changed")
+    age = repository.get("AGE")
+    expected = ChangedSchemaAnalyzer().analyze(_rule("age", ">", 10))
+    assert age.is_current("changed")
+    assert [issue.issue_type for issue in age.result.issues] == [issue.issue_type for issue in expected.issues]
+
+
+def test_migration_upgrades_database_created_before_alembic(tmp_path):
+    """마이그레이션 도입 전 첫 사용 시 생성된 DB도 기존 룰을 유지한 채 최신 리비전으로 올라감"""
+    path = tmp_path / "rules.sqlite3"
+    legacy = sqlite3.connect(str(path))
+    legacy.executescript(
+        """
+        CREATE TABLE rules (rule_id TEXT PRIMARY KEY, version INTEGER NOT NULL, rule_hash TEXT NOT NULL, result TEXT,
+                            result_version INTEGER, schema_version TEXT, updated_at REAL NOT NULL);
+        CREATE TABLE rule_versions (rule_id TEXT NOT NULL, version INTEGER NOT NULL, rule TEXT NOT NULL, rule_hash TEXT NOT NULL,
+                                    created_at REAL NOT NULL, PRIMARY KEY (rule_id, version));
+        CREATE TABLE rule_fields (rule_id TEXT NOT NULL, field TEXT NOT NULL, PRIMARY KEY (rule_id, field));
+        CREATE TABLE schema_fields (field TEXT PRIMARY KEY, fingerprint TEXT NOT NULL);
+        """
+    )
+    legacy.execute("INSERT INTO rules VALUES ('R1', 1, 'h1', NULL, NULL, NULL, 1.0)")
+    legacy.execute("INSERT INTO rule_versions VALUES ('R1', 1, ?, 'h1', 1.0)", (_rule("age", ">", 10).model_dump_json(),))
+    legacy.commit()
+    legacy.close()
+
+    repository = RuleRepository(f"sqlite:///{path}")
+    assert repository.get("R1").rule.conditions[0].value == 10
+    assert repository.save("R1", _rule("age", ">", 20)) == (2, True)
+    repository.close()
+
+    connection = sqlite3.connect(str(path))
+    try:
+        assert connection.execute("SELECT version_num FROM alembic_version").fetchall() == [("0002",)]
+    finally:
+        connection.close()
@@ -0,0 +1,144 @@
+import asyncio
+import itertools
+import random
+import threading
+from app.api.rule_set import convert_rule_set
+from app.services.interval_engine import Interval, IntervalTree
+from app.services.rule_regions import build_rule_region, intersect_boxes, subtract_box
+from app.services import rule_set_analyzer as rule_set_module
+from app.services.rule_set_analyzer import PARTIALLY_SHADOWED, SHADOWED, find_region_overlaps, partition_by_fields, rule_set_analyzer
+
+
+def _cond(field, operator, value):
+    return {"field": field, "operator": operator, "value": value}
+
+
+def _rule(rule_id, priority, *conditions, enabled=True):
+    return {"ruleId": rule_id, "name": rule_id, "priority": priority, "enabled": enabled, "conditions": {"operator": "AND", "conditions": list(conditions)}}
+
+
+def _run(method, rules_json):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(method(convert_rule_set(rules_json)))
+    finally:
+        loop.close()
+
+
+def _find(rules_json):
+    return _run(rule_set_analyzer.find_overlaps, rules_json)
+
+
+def test_overlap_reports_priority_winner_and_region():
+    """겹치는 룰 쌍은 priority 값이 작은 룰을 우선 적용 룰로, 공유 필드별 교집합과 함께 보고"""
+    result = _find([
+        _rule("R1", 2, _cond("age", ">=", 20), _cond("MRKT_CD", "==", "LGT")),
+        _rule("R2", 1, _cond("age", "<", 30), _cond("MRKT_CD", "in", ["LGT", "KT"])),
+        _rule("R3", 1, _cond("age", "<", 10)),
+        _rule("R4", 1, _cond("age", ">", 0), enabled=False),
+        _rule("R5", 1, _cond("grade", "==", "A"))
+    ])
+
+    assert (result.rule_count, result.enabled_rule_count, result.group_count) == (5, 4, 2)
+    assert [(overlap.rule_id, overlap.other_rule_id, overlap.winner_rule_id) for overlap in result.overlaps] == [("R1", "R2", "R2"), ("R2", "R3", None)]
+    assert result.overlaps[0].region == {"MRKT_CD": "== 'LGT'", "age": "[20, 30)"}
+    # 공유하지 않는 필드(R2의 MRKT_CD)는 영역에 포함하지 않음
+    assert result.overlaps[1].region == {"age": "(-inf, 10)"}
+    assert not result.overlaps[0].approximate
+
+
+def test_indexed_overlaps_match_pairwise_check():
+    """필드 색인으로 찾은 겹침 쌍이 모든 박스 쌍을 직접 비교한 결과와 같음"""
+    generator = random.Random(7)
+    fields = [("age", "n"), ("IOT_MEM_PCNT", "n"), ("MRKT_CD", "s"), ("grade", "s")]
+
+    def leaf():
+        field, kind = generator.choice(fields)
+        if kind == "n":
+            return _cond(field, generator.choice([">", ">=", "<", "<=", "==", "!="]), generator.randint(0, 10))
+        operator = generator.choice(["==", "!=", "in"])
+        value = generator.sample("ABCDE", 2) if operator == "in" else generator.choice("ABCDE")
+        return _cond(field, operator, value)
+
+    rules_json = []
+    for position in range(80):
+        conditions = [leaf() for _ in range(generator.randint(1, 3))]
+        if generator.random() < 0.4:
+            conditions.append({"operator": "OR", "conditions": [leaf(), leaf()]})
+        rules_json.append(_rule(f"R{position}", generator.randint(1, 3), *conditions))
+
+    regions = [build_rule_region(rule, rule_id) for rule_id, rule in convert_rule_set(rules_json)]
+    expected = set()
+    for first, second in itertools.combinations(regions, 2):
+        if any(set(box) & set(other) and intersect_boxes(box, other) is not None for box in first.boxes for other in second.boxes):
+            expected.add((first.rule_id, second.rule_id))
+
+    assert expected
+    assert {(overlap.rule_id, overlap.other_rule_id) for overlap in find_region_overlaps(regions)} == expected
+
+
+def test_partition_and_interval_tree():
+    """필드를 공유하는 룰끼리만 같은 그룹, 구간 트리 질의는 겹치는 구간만 반환"""
+    assert partition_by_fields([["a"], ["b"], ["a", "c"], ["c"], []]) == [[0, 2, 3], [1]]
+
+    intervals = [(position, Interval(lo, True, lo + width, False)) for position, (lo, width) in enumerate([(0, 5), (3, 1), (10, 2), (4, 8), (20, 1)])]
+    tree = IntervalTree(intervals)
+    assert sorted(tree.query(Interval(4, True, 10, False))) == [0, 3]
+    assert sorted(tree.stab(11)) == [2, 3]
+
+
+def test_shadowed_rules_by_union_of_higher_priority_rules():
+    """상위 룰 여러 개의 합집합이 덮으면 shadowed, 일부만 덮으면 partially_shadowed, 같은 priority는 가림 아님"""
+    result = _run(rule_set_analyzer.find_shadowed, [
+        _rule("LOW", 1, _cond("age", "<", 20)),
+        _rule("HIGH", 1, _cond("age", ">=", 20), _cond("MRKT_CD", "in", ["LGT", "KT"])),
+        _rule("ADULT_LGT", 2, _cond("age", ">", 10), _cond("MRKT_CD", "==", "LGT")),
+        _rule("ANY_MRKT", 2, _cond("age", ">", 10)),
+        _rule("SAME", 1, _cond("age", "<", 5)),
+        _rule("TEXT", 1, _cond("age", ">=", 30), _cond("name", "contains", "VIP")),
+        _rule("NAME", 2, _cond("age", ">=", 25), _cond("name", "==", "VIP"))
+    ])
+
+    shadows = {shadow.rule_id: shadow for shadow in result.shadows}
+    assert (result.shadowed_count, result.partially_shadowed_count) == (1, 2)
+    assert (shadows["ADULT_LGT"].status, shadows["ADULT_LGT"].covering_rule_ids) == (SHADOWED, ["LOW", "HIGH"])
+    assert (shadows["ANY_MRKT"].status, shadows["ANY_MRKT"].covering_rule_ids) == (PARTIALLY_SHADOWED, ["LOW", "HIGH", "TEXT"])
+    # contains 조건은 영역을 근사하므로 TEXT는 덮는 룰로 쓰지 않고 부분 가림만 근사로 보고
+    assert (shadows["NAME"].status, shadows["NAME"].covering_rule_ids, shadows["NAME"].approximate) == (PARTIALLY_SHADOWED, ["HIGH", "TEXT"], True)
+    assert "SAME" not in shadows
+
+
+def test_subtract_box_leaves_exact_remainder():
+    """박스 차집합 조각은 서로 겹치지 않는 나머지 영역"""
+    rules = convert_rule_set([
+        _rule("A", 1, _cond("age", ">=", 0), _cond("age", "<", 100), _cond("MRKT_CD", "in", ["LGT", "KT"])),
+        _rule("B", 1, _cond("age", ">", 10), _cond("MRKT_CD", "!=", "KT"))
+    ])
+    box, other = (build_rule_region(rule, rule_id).boxes[0] for rule_id, rule in rules)
+
+    pieces = sorted(sorted((field, constraint.describe()) for field, constraint in piece.items()) for piece in subtract_box(box, other))
+    assert pieces == [
+        [("MRKT_CD", "== 'KT'"), ("age", "(10, 100)")],
+        [("MRKT_CD", "in ['KT', 'LGT']"), ("age", "[0, 10]")]
+    ]
+
+
+def test_rule_set_analysis_runs_off_the_event_loop(monkeypatch):
+    """inline 모드에서도 그룹 분할과 겹침/가림 검출은 이벤트 루프 스레드에서 실행하지 않음"""
+    threads = []
+
+    def recorded(func):
+        def wrapper(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return func(*args, **kwargs)
+        return wrapper
+
+    for name in ("partition_by_fields", "find_region_overlaps", "find_shadowed_rules"):
+        monkeypatch.setattr(rule_set_module, name, recorded(getattr(rule_set_module, name)))
+    rules_json = [_rule("A", 1, _cond("age", ">", 10)), _rule("B", 2, _cond("age", ">", 20))]
+
+    overlaps = _run(rule_set_analyzer.find_overlaps, rules_json)
+    shadows = _run(rule_set_analyzer.find_shadowed, rules_json)
+
+    assert len(overlaps.overlaps) == 1 and shadows.shadowed_count == 1
+    assert len(threads) == 3 and threading.get_ident() not in threads
@@ -0,0 +1,118 @@
+import sys
+import pytest
+from app.config import settings
+from app.models.rule import Rule
+from app.services.condition_ir import compile_conditions
+from app.services.rule_analyzer import rule_analyzer
+from app.services.satisfiability import (
+    ALWAYS_TRUE, BDD, FALSE, REDUNDANT, TRUE, UNSATISFIABLE, BDDLimitExceeded, SatisfiabilityAnalyzer, analyze_branches
+)
+
+
+def _cond(field, operator, value):
+    return {"field": field, "operator": operator, "value": value}
+
+
+def _group(operator, *conditions):
+    return {"field": "placeholder", "operator": operator, "value": None, "conditions": list(conditions)}
+
+
+def _findings(conditions):
+    ir = compile_conditions(Rule(id="R1", name="테스트 룰", conditions=conditions).conditions)
+    return [(finding.kind, finding.index, finding.indices) for finding in analyze_branches(rule_analyzer, ir)]
+
+
+def test_unsatisfiable_groups_report_minimal_core():
+    """세 조건 이상에 걸친 모순은 최소 조건 집합으로, 상위 AND 조건과 맞지 않는 OR 분기는 분기 단위로 보고"""
+    assert _findings([_cond("age", ">", 5), _cond("age", "<", 10), _cond("age", "==", 20)]) == [(UNSATISFIABLE, -1, [1, 2])]
+    assert _findings([
+        _cond("MBL_ACT_MEM_PCNT", "in", [1, 2]),
+        _cond("MBL_ACT_MEM_PCNT", "!=", 1),
+        _cond("MBL_ACT_MEM_PCNT", "!=", 2)
+    ]) == [(UNSATISFIABLE, -1, [0, 1, 2])]
+    assert _findings([
+        _cond("age", ">", 5),
+        _group("or", _cond("age", "<", 3), _group("and", _cond("MRKT_CD", "==", "LGT"), _cond("age", "<=", 5)), _cond("MRKT_CD", "==", "KT"))
+    ]) == [(UNSATISFIABLE, 2, [0, 2]), (UNSATISFIABLE, 3, [0, 5])]
+
+    # inf 경계(JSON 1e999)는 도메인으로 해석하지 않으므로 만족 가능한 조건을 모순으로 보지 않음
+    assert _findings([_cond("age", "<", float("inf"))]) == []
+
+
+def test_always_true_and_redundant_branches():
+    """상위 조건 아래에서 항상 참인 그룹과 다른 분기/형제 조건에 포함되는 조건 검출"""
+    assert _findings([_group("or", _cond("age", ">=", 1), _cond("age", "<", 1))]) == [(ALWAYS_TRUE, -1, [0])]
+    assert _findings([
+        _cond("MRKT_CD", "==", "LGT"),
+        _group("or", _cond("age", ">=", 1), _cond("age", "<", 1))
+    ]) == [(ALWAYS_TRUE, 1, [1])]
+    assert _findings([_cond("age", ">", 5), _cond("age", ">", 3)]) == [(REDUNDANT, 1, [0, 1])]
+    assert _findings([
+        _group("or", _cond("age", ">", 5), _group("and", _cond("age", ">", 7), _cond("MRKT_CD", "==", "LGT")))
+    ]) == [(REDUNDANT, 2, [1, 2])]
+    # 도메인으로 해석하지 않는 연산자는 독립 변수라 판정하지 않음
+    assert _findings([_cond("name", "contains", "a"), _cond("name", "starts_with", "a")]) == []
+
+
+def test_identical_leaves_share_bdd_nodes():
+    """같은 (필드, 연산자, 값) 조건은 위치와 관계없이 같은 BDD 노드"""
+    conditions = [_group("or", _group("and", _cond("age", ">", 5), _cond("MRKT_CD", "==", "LGT")), _cond("age", ">", 5))]
+    ir = compile_conditions(Rule(id="R1", name="테스트 룰", conditions=conditions).conditions)
+    analyzer = SatisfiabilityAnalyzer(rule_analyzer, ir)
+    analyzer.run()
+
+    assert analyzer.functions[2] == analyzer.functions[4]
+
+
+def test_analyzer_reports_branch_contradiction():
+    """필드 단위 모순 검사가 놓치는 값 목록 모순을 self_contradiction으로 보고"""
+    result = rule_analyzer.analyze(Rule(id="R1", name="테스트 룰", conditions=[
+        _cond("MBL_ACT_MEM_PCNT", "in", [1, 2]),
+        _cond("MBL_ACT_MEM_PCNT", "!=", 1),
+        _cond("MBL_ACT_MEM_PCNT", "!=", 2)
+    ]))
+
+    contradictions = [issue for issue in result.issues if issue.issue_type == "self_contradiction"]
+    assert len(contradictions) == 1
+    assert contradictions[0].location == "조건 1, 조건 2, 조건 3"
+    assert "룰 전체가 항상 거짓" in contradictions[0].explanation
+
+
+def test_bdd_operations_do_not_recurse_per_variable():
+    """변수 수가 재귀 한도보다 많은 BDD도 and/or/not/disjoint 연산 가능"""
+    bdd = BDD()
+    count = sys.getrecursionlimit() * 2
+    # v0 ∨ v1 ∨ ... (뒤 변수부터 붙여 깊이 count의 사슬을 만듦)
+    any_var = FALSE
+    for var in reversed(range(count)):
+        any_var = bdd.disjoin(bdd.node(var, FALSE, TRUE), any_var)
+    none_var = bdd.negate(any_var)
+
+    assert bdd.conjoin(any_var, none_var) == FALSE
+    assert bdd.disjoin(any_var, none_var) == TRUE
+    assert bdd.disjoint(any_var, none_var)
+    assert not bdd.disjoint(any_var, bdd.node(count - 1, FALSE, TRUE))
+
+    limited = BDD(max_steps=100)
+    chain = FALSE
+    with pytest.raises(BDDLimitExceeded):
+        for var in range(count):
+            chain = limited.disjoin(chain, limited.node(var, FALSE, TRUE))
+
+
+def test_wide_contains_or_skips_branch_check_within_budget(monkeypatch):
+    """조건 수 한도를 올려도 넓은 contains OR은 작업량 한도에서 분기 판정만 생략하고, 결과는 분기 판정을 끈 경우와 같음"""
+    rule = Rule(id="R1", name="넓은 OR", conditions=[
+        _group("or", *(_cond("MRKT_CD", "contains", f"v{index}") for index in range(1200)))
+    ])
+    monkeypatch.setattr(settings, "ANALYSIS_BDD_MAX_NODES", 0)
+    expected = rule_analyzer.analyze(rule)
+
+    monkeypatch.setattr(settings, "ANALYSIS_BDD_MAX_NODES", 20000)
+    monkeypatch.setattr(settings, "ANALYSIS_BDD_MAX_CONDITIONS", 10000)
+    result = rule_analyzer.analyze(rule)
+
+    assert result == expected
+    assert not any("분석 중 오류" in issue.explanation for issue in result.issues)
+    with pytest.raises(BDDLimitExceeded):
+        analyze_branches(rule_analyzer, compile_conditions(rule.conditions), max_steps=settings.ANALYSIS_BDD_MAX_STEPS)
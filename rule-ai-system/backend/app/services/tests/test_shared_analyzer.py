@@ -0,0 +1,63 @@
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from app.models.rule import Rule, RuleCondition
+from app.services.rule_conversion import convert_json_to_rule
+from app.services.rule_analyzer import RuleAnalyzer, rule_analyzer
+from benchmarks.rule_generator import RuleGenerator, RuleShape
+
+
+def _rule(name, limit):
+    return Rule(name=name, conditions=[
+        RuleCondition(field="age", operator=">", value=limit),
+        RuleCondition(field="placeholder", operator="OR", value=None, conditions=[
+            RuleCondition(field="age", operator="<", value=limit - 1),
+            RuleCondition(field="MRKT_CD", operator="==", value="LGT")
+        ])
+    ])
+
+
+def test_shared_analyzer_concurrent_calls():
+    """공유 분석기 인스턴스로 동시 분석해도 결과가 섞이지 않고 입력 룰이 변경되지 않음"""
+    rules = [_rule(f"rule-{i}", i + 10) for i in range(8)]
+    snapshots = [rule.model_dump() for rule in rules]
+
+    async def run_all():
+        return await asyncio.gather(*(rule_analyzer.analyze_rule(rule) for rule in rules))
+
+    loop = asyncio.new_event_loop()
+    try:
+        results = loop.run_until_complete(run_all())
+    finally:
+        loop.close()
+    expected = rule_analyzer.analyze(_rule("rule-0", 10))
+
+    for index, result in enumerate(results):
+        assert f"rule-{index}" in result.summary
+        assert result.issue_counts == expected.issue_counts
+    assert [rule.model_dump() for rule in rules] == snapshots
+    assert not hasattr(rule_analyzer, "issues")
+
+
+def test_shared_analyzer_threads_match_fresh_instances():
+    """서로 다른 룰 여러 개를 스레드에서 동시에 공유 인스턴스로 분석한 결과가 룰마다 새 인스턴스로 분석한 결과와 같음"""
+    shapes = [
+        RuleShape(depth=2, fan_out=3, field_count=4, contradiction_rate=0.5),
+        RuleShape(depth=3, fan_out=2, field_count=6, operator_mix={"==": 2, ">": 1, "<=": 1, "in": 1}, contradiction_rate=0.2),
+        RuleShape(depth=1, fan_out=6, field_count=3, operator_mix={"==": 1, "!=": 1, "contains": 1}, contradiction_rate=0.0)
+    ]
+    rules = [convert_json_to_rule(rule_json) for seed, shape in enumerate(shapes) for rule_json in RuleGenerator(shape, seed=seed).rules(8)]
+    expected = [RuleAnalyzer().analyze(rule).model_dump() for rule in rules]
+    # 같은 룰을 여러 번, 섞인 순서로 제출해 서로 다른 분석이 겹치게 함
+    order = [index for _ in range(4) for index in range(len(rules))][::-1]
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda index: rule_analyzer.analyze(rules[index]).model_dump(), order))
+    finally:
+        sys.setswitchinterval(interval)
+
+    for index, result in zip(order, results):
+        assert result == expected[index]
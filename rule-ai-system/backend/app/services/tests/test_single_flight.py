@@ -0,0 +1,73 @@
+import asyncio
+from app.models.rule import Rule
+from app.services.rule_analyzer import rule_analyzer
+from app.services.rule_report_service import RuleReportService
+from app.services.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    """같은 키의 동시 호출은 한 번만 실행되고, 다른 키는 따로 실행"""
+    flight = SingleFlight()
+    executions = []
+
+    async def work(key):
+        executions.append(key)
+        await asyncio.sleep(0.01)
+        return {"key": key}
+
+    async def run_all():
+        calls = [flight.do("a", lambda: work("a")) for _ in range(4)] + [flight.do("b", lambda: work("b"))]
+        return await asyncio.gather(*calls)
+
+    loop = asyncio.new_event_loop()
+    try:
+        results = loop.run_until_complete(run_all())
+        # 완료 후 같은 키는 다시 실행됨
+        loop.run_until_complete(flight.do("a", lambda: work("a")))
+    finally:
+        loop.close()
+
+    assert [result["key"] for result in results] == ["a", "a", "a", "a", "b"]
+    assert executions == ["a", "b", "a"]
+    assert flight.stats() == {"calls": 6, "executions": 3, "coalesced": 3, "in_flight": 0}
+
+
+class StubLLMService:
+    """고정 응답을 돌려주는 LLM 서비스 (리포트 캐시는 사용하지 않음)"""
+
+    model = None
+    fake_mode = True
+
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+
+    async def call_llm_with_status(self, prompt, system_message):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.text, False
+
+
+def test_report_calls_are_not_shared_across_llm_services():
+    """같은 룰/검증 결과라도 LLM 서비스가 다르면 병합하지 않고, 같은 서비스의 병합 결과는 서로 독립된 복사본"""
+    rule = Rule(name="병합 룰", conditions=[{"field": "age", "operator": ">", "value": 10}])
+    validation_result = rule_analyzer.analyze(rule)
+    first, second = StubLLMService("첫 번째 리포트"), StubLLMService("두 번째 리포트")
+    first_service, second_service = RuleReportService(first), RuleReportService(second)
+
+    async def run_all():
+        return await asyncio.gather(
+            first_service.generate_report(rule, validation_result, "llm"),
+            first_service.generate_report(rule, validation_result, "llm"),
+            second_service.generate_report(rule, validation_result, "llm")
+        )
+
+    loop = asyncio.new_event_loop()
+    try:
+        shared, coalesced, other = loop.run_until_complete(run_all())
+    finally:
+        loop.close()
+
+    assert (first.calls, second.calls) == (1, 1)
+    assert "첫 번째 리포트" in shared["report"] and "두 번째 리포트" in other["report"]
+    assert shared == coalesced and shared is not coalesced
@@ -0,0 +1,83 @@
+import pytest
+from app.models.rule import Rule
+from app.services.condition_ir import compile_conditions
+from app.services.json_patch import JsonPatchError, apply_patch
+from app.services.rule_analyzer import RuleAnalyzer
+from app.services.subtree_cache import SubtreeArtifactCache, subtree_hashes
+
+
+def _rule():
+    return Rule(name="테스트 룰", conditions=[{
+        "field": "", "operator": "AND", "value": None,
+        "conditions": [
+            {"field": "age", "operator": ">", "value": 20},
+            {"field": "age", "operator": "<", "value": "30"},
+            {"field": "", "operator": "OR", "value": None, "conditions": [
+                {"field": "MRKT_CD", "operator": "==", "value": "LGT"},
+                {"field": "name", "operator": "LIKE", "value": 5}
+            ]},
+            {"field": "", "operator": "OR", "value": None, "conditions": [
+                {"field": "gender", "operator": "==", "value": "M"},
+                {"field": "gender", "operator": "==", "value": "F"}
+            ]}
+        ]
+    }])
+
+
+def test_cached_analysis_matches_and_reuses_unchanged_subtrees():
+    """캐시 사용 여부와 무관하게 결과가 같고, 한 조건을 고치면 그 경로의 노드만 다시 계산"""
+    analyzer = RuleAnalyzer()
+    cache = SubtreeArtifactCache(max_size=100)
+    rule = _rule()
+    assert analyzer.analyze(rule, cache).model_dump() == analyzer.analyze(rule).model_dump()
+    assert cache.stats()["misses"] == 9 and cache.stats()["hits"] == 0
+
+    document = apply_patch(rule.model_dump(mode="json"), [
+        {"op": "replace", "path": "/conditions/0/conditions/2/conditions/1/value", "value": "홍%"}
+    ])
+    edited = Rule.model_validate(document)
+    before = cache.stats()
+    assert analyzer.analyze(edited, cache).model_dump() == analyzer.analyze(edited).model_dump()
+    after = cache.stats()
+    # 수정된 조건, 그 OR 그룹, 루트 AND 그룹만 미적중 - 나머지 형제 서브트리 4개(age 2개, MRKT_CD, gender OR)는 재사용
+    assert after["misses"] - before["misses"] == 3
+    assert after["hits"] - before["hits"] == 4
+
+
+def test_subtree_hashes_depend_on_content_not_position():
+    """같은 내용의 서브트리는 위치가 달라도 같은 해시, 값의 타입이 다르면 다른 해시"""
+    hashes = subtree_hashes(compile_conditions(_rule().conditions))
+    assert hashes[4] != hashes[7]
+    same = Rule(name="룰", conditions=[
+        {"field": "age", "operator": ">", "value": 1},
+        {"field": "age", "operator": ">", "value": 1.0},
+        {"field": "age", "operator": ">", "value": 1}
+    ])
+    first, second, third = subtree_hashes(compile_conditions(same.conditions))
+    assert first == third and first != second
+
+
+def test_json_patch_operations():
+    """RFC 6902 연산 적용과 원본 불변, 실패 시 JsonPatchError"""
+    document = {"a": {"b": [1, 2]}, "c~/d": True}
+    patched = apply_patch(document, [
+        {"op": "add", "path": "/a/b/-", "value": 3},
+        {"op": "add", "path": "/a/b/0", "value": 0},
+        {"op": "remove", "path": "/a/b/1"},
+        {"op": "replace", "path": "/c~0~1d", "value": False},
+        {"op": "copy", "from": "/a/b", "path": "/e"},
+        {"op": "move", "from": "/a/b", "path": "/f"},
+        {"op": "test", "path": "/f", "value": [0, 2, 3]}
+    ])
+    assert patched == {"a": {}, "c~/d": False, "e": [0, 2, 3], "f": [0, 2, 3]}
+    assert document == {"a": {"b": [1, 2]}, "c~/d": True}
+
+    for operations in (
+        [{"op": "test", "path": "/c~0~1d", "value": 1}],
+        [{"op": "remove", "path": "/a/x"}],
+        [{"op": "replace", "path": "/a/b/5", "value": 1}],
+        [{"op": "move", "from": "/a", "path": "/a/b/c"}],
+        [{"op": "frobnicate", "path": "/a"}]
+    ):
+        with pytest.raises(JsonPatchError):
+            apply_patch(document, operations)
@@ -0,0 +1,65 @@
+import asyncio
+from app.models.rule import Rule
+from app.models.validation_result import ConditionIssue, StructureInfo, ValidationResult
+from app.services.rule_report_service import RuleReportService
+
+
+def _rule():
+    return Rule(id="R1", name="테스트 룰", conditions=[{"field": "AGE", "operator": ">", "value": 1}])
+
+
+def _validation_result():
+    return ValidationResult(
+        is_valid=False,
+        summary="",
+        issue_counts={"duplicate_condition": 2, "type_mismatch": 1},
+        issues=[
+            ConditionIssue(field="AGE", issue_type="duplicate_condition", severity="warning", location="조건 1, 2", explanation="중복 조건"),
+            ConditionIssue(field="AGE", issue_type="duplicate_condition", severity="warning", location="조건 2, 3", explanation="중복 조건"),
+            ConditionIssue(field="NAME", issue_type="type_mismatch", severity="error", location="조건 3", explanation="타입 오류")
+        ],
+        structure=StructureInfo(depth=1, condition_node_count=3, field_condition_count=3, unique_fields=["AGE", "NAME"])
+    )
+
+
+class _StubLLM:
+    """호출된 프롬프트를 기록하고 고정 총평을 반환하는 가짜 LLM"""
+    fake_mode = True
+    model = None
+
+    def __init__(self):
+        self.prompts = []
+
+    async def call_llm_with_status(self, prompt, system_message=None, timeout=None):
+        self.prompts.append(prompt)
+        return "타입 오류부터 수정하세요.", True
+
+
+def _generate(service, mode):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(service.generate_report(_rule(), _validation_result(), mode))
+    finally:
+        loop.close()
+
+
+def test_fast_mode_renders_full_report_without_llm():
+    """fast 모드는 LLM 없이 요약, 필드별 이슈 목록, 기본 총평까지 모두 생성"""
+    llm = _StubLLM()
+    report = _generate(RuleReportService(llm_service=llm), "fast")["report"]
+
+    assert llm.prompts == []
+    assert "**이슈 요약:** 총 2가지 유형의 오류, 총 3건 감지됨." in report
+    assert "### 조건 겹침: 2건\n\n**AGE**\n- 중복 조건 (위치: 조건 1, 2)\n- 중복 조건 (위치: 조건 2, 3)\n" in report
+    assert report.index("### 타입 오류: 1건") < report.index("## 📌 총평")
+    assert "수정이 필요한 오류가 있습니다" in report
+
+
+def test_hybrid_mode_fills_only_the_narrative():
+    """hybrid 모드는 템플릿 리포트를 그대로 두고 총평만 LLM 응답으로 채움"""
+    llm = _StubLLM()
+    report = _generate(RuleReportService(llm_service=llm), "hybrid")["report"]
+
+    assert len(llm.prompts) == 1 and "### 조건 겹침: 2건" in llm.prompts[0]
+    assert report.endswith("## 📌 총평\n\n타입 오류부터 수정하세요.\n")
+    assert "### 조건 겹침: 2건\n\n**AGE**" in report
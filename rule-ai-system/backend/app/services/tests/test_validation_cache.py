@@ -0,0 +1,34 @@
+from app.models.validation_result import ValidationResult, StructureInfo
+from app.services.rule_hash import canonical_rule_hash
+from app.services.validation_cache import ValidationResultCache
+
+
+def _result(summary):
+    return ValidationResult(is_valid=True, summary=summary, issues=[], structure=StructureInfo(depth=1, unique_fields=[]))
+
+
+def test_canonical_rule_hash_ignores_key_order_aliases_and_id_key():
+    """키 순서, 연산자 약어, ruleId/id 차이는 같은 해시"""
+    rule1 = {"ruleId": "R1", "name": "룰", "conditions": {"operator": "AND", "conditions": [
+        {"field": "age", "operator": "gt", "value": 10}
+    ]}}
+    rule2 = {"conditions": {"conditions": [
+        {"value": 10, "operator": ">", "field": "age"}
+    ], "operator": "and"}, "name": "룰", "id": "R1"}
+
+    assert canonical_rule_hash(rule1) == canonical_rule_hash(rule2)
+    assert canonical_rule_hash(rule1) != canonical_rule_hash(dict(rule2, name="다른 룰"))
+
+
+def test_lru_eviction_and_schema_invalidation():
+    """크기 초과 시 오래된 항목 제거, 스키마 버전 변경 시 전체 무효화"""
+    cache = ValidationResultCache(max_size=2)
+    cache.put("a", "v1", _result("a"))
+    cache.put("b", "v1", _result("b"))
+    assert cache.get("a", "v1").summary == "a"
+    cache.put("c", "v1", _result("c"))
+
+    assert cache.get("b", "v1") is None
+    assert cache.get("a", "v1") is not None
+    assert cache.get("a", "v2") is None
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 2 and cache.stats()["evictions"] == 1
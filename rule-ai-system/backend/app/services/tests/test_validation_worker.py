@@ -0,0 +1,98 @@
+import asyncio
+import json
+import pytest
+from app.services.rule_broker import LocalBroker, RuleBroker
+from app.services.validation_worker import ValidationWorker
+
+
+def _rule_message(rule_id, value):
+    return json.dumps({
+        "ruleId": rule_id,
+        "name": f"룰 {rule_id}",
+        "conditions": {"operator": "AND", "conditions": [{"field": "age", "operator": ">", "value": value}]}
+    }).encode("utf-8")
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class FlakyBroker(LocalBroker):
+    """첫 flush만 실패하는 로컬 브로커"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.failures = 1
+
+    def flush(self):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("broker unavailable")
+
+
+def test_batch_publishes_results_and_commits():
+    """배치의 메시지마다 결과 발행, 같은 룰은 한 번만 분석, 잘못된 메시지는 error 결과"""
+    broker = LocalBroker("rules", "validator")
+    broker.publish("rules", b"R1", _rule_message("R1", 10))
+    broker.publish("rules", b"R1", _rule_message("R1", 10))
+    broker.publish("rules", b"R2", b"{not json")
+    worker = ValidationWorker(broker, "results", batch_size=10, poll_timeout=0.01)
+
+    assert broker.lag() == 3
+    assert _run(worker.run_batch()) == 3
+    results = [json.loads(value) for _, value in broker.messages("results")]
+    assert [result["status"] for result in results] == ["valid", "valid", "error"]
+    assert [result["source"]["offset"] for result in results] == [0, 1, 2]
+    assert results[0]["rule_id"] == "R1" and results[2]["rule_id"] == "R2"
+    assert results[0]["rule_hash"] == results[1]["rule_hash"]
+    stats = worker.stats()
+    assert stats["lag"] == 0 and stats["published"] == 3 and stats["invalid_messages"] == 1
+    assert stats["analyzed"] <= 1
+
+
+def test_failed_publish_is_redelivered_and_restart_resumes_from_commit(tmp_path):
+    """발행 확인 전에는 커밋하지 않고 재처리, 재시작하면 커밋된 위치부터 읽음 (at-least-once)"""
+    producer = LocalBroker("rules", "producer", str(tmp_path))
+    producer.publish("rules", b"R1", _rule_message("R1", 10))
+    producer.publish("rules", b"R2", _rule_message("R2", 20))
+
+    broker = FlakyBroker("rules", "validator", str(tmp_path))
+    worker = ValidationWorker(broker, "results", batch_size=10, poll_timeout=0.01)
+    assert _run(worker.run_batch()) == -1
+    assert broker.lag() == 2
+    assert _run(worker.run_batch()) == 2
+    assert broker.lag() == 0
+    # 실패한 시도에서 flush 전에 기록된 결과가 남아 있어 결과는 중복될 수 있음
+    assert len(broker.messages("results")) == 4
+
+    producer.publish("rules", b"R3", _rule_message("R3", 30))
+    restarted = LocalBroker("rules", "validator", str(tmp_path))
+    assert restarted.lag() == 1
+    messages = restarted.poll(10, 0.01)
+    assert [message.key for message in messages] == [b"R3"]
+
+
+def test_incomplete_broker_fails_at_construction():
+    """인터페이스 메서드를 빠뜨린 브로커는 배치 처리 중이 아니라 생성 시점에 실패"""
+    class NoLagBroker(RuleBroker):
+        def poll(self, max_records, timeout):
+            return []
+
+        def commit(self, messages):
+            pass
+
+        def rewind(self, messages):
+            pass
+
+        def publish(self, topic, key, value):
+            pass
+
+        def flush(self):
+            pass
+
+    with pytest.raises(TypeError, match="lag"):
+        NoLagBroker()
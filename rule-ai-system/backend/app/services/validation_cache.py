@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional
+from app.config import settings
+from app.models.validation_result import ValidationResult
+
+
+class ValidationResultCache:
+    """
+    정규화 룰 해시 기반 ValidationResult LRU 캐시
+
+    - 크기를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    - 분석기 스키마 버전이 바뀌면 기존 항목을 모두 비웁니다.
+    - 캐시된 결과는 여러 요청이 공유하므로 호출 측에서 수정하면 안 됩니다.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, ValidationResult]" = OrderedDict()
+        self._schema_version: Optional[str] = None
+        self._lock = Lock()
+
+    def _check_schema_version(self, schema_version: str) -> None:
+        if schema_version != self._schema_version:
+            self._entries.clear()
+            self._schema_version = schema_version
+
+    def get(self, rule_hash: str, schema_version: str) -> Optional[ValidationResult]:
+        """캐시 조회 (없으면 None)"""
+        with self._lock:
+            self._check_schema_version(schema_version)
+            result = self._entries.get(rule_hash)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(rule_hash)
+            self.hits += 1
+            return result
+
+    def put(self, rule_hash: str, schema_version: str, result: ValidationResult) -> None:
+        """캐시 저장"""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._check_schema_version(schema_version)
+            self._entries[rule_hash] = result
+            self._entries.move_to_end(rule_hash)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/미적중 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "schema_version": self._schema_version
+            }
+
+
+# 앱 전체에서 공유하는 검증 결과 캐시
+validation_cache = ValidationResultCache(max_size=settings.VALIDATION_CACHE_SIZE)
@@ -0,0 +1,178 @@
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from app.config import settings
+from app.models.validation_result import ValidationResult
+from app.services.analysis_executor import analysis_executor
+from app.services.rule_analyzer import rule_analyzer
+from app.services.rule_broker import BrokerMessage, RuleBroker
+from app.services.rule_conversion import convert_json_to_rule
+from app.services.rule_hash import canonical_rule_hash
+from app.services.validation_cache import validation_cache
+
+logger = logging.getLogger(__name__)
+
+# 처리량 계산 구간 (초)
+THROUGHPUT_WINDOW_SECONDS = 60.0
+
+
+def _rule_id(message: BrokerMessage, rule_json: Optional[Dict[str, Any]]) -> Optional[str]:
+    if isinstance(rule_json, dict) and (rule_json.get("ruleId") or rule_json.get("id")):
+        return str(rule_json.get("ruleId") or rule_json.get("id"))
+    return message.key.decode("utf-8", errors="replace") if message.key is not None else None
+
+
+class ValidationWorker:
+    """
+    룰 변경 이벤트 검증 워커
+
+    - 요청 토픽에서 룰 JSON 메시지(validate-json과 같은 원본 형식)를 배치로 받아 분석하고 결과를 결과 토픽에 발행합니다.
+    - 배치 안에서 같은 룰(정규화 해시 기준)은 한 번만 분석하고, 검증 결과 캐시를 함께 사용합니다.
+    - 결과 발행이 모두 확인된 뒤에만 오프셋을 커밋합니다 (at-least-once). 발행에 실패하면 읽기 위치를 되돌려 배치를 다시 처리하므로,
+      결과 토픽에는 같은 요청의 결과가 중복될 수 있습니다 (source 오프셋으로 구분).
+    - JSON이 아니거나 룰로 변환할 수 없는 메시지는 재시도하지 않고 status "error" 결과로 발행합니다.
+    """
+
+    def __init__(self, broker: RuleBroker, result_topic: str, batch_size: int = 100, poll_timeout: float = 1.0):
+        self.broker = broker
+        self.result_topic = result_topic
+        self.batch_size = max(1, batch_size)
+        self.poll_timeout = poll_timeout
+        self.consumed = 0
+        self.published = 0
+        self.analyzed = 0
+        self.invalid_messages = 0
+        self.failed_batches = 0
+        self.batches = 0
+        self.last_batch_seconds = 0.0
+        self._started_at = time.monotonic()
+        self._window: Deque[Tuple[float, int]] = deque()
+
+    async def _analyze(self, rules: Dict[str, Any]) -> Dict[str, ValidationResult]:
+        """정규화 해시별 룰 분석 (캐시에 없는 룰만 분석기 실행)"""
+        results: Dict[str, ValidationResult] = {}
+        missing: List[str] = []
+        for rule_hash in rules:
+            cached = validation_cache.get(rule_hash, rule_analyzer.schema_version)
+            if cached is None:
+                missing.append(rule_hash)
+            else:
+                results[rule_hash] = cached
+        analyzed = await asyncio.gather(*(analysis_executor.analyze(rules[rule_hash]) for rule_hash in missing))
+        for rule_hash, result in zip(missing, analyzed):
+            validation_cache.put(rule_hash, rule_analyzer.schema_version, result)
+            results[rule_hash] = result
+        self.analyzed += len(missing)
+        return results
+
+    async def validate(self, messages: List[BrokerMessage]) -> List[Dict[str, Any]]:
+        """메시지별 검증 결과 문서 (메시지 순서 유지)"""
+        parsed: List[Tuple[BrokerMessage, Optional[Dict[str, Any]], Optional[str], Optional[str]]] = []
+        rules: Dict[str, Any] = {}
+        for message in messages:
+            rule_json = None
+            try:
+                rule_json = json.loads(message.value)
+                if not isinstance(rule_json, dict) or not rule_json:
+                    raise ValueError("Rule JSON must be a non-empty object")
+                rule_hash = canonical_rule_hash(rule_json)
+                if rule_hash not in rules:
+                    rules[rule_hash] = convert_json_to_rule(rule_json)
+                parsed.append((message, rule_json, rule_hash, None))
+            except Exception as e:
+                parsed.append((message, rule_json, None, str(e)))
+
+        results = await self._analyze(rules)
+        documents = []
+        for message, rule_json, rule_hash, error in parsed:
+            document: Dict[str, Any] = {
+                "rule_id": _rule_id(message, rule_json),
+                "rule_hash": rule_hash,
+                "source": {"topic": message.topic, "partition": message.partition, "offset": message.offset}
+            }
+            if error is not None:
+                self.invalid_messages += 1
+                document.update(status="error", error=error)
+            else:
+                result = results[rule_hash]
+                document.update(status="valid" if result.is_valid else "invalid", result=result.model_dump(mode="json"))
+            documents.append(document)
+        return documents
+
+    def _publish_and_commit(self, messages: List[BrokerMessage], documents: List[Dict[str, Any]]) -> None:
+        for message, document in zip(messages, documents):
+            self.broker.publish(self.result_topic, message.key, json.dumps(document, ensure_ascii=False).encode("utf-8"))
+        self.broker.flush()
+        self.broker.commit(messages)
+
+    async def run_batch(self) -> int:
+        """배치 하나 처리 - 처리(커밋)한 메시지 수 반환 (처리에 실패해 배치를 되돌렸으면 -1)"""
+        messages = await asyncio.to_thread(self.broker.poll, self.batch_size, self.poll_timeout)
+        if not messages:
+            return 0
+        started = time.perf_counter()
+        self.consumed += len(messages)
+        try:
+            documents = await self.validate(messages)
+            await asyncio.to_thread(self._publish_and_commit, messages, documents)
+        except Exception as e:
+            # 커밋하지 않은 배치는 다음 poll에서 다시 받음
+            self.failed_batches += 1
+            self.broker.rewind(messages)
+            logger.warning("검증 배치 처리 오류, 배치를 다시 처리합니다: %s", e)
+            return -1
+        self.batches += 1
+        self.published += len(messages)
+        self.last_batch_seconds = time.perf_counter() - started
+        self._window.append((time.monotonic(), len(messages)))
+        return len(messages)
+
+    async def run(self, stop: asyncio.Event, metrics_interval: float = 30.0) -> None:
+        """stop이 설정될 때까지 배치 처리, metrics_interval초마다 지표 출력 (0이면 출력 안 함)"""
+        last_report = time.monotonic()
+        while not stop.is_set():
+            if await self.run_batch() < 0:
+                # 실패 직후 바로 재시도하지 않도록 잠시 대기
+                await asyncio.sleep(min(self.poll_timeout, 1.0))
+            if metrics_interval > 0 and time.monotonic() - last_report >= metrics_interval:
+                last_report = time.monotonic()
+                logger.info("검증 워커 지표", extra={"fields": self.stats()})
+
+    def throughput(self) -> float:
+        """최근 THROUGHPUT_WINDOW_SECONDS초 동안 초당 처리 메시지 수"""
+        now = time.monotonic()
+        while self._window and now - self._window[0][0] > THROUGHPUT_WINDOW_SECONDS:
+            self._window.popleft()
+        span = min(THROUGHPUT_WINDOW_SECONDS, now - self._started_at)
+        return sum(count for _, count in self._window) / span if span > 0 else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """컨슈머 지연과 처리량 지표"""
+        try:
+            lag: Optional[int] = self.broker.lag()
+        except Exception:
+            lag = None
+        return {
+            "lag": lag,
+            "messages_per_second": round(self.throughput(), 3),
+            "consumed": self.consumed,
+            "published": self.published,
+            "analyzed": self.analyzed,
+            "invalid_messages": self.invalid_messages,
+            "failed_batches": self.failed_batches,
+            "batches": self.batches,
+            "last_batch_seconds": round(self.last_batch_seconds, 4)
+        }
+
+
+def create_worker(broker: RuleBroker) -> ValidationWorker:
+    """설정에 따른 검증 워커 생성"""
+    return ValidationWorker(
+        broker,
+        settings.VALIDATION_RESULT_TOPIC,
+        batch_size=settings.VALIDATION_BATCH_SIZE,
+        poll_timeout=settings.VALIDATION_POLL_TIMEOUT_SECONDS
+    )
@@ -0,0 +1,38 @@
+import asyncio
+import logging
+import signal
+from app.config import settings
+from app.logging_config import configure_logging
+from app.services.analysis_executor import analysis_executor
+from app.services.rule_broker import create_broker
+from app.services.validation_worker import create_worker
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    """검증 워커 실행 - SIGINT/SIGTERM을 받으면 처리 중인 배치를 마치고 종료"""
+    broker = create_broker()
+    worker = create_worker(broker)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Windows 이벤트 루프는 시그널 핸들러를 지원하지 않음 (Ctrl+C는 KeyboardInterrupt로 종료)
+            pass
+
+    await analysis_executor.start()
+    logger.info("검증 워커 시작: %s %s -> %s", settings.VALIDATION_BROKER, settings.VALIDATION_REQUEST_TOPIC, settings.VALIDATION_RESULT_TOPIC)
+    try:
+        await worker.run(stop, metrics_interval=settings.VALIDATION_METRICS_INTERVAL_SECONDS)
+    finally:
+        logger.info("검증 워커 종료", extra={"fields": worker.stats()})
+        broker.close()
+        analysis_executor.shutdown()
+
+
+if __name__ == "__main__":
+    configure_logging()
+    asyncio.run(main())
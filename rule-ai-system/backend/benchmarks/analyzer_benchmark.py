@@ -0,0 +1,379 @@
+"""
+룰 분석기 벤치마크
+
+합성 룰(시드 고정)로 분석 단계별 지연 시간과 메모리 할당을 측정하고, 결과를 JSON으로 저장한 뒤 기준 결과와 비교합니다.
+
+    cd rule-ai-system/backend
+    python -m benchmarks.analyzer_benchmark                      # 측정 + benchmarks/baseline.json과 비교
+    python -m benchmarks.analyzer_benchmark --output result.json # 결과 저장
+    python -m benchmarks.analyzer_benchmark --update-baseline    # 현재 결과를 기준으로 저장
+
+기준 결과는 측정한 기계에 따라 달라지므로, 같은 기계에서 만든 기준과 비교해야 의미가 있습니다.
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+from app.api.v1.rule_validator import force_fix_issue_summary
+from app.logging_config import APP_LOGGER, TextFormatter
+from app.models.validation_result import StructureInfo
+from app.services.condition_ir import compile_conditions
+from app.services.fixed_report_service import template_report_renderer
+from app.services.rule_conversion import convert_json_to_rule
+from app.services.rule_analyzer import RuleAnalyzer
+from app.services.rule_report_service import RuleReportService
+from benchmarks.rule_generator import RuleGenerator, RuleShape
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# 측정 시나리오 (룰 모양)
+SCENARIOS: Dict[str, RuleShape] = {
+    "small": RuleShape(depth=1, fan_out=3, field_count=4),
+    "medium": RuleShape(depth=2, fan_out=4, field_count=8),
+    "large": RuleShape(depth=3, fan_out=4, field_count=12),
+    "contradictions": RuleShape(depth=2, fan_out=4, field_count=6, contradiction_rate=0.6),
+    "wide_fields": RuleShape(depth=2, fan_out=6, field_count=24, operator_mix={"==": 3, "!=": 1, "in": 1}, contradiction_rate=0.0)
+}
+
+
+def _prepare(analyzer: RuleAnalyzer, rule_json: Dict[str, Any]) -> Dict[str, Any]:
+    """단계별 측정에 필요한 앞 단계 산출물을 미리 계산 (워밍업 겸용)"""
+    rule = convert_json_to_rule(rule_json)
+    ir = compile_conditions(rule.conditions)
+    type_issues, node_issues, _ = analyzer._check_nodes(ir)
+    contradiction_issues, contradiction_fields = analyzer._check_contradictions(ir)
+    issues = type_issues + node_issues + contradiction_issues
+    issues += analyzer._check_duplicate_conditions(ir, set(contradiction_fields))
+    issues += analyzer._check_branch_satisfiability(ir, set(contradiction_fields))
+    issues += analyzer._check_missing_conditions(ir)
+    issues += analyzer._check_ambiguous_branches(ir)
+    result = analyzer.analyze(rule)
+    return {
+        "rule_json": rule_json,
+        "rule": rule,
+        "ir": ir,
+        "contradiction_fields": set(contradiction_fields),
+        "issues": issues,
+        "structure": result.structure or StructureInfo(depth=ir.max_depth, condition_count=ir.size),
+        "result": result,
+        # 리포트 후처리 입력 - LLM 응답 대신 같은 분석 결과로 만든 템플릿 리포트
+        "report": template_report_renderer.render(rule.model_dump(), result)
+    }
+
+
+@lru_cache(maxsize=1)
+def _report_service() -> RuleReportService:
+    return RuleReportService()
+
+
+# 측정 단계 - 분석기 본체(analyze)의 단계를 같은 입력으로 하나씩 실행
+CHECKS: Dict[str, Callable[[RuleAnalyzer, Dict[str, Any]], Any]] = {
+    "convert_json_to_rule": lambda analyzer, context: convert_json_to_rule(context["rule_json"]),
+    "compile_conditions": lambda analyzer, context: compile_conditions(context["rule"].conditions),
+    "node_checks": lambda analyzer, context: analyzer._check_nodes(context["ir"]),
+    "contradictions": lambda analyzer, context: analyzer._check_contradictions(context["ir"]),
+    "duplicates": lambda analyzer, context: analyzer._check_duplicate_conditions(context["ir"], context["contradiction_fields"]),
+    "branch_satisfiability": lambda analyzer, context: analyzer._check_branch_satisfiability(context["ir"], context["contradiction_fields"]),
+    "missing_conditions": lambda analyzer, context: analyzer._check_missing_conditions(context["ir"]),
+    "ambiguous_branches": lambda analyzer, context: analyzer._check_ambiguous_branches(context["ir"]),
+    "rule_summary": lambda analyzer, context: analyzer._generate_rule_summary(context["rule"], context["ir"]),
+    "optimize_issues": lambda analyzer, context: analyzer._optimize_issues(context["issues"]),
+    "ai_comment": lambda analyzer, context: analyzer._generate_ai_comment(context["ir"], context["issues"], context["structure"]),
+    # analyze_rule(비동기 래퍼)의 본체 전체
+    "analyze_rule": lambda analyzer, context: analyzer.analyze(context["rule"]),
+    # 리포트 요청마다 실행하는 후처리
+    "validate_and_fix_report": lambda analyzer, context: _report_service()._validate_and_fix_report(context["report"], context["result"]),
+    "force_fix_issue_summary": lambda analyzer, context: force_fix_issue_summary({"report": context["report"]}, context["result"])
+}
+
+
+def _calibration_workload() -> int:
+    total = 0
+    table: Dict[int, str] = {}
+    for index in range(20000):
+        table[index % 512] = str(index)
+        total += len(table[index % 512]) * (index & 7)
+    return total
+
+
+def calibrate(repeat: int = 15) -> float:
+    """
+    기계 속도 보정값 - 고정된 파이썬 작업의 최솟값(ms)
+
+    같은 기계라도 실행 시점의 부하에 따라 전체가 함께 느려질 수 있어, 기준과 비교할 때 이 값의 비율로 보정합니다.
+    """
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        _calibration_workload()
+        durations.append((time.perf_counter() - started) * 1000)
+    return min(durations)
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class OutputCounter(io.TextIOBase):
+    """
+    분석 중 출력(stdout/stderr, 로그)을 버리면서 write 호출 수와 문자 수를 세는 스트림
+
+    - 컨테이너의 PYTHONUNBUFFERED=1 stdout처럼 버퍼 없이 호출마다 write를 받습니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.chars = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        self.chars += len(text)
+        return len(text)
+
+
+def measure_check(func: Callable[[], Any], repeat: int, memory: bool, time_budget: float = 0.5,
+                  output: Optional[OutputCounter] = None) -> Dict[str, Any]:
+    """
+    단계 하나 측정 - 지연 시간(최대 repeat회, time_budget초를 넘기면 중단)과 메모리(1회)
+
+    - tracemalloc은 호출을 몇 배 느리게 하므로 시간 측정이 끝난 뒤 메모리 측정 호출에서만 켭니다.
+    - alloc_kib: 호출 중 새로 할당된 메모리의 최고점 (호출 전 대비)
+    - retained_kib: 호출이 끝난 뒤에도 남은 메모리 (결과 객체 포함)
+    - output_writes/output_chars: output이 있으면 호출당 출력 write 수와 문자 수
+    """
+    durations = []
+    deadline = time.perf_counter() + time_budget
+    writes, chars = (output.writes, output.chars) if output is not None else (0, 0)
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - started) * 1000)
+        if started >= deadline:
+            break
+    stats: Dict[str, Any] = {"samples_ms": durations}
+    if output is not None:
+        stats["output_writes"] = (output.writes - writes) / len(durations)
+        stats["output_chars"] = (output.chars - chars) / len(durations)
+    if memory:
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            result = func()
+            current, peak = tracemalloc.get_traced_memory()
+            del result
+        finally:
+            tracemalloc.stop()
+        stats["alloc_kib"] = (peak - before) / 1024
+        stats["retained_kib"] = max(0, current - before) / 1024
+    return stats
+
+
+def run_scenario(name: str, shape: RuleShape, rule_count: int, repeat: int, seed: int, memory: bool, time_budget: float = 0.5,
+                 output: Optional[OutputCounter] = None) -> Dict[str, Any]:
+    """시나리오 하나 측정 - 룰 rule_count개에 대해 단계별 결과를 모아 요약"""
+    analyzer = RuleAnalyzer()
+    # 서비스 생성 시 한 번 나는 출력(API 키 경고 등)이 측정에 섞이지 않도록 미리 생성
+    _report_service()
+    rules = RuleGenerator(shape, seed=seed).rules(rule_count)
+    calibration_ms = calibrate()
+    collected: Dict[str, List[Dict[str, Any]]] = {check: [] for check in CHECKS}
+    node_counts = []
+    issue_counts = []
+    for rule_json in rules:
+        context = _prepare(analyzer, rule_json)
+        node_counts.append(context["ir"].size)
+        issue_counts.append(len(context["issues"]))
+        for check, func in CHECKS.items():
+            collected[check].append(measure_check(lambda: func(analyzer, context), repeat, memory, time_budget, output))
+
+    checks = {}
+    for check, measurements in collected.items():
+        samples = [sample for measurement in measurements for sample in measurement["samples_ms"]]
+        summary = {
+            "min_ms": round(min(samples), 4),
+            "median_ms": round(statistics.median(samples), 4),
+            "p95_ms": round(_percentile(samples, 0.95), 4),
+            "mean_ms": round(statistics.fmean(samples), 4)
+        }
+        if memory:
+            summary["alloc_kib"] = round(max(measurement["alloc_kib"] for measurement in measurements), 2)
+            summary["retained_kib"] = round(statistics.median(measurement["retained_kib"] for measurement in measurements), 2)
+        if output is not None:
+            summary["output_writes"] = round(statistics.fmean(measurement["output_writes"] for measurement in measurements), 2)
+            summary["output_chars"] = round(statistics.fmean(measurement["output_chars"] for measurement in measurements), 1)
+        checks[check] = summary
+    return {
+        "shape": shape.to_dict(),
+        "rules": rule_count,
+        "mean_nodes": round(statistics.fmean(node_counts), 1),
+        "mean_issues_before_optimize": round(statistics.fmean(issue_counts), 1),
+        "calibration_ms": round((calibration_ms + calibrate()) / 2, 4),
+        "checks": checks
+    }
+
+
+def run_benchmark(scenarios: List[str], rule_count: int = 3, repeat: int = 30, seed: int = 0,
+                  memory: bool = True, time_budget: float = 0.5, log_level: str = "INFO") -> Dict[str, Any]:
+    """
+    선택한 시나리오 측정 (분석 중 출력은 버리고 단계별 출력량만 기록)
+
+    - 앱 로거는 log_level로 두고 앱과 같은 텍스트 형식으로 출력해 로그 비용까지 측정합니다.
+    """
+    results: Dict[str, Any] = {}
+    started = time.perf_counter()
+    output = OutputCounter()
+    app_logger = logging.getLogger(APP_LOGGER)
+    handler = logging.StreamHandler(output)
+    handler.setFormatter(TextFormatter())
+    previous = (app_logger.level, app_logger.propagate)
+    app_logger.setLevel(log_level.upper())
+    app_logger.addHandler(handler)
+    app_logger.propagate = False
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            for name in scenarios:
+                results[name] = run_scenario(name, SCENARIOS[name], rule_count, repeat, seed, memory, time_budget, output)
+    finally:
+        app_logger.removeHandler(handler)
+        app_logger.setLevel(previous[0])
+        app_logger.propagate = previous[1]
+    meta: Dict[str, Any] = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "rules_per_scenario": rule_count,
+        "repeat": repeat,
+        "time_budget_seconds": time_budget,
+        "memory": memory,
+        "log_level": log_level.upper(),
+        "elapsed_seconds": round(time.perf_counter() - started, 2)
+    }
+    try:
+        import resource
+        # 리눅스는 KiB, macOS는 바이트 단위
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        meta["peak_rss_mib"] = round(max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    except ImportError:
+        pass
+    return {"meta": meta, "scenarios": results}
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.25,
+            min_delta_ms: float = 0.05, min_delta_kib: float = 16.0) -> List[Dict[str, Any]]:
+    """
+    기준 결과 대비 회귀 목록
+
+    - min_ms가 기준보다 threshold 비율 이상, 그리고 min_delta_ms 이상 느려지면 회귀
+      (최솟값이 다른 프로세스의 간섭을 가장 덜 받음. 시나리오의 보정값 비율로 기준 시간을 환산해 기계 전체가 느려진 만큼은 회귀로 보지 않음)
+    - alloc_kib가 기준보다 threshold 비율 이상, 그리고 min_delta_kib 이상 늘면 회귀
+    - 한쪽에만 있는 시나리오/단계는 비교하지 않음
+    """
+    regressions = []
+    limits = (("min_ms", min_delta_ms), ("alloc_kib", min_delta_kib))
+    for name, scenario in current.get("scenarios", {}).items():
+        baseline_scenario = baseline.get("scenarios", {}).get(name, {})
+        baseline_checks = baseline_scenario.get("checks", {})
+        scale = 1.0
+        if scenario.get("calibration_ms") and baseline_scenario.get("calibration_ms"):
+            scale = scenario["calibration_ms"] / baseline_scenario["calibration_ms"]
+        for check, summary in scenario["checks"].items():
+            reference = baseline_checks.get(check)
+            if reference is None:
+                continue
+            for metric, min_delta in limits:
+                if metric not in summary or metric not in reference:
+                    continue
+                value, base = summary[metric], reference[metric]
+                if metric == "min_ms":
+                    base = round(base * scale, 4)
+                if value - base >= min_delta and value > base * (1 + threshold):
+                    regressions.append({
+                        "scenario": name,
+                        "check": check,
+                        "metric": metric,
+                        "baseline": base,
+                        "current": value,
+                        "ratio": round(value / base, 2) if base else None
+                    })
+    return regressions
+
+
+def format_table(current: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> str:
+    """시나리오/단계별 결과 표 (기준이 있으면 최솟값 변화율 포함)"""
+    lines = [f"{'scenario':<16}{'check':<24}{'min_ms':>10}{'median_ms':>11}{'p95_ms':>10}{'alloc_kib':>11}{'out_chars':>11}{'vs base':>10}"]
+    for name, scenario in current["scenarios"].items():
+        reference = (baseline or {}).get("scenarios", {}).get(name, {}).get("checks", {})
+        for check, summary in scenario["checks"].items():
+            change = ""
+            base = reference.get(check, {}).get("min_ms")
+            if base:
+                change = f"{(summary['min_ms'] / base - 1) * 100:+.0f}%"
+            alloc = f"{summary['alloc_kib']:.1f}" if "alloc_kib" in summary else "-"
+            chars = f"{summary['output_chars']:.0f}" if "output_chars" in summary else "-"
+            lines.append(f"{name:<16}{check:<24}{summary['min_ms']:>10.3f}{summary['median_ms']:>11.3f}{summary['p95_ms']:>10.3f}{alloc:>11}{chars:>11}{change:>10}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="룰 분석기 단계별 벤치마크")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"쉼표로 구분한 시나리오 ({', '.join(SCENARIOS)})")
+    parser.add_argument("--rules", type=int, default=3, help="시나리오별 생성 룰 수")
+    parser.add_argument("--repeat", type=int, default=30, help="룰/단계별 반복 측정 횟수")
+    parser.add_argument("--time-budget", type=float, default=0.5, help="룰/단계별 반복 측정 시간 한도 (초, 최소 1회는 측정)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="메모리 측정 생략")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="비교할 기준 결과 JSON")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 결과를 기준 결과로 저장")
+    parser.add_argument("--threshold", type=float, default=0.25, help="회귀로 볼 증가 비율")
+    parser.add_argument("--log-level", default="INFO", help="측정 중 앱 로그 레벨 (DEBUG로 두면 디버그 덤프 비용 포함)")
+    args = parser.parse_args(argv)
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+
+    current = run_benchmark(scenarios, rule_count=args.rules, repeat=args.repeat, seed=args.seed,
+                            memory=not args.no_memory, time_budget=args.time_budget, log_level=args.log_level)
+    baseline = None
+    if not args.update_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print(format_table(current, baseline))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"기준 결과 저장: {args.baseline}")
+        return 0
+    if baseline is None:
+        return 0
+
+    regressions = compare(current, baseline, threshold=args.threshold)
+    for regression in regressions:
+        print(f"회귀: {regression['scenario']}/{regression['check']} {regression['metric']} "
+              f"{regression['baseline']} -> {regression['current']} (x{regression['ratio']})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+import random
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from app.services.rule_analyzer import FIELD_SCHEMA
+
+# 타입별로 생성할 수 있는 연산자 (허용 여부와 무관 - 허용되지 않는 연산자는 invalid_operator 이슈가 됨)
+NUMBER_OPERATORS = ("==", "!=", ">", ">=", "<", "<=", "in")
+STRING_OPERATORS = ("==", "!=", "in", "contains", "starts_with")
+
+DEFAULT_OPERATOR_MIX: Mapping[str, float] = {
+    "==": 3, "!=": 1, ">": 2, ">=": 2, "<": 2, "<=": 2, "in": 1, "contains": 1
+}
+
+CODE_VALUES = tuple("ABCDEFGHIJ")
+
+
+class RuleShape:
+    """
+    합성 룰 모양 파라미터
+
+    - depth: 최상위 그룹 아래 그룹 중첩 깊이 (0이면 최상위 그룹에 비교 조건만), fan_out: 그룹당 하위 조건 수
+    - field_count: 사용할 필드 수 (스키마 필드를 먼저 쓰고, 모자라면 스키마에 없는 FIELD_NN 추가)
+    - operator_mix: 연산자별 가중치 (필드 타입에 맞지 않는 연산자는 그 필드에서 제외)
+    - contradiction_rate: AND 그룹의 마지막 두 조건을 같은 숫자 필드의 모순 쌍(x > a, x < a)으로 바꿀 확률
+    """
+
+    def __init__(self, depth: int = 3, fan_out: int = 3, field_count: int = 8,
+                 operator_mix: Optional[Mapping[str, float]] = None, contradiction_rate: float = 0.1):
+        self.depth = max(0, depth)
+        self.fan_out = max(1, fan_out)
+        self.field_count = max(1, field_count)
+        self.operator_mix = dict(operator_mix or DEFAULT_OPERATOR_MIX)
+        self.contradiction_rate = contradiction_rate
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "depth": self.depth,
+            "fan_out": self.fan_out,
+            "field_count": self.field_count,
+            "operator_mix": self.operator_mix,
+            "contradiction_rate": self.contradiction_rate
+        }
+
+
+def generator_fields(field_count: int) -> List[Tuple[str, str]]:
+    """(필드, 타입) 목록 - 숫자/문자열 스키마 필드를 번갈아 쓰고 모자라면 FIELD_NN(문자열로 추론) 추가"""
+    numbers = [field for field, schema in FIELD_SCHEMA.items() if schema["type"] == "number"]
+    strings = [field for field, schema in FIELD_SCHEMA.items() if schema["type"] == "string"]
+    fields: List[Tuple[str, str]] = []
+    for index in range(max(len(numbers), len(strings))):
+        if index < len(numbers):
+            fields.append((numbers[index], "number"))
+        if index < len(strings):
+            fields.append((strings[index], "string"))
+    fields = fields[:field_count]
+    fields.extend((f"FIELD_{index:02d}", "string") for index in range(len(fields), field_count))
+    return fields
+
+
+class RuleGenerator:
+    """
+    시드 고정 합성 룰 생성기 - validate-json과 같은 원본 JSON 형식의 룰 생성
+
+    같은 시드와 모양이면 항상 같은 룰 목록을 만듭니다.
+    """
+
+    def __init__(self, shape: RuleShape, seed: int = 0):
+        self.shape = shape
+        self.random = random.Random(seed)
+        self.fields = generator_fields(shape.field_count)
+        self.number_fields = [field for field, field_type in self.fields if field_type == "number"]
+        self._operators = {
+            field_type: self._weighted(operators)
+            for field_type, operators in (("number", NUMBER_OPERATORS), ("string", STRING_OPERATORS))
+        }
+
+    def _weighted(self, operators: Tuple[str, ...]) -> Tuple[List[str], List[float]]:
+        candidates = [(operator, weight) for operator, weight in self.shape.operator_mix.items() if operator in operators and weight > 0]
+        if not candidates:
+            candidates = [("==", 1.0)]
+        return [operator for operator, _ in candidates], [weight for _, weight in candidates]
+
+    def _leaf(self) -> Dict[str, Any]:
+        field, field_type = self.random.choice(self.fields)
+        operators, weights = self._operators[field_type]
+        operator = self.random.choices(operators, weights)[0]
+        if operator == "in":
+            if field_type == "number":
+                value: Any = sorted(self.random.sample(range(100), 3))
+            else:
+                value = sorted(self.random.sample(CODE_VALUES, 3))
+        elif field_type == "number":
+            value = self.random.randint(0, 100)
+        else:
+            value = self.random.choice(CODE_VALUES)
+        return {"field": field, "operator": operator, "value": value}
+
+    def _contradiction(self) -> List[Dict[str, Any]]:
+        field = self.random.choice(self.number_fields)
+        value = self.random.randint(10, 90)
+        return [
+            {"field": field, "operator": ">", "value": value + self.random.randint(0, 10)},
+            {"field": field, "operator": "<", "value": value}
+        ]
+
+    def _group(self, depth: int, operator: str) -> Dict[str, Any]:
+        shape = self.shape
+        if depth <= 0:
+            conditions = [self._leaf() for _ in range(shape.fan_out)]
+        else:
+            child_operator = "OR" if operator == "AND" else "AND"
+            conditions = [
+                self._group(depth - 1, child_operator) if self.random.random() < 0.8 else self._leaf()
+                for _ in range(shape.fan_out)
+            ]
+        if operator == "AND" and shape.fan_out >= 2 and self.number_fields and self.random.random() < shape.contradiction_rate:
+            conditions[-2:] = self._contradiction()
+        return {"operator": operator, "conditions": conditions}
+
+    def rule(self, index: int = 0) -> Dict[str, Any]:
+        """룰 하나 생성 (최상위는 AND 그룹, 하위로 갈수록 AND/OR 교대)"""
+        return {
+            "ruleId": f"BENCH-{index:04d}",
+            "name": f"벤치마크 룰 {index}",
+            "priority": self.random.randint(1, 10),
+            "conditions": self._group(self.shape.depth, "AND")
+        }
+
+    def rules(self, count: int) -> List[Dict[str, Any]]:
+        return [self.rule(index) for index in range(count)]
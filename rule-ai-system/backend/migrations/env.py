@@ -0,0 +1,46 @@
+from logging.config import fileConfig
+from alembic import context
+from app.config import settings
+from app.services.rule_repository import create_repository_engine, metadata
+
+config = context.config
+target_metadata = metadata
+
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL 스크립트 출력 (alembic upgrade head --sql)"""
+    context.configure(url=settings.RULE_REPOSITORY_URL, target_metadata=target_metadata, literal_binds=True, render_as_batch=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """
+    DB에 마이그레이션 적용
+
+    - 앱(upgrade_database)은 열어 둔 연결을 config.attributes["connection"]으로 넘깁니다.
+    - alembic 명령으로 실행하면 RULE_REPOSITORY_URL로 직접 연결합니다.
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata, render_as_batch=True)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    if config.config_file_name is not None:
+        fileConfig(config.config_file_name)
+    engine = create_repository_engine(settings.RULE_REPOSITORY_URL)
+    try:
+        with engine.begin() as connection:
+            context.configure(connection=connection, target_metadata=target_metadata, render_as_batch=True)
+            with context.begin_transaction():
+                context.run_migrations()
+    finally:
+        engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,59 @@
+"""룰 저장소 테이블 생성
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 마이그레이션 도입 전에 첫 사용 시 생성된 DB는 테이블이 이미 있으므로 없는 테이블만 생성 (--sql 출력은 전체 생성)
+    existing = set() if context.is_offline_mode() else set(sa.inspect(op.get_bind()).get_table_names())
+    if "rules" not in existing:
+        op.create_table(
+            "rules",
+            sa.Column("rule_id", sa.String(), primary_key=True),
+            sa.Column("version", sa.Integer(), nullable=False),
+            sa.Column("rule_hash", sa.String(), nullable=False),
+            sa.Column("result", sa.Text()),
+            sa.Column("result_version", sa.Integer()),
+            sa.Column("schema_version", sa.String()),
+            sa.Column("updated_at", sa.Float(), nullable=False)
+        )
+    if "rule_versions" not in existing:
+        op.create_table(
+            "rule_versions",
+            sa.Column("rule_id", sa.String(), primary_key=True),
+            sa.Column("version", sa.Integer(), primary_key=True),
+            sa.Column("rule", sa.Text(), nullable=False),
+            sa.Column("rule_hash", sa.String(), nullable=False),
+            sa.Column("created_at", sa.Float(), nullable=False)
+        )
+    if "rule_fields" not in existing:
+        op.create_table(
+            "rule_fields",
+            sa.Column("rule_id", sa.String(), primary_key=True),
+            sa.Column("field", sa.String(), primary_key=True)
+        )
+        op.create_index("idx_rule_fields_field", "rule_fields", ["field"])
+    if "schema_fields" not in existing:
+        op.create_table(
+            "schema_fields",
+            sa.Column("field", sa.String(), primary_key=True),
+            sa.Column("fingerprint", sa.String(), nullable=False)
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("schema_fields")
+    op.drop_index("idx_rule_fields_field", table_name="rule_fields")
+    op.drop_table("rule_fields")
+    op.drop_table("rule_versions")
+    op.drop_table("rules")
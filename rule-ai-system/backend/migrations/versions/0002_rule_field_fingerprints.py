@@ -0,0 +1,47 @@
+"""룰별 필드 스키마 지문
+
+필드별 지문 하나(schema_fields)만 두면 재검증이 끝나기 전에 지문이 갱신되어, 재시작 시
+이전 스키마로 분석한 결과가 현재 결과로 표시될 수 있습니다. 룰마다 결과를 만든 시점의
+필드 지문을 rule_fields.fingerprint에 보관하도록 바꿉니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("rule_fields") as batch:
+        batch.add_column(sa.Column("fingerprint", sa.String()))
+    # 현재 버전의 결과가 있는 룰은 기존 필드 지문으로 분석된 것으로 봄
+    op.execute(
+        """
+        UPDATE rule_fields
+        SET fingerprint = (SELECT fingerprint FROM schema_fields WHERE schema_fields.field = rule_fields.field)
+        WHERE rule_id IN (SELECT rule_id FROM rules WHERE result IS NOT NULL AND result_version = version)
+        """
+    )
+    op.drop_table("schema_fields")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "schema_fields",
+        sa.Column("field", sa.String(), primary_key=True),
+        sa.Column("fingerprint", sa.String(), nullable=False)
+    )
+    op.execute(
+        """
+        INSERT INTO schema_fields (field, fingerprint)
+        SELECT field, MAX(fingerprint) FROM rule_fields WHERE fingerprint IS NOT NULL GROUP BY field
+        """
+    )
+    with op.batch_alter_table("rule_fields") as batch:
+        batch.drop_column("fingerprint")